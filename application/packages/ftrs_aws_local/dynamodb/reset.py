@@ -38,6 +38,8 @@ class RepositoryTypes(StrEnum):
     field = "field"
 
 
+DEFAULT_SCAN_SEGMENTS = 4
+
 DEFAULT_CLEARABLE_ENTITY_TYPES = [
     ClearableEntityTypes.organisation,
     ClearableEntityTypes.healthcare_service,
@@ -122,7 +124,7 @@ def init_tables(
             reset_logger.log(DataMigrationLogBase.ETL_RESET_004, table_name=table_name)
 
 
-def reset(
+def reset(  # noqa: PLR0913
     env: Annotated[
         TargetEnvironment, Option(help="Environment to clear the data from")
     ],
@@ -140,6 +142,10 @@ def reset(
         List[ClearableEntityTypes] | None,
         Option(help="Types of entities to clear from the database"),
     ] = None,
+    scan_segments: Annotated[
+        int,
+        Option(help="Number of parallel scan segments used to read each table"),
+    ] = DEFAULT_SCAN_SEGMENTS,
 ) -> None:
     """
     Reset the database by deleting all items in the specified table(s).
@@ -190,7 +196,7 @@ def reset(
 
             count = 0
             for item in track(
-                repository.iter_records(max_results=None),
+                repository.iter_records(max_results=None, total_segments=scan_segments),
                 description=f"Deleting items from {entity_name}",
                 transient=True,
             ):
@@ -8,6 +8,7 @@ from typer import Abort
 
 from dynamodb.reset import (
     DEFAULT_CLEARABLE_ENTITY_TYPES,
+    DEFAULT_SCAN_SEGMENTS,
     ClearableEntityTypes,
     get_entity_cls,
     get_entity_config,
@@ -68,7 +69,9 @@ def test_reset_success(mocker: MockerFixture) -> None:
         model_cls=Organisation,
         endpoint_url="http://localhost:8000",
     )
-    mock_repo_instance.iter_records.assert_called_once_with(max_results=None)
+    mock_repo_instance.iter_records.assert_called_once_with(
+        max_results=None, total_segments=DEFAULT_SCAN_SEGMENTS
+    )
     assert mock_repo_instance.delete.call_count == len(mock_records)
     mock_repo_instance.delete.assert_any_call("item1")
     mock_repo_instance.delete.assert_any_call("item2")
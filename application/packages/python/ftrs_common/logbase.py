@@ -46,3 +46,22 @@ class FeatureFlagLogBase(LogBase):
         level=INFO,
         message="Triage code loading was disabled by feature flag, skipping execution",
     )
+
+
+class JWTAuthLogBase(LogBase):
+    JWT_001 = LogReference(
+        level=INFO,
+        message="Refreshed bearer token in {refresh_duration_ms}ms, replacing a token aged {token_age_seconds}s",
+    )
+    JWT_002 = LogReference(
+        level=WARNING,
+        message="Early bearer token refresh failed, the current token is used until it expires: {error}",
+    )
+    JWT_003 = LogReference(
+        level=INFO,
+        message="Loaded JWT credentials from {source} in {duration_ms}ms",
+    )
+    JWT_004 = LogReference(
+        level=INFO,
+        message="Fetched the first bearer token in {refresh_duration_ms}ms",
+    )
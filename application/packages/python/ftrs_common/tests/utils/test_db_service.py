@@ -29,6 +29,18 @@ def test_get_service_repository_returns_repository(mocker: MockerFixture) -> Non
 
     assert isinstance(repository, AttributeLevelRepository)
     assert repository.model_cls == MockModel
+    assert repository.trusted_reads is False
+
+
+def test_get_service_repository_with_trusted_reads(mocker: MockerFixture) -> None:
+    mocker.patch(
+        "ftrs_common.utils.db_service.get_table_name",
+        return_value="mock-table-name",
+    )
+
+    repository = get_service_repository(MockModel, "entity-name", trusted_reads=True)
+
+    assert repository.trusted_reads is True
 
 
 def test_get_service_repository_with_no_endpoint_url(mocker: MockerFixture) -> None:
@@ -1,13 +1,23 @@
 """Test JWT authentication with caching functionality."""
 
 import os
-from time import time
+import threading
+from time import sleep, time
 from typing import Callable
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
+import requests
 import rsa
-from ftrs_common.utils.jwt_auth import JWTAuthenticator
+from ftrs_common.logbase import JWTAuthLogBase
+from ftrs_common.utils.jwt_auth import JWTAuthenticator, JWTTokenError
+
+
+def _token_response(token: str) -> MagicMock:
+    response = MagicMock()
+    response.json.return_value = {"access_token": token}
+    response.raise_for_status.return_value = None
+    return response
 
 
 class TestJWTAuthenticatorCaching:
@@ -195,3 +205,152 @@ class TestJWTAuthenticatorCaching:
         # Both instances should maintain their own caches
         assert auth1.cached_token == "token-1"
         assert auth2.cached_token == "token-2"
+
+    @patch("ftrs_common.utils.jwt_auth.requests.post")
+    @patch("ftrs_common.utils.jwt_auth.time")
+    def test_credentials_loaded_once(
+        self,
+        mock_time: MagicMock,
+        mock_post: MagicMock,
+        jwt_authenticator: JWTAuthenticator,
+    ) -> None:
+        """Test credentials are reused across assertions and refreshes."""
+        mock_time.return_value = 1000.0
+        mock_post.side_effect = [_token_response("token-1"), _token_response("token-2")]
+
+        with patch.object(
+            jwt_authenticator,
+            "_get_local_credentials",
+            wraps=jwt_authenticator._get_local_credentials,
+        ) as mock_get_credentials:
+            jwt_authenticator.get_bearer_token()
+            mock_time.return_value = 1400.0
+            jwt_authenticator.get_bearer_token()
+
+        mock_get_credentials.assert_called_once()
+        assert mock_post.call_count == 2  # noqa: PLR2004
+
+    @patch("ftrs_common.utils.jwt_auth.jwt_auth_logger")
+    @patch("ftrs_common.utils.jwt_auth.requests.post")
+    @patch("ftrs_common.utils.jwt_auth.time")
+    def test_refreshes_before_expiry(
+        self,
+        mock_time: MagicMock,
+        mock_post: MagicMock,
+        mock_logger: MagicMock,
+        jwt_authenticator: JWTAuthenticator,
+    ) -> None:
+        """Test a token close to expiry is refreshed by the calling request."""
+        mock_time.return_value = 1000.0
+        mock_post.side_effect = [_token_response("token-1"), _token_response("token-2")]
+        jwt_authenticator.get_bearer_token()
+        mock_logger.log.assert_any_call(JWTAuthLogBase.JWT_004, refresh_duration_ms=ANY)
+
+        # Within the refresh margin of the token expiring at 1300
+        mock_time.return_value = 1250.0
+        assert jwt_authenticator.get_bearer_token() == "token-2"
+
+        assert jwt_authenticator.token_issued_at == 1250.0  # noqa: PLR2004
+        assert jwt_authenticator.token_expires_at == 1550.0  # noqa: PLR2004
+        assert mock_post.call_count == 2  # noqa: PLR2004
+        assert not jwt_authenticator._refresh_lock.locked()
+        mock_logger.log.assert_any_call(
+            JWTAuthLogBase.JWT_001, refresh_duration_ms=ANY, token_age_seconds=250
+        )
+
+    @patch("ftrs_common.utils.jwt_auth.requests.post")
+    @patch("ftrs_common.utils.jwt_auth.time")
+    def test_early_refresh_does_not_block_other_callers(
+        self,
+        mock_time: MagicMock,
+        mock_post: MagicMock,
+        jwt_authenticator: JWTAuthenticator,
+    ) -> None:
+        """Test callers keep the current token while another caller refreshes it."""
+        mock_time.return_value = 1000.0
+        mock_post.return_value = _token_response("token-1")
+        jwt_authenticator.get_bearer_token()
+
+        mock_time.return_value = 1250.0
+        with jwt_authenticator._refresh_lock:
+            assert jwt_authenticator.get_bearer_token() == "token-1"
+
+        assert mock_post.call_count == 1
+
+    @patch("ftrs_common.utils.jwt_auth.jwt_auth_logger")
+    @patch("ftrs_common.utils.jwt_auth.requests.post")
+    @patch("ftrs_common.utils.jwt_auth.time")
+    def test_early_refresh_failure_keeps_token(
+        self,
+        mock_time: MagicMock,
+        mock_post: MagicMock,
+        mock_logger: MagicMock,
+        jwt_authenticator: JWTAuthenticator,
+    ) -> None:
+        """Test a failed early refresh is logged and the current token kept."""
+        mock_time.return_value = 1000.0
+        mock_post.side_effect = [
+            _token_response("token-1"),
+            requests.exceptions.ConnectionError("unreachable"),
+        ]
+        jwt_authenticator.get_bearer_token()
+
+        mock_time.return_value = 1250.0
+        assert jwt_authenticator.get_bearer_token() == "token-1"
+
+        assert jwt_authenticator.cached_token == "token-1"
+        assert not jwt_authenticator._refresh_lock.locked()
+        mock_logger.log.assert_any_call(
+            JWTAuthLogBase.JWT_002, error="Failed to fetch bearer token"
+        )
+
+    @patch("ftrs_common.utils.jwt_auth.requests.post")
+    def test_concurrent_callers_share_one_refresh(
+        self, mock_post: MagicMock, jwt_authenticator: JWTAuthenticator
+    ) -> None:
+        """Test callers without a valid token wait for a single refresh."""
+        thread_count = 5
+        barrier = threading.Barrier(thread_count, timeout=5)
+        tokens = []
+
+        def post(*args: object, **kwargs: object) -> MagicMock:
+            # Hold the refresh so the other callers queue on the lock
+            sleep(0.2)
+            return _token_response("shared-token")
+
+        mock_post.side_effect = post
+
+        def call() -> None:
+            barrier.wait()
+            tokens.append(jwt_authenticator.get_bearer_token())
+
+        threads = [threading.Thread(target=call) for _ in range(thread_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert tokens == ["shared-token"] * thread_count
+        assert mock_post.call_count == 1
+
+    @patch("ftrs_common.utils.jwt_auth.requests.post")
+    def test_rejected_credentials_are_reloaded(
+        self, mock_post: MagicMock, jwt_authenticator: JWTAuthenticator
+    ) -> None:
+        """Test credentials are reloaded after the token endpoint rejects them."""
+        rejected = MagicMock()
+        rejected.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            "401 Unauthorized"
+        )
+        mock_post.side_effect = [rejected, _token_response("token-1")]
+
+        with pytest.raises(JWTTokenError):
+            jwt_authenticator.get_bearer_token()
+        with patch.object(
+            jwt_authenticator,
+            "_get_local_credentials",
+            wraps=jwt_authenticator._get_local_credentials,
+        ) as mock_get_credentials:
+            assert jwt_authenticator.get_bearer_token() == "token-1"
+
+        mock_get_credentials.assert_called_once()
@@ -17,6 +17,7 @@ def get_service_repository(
     entity_name: str,
     logger: Logger | None = None,
     endpoint_url: str | None = None,
+    trusted_reads: bool = False,
 ) -> AttributeLevelRepository[DBModelT]:
     """
     Get a repository for the specified model and entity name.
@@ -24,6 +25,8 @@ def get_service_repository(
     Args:
         model_cls: The model class (e.g., Organisation, HealthcareService).
         entity_name: The type of entity for the table name.
+        trusted_reads: Skip the Telecom email, web and phone format checks when building
+            read models. Other pydantic validation still runs.
 
     Returns:
         AttributeLevelRepository[DBModelT]: The repository for the specified model.
@@ -33,6 +36,7 @@ def get_service_repository(
         model_cls=model_cls,
         endpoint_url=endpoint_url or env_variable_settings.endpoint_url or None,
         logger=logger,
+        trusted_reads=trusted_reads,
     )
 
 
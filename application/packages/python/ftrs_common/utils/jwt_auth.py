@@ -1,17 +1,25 @@
 import json
 import os
+import threading
 import uuid
-from time import time
+from time import perf_counter, time
 from typing import Dict, Optional
 
 import boto3
 import jwt
 import requests
 from botocore.exceptions import ClientError
+from ftrs_common.logbase import JWTAuthLogBase
+from ftrs_common.logger import Logger
+
+jwt_auth_logger = Logger.get(service="jwt_auth")
 
 
 class JWTAuthenticator:
     _FIVE_MINS_IN_SECS = 300
+    # Refresh the token once it is this close to expiring. One caller refreshes
+    # it while the others keep using the current token.
+    _REFRESH_MARGIN_SECS = 60
 
     def __init__(
         self,
@@ -24,11 +32,35 @@ class JWTAuthenticator:
         self.custom_secret_name = secret_name
         self.cached_token: Optional[str] = None
         self.token_expires_at: Optional[float] = None
+        self.token_issued_at: Optional[float] = None
+        self._credentials: Optional[Dict[str, str]] = None
+        self._credentials_lock = threading.Lock()
+        # Held while a token is refreshed, so concurrent callers share one refresh
+        self._refresh_lock = threading.Lock()
 
     def get_jwt_credentials(self) -> Dict[str, str]:
-        if self.environment == "local":
-            return self._get_local_credentials()
-        return self._get_aws_credentials()
+        """
+        Return the JWT credentials, loading them on first use.
+        Credentials are kept for the lifetime of the authenticator and are only
+        reloaded after the token endpoint rejects them.
+        """
+        if self._credentials is None:
+            with self._credentials_lock:
+                if self._credentials is None:
+                    start = perf_counter()
+                    if self.environment == "local":
+                        source = "environment variables"
+                        credentials = self._get_local_credentials()
+                    else:
+                        source = "Secrets Manager"
+                        credentials = self._get_aws_credentials()
+                    jwt_auth_logger.log(
+                        JWTAuthLogBase.JWT_003,
+                        source=source,
+                        duration_ms=round((perf_counter() - start) * 1000),
+                    )
+                    self._credentials = credentials
+        return self._credentials
 
     def _get_local_credentials(self) -> Dict[str, str]:
         required_vars = [
@@ -94,15 +126,50 @@ class JWTAuthenticator:
         current_time = time()
 
         # Check if we have a cached token that hasn't expired
-        if (
+        if self._has_valid_token(current_time):
+            if current_time < self.token_expires_at - self._REFRESH_MARGIN_SECS:
+                return self.cached_token
+            return self._refresh_early()
+
+        with self._refresh_lock:
+            # Another caller may have refreshed the token while we waited
+            if self._has_valid_token(time()):
+                return self.cached_token
+            return self._refresh_token()
+
+    def _has_valid_token(self, current_time: float) -> bool:
+        return bool(
             self.cached_token
             and self.token_expires_at
             and current_time < self.token_expires_at
-        ):
-            # Use cached token
+        )
+
+    def _refresh_early(self) -> str:
+        """
+        Refresh a token that is close to expiring. The first caller refreshes it
+        while any others keep using the current token. A failed refresh is
+        logged, and the current token is used until it expires.
+        """
+        if not self._refresh_lock.acquire(blocking=False):
             return self.cached_token
 
-        # Generate a new token
+        try:
+            # Another caller may have refreshed the token already
+            if time() < self.token_expires_at - self._REFRESH_MARGIN_SECS:
+                return self.cached_token
+            return self._refresh_token()
+        except Exception as e:
+            jwt_auth_logger.log(JWTAuthLogBase.JWT_002, error=str(e))
+            return self.cached_token
+        finally:
+            self._refresh_lock.release()
+
+    def _refresh_token(self) -> str:
+        """
+        Fetch a new bearer token and cache it. Callers must hold the refresh lock.
+        """
+        start = perf_counter()
+        current_time = time()
         creds = self.get_jwt_credentials()
         jwt_assertion = self.generate_assertion()
 
@@ -122,15 +189,30 @@ class JWTAuthenticator:
             token = body.get("access_token")
             if not token:
                 raise JWTTokenError("no_access_token", body)
-            else:
-                # Cache the token with 5-minute expiration
-                self.cached_token = token
-                self.token_expires_at = current_time + self._FIVE_MINS_IN_SECS
-                # 5 minutes
-                return token
+        except requests.exceptions.HTTPError as e:
+            # The credentials may have been rotated, so reload them next time
+            self._credentials = None
+            raise JWTTokenError("request_failed", original_error=e) from e
         except requests.exceptions.RequestException as e:
             raise JWTTokenError("request_failed", original_error=e) from e
 
+        refresh_duration_ms = round((perf_counter() - start) * 1000)
+        if self.token_issued_at is None:
+            jwt_auth_logger.log(
+                JWTAuthLogBase.JWT_004, refresh_duration_ms=refresh_duration_ms
+            )
+        else:
+            jwt_auth_logger.log(
+                JWTAuthLogBase.JWT_001,
+                refresh_duration_ms=refresh_duration_ms,
+                token_age_seconds=round(current_time - self.token_issued_at),
+            )
+        # Cache the token with 5-minute expiration
+        self.cached_token = token
+        self.token_issued_at = current_time
+        self.token_expires_at = current_time + self._FIVE_MINS_IN_SECS
+        return token
+
     def get_auth_headers(self) -> Dict[str, str]:
         bearer_token = self.get_bearer_token()
         return {"Authorization": f"Bearer {bearer_token}"}
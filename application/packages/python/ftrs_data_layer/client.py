@@ -1,8 +1,11 @@
+import threading
 from functools import cache
 
 import boto3
 from mypy_boto3_dynamodb import DynamoDBClient, DynamoDBServiceResource
 
+_thread_local = threading.local()
+
 
 @cache
 def get_dynamodb_client(
@@ -22,3 +25,21 @@ def get_dynamodb_resource(
     Cached DynamoDB client for accessing the DynamoDB service.
     """
     return boto3.resource("dynamodb", endpoint_url=endpoint_url)
+
+
+def get_thread_dynamodb_resource(
+    endpoint_url: str | None = None,
+) -> DynamoDBServiceResource:
+    """
+    DynamoDB resource for the calling thread.
+    boto3 resources are not thread-safe, so each worker thread builds its own
+    from a new session and keeps it for the life of the thread.
+    """
+    resources = getattr(_thread_local, "dynamodb_resources", None)
+    if resources is None:
+        resources = _thread_local.dynamodb_resources = {}
+    if endpoint_url not in resources:
+        resources[endpoint_url] = boto3.session.Session().resource(
+            "dynamodb", endpoint_url=endpoint_url
+        )
+    return resources[endpoint_url]
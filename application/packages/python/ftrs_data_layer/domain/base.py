@@ -2,7 +2,18 @@ from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
 from ftrs_data_layer.domain.auditevent import AuditEvent, AuditEventType
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationInfo
+
+TRUSTED_READ_CONTEXT = {"trusted_read": True}
+
+
+def is_trusted_read(info: ValidationInfo) -> bool:
+    """
+    True when validating items written by our own serialisers, which have
+    already passed the expensive checks in custom validators.
+    """
+    return bool(info.context and info.context.get("trusted_read"))
+
 
 # TODO: Remove this once ingress API changes are made
 audit_default_value = AuditEvent(
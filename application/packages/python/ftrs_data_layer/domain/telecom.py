@@ -1,8 +1,9 @@
 import re
 
 from email_validator import validate_email
+from ftrs_data_layer.domain.base import is_trusted_read
 from ftrs_data_layer.domain.enums import TelecomType
-from pydantic import BaseModel, Field, HttpUrl, model_validator
+from pydantic import BaseModel, Field, HttpUrl, ValidationInfo, model_validator
 from pydantic_extra_types.phone_numbers import PhoneNumberValidator
 from typing_extensions import Self
 
@@ -16,20 +17,20 @@ class Telecom(BaseModel):
         return f"Telecom(type={self.type.value},value={self.value},isPublic={self.isPublic})"
 
     @model_validator(mode="after")
-    def check_valid_email(self) -> Self:
-        if self.type == TelecomType.EMAIL:
+    def check_valid_email(self, info: ValidationInfo) -> Self:
+        if self.type == TelecomType.EMAIL and not is_trusted_read(info):
             validate_email(self.value)
         return self
 
     @model_validator(mode="after")
-    def check_valid_web(self) -> Self:
-        if self.type == TelecomType.WEB:
+    def check_valid_web(self, info: ValidationInfo) -> Self:
+        if self.type == TelecomType.WEB and not is_trusted_read(info):
             HttpUrl(url=self.value)
         return self
 
     @model_validator(mode="after")
-    def check_valid_phone(self) -> Self:
-        if self.type == TelecomType.PHONE:
+    def check_valid_phone(self, info: ValidationInfo) -> Self:
+        if self.type == TelecomType.PHONE and not is_trusted_read(info):
             if not (re.match(r"^[\d\+\(\) ]+$", self.value)):
                 msg = "invalid characters in phone number"
                 raise ValueError(msg)
@@ -37,6 +37,23 @@ class DDBLogBase(LogBase):
     DDB_CORE_014 = LogReference(level=ERROR, message="Error performing batch write")
     DDB_CORE_015 = LogReference(level=ERROR, message="Unprocessed items in batch write")
 
+    DDB_CORE_016 = LogReference(
+        level=INFO, message="Completed parallel scan segment on DynamoDB table"
+    )
+    DDB_CORE_017 = LogReference(
+        level=ERROR, message="Error scanning DynamoDB table segment"
+    )
+
+    DDB_CORE_018 = LogReference(level=DEBUG, message="Performing batch get on DynamoDB")
+    DDB_CORE_019 = LogReference(level=ERROR, message="Error performing batch get")
+    DDB_CORE_020 = LogReference(level=INFO, message="Completed batch get on DynamoDB")
+    DDB_CORE_021 = LogReference(
+        level=ERROR, message="Unprocessed keys in batch get after retries"
+    )
+    DDB_CORE_022 = LogReference(
+        level=INFO, message="Completed buffered batch write to DynamoDB"
+    )
+
 
 class DataMigrationLogBase(LogBase):
     """
@@ -251,6 +268,38 @@ class DataMigrationLogBase(LogBase):
         level=ERROR,
         message="DynamoDB ValidationException during transaction write",
     )
+    DM_ETL_042 = LogReference(
+        level=INFO,
+        message="Prefetched {found_count} of {record_count} migration state records in {request_count} requests",
+    )
+    DM_ETL_043 = LogReference(
+        level=WARNING,
+        message="Failed to prefetch migration state records, falling back to individual reads",
+    )
+    DM_ETL_044 = LogReference(
+        level=INFO,
+        message="Full sync progress: {processed_count} services processed at {services_per_second} services per second",
+    )
+    DM_ETL_045 = LogReference(
+        level=INFO,
+        message="Warmed DoS metadata cache from {source}",
+    )
+    DM_ETL_046 = LogReference(
+        level=WARNING,
+        message="Failed to {action} DoS metadata snapshot at {path}",
+    )
+    DM_ETL_047 = LogReference(
+        level=WARNING,
+        message="Coalesced transaction for {service_count} services failed, writing each service separately",
+    )
+    DM_ETL_048 = LogReference(
+        level=INFO,
+        message="Coalesced {record_count} SQS records into {service_count} service syncs",
+    )
+    DM_ETL_049 = LogReference(
+        level=DEBUG,
+        message="Changes to {entity} since last migration",
+    )
 
     DM_ETL_999 = LogReference(
         level=INFO, message="Data Migration ETL Pipeline completed successfully."
@@ -411,16 +460,9 @@ class UtilsLogBase(LogBase):
     UTILS_ADDRESS_FORMATTER_001 = LogReference(
         level=DEBUG, message="Searching county for name: {county_name}"
     )
-    UTILS_ADDRESS_FORMATTER_002 = LogReference(
-        level=WARNING, message="Error searching for county{county_name}: {error}"
-    )
     UTILS_ADDRESS_FORMATTER_003 = LogReference(
         level=DEBUG, message="Matched county name: {county_name}"
     )
-    UTILS_ADDRESS_FORMATTER_004 = LogReference(
-        level=DEBUG,
-        message="No county match found for name falling back to predefined list: {county_name}",
-    )
     UTILS_ADDRESS_FORMATTER_005 = LogReference(
         level=DEBUG, message="No county found for name: {county_name}"
     )
@@ -522,6 +564,14 @@ class OdsETLPipelineLogBase(LogBase):
         level=WARNING,
         message="ODS code validation failed: {e}.",
     )
+    ETL_TRANSFORMER_035 = LogReference(
+        level=INFO,
+        message="Resolved {resolved_count} of {ods_code_count} organisation uuids in {duration_ms}ms.",
+    )
+    ETL_TRANSFORMER_036 = LogReference(
+        level=WARNING,
+        message="Failed to prefetch organisation uuids for the batch, resolving them per message: {error_message}.",
+    )
     ETL_EXTRACTOR_029 = LogReference(
         level=WARNING,
         message="Error processing date with code: {status_code} and message: {error_message}.",
@@ -531,16 +581,24 @@ class OdsETLPipelineLogBase(LogBase):
     )
     ETL_EXTRACTOR_035 = LogReference(
         level=INFO,
-        message="Page {page_num} returned {page_total} organisations. Cumulative total: {cumulative_total}.",
+        message="Page {page_num} returned {page_total} organisations in {fetch_duration_ms}ms. Cumulative total: {cumulative_total}.",
     )
     ETL_EXTRACTOR_036 = LogReference(
         level=ERROR,
         message="Mock testing scenarios cannot be enabled in environment '{env}'.",
     )
+    ETL_EXTRACTOR_037 = LogReference(
+        level=INFO,
+        message="Page {page_num} of {page_total} organisations sent to the transform queue in {duration_ms}ms.",
+    )
     ETL_CONSUMER_007 = LogReference(
         level=INFO,
         message="Sent PUT request for Organisation {organization_id}. Status code: {status_code}.",
     )
+    ETL_CONSUMER_008 = LogReference(
+        level=WARNING,
+        message="Invalid environment variable {env_var} value '{invalid_value}' provided, using default value {default_value}.",
+    )
     ETL_COMMON_001 = LogReference(
         level=ERROR,
         message="Rate limit exceeded for message id: {message_id}. Attempt {receive_count}/{max_receive_count}. {error_message}",
@@ -1,10 +1,23 @@
 from ftrs_data_layer.repository.dynamodb.attribute_level import AttributeLevelRepository
 from ftrs_data_layer.repository.dynamodb.field_level import FieldLevelRepository
-from ftrs_data_layer.repository.dynamodb.repository import DynamoDBRepository, ModelType
+from ftrs_data_layer.repository.dynamodb.repository import (
+    BatchWriter,
+    BatchWriteReport,
+    DynamoDBRepository,
+    ModelType,
+    QueryPage,
+    decode_continuation_token,
+    encode_continuation_token,
+)
 
 __all__ = [
     "ModelType",
     "DynamoDBRepository",
     "AttributeLevelRepository",
     "FieldLevelRepository",
+    "BatchWriter",
+    "BatchWriteReport",
+    "QueryPage",
+    "decode_continuation_token",
+    "encode_continuation_token",
 ]
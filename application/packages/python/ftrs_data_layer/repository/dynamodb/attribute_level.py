@@ -36,6 +36,23 @@ class AttributeLevelRepository(DynamoDBRepository[ModelType]):
 
         return self._parse_item(item)
 
+    def get_many(
+        self, ids: list[str | UUID], projection: list[str] | None = None
+    ) -> list[ModelType | dict | None]:
+        """
+        Get items from DynamoDB by ID using BatchGetItem.
+        Results are in the same order as ids, with None for any ID not found.
+        When a projection is given, items are returned as raw dicts.
+        """
+        keys = [
+            {"id": key, "field": "document"} for key in dict.fromkeys(map(str, ids))
+        ]
+        items = self._batch_get(keys, projection=projection)
+
+        parse = self._parse_item if projection is None else dict
+        items_by_id = {item["id"]: parse(item) for item in items}
+        return [items_by_id.get(str(id)) for id in ids]
+
     def upsert(self, obj: ModelType) -> None:
         """
         Upsert an item in DynamoDB.
@@ -75,26 +92,34 @@ class AttributeLevelRepository(DynamoDBRepository[ModelType]):
         """
         Parse the item from DynamoDB into the model format.
         """
-        parsed_item = item.copy()
-        return self.model_cls.model_validate(parsed_item)
+        return self._build_model(item)
 
     def iter_records(
-        self, max_results: int | None = 100
+        self, max_results: int | None = 100, total_segments: int = 1
     ) -> Generator[ModelType, None, None]:
         """
         Iterate across all items in the table.
+        With total_segments > 1 the table is read with a parallel segmented
+        scan and records are returned in no particular order.
         """
-        return islice(
-            map(self._parse_item, self._scan(Limit=max_results)),
-            max_results,
-        )
+        if total_segments > 1:
+            items = self._parallel_scan(total_segments, Limit=max_results)
+        else:
+            items = self._scan(Limit=max_results)
+
+        return islice(map(self._parse_item, items), max_results)
 
     def get_by_ods_code(self, ods_code: str) -> list[str]:
         return self._get_records_by_ods_code(ods_code)
 
     def get_first_record_by_ods_code(self, ods_code: str) -> ModelType | None:
-        records = self._get_records_by_ods_code(ods_code)
-        return records[0] if records else None
+        records = self.iter_query(
+            key="identifier_ODS_ODSCode",
+            value=ods_code,
+            max_results=1,
+            IndexName="OdsCodeValueIndex",
+        )
+        return next(records, None)
 
     def get_first_record_ods_code(self) -> str | None:
         records = self.iter_records(max_results=1)
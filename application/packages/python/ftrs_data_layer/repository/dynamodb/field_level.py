@@ -1,4 +1,5 @@
 from itertools import islice
+from operator import itemgetter
 from typing import Generator
 from uuid import UUID
 
@@ -7,6 +8,8 @@ from ftrs_data_layer.repository.dynamodb.repository import (
     ModelType,
 )
 
+ITER_RECORDS_BATCH_SIZE = 25
+
 
 class FieldLevelRepository(DynamoDBRepository[ModelType]):
     def create(self, obj: ModelType) -> None:
@@ -30,6 +33,28 @@ class FieldLevelRepository(DynamoDBRepository[ModelType]):
 
         return self._parse_item(items)
 
+    def get_many(self, ids: list[str | UUID]) -> list[ModelType | None]:
+        """
+        Get documents from DynamoDB by ID using BatchGetItem.
+        Every field of the model is requested for each ID. Results are in the
+        same order as ids, with None for any ID not found.
+        """
+        fields = [field for field in self.model_cls.model_fields if field != "id"]
+        keys = [
+            {"id": key, "field": field}
+            for key in dict.fromkeys(map(str, ids))
+            for field in fields
+        ]
+
+        items_by_id: dict[str, list[dict]] = {}
+        for item in self._batch_get(keys):
+            items_by_id.setdefault(item["id"], []).append(item)
+
+        return [
+            self._parse_item(items_by_id[str(id)]) if str(id) in items_by_id else None
+            for id in ids
+        ]
+
     def update(self, obj_id: str | UUID, obj: ModelType) -> None:
         """
         Update an existing document in DynamoDB.
@@ -75,7 +100,7 @@ class FieldLevelRepository(DynamoDBRepository[ModelType]):
             "id": item[0]["id"],
             **{item["field"]: item["value"] for item in item},
         }
-        return self.model_cls.model_validate(item_dict)
+        return self._build_model(item_dict)
 
     def _iter_record_ids(
         self, max_results: int | None = 100
@@ -102,5 +127,6 @@ class FieldLevelRepository(DynamoDBRepository[ModelType]):
         """
         Iterate over the records in the DynamoDB table.
         """
-        for record_id, _ in self._iter_record_ids(max_results):
-            yield self.get(record_id)
+        record_ids = map(itemgetter(0), self._iter_record_ids(max_results))
+        while batch := list(islice(record_ids, ITER_RECORDS_BATCH_SIZE)):
+            yield from self.get_many(batch)
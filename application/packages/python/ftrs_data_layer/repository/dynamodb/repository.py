@@ -1,13 +1,112 @@
-from typing import Any, Generator
+import base64
+import binascii
+import json
+import random
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass
+from itertools import islice
+from queue import Full, Queue
+from threading import Event, get_ident
+from types import TracebackType
+from typing import Any, Generator, Generic
 from uuid import UUID
 
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
 from botocore.exceptions import ClientError
 from ftrs_common.logger import Logger
-from ftrs_data_layer.client import get_dynamodb_resource
+from ftrs_data_layer.client import (
+    get_dynamodb_resource,
+    get_thread_dynamodb_resource,
+)
+from ftrs_data_layer.domain.base import TRUSTED_READ_CONTEXT
 from ftrs_data_layer.logbase import DDBLogBase
 from ftrs_data_layer.repository.base import BaseRepository, ModelType
+from mypy_boto3_dynamodb import DynamoDBServiceResource
+from mypy_boto3_dynamodb.service_resource import Table
 from mypy_boto3_dynamodb.type_defs import PutItemInputTablePutItemTypeDef
 
+_serialiser = TypeSerializer()
+_deserialiser = TypeDeserializer()
+
+_SEGMENT_DONE = object()
+_BUFFER_POLL_SECONDS = 0.1
+
+BATCH_GET_MAX_KEYS = 100
+BATCH_WRITE_MAX_ITEMS = 25
+MAX_UNPROCESSED_RETRIES = 5
+BACKOFF_BASE_SECONDS = 0.05
+BACKOFF_MAX_SECONDS = 2.0
+
+
+def backoff_delay(attempt: int) -> float:
+    """
+    Full-jitter exponential backoff delay in seconds for a zero-based retry attempt.
+    """
+    return random.uniform(
+        0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2**attempt)
+    )
+
+
+@dataclass
+class BatchWriteReport:
+    """
+    Totals for the requests sent by a BatchWriter.
+    """
+
+    item_count: int = 0
+    request_count: int = 0
+    retry_count: int = 0
+    consumed_capacity_units: float = 0.0
+    duration_seconds: float = 0.0
+
+    @property
+    def items_per_second(self) -> float:
+        if not self.duration_seconds:
+            return 0.0
+        return self.item_count / self.duration_seconds
+
+
+@dataclass
+class QueryPage(Generic[ModelType]):
+    """
+    A single page of query results and the token to resume after it.
+    continuation_token is None when there are no more results.
+    """
+
+    items: list[ModelType]
+    continuation_token: str | None
+
+
+def encode_continuation_token(last_evaluated_key: dict | None) -> str | None:
+    """
+    Encode a DynamoDB LastEvaluatedKey as an opaque, URL-safe token.
+    """
+    if not last_evaluated_key:
+        return None
+
+    typed_key = {
+        name: _serialiser.serialize(value) for name, value in last_evaluated_key.items()
+    }
+    encoded = json.dumps(typed_key, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(encoded).decode("ascii")
+
+
+def decode_continuation_token(token: str) -> dict:
+    """
+    Decode a token produced by encode_continuation_token into an ExclusiveStartKey.
+    """
+    try:
+        typed_key = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+        return {
+            name: _deserialiser.deserialize(value) for name, value in typed_key.items()
+        }
+    except (binascii.Error, ValueError, TypeError, AttributeError) as error:
+        error_msg = f"Invalid continuation token: {token}"
+        raise ValueError(error_msg) from error
+
 
 class DynamoDBRepository(BaseRepository[ModelType]):
     """
@@ -21,10 +120,14 @@ class DynamoDBRepository(BaseRepository[ModelType]):
         model_cls: ModelType = None,
         endpoint_url: str | None = None,
         logger: Logger | None = None,
+        trusted_reads: bool = False,
     ) -> None:
         super().__init__(model_cls, logger)
+        self.endpoint_url = endpoint_url
         self.resource = get_dynamodb_resource(endpoint_url)
         self.table = self.resource.Table(table_name)
+        self._owner_thread_id = get_ident()
+        self.trusted_reads = trusted_reads
         self.logger.log(
             DDBLogBase.DDB_CORE_001,
             table_name=table_name,
@@ -33,6 +136,24 @@ class DynamoDBRepository(BaseRepository[ModelType]):
             model_cls=f"{model_cls.__module__}:{model_cls.__qualname__}",
         )
 
+    def _resource_for_thread(self) -> DynamoDBServiceResource:
+        """
+        Return the resource to use on the calling thread.
+        boto3 resources are not thread-safe, so worker threads use a resource of
+        their own rather than sharing self.resource.
+        """
+        if get_ident() == self._owner_thread_id:
+            return self.resource
+        return get_thread_dynamodb_resource(self.endpoint_url)
+
+    def _table_for_thread(self) -> Table:
+        """
+        Return the table to use on the calling thread, see _resource_for_thread.
+        """
+        if get_ident() == self._owner_thread_id:
+            return self.table
+        return self._resource_for_thread().Table(self.table.name)
+
     def _serialise_item(self, item: ModelType) -> dict:
         """
         Prepare the item for DynamoDB.
@@ -45,7 +166,16 @@ class DynamoDBRepository(BaseRepository[ModelType]):
         Prepare the item for DynamoDB.
         Can be extended to add custom index or serialisation logic by child classes.
         """
-        return self.model_cls.model_validate(item)
+        return self._build_model(item)
+
+    def _build_model(self, data: dict) -> ModelType:
+        """
+        Build the model from a stored item.
+        With trusted_reads the item is assumed to have been written by our own
+        serialiser, so custom validators skip their expensive checks.
+        """
+        context = TRUSTED_READ_CONTEXT if self.trusted_reads else None
+        return self.model_cls.model_validate(data, context=context)
 
     def _put_item(
         self, item: ModelType, **kwargs: dict
@@ -116,39 +246,227 @@ class DynamoDBRepository(BaseRepository[ModelType]):
 
         return self._parse_item(item)
 
+    def iter_query(
+        self,
+        key: str,
+        value: str | UUID,
+        max_results: int | None = None,
+        page_size: int | None = None,
+        projection: list[str] | None = None,
+        **kwargs: dict,
+    ) -> Generator[ModelType | dict, None, None]:
+        """
+        Lazily queries the DynamoDB table, following LastEvaluatedKey.
+        Items are parsed one at a time as they are consumed, and the query stops
+        requesting pages once max_results items have been yielded.
+        When a projection is given, items are yielded as raw dicts as they
+        cannot be validated against the model.
+        """
+        ddb_request = self._build_query_request(
+            key, value, page_size or max_results, projection, **kwargs
+        )
+        items = (
+            item
+            for response in self._iter_query_responses(ddb_request)
+            for item in response.get("Items", [])
+        )
+        parse = self._parse_item if projection is None else dict
+        return islice(map(parse, items), max_results)
+
+    def iter_query_pages(
+        self,
+        key: str,
+        value: str | UUID,
+        page_size: int | None = None,
+        continuation_token: str | None = None,
+        projection: list[str] | None = None,
+        **kwargs: dict,
+    ) -> Generator[QueryPage[ModelType | dict], None, None]:
+        """
+        Lazily queries the DynamoDB table one page at a time.
+        Each page carries an opaque continuation token that can be handed back
+        to callers and passed in again to resume the query after that page.
+        """
+        if continuation_token is not None:
+            kwargs["ExclusiveStartKey"] = decode_continuation_token(continuation_token)
+
+        ddb_request = self._build_query_request(
+            key, value, page_size, projection, **kwargs
+        )
+        parse = self._parse_item if projection is None else dict
+        for response in self._iter_query_responses(ddb_request):
+            yield QueryPage(
+                items=[parse(item) for item in response.get("Items", [])],
+                continuation_token=encode_continuation_token(
+                    response.get("LastEvaluatedKey")
+                ),
+            )
+
     def _query(self, key: str, value: str | UUID, **kwargs: dict) -> list[ModelType]:
         """
         Queries the DynamoDB table.
+        Follows LastEvaluatedKey so results larger than a single 1 MB page
+        are returned in full.
         """
+        return list(self.iter_query(key, value, **kwargs))
+
+    def _build_query_request(
+        self,
+        key: str,
+        value: str | UUID,
+        limit: int | None = None,
+        projection: list[str] | None = None,
+        **kwargs: dict,
+    ) -> dict:
         ddb_request = {
             "KeyConditionExpression": f"{key} = :{key}",
             "ExpressionAttributeValues": {f":{key}": str(value)},
             "ReturnConsumedCapacity": "INDEXES",
             **kwargs,
         }
+        if limit is not None:
+            ddb_request["Limit"] = limit
+
+        if projection:
+            attribute_names = {
+                f"#proj{index}": name for index, name in enumerate(projection)
+            }
+            ddb_request["ProjectionExpression"] = ", ".join(attribute_names)
+            ddb_request["ExpressionAttributeNames"] = {
+                **ddb_request.get("ExpressionAttributeNames", {}),
+                **attribute_names,
+            }
+
+        return ddb_request
+
+    def _iter_query_responses(self, ddb_request: dict) -> Generator[dict, None, None]:
+        """
+        Yields raw query responses page by page, following LastEvaluatedKey.
+        """
         self.logger.log(
             DDBLogBase.DDB_CORE_009, request=ddb_request, table=self.table.name
         )
-        try:
-            response = self.table.query(**ddb_request)
-            items = response.get("Items", [])
 
-            self.logger.log(
-                DDBLogBase.DDB_CORE_010,
-                item_count=len(items),
-                table=self.table.name,
-                consumed_capacity=response.get("ConsumedCapacity"),
-            )
-        except ClientError as client_error:
-            self.logger.log(
-                DDBLogBase.DDB_CORE_011,
-                table=self.table.name,
-                error=client_error.response["Error"],
-                request=ddb_request,
-            )
-            raise
+        table = self._table_for_thread()
+        page_request = ddb_request
+        while True:
+            try:
+                response = table.query(**page_request)
+                self.logger.log(
+                    DDBLogBase.DDB_CORE_010,
+                    item_count=len(response.get("Items", [])),
+                    table=self.table.name,
+                    consumed_capacity=response.get("ConsumedCapacity"),
+                )
+            except ClientError as client_error:
+                self.logger.log(
+                    DDBLogBase.DDB_CORE_011,
+                    table=self.table.name,
+                    error=client_error.response["Error"],
+                    request=page_request,
+                )
+                raise
 
-        return [self._parse_item(item) for item in items]
+            yield response
+
+            if "LastEvaluatedKey" not in response:
+                break
+
+            page_request = {
+                **ddb_request,
+                "ExclusiveStartKey": response["LastEvaluatedKey"],
+            }
+
+    def _batch_get(
+        self,
+        keys: list[dict],
+        projection: list[str] | None = None,
+    ) -> list[dict]:
+        """
+        Gets items by key using BatchGetItem in chunks of 100 keys.
+        UnprocessedKeys are retried with jittered exponential backoff.
+        Items are returned in no particular order; missing keys are omitted.
+        """
+        key_names = list(keys[0]) if keys else []
+        request_options = {}
+        if projection:
+            attribute_names = {
+                f"#proj{index}": name
+                for index, name in enumerate(dict.fromkeys([*key_names, *projection]))
+            }
+            request_options = {
+                "ProjectionExpression": ", ".join(attribute_names),
+                "ExpressionAttributeNames": attribute_names,
+            }
+
+        items = []
+        for start in range(0, len(keys), BATCH_GET_MAX_KEYS):
+            request_items = {
+                self.table.name: {
+                    "Keys": keys[start : start + BATCH_GET_MAX_KEYS],
+                    **request_options,
+                }
+            }
+            attempt = 0
+            while request_items:
+                ddb_request = {
+                    "RequestItems": request_items,
+                    "ReturnConsumedCapacity": "INDEXES",
+                }
+                self.logger.log(
+                    DDBLogBase.DDB_CORE_018,
+                    key_count=len(request_items[self.table.name]["Keys"]),
+                    attempt=attempt,
+                    table=self.table.name,
+                )
+                try:
+                    response = self.resource.batch_get_item(**ddb_request)
+                except ClientError as client_error:
+                    self.logger.log(
+                        DDBLogBase.DDB_CORE_019,
+                        table=self.table.name,
+                        error=client_error.response["Error"],
+                    )
+                    raise
+
+                page_items = response.get("Responses", {}).get(self.table.name, [])
+                items.extend(page_items)
+                self.logger.log(
+                    DDBLogBase.DDB_CORE_020,
+                    item_count=len(page_items),
+                    table=self.table.name,
+                    consumed_capacity=response.get("ConsumedCapacity"),
+                )
+
+                request_items = response.get("UnprocessedKeys") or {}
+                if not request_items:
+                    break
+
+                if attempt >= MAX_UNPROCESSED_RETRIES:
+                    self.logger.log(
+                        DDBLogBase.DDB_CORE_021,
+                        table=self.table.name,
+                        unprocessed_key_count=len(
+                            request_items[self.table.name]["Keys"]
+                        ),
+                    )
+                    error_msg = (
+                        f"Unprocessed keys in batch get after {attempt} retries: "
+                        f"{request_items}"
+                    )
+                    raise RuntimeError(error_msg)
+
+                time.sleep(backoff_delay(attempt))
+                attempt += 1
+
+        return items
+
+    def batch_writer(self, max_workers: int = 1, **kwargs: dict) -> "BatchWriter":
+        """
+        Returns a buffered BatchWriter for this table.
+        Use it as a context manager; any buffered writes are sent on exit.
+        """
+        return BatchWriter(self, max_workers=max_workers, **kwargs)
 
     def _batch_write(
         self,
@@ -158,56 +476,76 @@ class DynamoDBRepository(BaseRepository[ModelType]):
     ) -> None:
         """
         Performs a batch write operation on the DynamoDB table.
+        Items are sent in chunks of 25, retrying any unprocessed items.
         """
-        if not put_items:
-            put_items = []
-
-        if not delete_items:
-            delete_items = []
-
-        ddb_request = {
-            "RequestItems": {
-                self.table.name: [
-                    *[{"PutRequest": {"Item": item}} for item in put_items],
-                    *[{"DeleteRequest": {"Key": item}} for item in delete_items],
-                ]
-            },
-            "ReturnConsumedCapacity": "INDEXES",
-            **kwargs,
-        }
+        with self.batch_writer(**kwargs) as writer:
+            for item in put_items or []:
+                writer.put(item)
 
-        self.logger.log(
-            DDBLogBase.DDB_CORE_012,
-            request=ddb_request,
-            table=self.table.name,
-        )
+            for key in delete_items or []:
+                writer.delete(key)
 
-        try:
-            response = self.resource.batch_write_item(**ddb_request)
-            self.logger.log(
-                DDBLogBase.DDB_CORE_013,
-                table=self.table.name,
-                consumed_capacity=response.get("ConsumedCapacity"),
-            )
-        except ClientError as client_error:
+    def _write_batch(
+        self, write_requests: list[dict], **kwargs: dict[str, Any]
+    ) -> BatchWriteReport:
+        """
+        Sends a single chunk of write requests with BatchWriteItem.
+        UnprocessedItems are retried with jittered exponential backoff.
+        """
+        report = BatchWriteReport(item_count=len(write_requests))
+        request_items = {self.table.name: write_requests}
+        attempt = 0
+        while True:
+            ddb_request = {
+                "RequestItems": request_items,
+                "ReturnConsumedCapacity": "INDEXES",
+                **kwargs,
+            }
             self.logger.log(
-                DDBLogBase.DDB_CORE_014,
-                table=self.table.name,
-                error=client_error.response["Error"],
+                DDBLogBase.DDB_CORE_012,
                 request=ddb_request,
+                table=self.table.name,
             )
-            raise
 
-        unprocessed_items = response.get("UnprocessedItems")
-        if unprocessed_items:
-            self.logger.log(
-                DDBLogBase.DDB_CORE_015,
-                table=self.table.name,
-                request=ddb_request,
-                unprocessed_items=unprocessed_items,
+            try:
+                response = self._resource_for_thread().batch_write_item(**ddb_request)
+                self.logger.log(
+                    DDBLogBase.DDB_CORE_013,
+                    table=self.table.name,
+                    consumed_capacity=response.get("ConsumedCapacity"),
+                )
+            except ClientError as client_error:
+                self.logger.log(
+                    DDBLogBase.DDB_CORE_014,
+                    table=self.table.name,
+                    error=client_error.response["Error"],
+                    request=ddb_request,
+                )
+                raise
+
+            report.request_count += 1
+            report.consumed_capacity_units += sum(
+                capacity.get("CapacityUnits", 0)
+                for capacity in response.get("ConsumedCapacity") or []
             )
-            error_msg = f"Unprocessed items in batch write: {unprocessed_items}"
-            raise RuntimeError(error_msg)
+
+            request_items = response.get("UnprocessedItems")
+            if not request_items:
+                return report
+
+            if attempt >= MAX_UNPROCESSED_RETRIES:
+                self.logger.log(
+                    DDBLogBase.DDB_CORE_015,
+                    table=self.table.name,
+                    request=ddb_request,
+                    unprocessed_items=request_items,
+                )
+                error_msg = f"Unprocessed items in batch write: {request_items}"
+                raise RuntimeError(error_msg)
+
+            time.sleep(backoff_delay(attempt))
+            attempt += 1
+            report.retry_count += 1
 
     def _scan(self, **kwargs: dict) -> Generator[dict, None, None]:
         """
@@ -233,3 +571,242 @@ class DynamoDBRepository(BaseRepository[ModelType]):
                 ReturnConsumedCapacity="INDEXES",
                 **kwargs,
             )
+
+    def _parallel_scan(
+        self,
+        total_segments: int,
+        max_buffered_pages: int | None = None,
+        **kwargs: dict,
+    ) -> Generator[dict, None, None]:
+        """
+        Scans the DynamoDB table as total_segments parallel segment scans.
+        Each segment is scanned on its own worker thread and pages are merged
+        into a single iterator through a bounded buffer, so workers pause when
+        the consumer falls behind. Items are not returned in a defined order.
+        """
+        if total_segments <= 1:
+            yield from self._scan(**kwargs)
+            return
+
+        limit = min(kwargs.pop("Limit", None) or 1000, 1000)
+        buffer = _ScanBuffer(max_buffered_pages or total_segments * 2)
+
+        executor = ThreadPoolExecutor(max_workers=total_segments)
+        try:
+            for segment in range(total_segments):
+                # Each worker runs in a copy of the caller's context so logger
+                # keys appended for the current request are kept.
+                executor.submit(
+                    copy_context().run,
+                    self._scan_segment,
+                    buffer,
+                    segment,
+                    total_segments,
+                    Limit=limit,
+                    **kwargs,
+                )
+
+            remaining_segments = total_segments
+            while remaining_segments:
+                page = buffer.pages.get()
+                if page is _SEGMENT_DONE:
+                    remaining_segments -= 1
+                elif isinstance(page, Exception):
+                    raise page
+                else:
+                    yield from page
+        finally:
+            buffer.stop.set()
+            executor.shutdown(wait=True)
+
+    def _scan_segment(
+        self,
+        buffer: "_ScanBuffer",
+        segment: int,
+        total_segments: int,
+        **kwargs: dict,
+    ) -> None:
+        """
+        Scans a single segment into the buffer and reports its consumed capacity.
+        """
+        ddb_request = {
+            "Segment": segment,
+            "TotalSegments": total_segments,
+            "ReturnConsumedCapacity": "INDEXES",
+            **kwargs,
+        }
+        item_count = 0
+        consumed_capacity_units = 0.0
+        try:
+            table = self._table_for_thread()
+            while True:
+                if buffer.stop.is_set():
+                    return
+
+                response = table.scan(**ddb_request)
+                items = response.get("Items", [])
+                item_count += len(items)
+                consumed_capacity_units += response.get("ConsumedCapacity", {}).get(
+                    "CapacityUnits", 0
+                )
+
+                if items and not buffer.put(items):
+                    return
+
+                if "LastEvaluatedKey" not in response:
+                    break
+
+                ddb_request["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+            self.logger.log(
+                DDBLogBase.DDB_CORE_016,
+                table=self.table.name,
+                segment=segment,
+                total_segments=total_segments,
+                item_count=item_count,
+                consumed_capacity_units=consumed_capacity_units,
+            )
+            buffer.put(_SEGMENT_DONE)
+
+        except ClientError as client_error:
+            self.logger.log(
+                DDBLogBase.DDB_CORE_017,
+                table=self.table.name,
+                segment=segment,
+                total_segments=total_segments,
+                error=client_error.response["Error"],
+            )
+            buffer.put(client_error)
+
+        except Exception as error:
+            buffer.put(error)
+
+
+class _ScanBuffer:
+    """
+    Bounded hand-off between parallel scan workers and the consuming iterator.
+    """
+
+    def __init__(self, max_pages: int) -> None:
+        self.pages: Queue = Queue(maxsize=max_pages)
+        self.stop = Event()
+
+    def put(self, page: object) -> bool:
+        """
+        Block until there is room for the page, or the consumer has stopped.
+        Returns False if the consumer stopped before the page was accepted.
+        """
+        while not self.stop.is_set():
+            try:
+                self.pages.put(page, timeout=_BUFFER_POLL_SECONDS)
+            except Full:
+                continue
+            else:
+                return True
+        return False
+
+
+class BatchWriter:
+    """
+    Buffered writer that sends puts and deletes in chunks of 25 items.
+
+    Chunks are sent as soon as they are full, optionally on up to max_workers
+    threads that each use their own DynamoDB resource, and unprocessed items
+    are retried with backoff. On exit the
+    remaining items are flushed and the totals are logged and kept in report.
+    """
+
+    def __init__(
+        self,
+        repository: DynamoDBRepository,
+        max_workers: int = 1,
+        **kwargs: dict,
+    ) -> None:
+        self.repository = repository
+        self.max_workers = max_workers
+        self.report = BatchWriteReport()
+        self._request_options = kwargs
+        self._buffer: list[dict] = []
+        self._pending: deque[Future] = deque()
+        self._executor: ThreadPoolExecutor | None = None
+        self._start = 0.0
+
+    def __enter__(self) -> "BatchWriter":
+        self._start = time.perf_counter()
+        if self.max_workers > 1:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        try:
+            if exc_type is None:
+                self.flush()
+                while self._pending:
+                    self._record(self._pending.popleft().result())
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+            self._pending.clear()
+
+        if exc_type is None:
+            self.report.duration_seconds = time.perf_counter() - self._start
+            self.repository.logger.log(
+                DDBLogBase.DDB_CORE_022,
+                table=self.repository.table.name,
+                item_count=self.report.item_count,
+                request_count=self.report.request_count,
+                retry_count=self.report.retry_count,
+                consumed_capacity_units=self.report.consumed_capacity_units,
+                duration_ms=round(self.report.duration_seconds * 1000),
+                items_per_second=round(self.report.items_per_second, 2),
+            )
+
+    def put(self, item: dict) -> None:
+        self._add({"PutRequest": {"Item": item}})
+
+    def delete(self, key: dict) -> None:
+        self._add({"DeleteRequest": {"Key": key}})
+
+    def flush(self) -> None:
+        """
+        Send everything currently buffered, including a partial chunk.
+        """
+        while self._buffer:
+            chunk = self._buffer[:BATCH_WRITE_MAX_ITEMS]
+            self._buffer = self._buffer[BATCH_WRITE_MAX_ITEMS:]
+            self._send(chunk)
+
+    def _add(self, write_request: dict) -> None:
+        self._buffer.append(write_request)
+        if len(self._buffer) >= BATCH_WRITE_MAX_ITEMS:
+            self.flush()
+
+    def _send(self, chunk: list[dict]) -> None:
+        if self._executor is None:
+            self._record(self.repository._write_batch(chunk, **self._request_options))
+            return
+
+        # Bound the chunks in flight so a fast producer cannot buffer the
+        # whole load in memory while the workers catch up.
+        if len(self._pending) >= self.max_workers:
+            self._record(self._pending.popleft().result())
+
+        self._pending.append(
+            self._executor.submit(
+                copy_context().run,
+                self.repository._write_batch,
+                chunk,
+                **self._request_options,
+            )
+        )
+
+    def _record(self, chunk_report: BatchWriteReport) -> None:
+        self.report.item_count += chunk_report.item_count
+        self.report.request_count += chunk_report.request_count
+        self.report.retry_count += chunk_report.retry_count
+        self.report.consumed_capacity_units += chunk_report.consumed_capacity_units
@@ -1,4 +1,5 @@
 import pytest
+from ftrs_data_layer.domain.base import TRUSTED_READ_CONTEXT
 from ftrs_data_layer.domain.enums import TelecomType
 from ftrs_data_layer.domain.telecom import Telecom
 from pydantic import ValidationError
@@ -176,3 +177,27 @@ def test_telecom_type_enum_from_fhir_value_unset_type() -> None:
         ValueError, match=r"Telecom type \(system\) cannot be None or empty"
     ):
         TelecomType.from_fhir_value(None)
+
+
+@pytest.mark.parametrize(
+    ("telecom_type", "value"),
+    [
+        ("phone", "abc"),
+        ("email", "plainaddress"),
+        ("web", "not a url"),
+    ],
+)
+def test_telecom_trusted_read_skips_value_checks(telecom_type: str, value: str) -> None:
+    """
+    Items written by our own serialisers are not re-checked on trusted reads
+    """
+    telecom = Telecom.model_validate(
+        {"type": telecom_type, "value": value, "isPublic": True},
+        context=TRUSTED_READ_CONTEXT,
+    )
+
+    assert telecom.type == TelecomType(telecom_type)
+    assert telecom.value == value
+
+    with pytest.raises(ValidationError):
+        Telecom.model_validate({"type": telecom_type, "value": value, "isPublic": True})
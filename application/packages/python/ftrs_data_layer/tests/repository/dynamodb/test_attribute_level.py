@@ -1,7 +1,11 @@
 from unittest.mock import MagicMock
+from uuid import UUID
 
+import pytest
+from ftrs_data_layer.domain import Organisation
 from ftrs_data_layer.repository.dynamodb import AttributeLevelRepository
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
+from pytest_mock import MockerFixture
 
 
 class MockModel(BaseModel):
@@ -193,6 +197,41 @@ def test_doc_parse_item() -> None:
     assert result == MockModel(id="1", name="Test")
 
 
+def test_doc_parse_item_trusted_reads() -> None:
+    """
+    Test that trusted reads skip the expensive custom validators but still
+    coerce stored values to the model types.
+    """
+    repo = AttributeLevelRepository(
+        table_name="test_table",
+        model_cls=Organisation,
+        trusted_reads=True,
+    )
+    item = {
+        "id": "0f0e1c2d-3b4a-4968-8776-655443322110",
+        "field": "document",
+        "identifier_ODS_ODSCode": "ABC123",
+        "active": True,
+        "name": "Test Organisation",
+        "telecom": [
+            {"type": "phone", "value": "not a phone number", "isPublic": True},
+            {"type": "email", "value": "not an email", "isPublic": True},
+        ],
+    }
+
+    result = repo._parse_item(item)
+
+    assert result.id == UUID("0f0e1c2d-3b4a-4968-8776-655443322110")
+    assert [telecom.value for telecom in result.telecom] == [
+        "not a phone number",
+        "not an email",
+    ]
+
+    repo.trusted_reads = False
+    with pytest.raises(ValidationError):
+        repo._parse_item(item)
+
+
 def test_iter_records_single_page() -> None:
     """
     Test the iter_records method of the DocumentLevelRepository when all records fit in a single page.
@@ -304,6 +343,36 @@ def test_iter_records_with_max_results() -> None:
     repo.table.scan.assert_called_once_with(Limit=1, ReturnConsumedCapacity="INDEXES")
 
 
+def test_iter_records_parallel_scan(mocker: MockerFixture) -> None:
+    """
+    Test that iter_records uses a segmented scan when total_segments > 1.
+    """
+    mock_get_resource = mocker.patch(
+        "ftrs_data_layer.repository.dynamodb.repository.get_thread_dynamodb_resource"
+    )
+    thread_table = mock_get_resource.return_value.Table.return_value
+    repo = AttributeLevelRepository(
+        table_name="test_table",
+        model_cls=MockModel,
+    )
+
+    def scan(**kwargs: dict) -> dict:
+        segment = kwargs["Segment"]
+        return {"Items": [{"id": str(segment), "field": "document", "name": "Test"}]}
+
+    thread_table.scan = MagicMock(side_effect=scan)
+
+    results = list(repo.iter_records(max_results=None, total_segments=4))
+
+    assert sorted(result.id for result in results) == ["0", "1", "2", "3"]
+    thread_table.scan.assert_any_call(
+        Segment=0,
+        TotalSegments=4,
+        ReturnConsumedCapacity="INDEXES",
+        Limit=1000,
+    )
+
+
 def test_iter_records_no_results() -> None:
     """
     Test the iter_records method of the DocumentLevelRepository when no records are found.
@@ -474,3 +543,113 @@ def test_get_records_by_provided_by_single_result() -> None:
         ExpressionAttributeValues={":providedBy": organisation_id},
         ReturnConsumedCapacity="INDEXES",
     )
+
+
+def test_get_first_record_by_ods_code() -> None:
+    """
+    Test that get_first_record_by_ods_code only reads a single item.
+    """
+    repo = AttributeLevelRepository(
+        table_name="test_table",
+        model_cls=MockModel,
+    )
+    repo.table.query = MagicMock(
+        return_value={
+            "Items": [{"id": "1", "name": "Test"}],
+            "LastEvaluatedKey": {"id": "1"},
+        }
+    )
+
+    result = repo.get_first_record_by_ods_code("ABC123")
+
+    assert result == MockModel(id="1", name="Test")
+    repo.table.query.assert_called_once_with(
+        KeyConditionExpression="identifier_ODS_ODSCode = :identifier_ODS_ODSCode",
+        ExpressionAttributeValues={":identifier_ODS_ODSCode": "ABC123"},
+        ReturnConsumedCapacity="INDEXES",
+        IndexName="OdsCodeValueIndex",
+        Limit=1,
+    )
+
+
+def test_get_first_record_by_ods_code_no_results() -> None:
+    repo = AttributeLevelRepository(
+        table_name="test_table",
+        model_cls=MockModel,
+    )
+    repo.table.query = MagicMock(return_value={"Items": []})
+
+    assert repo.get_first_record_by_ods_code("ABC123") is None
+
+
+def test_doc_get_many() -> None:
+    """
+    Test that get_many keeps the order of the input ids, including
+    duplicates and ids that were not found.
+    """
+    repo = AttributeLevelRepository(
+        table_name="test_table",
+        model_cls=MockModel,
+    )
+    repo.resource.batch_get_item = MagicMock(
+        return_value={
+            "Responses": {
+                "test_table": [
+                    {"id": "2", "field": "document", "name": "Test2"},
+                    {"id": "1", "field": "document", "name": "Test1"},
+                ]
+            }
+        }
+    )
+
+    result = repo.get_many(["1", "missing", "2", "1"])
+
+    assert result == [
+        MockModel(id="1", name="Test1"),
+        None,
+        MockModel(id="2", name="Test2"),
+        MockModel(id="1", name="Test1"),
+    ]
+    repo.resource.batch_get_item.assert_called_once_with(
+        RequestItems={
+            "test_table": {
+                "Keys": [
+                    {"id": "1", "field": "document"},
+                    {"id": "missing", "field": "document"},
+                    {"id": "2", "field": "document"},
+                ]
+            }
+        },
+        ReturnConsumedCapacity="INDEXES",
+    )
+
+
+def test_doc_get_many_with_projection() -> None:
+    """
+    Test that get_many with a projection always requests the key attributes
+    and returns raw dicts.
+    """
+    repo = AttributeLevelRepository(
+        table_name="test_table",
+        model_cls=MockModel,
+    )
+    repo.resource.batch_get_item = MagicMock(
+        return_value={
+            "Responses": {
+                "test_table": [{"id": "1", "field": "document", "name": "Test1"}]
+            }
+        }
+    )
+
+    result = repo.get_many(["1"], projection=["name"])
+
+    assert result == [{"id": "1", "field": "document", "name": "Test1"}]
+    request = repo.resource.batch_get_item.call_args.kwargs["RequestItems"][
+        "test_table"
+    ]
+    assert request["ProjectionExpression"] == "#proj0, #proj1, #proj2"
+    assert request["ExpressionAttributeNames"] == {
+        "#proj0": "id",
+        "#proj1": "field",
+        "#proj2": "name",
+    }
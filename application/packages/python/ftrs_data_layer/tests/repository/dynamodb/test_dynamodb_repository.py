@@ -1,10 +1,23 @@
-from unittest.mock import Mock
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from unittest.mock import Mock, call
 
 import pytest
 from botocore.exceptions import ClientError
 from ftrs_common.mocks.mock_logger import MockLogger
-from ftrs_data_layer.repository.dynamodb import DynamoDBRepository
+from ftrs_data_layer.repository.dynamodb import (
+    DynamoDBRepository,
+    decode_continuation_token,
+    encode_continuation_token,
+)
+from ftrs_data_layer.repository.dynamodb.repository import (
+    BACKOFF_BASE_SECONDS,
+    BACKOFF_MAX_SECONDS,
+    MAX_UNPROCESSED_RETRIES,
+    backoff_delay,
+)
 from pydantic import BaseModel
+from pytest_mock import MockerFixture
 
 
 class ExampleDDBRepository(DynamoDBRepository):
@@ -383,6 +396,54 @@ def test_dynamodb_query(
     ]
 
 
+def test_dynamodb_query_follows_pagination(
+    mock_logger: MockLogger,
+) -> None:
+    """
+    Test that the _query method follows LastEvaluatedKey across pages
+    """
+
+    class MockModel(BaseModel):
+        id: str
+        name: str
+
+    ddb_repo = ExampleDDBRepository(table_name="test_table", model_cls=MockModel)
+
+    ddb_repo.table.query = Mock(
+        side_effect=[
+            {
+                "Items": [{"id": "123", "name": "first_page"}],
+                "LastEvaluatedKey": {"id": "123"},
+            },
+            {"Items": [{"id": "456", "name": "second_page"}]},
+        ]
+    )
+
+    result = ddb_repo._query(key="id", value="123", IndexName="TestIndex")
+
+    assert result == [
+        MockModel(id="123", name="first_page"),
+        MockModel(id="456", name="second_page"),
+    ]
+    assert ddb_repo.table.query.call_args_list == [
+        call(
+            KeyConditionExpression="id = :id",
+            ExpressionAttributeValues={":id": "123"},
+            ReturnConsumedCapacity="INDEXES",
+            IndexName="TestIndex",
+        ),
+        call(
+            KeyConditionExpression="id = :id",
+            ExpressionAttributeValues={":id": "123"},
+            ReturnConsumedCapacity="INDEXES",
+            IndexName="TestIndex",
+            ExclusiveStartKey={"id": "123"},
+        ),
+    ]
+    expected_page_count = 2
+    assert len(mock_logger.get_log("DDB_CORE_010", "INFO")) == expected_page_count
+
+
 def test_dynamodb_query_error(
     mock_logger: MockLogger,
 ) -> None:
@@ -434,6 +495,156 @@ def test_dynamodb_query_error(
     ]
 
 
+class QueryModel(BaseModel):
+    id: str
+    name: str
+
+
+def test_dynamodb_iter_query_is_lazy(
+    mock_logger: MockLogger,
+) -> None:
+    """
+    Test that iter_query only requests the next page once the current one
+    has been consumed
+    """
+    ddb_repo = ExampleDDBRepository(table_name="test_table", model_cls=QueryModel)
+    ddb_repo.table.query = Mock(
+        side_effect=[
+            {
+                "Items": [{"id": "1", "name": "one"}, {"id": "2", "name": "two"}],
+                "LastEvaluatedKey": {"id": "2"},
+            },
+            {"Items": [{"id": "3", "name": "three"}]},
+        ]
+    )
+
+    results = ddb_repo.iter_query(key="id", value="1", page_size=2)
+    ddb_repo.table.query.assert_not_called()
+
+    assert next(results) == QueryModel(id="1", name="one")
+    assert next(results) == QueryModel(id="2", name="two")
+    ddb_repo.table.query.assert_called_once()
+
+    assert list(results) == [QueryModel(id="3", name="three")]
+    assert ddb_repo.table.query.call_args_list[1] == call(
+        KeyConditionExpression="id = :id",
+        ExpressionAttributeValues={":id": "1"},
+        ReturnConsumedCapacity="INDEXES",
+        Limit=2,
+        ExclusiveStartKey={"id": "2"},
+    )
+
+
+def test_dynamodb_iter_query_max_results_stops_paging(
+    mock_logger: MockLogger,
+) -> None:
+    """
+    Test that iter_query uses max_results as the page size and stops
+    requesting pages once enough items have been returned
+    """
+    ddb_repo = ExampleDDBRepository(table_name="test_table", model_cls=QueryModel)
+    ddb_repo.table.query = Mock(
+        return_value={
+            "Items": [{"id": "1", "name": "one"}],
+            "LastEvaluatedKey": {"id": "1"},
+        }
+    )
+
+    results = list(ddb_repo.iter_query(key="id", value="1", max_results=1))
+
+    assert results == [QueryModel(id="1", name="one")]
+    ddb_repo.table.query.assert_called_once_with(
+        KeyConditionExpression="id = :id",
+        ExpressionAttributeValues={":id": "1"},
+        ReturnConsumedCapacity="INDEXES",
+        Limit=1,
+    )
+
+
+def test_dynamodb_iter_query_with_projection_returns_dicts(
+    mock_logger: MockLogger,
+) -> None:
+    """
+    Test that a projection is sent with placeholder attribute names and that
+    projected items are returned unparsed
+    """
+    ddb_repo = ExampleDDBRepository(table_name="test_table", model_cls=QueryModel)
+    ddb_repo.table.query = Mock(return_value={"Items": [{"id": "1"}]})
+
+    results = list(
+        ddb_repo.iter_query(
+            key="providedBy",
+            value="org-1",
+            projection=["id", "name"],
+            IndexName="ProvidedByIndex",
+        )
+    )
+
+    assert results == [{"id": "1"}]
+    ddb_repo.table.query.assert_called_once_with(
+        KeyConditionExpression="providedBy = :providedBy",
+        ExpressionAttributeValues={":providedBy": "org-1"},
+        ReturnConsumedCapacity="INDEXES",
+        IndexName="ProvidedByIndex",
+        ProjectionExpression="#proj0, #proj1",
+        ExpressionAttributeNames={"#proj0": "id", "#proj1": "name"},
+    )
+
+
+def test_dynamodb_iter_query_pages_continuation_token_round_trip(
+    mock_logger: MockLogger,
+) -> None:
+    """
+    Test that the continuation token of one page resumes the query after it
+    """
+    ddb_repo = ExampleDDBRepository(table_name="test_table", model_cls=QueryModel)
+    last_evaluated_key = {"id": "1", "field": "document", "odsCode": "ABC123"}
+    ddb_repo.table.query = Mock(
+        side_effect=[
+            {
+                "Items": [{"id": "1", "name": "one"}],
+                "LastEvaluatedKey": last_evaluated_key,
+            },
+            {"Items": [{"id": "2", "name": "two"}]},
+        ]
+    )
+
+    first_page = next(ddb_repo.iter_query_pages(key="id", value="1", page_size=1))
+    assert first_page.items == [QueryModel(id="1", name="one")]
+    assert first_page.continuation_token is not None
+
+    second_page = next(
+        ddb_repo.iter_query_pages(
+            key="id",
+            value="1",
+            page_size=1,
+            continuation_token=first_page.continuation_token,
+        )
+    )
+    assert second_page.items == [QueryModel(id="2", name="two")]
+    assert second_page.continuation_token is None
+    assert (
+        ddb_repo.table.query.call_args_list[1].kwargs["ExclusiveStartKey"]
+        == last_evaluated_key
+    )
+
+
+def test_encode_continuation_token_preserves_numbers() -> None:
+    key = {"id": "1", "order": Decimal(3)}
+
+    token = encode_continuation_token(key)
+
+    assert decode_continuation_token(token) == key
+    assert encode_continuation_token(None) is None
+    assert encode_continuation_token({}) is None
+
+
+@pytest.mark.parametrize("token", ["not-base64!", "bm90LWpzb24=", "WzFd"])
+def test_decode_continuation_token_invalid(token: str) -> None:
+    with pytest.raises(ValueError, match="Invalid continuation token"):
+        decode_continuation_token(token)
+
+
 def test_dynamodb_batch_write(
     mock_logger: MockLogger,
 ) -> None:
@@ -565,16 +776,20 @@ def test_dynamodb_batch_write_error(
 
 
 def test_dynamodb_batch_write_unprocessed_items(
-    mock_logger: MockLogger,
+    mock_logger: MockLogger, mocker: MockerFixture
 ) -> None:
     """
-    Test that the _batch_write method handles unprocessed items correctly
+    Test that the _batch_write method retries unprocessed items and raises
+    once the retries are exhausted
     """
 
     class MockModel(BaseModel):
         id: str
         name: str
 
+    mock_sleep = mocker.patch(
+        "ftrs_data_layer.repository.dynamodb.repository.time.sleep"
+    )
     ddb_repo = ExampleDDBRepository(table_name="test_table", model_cls=MockModel)
 
     # Mock the batch_write_item method to return unprocessed items
@@ -594,6 +809,8 @@ def test_dynamodb_batch_write_unprocessed_items(
     with pytest.raises(RuntimeError):
         ddb_repo._batch_write(put_items=put_items, delete_items=delete_items)
 
+    assert mock_sleep.call_count == MAX_UNPROCESSED_RETRIES
+    assert ddb_repo.resource.batch_write_item.call_count == MAX_UNPROCESSED_RETRIES + 1
     assert mock_logger.get_log("DDB_CORE_015", "ERROR") == [
         {
             "reference": "DDB_CORE_015",
@@ -608,7 +825,6 @@ def test_dynamodb_batch_write_unprocessed_items(
                                     "Item": {"id": "123", "name": "test_item"}
                                 }
                             },
-                            {"DeleteRequest": {"Key": {"id": "456"}}},
                         ]
                     },
                     "ReturnConsumedCapacity": "INDEXES",
@@ -621,6 +837,133 @@ def test_dynamodb_batch_write_unprocessed_items(
             },
         }
     ]
+    assert mock_logger.was_logged("DDB_CORE_022", "INFO") is False
+
+
+def test_dynamodb_batch_write_retries_unprocessed_items(
+    mock_logger: MockLogger, mocker: MockerFixture
+) -> None:
+    """
+    Test that unprocessed items are resent on their own after a backoff delay
+    """
+
+    class MockModel(BaseModel):
+        id: str
+
+    mock_sleep = mocker.patch(
+        "ftrs_data_layer.repository.dynamodb.repository.time.sleep"
+    )
+    ddb_repo = ExampleDDBRepository(table_name="test_table", model_cls=MockModel)
+    unprocessed = {"test_table": [{"PutRequest": {"Item": {"id": "2"}}}]}
+    ddb_repo.resource.batch_write_item = Mock(
+        side_effect=[
+            {
+                "UnprocessedItems": unprocessed,
+                "ConsumedCapacity": [{"TableName": "test_table", "CapacityUnits": 1.0}],
+            },
+            {
+                "UnprocessedItems": {},
+                "ConsumedCapacity": [{"TableName": "test_table", "CapacityUnits": 1.0}],
+            },
+        ]
+    )
+
+    with ddb_repo.batch_writer() as writer:
+        writer.put({"id": "1"})
+        writer.put({"id": "2"})
+
+    mock_sleep.assert_called_once()
+    assert ddb_repo.resource.batch_write_item.call_args_list[1] == call(
+        RequestItems=unprocessed, ReturnConsumedCapacity="INDEXES"
+    )
+    assert writer.report.item_count == 2  # noqa: PLR2004
+    assert writer.report.request_count == 2  # noqa: PLR2004
+    assert writer.report.retry_count == 1
+    assert writer.report.consumed_capacity_units == 2.0  # noqa: PLR2004
+
+
+def test_dynamodb_batch_writer_chunks_items(mock_logger: MockLogger) -> None:
+    """
+    Test that the batch writer flushes every 25 items and sends the
+    remainder on exit, then logs a summary
+    """
+
+    class MockModel(BaseModel):
+        id: str
+
+    ddb_repo = ExampleDDBRepository(table_name="test_table", model_cls=MockModel)
+    ddb_repo.resource.batch_write_item = Mock(return_value={"UnprocessedItems": {}})
+
+    with ddb_repo.batch_writer() as writer:
+        for index in range(60):
+            writer.put({"id": str(index)})
+        assert ddb_repo.resource.batch_write_item.call_count == 2  # noqa: PLR2004
+
+    assert [
+        len(call.kwargs["RequestItems"]["test_table"])
+        for call in ddb_repo.resource.batch_write_item.call_args_list
+    ] == [25, 25, 10]
+    summary = mock_logger.get_log("DDB_CORE_022", "INFO")[0]["detail"]
+    assert summary["item_count"] == 60  # noqa: PLR2004
+    assert summary["request_count"] == 3  # noqa: PLR2004
+    assert summary["retry_count"] == 0
+
+
+def test_dynamodb_batch_writer_concurrent(
+    mock_logger: MockLogger, mocker: MockerFixture
+) -> None:
+    """
+    Test that chunks are sent on worker threads, each with its own resource,
+    and every item is written
+    """
+
+    class MockModel(BaseModel):
+        id: str
+
+    mock_get_resource = mocker.patch(
+        "ftrs_data_layer.repository.dynamodb.repository.get_thread_dynamodb_resource"
+    )
+    thread_resource = mock_get_resource.return_value
+    thread_resource.batch_write_item = Mock(return_value={"UnprocessedItems": {}})
+    ddb_repo = ExampleDDBRepository(table_name="test_table", model_cls=MockModel)
+    ddb_repo.resource.batch_write_item = Mock()
+
+    with ddb_repo.batch_writer(max_workers=3) as writer:
+        for index in range(100):
+            writer.put({"id": str(index)})
+        writer.delete({"id": "old"})
+
+    ddb_repo.resource.batch_write_item.assert_not_called()
+    written = [
+        request
+        for call in thread_resource.batch_write_item.call_args_list
+        for request in call.kwargs["RequestItems"]["test_table"]
+    ]
+    assert len(written) == 101  # noqa: PLR2004
+    assert {"DeleteRequest": {"Key": {"id": "old"}}} in written
+    assert writer.report.item_count == 101  # noqa: PLR2004
+
+
+def test_dynamodb_batch_writer_does_not_flush_on_error(
+    mock_logger: MockLogger,
+) -> None:
+    """
+    Test that buffered items are discarded if the with block raises
+    """
+
+    class MockModel(BaseModel):
+        id: str
+
+    ddb_repo = ExampleDDBRepository(table_name="test_table", model_cls=MockModel)
+    ddb_repo.resource.batch_write_item = Mock(return_value={"UnprocessedItems": {}})
+
+    with pytest.raises(ValueError, match="boom"), ddb_repo.batch_writer() as writer:
+        writer.put({"id": "1"})
+        error_msg = "boom"
+        raise ValueError(error_msg)
+
+    ddb_repo.resource.batch_write_item.assert_not_called()
+    assert mock_logger.was_logged("DDB_CORE_022", "INFO") is False
 
 
 def test_dynamodb_scan() -> None:
@@ -655,3 +998,292 @@ def test_dynamodb_scan() -> None:
     ddb_repo.table.scan.assert_called_once_with(
         Limit=1000, ReturnConsumedCapacity="INDEXES"
     )
+
+
+@pytest.fixture
+def thread_table(mocker: MockerFixture) -> Mock:
+    """
+    Table used by worker threads, which build their own resource rather than
+    sharing the repository's.
+    """
+    mock_get_resource = mocker.patch(
+        "ftrs_data_layer.repository.dynamodb.repository.get_thread_dynamodb_resource"
+    )
+    return mock_get_resource.return_value.Table.return_value
+
+
+def _segmented_scan(pages_per_segment: int, items_per_page: int = 2) -> Mock:
+    """
+    Build a table.scan mock that returns distinct pages for each segment.
+    """
+
+    def scan(**kwargs: dict) -> dict:
+        segment = kwargs["Segment"]
+        page = kwargs.get("ExclusiveStartKey", {}).get("page", 0)
+        response = {
+            "Items": [
+                {"id": f"{segment}-{page}-{index}"} for index in range(items_per_page)
+            ],
+            "ConsumedCapacity": {"TableName": "test_table", "CapacityUnits": 0.5},
+        }
+        if page + 1 < pages_per_segment:
+            response["LastEvaluatedKey"] = {"page": page + 1}
+        return response
+
+    return Mock(side_effect=scan)
+
+
+def test_dynamodb_parallel_scan(mock_logger: MockLogger, thread_table: Mock) -> None:
+    """
+    Test that _parallel_scan merges every page of every segment and reports
+    consumed capacity per segment
+    """
+
+    class MockModel(BaseModel):
+        id: str
+
+    total_segments = 3
+    pages_per_segment = 2
+    items_per_segment = 4
+    ddb_repo = ExampleDDBRepository(table_name="test_table", model_cls=MockModel)
+    ddb_repo.table.scan = Mock()
+    thread_table.scan = _segmented_scan(pages_per_segment)
+
+    result = list(ddb_repo._parallel_scan(total_segments, Limit=50))
+
+    assert sorted(item["id"] for item in result) == sorted(
+        f"{segment}-{page}-{index}"
+        for segment in range(total_segments)
+        for page in range(pages_per_segment)
+        for index in range(2)
+    )
+    thread_table.scan.assert_any_call(
+        Segment=0,
+        TotalSegments=total_segments,
+        ReturnConsumedCapacity="INDEXES",
+        Limit=50,
+    )
+    ddb_repo.table.scan.assert_not_called()
+
+    segment_logs = mock_logger.get_log("DDB_CORE_016", "INFO")
+    assert sorted(log["detail"]["segment"] for log in segment_logs) == [0, 1, 2]
+    assert all(
+        log["detail"]["consumed_capacity_units"] == 1.0
+        and log["detail"]["item_count"] == items_per_segment
+        for log in segment_logs
+    )
+
+
+def test_dynamodb_parallel_scan_single_segment_uses_scan(
+    mock_logger: MockLogger,
+) -> None:
+    """
+    Test that a single segment falls back to the sequential scan
+    """
+
+    class MockModel(BaseModel):
+        id: str
+
+    ddb_repo = ExampleDDBRepository(table_name="test_table", model_cls=MockModel)
+    ddb_repo.table.scan = Mock(return_value={"Items": [{"id": "1"}]})
+
+    assert list(ddb_repo._parallel_scan(1)) == [{"id": "1"}]
+    ddb_repo.table.scan.assert_called_once_with(
+        Limit=1000, ReturnConsumedCapacity="INDEXES"
+    )
+
+
+def test_dynamodb_parallel_scan_error(
+    mock_logger: MockLogger, thread_table: Mock
+) -> None:
+    """
+    Test that an error in one segment is raised to the consumer and logged
+    """
+
+    class MockModel(BaseModel):
+        id: str
+
+    ddb_repo = ExampleDDBRepository(table_name="test_table", model_cls=MockModel)
+    thread_table.scan = Mock(
+        side_effect=ClientError(
+            {"Error": {"Code": "TestException", "Message": "Test exception"}},
+            operation_name="Scan",
+        )
+    )
+
+    with pytest.raises(ClientError):
+        list(ddb_repo._parallel_scan(2))
+
+    assert mock_logger.was_logged("DDB_CORE_017", "ERROR") is True
+
+
+def test_dynamodb_parallel_scan_stops_workers_when_closed(
+    mock_logger: MockLogger, thread_table: Mock
+) -> None:
+    """
+    Test that closing the iterator early stops the segment workers instead
+    of scanning the whole table
+    """
+
+    class MockModel(BaseModel):
+        id: str
+
+    pages_per_segment = 100
+    ddb_repo = ExampleDDBRepository(table_name="test_table", model_cls=MockModel)
+    thread_table.scan = _segmented_scan(pages_per_segment)
+
+    results = ddb_repo._parallel_scan(2, max_buffered_pages=1)
+    first = next(results)
+    results.close()
+
+    assert first["id"].endswith("-0-0")
+    assert thread_table.scan.call_count < 2 * pages_per_segment
+    assert mock_logger.was_logged("DDB_CORE_016", "INFO") is False
+
+
+def test_dynamodb_repository_uses_own_resource_on_worker_threads(
+    mock_logger: MockLogger, mocker: MockerFixture
+) -> None:
+    """
+    Test that worker threads get a resource of their own, as boto3 resources
+    are not thread-safe
+    """
+
+    class MockModel(BaseModel):
+        id: str
+
+    mock_get_resource = mocker.patch(
+        "ftrs_data_layer.repository.dynamodb.repository.get_thread_dynamodb_resource"
+    )
+    ddb_repo = ExampleDDBRepository(
+        table_name="test_table",
+        model_cls=MockModel,
+        endpoint_url="http://localhost:8000",
+    )
+
+    assert ddb_repo._resource_for_thread() is ddb_repo.resource
+    assert ddb_repo._table_for_thread() is ddb_repo.table
+    mock_get_resource.assert_not_called()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        resource = executor.submit(ddb_repo._resource_for_thread).result()
+        table = executor.submit(ddb_repo._table_for_thread).result()
+
+    assert resource is mock_get_resource.return_value
+    assert table is mock_get_resource.return_value.Table.return_value
+    mock_get_resource.assert_called_with("http://localhost:8000")
+    mock_get_resource.return_value.Table.assert_called_once_with("test_table")
+
+
+def test_dynamodb_query_on_worker_thread_uses_thread_table(
+    mock_logger: MockLogger, thread_table: Mock
+) -> None:
+    """
+    Test that a query run on a worker thread does not use the shared resource
+    """
+
+    class MockModel(BaseModel):
+        id: str
+
+    ddb_repo = ExampleDDBRepository(table_name="test_table", model_cls=MockModel)
+    ddb_repo.table.query = Mock()
+    thread_table.query = Mock(return_value={"Items": [{"id": "1"}]})
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        records = executor.submit(ddb_repo._query, "id", "1").result()
+
+    assert records == [MockModel(id="1")]
+    thread_table.query.assert_called_once()
+    ddb_repo.table.query.assert_not_called()
+
+
+def test_dynamodb_batch_get_chunks_keys(mock_logger: MockLogger) -> None:
+    """
+    Test that _batch_get sends at most 100 keys per BatchGetItem request
+    """
+
+    class MockModel(BaseModel):
+        id: str
+
+    ddb_repo = ExampleDDBRepository(table_name="test_table", model_cls=MockModel)
+    ddb_repo.resource.batch_get_item = Mock(
+        side_effect=lambda **kwargs: {
+            "Responses": {"test_table": kwargs["RequestItems"]["test_table"]["Keys"]}
+        }
+    )
+    keys = [{"id": str(index)} for index in range(250)]
+
+    result = ddb_repo._batch_get(keys)
+
+    assert result == keys
+    assert [
+        len(call.kwargs["RequestItems"]["test_table"]["Keys"])
+        for call in ddb_repo.resource.batch_get_item.call_args_list
+    ] == [100, 100, 50]
+
+
+def test_dynamodb_batch_get_retries_unprocessed_keys(
+    mock_logger: MockLogger, mocker: MockerFixture
+) -> None:
+    """
+    Test that unprocessed keys are retried after a backoff delay
+    """
+
+    class MockModel(BaseModel):
+        id: str
+
+    mock_sleep = mocker.patch(
+        "ftrs_data_layer.repository.dynamodb.repository.time.sleep"
+    )
+    ddb_repo = ExampleDDBRepository(table_name="test_table", model_cls=MockModel)
+    ddb_repo.resource.batch_get_item = Mock(
+        side_effect=[
+            {
+                "Responses": {"test_table": [{"id": "1"}]},
+                "UnprocessedKeys": {"test_table": {"Keys": [{"id": "2"}]}},
+            },
+            {"Responses": {"test_table": [{"id": "2"}]}, "UnprocessedKeys": {}},
+        ]
+    )
+
+    result = ddb_repo._batch_get([{"id": "1"}, {"id": "2"}])
+
+    assert result == [{"id": "1"}, {"id": "2"}]
+    mock_sleep.assert_called_once()
+    assert ddb_repo.resource.batch_get_item.call_args_list[1] == call(
+        RequestItems={"test_table": {"Keys": [{"id": "2"}]}},
+        ReturnConsumedCapacity="INDEXES",
+    )
+
+
+def test_dynamodb_batch_get_gives_up_after_max_retries(
+    mock_logger: MockLogger, mocker: MockerFixture
+) -> None:
+    """
+    Test that _batch_get raises once unprocessed keys exhaust the retries
+    """
+
+    class MockModel(BaseModel):
+        id: str
+
+    mock_sleep = mocker.patch(
+        "ftrs_data_layer.repository.dynamodb.repository.time.sleep"
+    )
+    ddb_repo = ExampleDDBRepository(table_name="test_table", model_cls=MockModel)
+    ddb_repo.resource.batch_get_item = Mock(
+        return_value={
+            "Responses": {"test_table": []},
+            "UnprocessedKeys": {"test_table": {"Keys": [{"id": "1"}]}},
+        }
+    )
+
+    with pytest.raises(RuntimeError, match="Unprocessed keys in batch get"):
+        ddb_repo._batch_get([{"id": "1"}])
+
+    assert mock_sleep.call_count == MAX_UNPROCESSED_RETRIES
+    assert mock_logger.was_logged("DDB_CORE_021", "ERROR") is True
+
+
+def test_backoff_delay_is_capped() -> None:
+    assert 0 <= backoff_delay(0) <= BACKOFF_BASE_SECONDS
+    assert 0 <= backoff_delay(100) <= BACKOFF_MAX_SECONDS
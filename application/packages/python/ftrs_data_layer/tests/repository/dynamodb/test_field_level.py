@@ -2,6 +2,7 @@ from unittest.mock import MagicMock
 
 import pytest
 from ftrs_data_layer.repository.dynamodb import FieldLevelRepository
+from ftrs_data_layer.repository.dynamodb.field_level import ITER_RECORDS_BATCH_SIZE
 from pydantic import BaseModel
 
 
@@ -453,12 +454,12 @@ def test_iter_records() -> None:
         model_cls=MockModel,
     )
 
-    # Mock the _iter_record_ids and get methods
+    # Mock the _iter_record_ids and get_many methods
     repo._iter_record_ids = MagicMock(
         return_value=[("1", "createdDateTime"), ("2", "createdDateTime")]
     )
-    repo.get = MagicMock(
-        side_effect=[
+    repo.get_many = MagicMock(
+        return_value=[
             MockModel(id="1", name="Test1", description="Description1"),
             MockModel(id="2", name="Test2", description="Description2"),
         ]
@@ -473,5 +474,69 @@ def test_iter_records() -> None:
     ]
 
     repo._iter_record_ids.assert_called_once_with(10)
-    repo.get.assert_any_call("1")
-    repo.get.assert_any_call("2")
+    repo.get_many.assert_called_once_with(["1", "2"])
+
+
+def test_iter_records_batches_ids() -> None:
+    """
+    Test that iter_records resolves ids in batches rather than one at a time.
+    """
+    repo = FieldLevelRepository(
+        table_name="test_table",
+        model_cls=MockModel,
+    )
+    record_count = ITER_RECORDS_BATCH_SIZE + 1
+    repo._iter_record_ids = MagicMock(
+        return_value=[(str(index), "createdDateTime") for index in range(record_count)]
+    )
+    repo.get_many = MagicMock(side_effect=lambda ids: [f"record-{id}" for id in ids])
+
+    result = list(repo.iter_records(max_results=None))
+
+    assert result == [f"record-{index}" for index in range(record_count)]
+    assert [len(call.args[0]) for call in repo.get_many.call_args_list] == [
+        ITER_RECORDS_BATCH_SIZE,
+        1,
+    ]
+
+
+def test_field_get_many() -> None:
+    """
+    Test that get_many requests every model field per id and regroups the
+    items into documents in the order of the input ids.
+    """
+    repo = FieldLevelRepository(
+        table_name="test_table",
+        model_cls=MockModel,
+    )
+    repo.resource.batch_get_item = MagicMock(
+        return_value={
+            "Responses": {
+                "test_table": [
+                    {"id": "2", "field": "name", "value": "Test2"},
+                    {"id": "1", "field": "description", "value": "Description1"},
+                    {"id": "2", "field": "description", "value": "Description2"},
+                    {"id": "1", "field": "name", "value": "Test1"},
+                ]
+            }
+        }
+    )
+
+    result = repo.get_many(["1", "missing", "2"])
+
+    assert result == [
+        MockModel(id="1", name="Test1", description="Description1"),
+        None,
+        MockModel(id="2", name="Test2", description="Description2"),
+    ]
+    requested_keys = repo.resource.batch_get_item.call_args.kwargs["RequestItems"][
+        "test_table"
+    ]["Keys"]
+    assert requested_keys == [
+        {"id": "1", "field": "name"},
+        {"id": "1", "field": "description"},
+        {"id": "missing", "field": "name"},
+        {"id": "missing", "field": "description"},
+        {"id": "2", "field": "name"},
+        {"id": "2", "field": "description"},
+    ]
@@ -1,4 +1,10 @@
-from ftrs_data_layer.client import get_dynamodb_client, get_dynamodb_resource
+from concurrent.futures import ThreadPoolExecutor
+
+from ftrs_data_layer.client import (
+    get_dynamodb_client,
+    get_dynamodb_resource,
+    get_thread_dynamodb_resource,
+)
 
 
 def test_get_dynamo_client_is_cached() -> None:
@@ -15,3 +21,17 @@ def test_get_dynamo_resource_is_cached() -> None:
 
     second_resource = get_dynamodb_resource()
     assert resource is second_resource
+
+
+def test_get_thread_dynamo_resource_is_per_thread() -> None:
+    resource = get_thread_dynamodb_resource()
+    assert get_thread_dynamodb_resource() is resource
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        worker_resources = list(
+            executor.map(lambda _: get_thread_dynamodb_resource(), range(2))
+        )
+
+    assert worker_resources[0] is worker_resources[1]
+    assert worker_resources[0] is not resource
+    assert worker_resources[0] is not get_dynamodb_resource()
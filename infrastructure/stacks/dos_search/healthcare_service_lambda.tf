@@ -34,6 +34,7 @@ module "healthcare_service_lambda" {
     "APPCONFIG_APPLICATION_ID"           = data.aws_ssm_parameter.appconfig_application_id.value
     "APPCONFIG_ENVIRONMENT_ID"           = local.appconfig_environment_id
     "APPCONFIG_CONFIGURATION_PROFILE_ID" = local.appconfig_configuration_profile_id
+    "VALIDATE_FHIR_RESPONSES"            = var.validate_fhir_responses
   }
 
   allowed_triggers = {
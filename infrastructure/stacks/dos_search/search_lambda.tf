@@ -44,9 +44,13 @@ module "lambda" {
   security_group_ids = [try(aws_security_group.dos_search_lambda_security_group[0].id, data.aws_security_group.dos_search_lambda_security_group[0].id)]
 
   environment_variables = {
-    "ENVIRONMENT"  = var.environment
-    "PROJECT_NAME" = var.project
-    "WORKSPACE"    = terraform.workspace == "default" ? "" : terraform.workspace
+    "ENVIRONMENT"                    = var.environment
+    "PROJECT_NAME"                   = var.project
+    "WORKSPACE"                      = terraform.workspace == "default" ? "" : terraform.workspace
+    "ODS_CACHE_MAX_SIZE"             = var.ods_cache_max_size
+    "ODS_CACHE_TTL_SECONDS"          = var.ods_cache_ttl_seconds
+    "ODS_CACHE_NEGATIVE_TTL_SECONDS" = var.ods_cache_negative_ttl_seconds
+    "VALIDATE_FHIR_RESPONSES"        = var.validate_fhir_responses
   }
 
   allowed_triggers = {
@@ -32,6 +32,30 @@ variable "lambda_timeout" {
   type        = number
 }
 
+variable "ods_cache_max_size" {
+  description = "Maximum number of ODS code lookups cached in each warm search lambda container"
+  type        = number
+  default     = 1000
+}
+
+variable "ods_cache_ttl_seconds" {
+  description = "How long an organisation found by ODS code is cached, in seconds"
+  type        = number
+  default     = 300
+}
+
+variable "ods_cache_negative_ttl_seconds" {
+  description = "How long an unknown ODS code is cached, in seconds"
+  type        = number
+  default     = 60
+}
+
+variable "validate_fhir_responses" {
+  description = "Whether the search lambdas validate each FHIR Bundle against the R4B models before returning it"
+  type        = bool
+  default     = true
+}
+
 #####################################################
 
 # API Gateway
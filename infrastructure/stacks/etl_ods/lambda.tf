@@ -173,11 +173,12 @@ module "consumer_lambda" {
   )
 
   environment_variables = {
-    "ENVIRONMENT"       = var.environment
-    "WORKSPACE"         = terraform.workspace == "default" ? "" : terraform.workspace
-    "PROJECT_NAME"      = var.project
-    "APIM_URL"          = "${var.apim_base_url}/${var.apim_dos_ingest_path_segment}${local.workspace_suffix}/FHIR/R4"
-    "MAX_RECEIVE_COUNT" = tostring(var.max_receive_count)
+    "ENVIRONMENT"              = var.environment
+    "WORKSPACE"                = terraform.workspace == "default" ? "" : terraform.workspace
+    "PROJECT_NAME"             = var.project
+    "APIM_URL"                 = "${var.apim_base_url}/${var.apim_dos_ingest_path_segment}${local.workspace_suffix}/FHIR/R4"
+    "MAX_RECEIVE_COUNT"        = tostring(var.max_receive_count)
+    "CONSUMER_MAX_CONCURRENCY" = tostring(var.consumer_max_concurrency)
   }
 
   account_id     = data.aws_caller_identity.current.account_id
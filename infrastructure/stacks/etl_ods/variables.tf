@@ -110,6 +110,12 @@ variable "consumer_lambda_logs_retention" {
   default     = 14
 }
 
+variable "consumer_max_concurrency" {
+  description = "The maximum number of PUT requests the consumer lambda sends at once from a batch"
+  type        = number
+  default     = 10
+}
+
 variable "ods_api_page_limit" {
   description = "The maximum number of organisations to retrieve per page from the ODS API"
   type        = number
@@ -1,10 +1,12 @@
 import asyncio
+import os
 from enum import StrEnum
+from time import perf_counter
 from typing import Annotated, List
 
 import rich
 from aws_lambda_powertools.utilities.data_classes.sqs_event import SQSRecord
-from typer import Option, Typer
+from typer import BadParameter, Option, Typer
 
 from common.config import DatabaseConfig
 from queue_populator.config import QueuePopulatorConfig
@@ -13,6 +15,9 @@ from seeding.export_to_s3 import run_s3_export
 from seeding.restore import run_s3_restore
 from service_migration.application import DataMigrationApplication, DMSEvent
 from service_migration.config import DataMigrationConfig
+from service_migration.dry_run import DryRunApplication, DryRunReport, dry_run_shard
+from service_migration.full_sync import iter_parallel_full_sync
+from service_migration.models import FullSyncShard, ServiceMigrationMetrics
 
 CONSOLE = rich.get_console()
 
@@ -47,20 +52,75 @@ def migrate_handler(  # noqa: PLR0913
     service_id: Annotated[
         str | None, Option(help="Service ID to migrate (for single record sync)")
     ] = None,
+    workers: Annotated[
+        int | None,
+        Option(
+            min=1,
+            help="Number of worker processes for a full sync "
+            "(default 1, or every core for a dry run)",
+        ),
+    ] = None,
+    shard: Annotated[
+        str | None,
+        Option(help="Only migrate this shard of a full sync, given as index/count"),
+    ] = None,
+    dry_run: Annotated[
+        bool,
+        Option(
+            "--dry-run",
+            help="Transform and validate services without reading or writing DynamoDB",
+        ),
+    ] = False,
+    report: Annotated[
+        str, Option(help="Path to write the dry run report to, as CSV")
+    ] = "dry-run-report.csv",
 ) -> None:
     """
     Local entrypoint for testing the data migration.
     This function can be used to run the full or single sync process locally.
+    A full sync can be split across worker processes, and across machines by shard.
+    A dry run writes a report of what the migration would do instead of writing
+    to DynamoDB.
     """
-    app = DataMigrationApplication(
-        config=DataMigrationConfig(
-            db_config=DatabaseConfig.from_uri(db_uri),
-            ENVIRONMENT=env,
-            WORKSPACE=workspace,
-            ENDPOINT_URL=ddb_endpoint_url,
-        ),
+    config = DataMigrationConfig(
+        db_config=DatabaseConfig.from_uri(db_uri),
+        ENVIRONMENT=env,
+        WORKSPACE=workspace,
+        ENDPOINT_URL=ddb_endpoint_url,
     )
 
+    try:
+        full_sync_shard = FullSyncShard.parse(shard) if shard else None
+    except ValueError as e:
+        raise BadParameter(str(e), param_hint="--shard") from e
+
+    if workers is None:
+        workers = (os.cpu_count() or 1) if dry_run else 1
+
+    if dry_run:
+        with DryRunReport(report) as dry_run_report:
+            if service_id:
+                app = DryRunApplication(config=config)
+                app.processor.sync_service(int(service_id), "insert")
+                dry_run_report.write(app.processor.report_rows())
+                metrics = app.processor.metrics
+            else:
+                metrics = run_dry_run(
+                    config,
+                    (full_sync_shard or FullSyncShard(index=0, count=1)).split(workers),
+                    dry_run_report,
+                )
+        print_dry_run_summary(metrics, dry_run_report)
+        return
+
+    if not service_id and workers > 1:
+        run_parallel_full_sync(
+            config, (full_sync_shard or FullSyncShard(index=0, count=1)).split(workers)
+        )
+        return
+
+    app = DataMigrationApplication(config=config)
+
     if service_id:
         event = DMSEvent(
             type="dms_event",
@@ -76,10 +136,89 @@ def migrate_handler(  # noqa: PLR0913
             }
         )
         app.handle_sqs_record(record)
+    elif full_sync_shard:
+        app.handle_full_sync_event(shard=full_sync_shard)
     else:
         app.handle_full_sync_event()
 
 
+def run_parallel_full_sync(
+    config: DataMigrationConfig, shards: list[FullSyncShard]
+) -> ServiceMigrationMetrics:
+    """
+    Run the full sync shards in parallel worker processes, reporting progress as
+    each shard completes and the combined metrics and throughput at the end.
+    """
+    CONSOLE.print(f"Running full sync across {len(shards)} worker processes")
+
+    start_time = perf_counter()
+    metrics = ServiceMigrationMetrics()
+
+    for completed, (shard, shard_metrics) in enumerate(
+        iter_parallel_full_sync(config, shards), start=1
+    ):
+        metrics.add(shard_metrics)
+        elapsed_time = perf_counter() - start_time
+        CONSOLE.print(
+            f"Shard {shard} complete ({completed}/{len(shards)}): "
+            f"{shard_metrics.total} services, {shard_metrics.errors} errors, "
+            f"{elapsed_time:.1f}s elapsed",
+            style="bright_black",
+        )
+
+    elapsed_time = perf_counter() - start_time
+    CONSOLE.print(
+        f"Full sync complete: {metrics.total} services in {elapsed_time:.1f}s "
+        f"({metrics.total / elapsed_time:.1f} services per second)"
+    )
+    CONSOLE.print(metrics.model_dump())
+    return metrics
+
+
+def run_dry_run(
+    config: DataMigrationConfig, shards: list[FullSyncShard], report: DryRunReport
+) -> ServiceMigrationMetrics:
+    """
+    Dry run the full sync shards in parallel worker processes, writing the report
+    rows of each shard as it completes.
+    """
+    CONSOLE.print(f"Running dry run across {len(shards)} worker processes")
+
+    start_time = perf_counter()
+    metrics = ServiceMigrationMetrics()
+
+    for completed, (shard, (rows, shard_metrics)) in enumerate(
+        iter_parallel_full_sync(config, shards, worker=dry_run_shard), start=1
+    ):
+        report.write(rows)
+        metrics.add(shard_metrics)
+        elapsed_time = perf_counter() - start_time
+        CONSOLE.print(
+            f"Shard {shard} complete ({completed}/{len(shards)}): "
+            f"{shard_metrics.total} services, {shard_metrics.errors} errors, "
+            f"{elapsed_time:.1f}s elapsed",
+            style="bright_black",
+        )
+
+    elapsed_time = perf_counter() - start_time
+    CONSOLE.print(
+        f"Dry run complete: {metrics.total} services in {elapsed_time:.1f}s "
+        f"({metrics.total / elapsed_time:.1f} services per second)"
+    )
+    return metrics
+
+
+def print_dry_run_summary(
+    metrics: ServiceMigrationMetrics, report: DryRunReport
+) -> None:
+    """
+    Print the metrics, outcomes and insert counts of a dry run.
+    """
+    CONSOLE.print(metrics.model_dump())
+    CONSOLE.print({"outcomes": dict(report.outcomes), "inserts": dict(report.inserts)})
+    CONSOLE.print(f"Dry run report written to {report.path}")
+
+
 @typer_app.command("populate-queue")
 def populate_queue_handler(
     db_uri: Annotated[str, Option(..., help="URI to connect to the source database")],
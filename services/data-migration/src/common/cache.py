@@ -1,4 +1,8 @@
-from typing import Generic, TypeVar
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Generic, TypeVar
 
 from ftrs_data_layer.domain.legacy import (
     Disposition,
@@ -7,13 +11,24 @@ from ftrs_data_layer.domain.legacy import (
     SymptomDiscriminator,
     SymptomGroup,
 )
-from sqlalchemy import Engine
+from sqlalchemy import Engine, inspect
 from sqlalchemy.orm import joinedload
 from sqlmodel import Session, SQLModel, select
 
 T = TypeVar("T", bound=SQLModel)
 
 
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Hit and miss counts for a cache since it was created.
+    """
+
+    hits: int
+    misses: int
+    size: int
+
+
 class SQLModelKVCache(Generic[T]):
     """
     A simple key-value cache for storing and retrieving data.
@@ -24,6 +39,8 @@ class SQLModelKVCache(Generic[T]):
         self.engine = engine
         self.model = model
         self.prejoin = prejoin
+        self.hits = 0
+        self.misses = 0
 
     def get(self, key: int) -> T:
         """
@@ -31,8 +48,10 @@ class SQLModelKVCache(Generic[T]):
         If the item is not found in the cache, it will be fetched from the database.
         """
         if cached_item := self.cache.get(key):
+            self.hits += 1
             return cached_item
 
+        self.misses += 1
         if item := self._retrieve_item(key):
             self.cache[key] = item
             return item
@@ -41,6 +60,73 @@ class SQLModelKVCache(Generic[T]):
             f"Item with key {key} and model {self.model.__name__} not found in cache or database"
         )
 
+    def warm(self) -> None:
+        """
+        Load every row of the table into the cache in a single query.
+        Keys missing after warming, such as rows added since, are still read
+        from the database on demand.
+        """
+        with Session(self.engine) as session:
+            stmt = select(self.model)
+            if self.prejoin:
+                stmt = stmt.options(joinedload("*"))
+
+            self.cache.update((item.id, item) for item in session.exec(stmt).unique())
+
+    def stats(self) -> CacheStats:
+        return CacheStats(hits=self.hits, misses=self.misses, size=len(self.cache))
+
+    def dump(self) -> list[dict[str, Any]]:
+        """
+        Return the cached rows, with any prejoined relationships, as JSON-compatible dicts.
+        """
+        return [self._dump_item(item) for item in self.cache.values()]
+
+    def load(self, rows: list[dict[str, Any]]) -> None:
+        """
+        Populate the cache from rows returned by dump.
+        """
+        for row in rows:
+            item = self.model.model_validate(row)
+            for key, value in self._load_relationships(row).items():
+                setattr(item, key, value)
+            self.cache[item.id] = item
+
+    def _dump_item(self, item: T) -> dict[str, Any]:
+        data = item.model_dump(mode="json")
+        if not self.prejoin:
+            return data
+
+        for relationship in inspect(self.model).relationships:
+            value = getattr(item, relationship.key)
+            if relationship.uselist:
+                data[relationship.key] = [
+                    related.model_dump(mode="json") for related in value
+                ]
+            else:
+                data[relationship.key] = value and value.model_dump(mode="json")
+
+        return data
+
+    def _load_relationships(self, row: dict[str, Any]) -> dict[str, Any]:
+        if not self.prejoin:
+            return {}
+
+        relationships = {}
+        for relationship in inspect(self.model).relationships:
+            related_model = relationship.mapper.class_
+            value = row.get(relationship.key)
+            if relationship.uselist:
+                relationships[relationship.key] = [
+                    related_model.model_validate(related) for related in value or []
+                ]
+            else:
+                relationships[relationship.key] = (
+                    related_model.model_validate(value) if value else None
+                )
+
+        return relationships
+
     def _retrieve_item(self, key: int) -> T | None:
         """
         Retrieve an item from the database using the provided key.
@@ -67,3 +153,42 @@ class DoSMetadataCache:
         self.dispositions = SQLModelKVCache(engine, Disposition)
         self.opening_time_days = SQLModelKVCache(engine, OpeningTimeDay)
         self.service_types = SQLModelKVCache(engine, ServiceType)
+
+    @property
+    def caches(self) -> dict[str, SQLModelKVCache]:
+        return {
+            "symptom_groups": self.symptom_groups,
+            "symptom_discriminators": self.symptom_discriminators,
+            "dispositions": self.dispositions,
+            "opening_time_days": self.opening_time_days,
+            "service_types": self.service_types,
+        }
+
+    def warm(self) -> None:
+        """
+        Load each metadata table in full, one query per table.
+        """
+        for cache in self.caches.values():
+            cache.warm()
+
+    def stats(self) -> dict[str, CacheStats]:
+        return {name: cache.stats() for name, cache in self.caches.items()}
+
+    def save_snapshot(self, path: str | Path) -> None:
+        """
+        Write the cached metadata to a JSON file for load_snapshot.
+        The file is replaced atomically so concurrent readers never see a partial snapshot.
+        """
+        path = Path(path)
+        snapshot = {name: cache.dump() for name, cache in self.caches.items()}
+        temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(snapshot))
+        os.replace(temp_path, path)
+
+    def load_snapshot(self, path: str | Path) -> None:
+        """
+        Populate every cache from a file written by save_snapshot.
+        """
+        snapshot = json.loads(Path(path).read_text())
+        for name, cache in self.caches.items():
+            cache.load(snapshot[name])
@@ -1,4 +1,10 @@
-"""Utilities for converting DeepDiff results to DynamoDB update expressions."""
+"""Utilities for diffing domain models and converting the differences to DynamoDB update expressions.
+
+The migration uses the schema-aware model differ (diff_organisation,
+diff_location and diff_healthcare_service). The DeepDiff based functions are
+the original implementation and remain as the reference its output is tested
+against.
+"""
 
 import re
 from dataclasses import dataclass, field
@@ -12,6 +18,7 @@ from boto3.dynamodb.types import TypeSerializer
 from deepdiff import DeepDiff
 from ftrs_data_layer.domain import HealthcareService, Location, Organisation
 from ftrs_data_layer.domain.auditevent import AuditEvent
+from pydantic import BaseModel
 
 # Type alias for DynamoDB-compatible values
 DynamoDBValue = str | int | float | bool | list | dict | Decimal | None
@@ -42,6 +49,7 @@ EXCLUDE_PATHS = [
     "root['created']",
     "root['lastUpdated']",
 ]
+EXCLUDE_FIELDS = frozenset({"created", "lastUpdated"})
 EXCLUDE_REGEX_PATHS = []
 
 
@@ -143,7 +151,95 @@ class DynamoDBUpdateExpressions:
         return f"SET {audit_clause} {self.update_expression}"
 
 
-class DeepDiffToDynamoDBConverter:
+class UpdateExpressionWriter:
+    """
+    Collects SET and REMOVE clauses, with their name and value placeholders,
+    into DynamoDB UpdateItem expressions.
+    """
+
+    def __init__(self) -> None:
+        self._serialiser = TypeSerializer()
+        self._set_clauses: list[str] = []
+        self._remove_clauses: list[str] = []
+        self._attribute_names: dict[str, str] = {}
+        self._attribute_values: dict[str, Any] = {}
+        self._value_counter = 0
+
+    def _add_set_clause_direct(self, ddb_path: str, value: Any) -> None:  # noqa: ANN401
+        """Add a SET clause for a path already in DynamoDB expression form."""
+        value_placeholder = self._register_value(value)
+        self._set_clauses.append(f"{ddb_path} = {value_placeholder}")
+
+    def _register_attribute_name(self, name: str) -> str:
+        """Register an attribute name and return its placeholder."""
+        # Return existing placeholder if already registered
+        for placeholder, attr_name in self._attribute_names.items():
+            if attr_name == name:
+                return placeholder
+
+        # Create new placeholder (prefix reserved words to avoid conflicts)
+        if name in DYNAMODB_RESERVED_WORDS:
+            placeholder = f"#attr_{name}"
+        else:
+            placeholder = f"#{name}"
+
+        self._attribute_names[placeholder] = name
+        return placeholder
+
+    def _register_value(self, value: Any) -> str:  # noqa: ANN401
+        """Register a value and return its placeholder."""
+        placeholder = f":val_{self._value_counter}"
+        self._value_counter += 1
+
+        prepared = self._prepare_for_dynamodb(value)
+        self._attribute_values[placeholder] = self._serialiser.serialize(prepared)
+        return placeholder
+
+    def _prepare_for_dynamodb(  # noqa: PLR0911
+        self,
+        value: DynamoDBValue | UUID | time | datetime | date | Enum,
+    ) -> DynamoDBValue:
+        """Convert value to a DynamoDB-serializable type."""
+        if value is None:
+            return None
+        if isinstance(value, UUID):
+            return str(value)
+        if isinstance(value, (datetime, date, time)):
+            return value.isoformat()
+        if isinstance(value, Enum):
+            return value.value
+        if isinstance(value, Decimal):
+            return str(value)
+        if isinstance(value, list):
+            return [self._prepare_for_dynamodb(item) for item in value]
+        if isinstance(value, dict):
+            return {k: self._prepare_for_dynamodb(v) for k, v in value.items()}
+        return value
+
+    def _build_result(self) -> DynamoDBUpdateExpressions:
+        """Build the final update expressions, removing unused placeholders."""
+        parts = []
+        if self._set_clauses:
+            parts.append("SET " + ", ".join(self._set_clauses))
+        if self._remove_clauses:
+            parts.append("REMOVE " + ", ".join(self._remove_clauses))
+
+        expression = " ".join(parts)
+
+        # Filter to only include placeholders actually used in the expression
+        used_names = {k: v for k, v in self._attribute_names.items() if k in expression}
+        used_values = {
+            k: v for k, v in self._attribute_values.items() if k in expression
+        }
+
+        return DynamoDBUpdateExpressions(
+            update_expression=expression,
+            expression_attribute_names=used_names,
+            expression_attribute_values=used_values,
+        )
+
+
+class DeepDiffToDynamoDBConverter(UpdateExpressionWriter):
     """
     Converts DeepDiff results to DynamoDB UpdateItem expressions.
 
@@ -155,13 +251,8 @@ class DeepDiffToDynamoDBConverter:
     """
 
     def __init__(self, diff: DeepDiff) -> None:
+        super().__init__()
         self._diff = diff
-        self._serialiser = TypeSerializer()
-        self._set_clauses: list[str] = []
-        self._remove_clauses: list[str] = []
-        self._attribute_names: dict[str, str] = {}
-        self._attribute_values: dict[str, Any] = {}
-        self._value_counter = 0
         self._replaced_list_paths: set[str] = set()
 
     def convert(self) -> DynamoDBUpdateExpressions:
@@ -222,11 +313,6 @@ class DeepDiffToDynamoDBConverter:
             return
         self._add_set_clause_direct(ddb_path, value)
 
-    def _add_set_clause_direct(self, ddb_path: str, value: Any) -> None:  # noqa: ANN401
-        """Add a SET clause without checking for replaced lists."""
-        value_placeholder = self._register_value(value)
-        self._set_clauses.append(f"{ddb_path} = {value_placeholder}")
-
     def _add_remove_clause(self, path: str) -> None:
         """Add a REMOVE clause, skipping paths inside replaced lists."""
         ddb_path = self._to_dynamodb_path(path)
@@ -290,74 +376,6 @@ class DeepDiffToDynamoDBConverter:
         match = re.search(r"\[\d+\]$", path)
         return path[: match.start()] if match else path
 
-    def _register_attribute_name(self, name: str) -> str:
-        """Register an attribute name and return its placeholder."""
-        # Return existing placeholder if already registered
-        for placeholder, attr_name in self._attribute_names.items():
-            if attr_name == name:
-                return placeholder
-
-        # Create new placeholder (prefix reserved words to avoid conflicts)
-        if name in DYNAMODB_RESERVED_WORDS:
-            placeholder = f"#attr_{name}"
-        else:
-            placeholder = f"#{name}"
-
-        self._attribute_names[placeholder] = name
-        return placeholder
-
-    def _register_value(self, value: Any) -> str:  # noqa: ANN401
-        """Register a value and return its placeholder."""
-        placeholder = f":val_{self._value_counter}"
-        self._value_counter += 1
-
-        prepared = self._prepare_for_dynamodb(value)
-        self._attribute_values[placeholder] = self._serialiser.serialize(prepared)
-        return placeholder
-
-    def _prepare_for_dynamodb(  # noqa: PLR0911
-        self,
-        value: DynamoDBValue | UUID | time | datetime | date | Enum,
-    ) -> DynamoDBValue:
-        """Convert value to a DynamoDB-serializable type."""
-        if value is None:
-            return None
-        if isinstance(value, UUID):
-            return str(value)
-        if isinstance(value, (datetime, date, time)):
-            return value.isoformat()
-        if isinstance(value, Enum):
-            return value.value
-        if isinstance(value, Decimal):
-            return str(value)
-        if isinstance(value, list):
-            return [self._prepare_for_dynamodb(item) for item in value]
-        if isinstance(value, dict):
-            return {k: self._prepare_for_dynamodb(v) for k, v in value.items()}
-        return value
-
-    def _build_result(self) -> DynamoDBUpdateExpressions:
-        """Build the final update expressions, removing unused placeholders."""
-        parts = []
-        if self._set_clauses:
-            parts.append("SET " + ", ".join(self._set_clauses))
-        if self._remove_clauses:
-            parts.append("REMOVE " + ", ".join(self._remove_clauses))
-
-        expression = " ".join(parts)
-
-        # Filter to only include placeholders actually used in the expression
-        used_names = {k: v for k, v in self._attribute_names.items() if k in expression}
-        used_values = {
-            k: v for k, v in self._attribute_values.items() if k in expression
-        }
-
-        return DynamoDBUpdateExpressions(
-            update_expression=expression,
-            expression_attribute_names=used_names,
-            expression_attribute_values=used_values,
-        )
-
 
 def deepdiff_to_dynamodb_expressions(diff: DeepDiff) -> DynamoDBUpdateExpressions:
     """Convert a DeepDiff result to DynamoDB update expressions."""
@@ -402,3 +420,231 @@ def get_healthcare_service_diff(
         threshold_to_diff_deeper=0,
         ignore_order=True,
     )
+
+
+ModelPath = tuple[str | int, ...]
+
+
+@dataclass(frozen=True)
+class ModelChange:
+    """A single difference between two models, at a path of field names and list indexes."""
+
+    path: ModelPath
+    old_value: Any
+    new_value: Any
+    removed: bool = False
+
+
+class ModelDiff:
+    """
+    Differences between two domain models, found by diff_models.
+
+    Each change is the smallest path whose value differs, except that a list
+    whose length changes is replaced as a whole. Lists that only differ in order
+    are treated as unchanged, as DeepDiff's ignore_order does.
+    """
+
+    def __init__(self, changes: list[ModelChange]) -> None:
+        self.changes = changes
+
+    def __bool__(self) -> bool:
+        return bool(self.changes)
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+    def paths(self) -> list[str]:
+        """Return the changed paths, e.g. endpoints[0].address."""
+        return [format_model_path(change.path) for change in self.changes]
+
+    def pretty(self) -> str:
+        """Return a human-readable description of the changes, one per line."""
+        return "\n".join(
+            f"Item {format_model_path(change.path)} removed."
+            if change.removed
+            else f"Value of {format_model_path(change.path)} changed from "
+            f"{dump_models(change.old_value)!r} to {dump_models(change.new_value)!r}."
+            for change in self.changes
+        )
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        """Return the old and new value for each changed path."""
+        return {
+            format_model_path(change.path): {
+                "old_value": dump_models(change.old_value),
+                "new_value": None if change.removed else dump_models(change.new_value),
+            }
+            for change in self.changes
+        }
+
+
+def format_model_path(path: ModelPath) -> str:
+    """Format a model path as dotted field names with list indexes, e.g. a[0].b."""
+    formatted = ""
+    for part in path:
+        if isinstance(part, int):
+            formatted += f"[{part}]"
+        else:
+            formatted += f".{part}" if formatted else part
+    return formatted
+
+
+def dump_models(value: Any) -> Any:  # noqa: ANN401
+    """Replace models in a value with their model_dump() output."""
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, list):
+        return [dump_models(item) for item in value]
+    return value
+
+
+def diff_models(
+    previous: BaseModel,
+    current: BaseModel,
+    exclude: frozenset[str] = EXCLUDE_FIELDS,
+) -> ModelDiff:
+    """
+    Compare two models of the same type field by field, skipping excluded top-level fields.
+    """
+    changes: list[ModelChange] = []
+    _diff_model_fields(previous, current, (), changes, exclude)
+    return ModelDiff(changes)
+
+
+def _diff_model_fields(
+    previous: BaseModel,
+    current: BaseModel,
+    path: ModelPath,
+    changes: list[ModelChange],
+    exclude: frozenset[str] = frozenset(),
+) -> None:
+    for name in type(current).model_fields:
+        if name not in exclude:
+            _diff_values(
+                getattr(previous, name), getattr(current, name), (*path, name), changes
+            )
+
+
+def _diff_values(
+    previous: Any,  # noqa: ANN401
+    current: Any,  # noqa: ANN401
+    path: ModelPath,
+    changes: list[ModelChange],
+) -> None:
+    if type(previous) is type(current) and previous == current:
+        return
+
+    if isinstance(current, BaseModel) and type(previous) is type(current):
+        _diff_model_fields(previous, current, path, changes)
+    elif isinstance(previous, list) and isinstance(current, list):
+        _diff_lists(previous, current, path, changes)
+    elif isinstance(previous, dict) and isinstance(current, dict):
+        _diff_dicts(previous, current, path, changes)
+    else:
+        changes.append(ModelChange(path, previous, current))
+
+
+def _diff_lists(
+    previous: list,
+    current: list,
+    path: ModelPath,
+    changes: list[ModelChange],
+) -> None:
+    if len(previous) != len(current):
+        # Indexes shift when items are added or removed, so replace the whole list
+        changes.append(ModelChange(path, previous, current))
+        return
+
+    if _same_items(previous, current):
+        return
+
+    for index, (previous_item, current_item) in enumerate(
+        zip(previous, current, strict=True)
+    ):
+        _diff_values(previous_item, current_item, (*path, index), changes)
+
+
+def _same_items(previous: list, current: list) -> bool:
+    """Check whether two lists of equal length hold the same items in any order."""
+    unmatched = list(previous)
+    for item in current:
+        for index, candidate in enumerate(unmatched):
+            if type(candidate) is type(item) and candidate == item:
+                del unmatched[index]
+                break
+        else:
+            return False
+    return True
+
+
+def _diff_dicts(
+    previous: dict,
+    current: dict,
+    path: ModelPath,
+    changes: list[ModelChange],
+) -> None:
+    for key, value in current.items():
+        if key in previous:
+            _diff_values(previous[key], value, (*path, key), changes)
+        else:
+            changes.append(ModelChange((*path, key), None, value))
+
+    for key in previous.keys() - current.keys():
+        changes.append(ModelChange((*path, key), previous[key], None, removed=True))
+
+
+class ModelDiffToDynamoDBConverter(UpdateExpressionWriter):
+    """Converts a ModelDiff to DynamoDB UpdateItem expressions."""
+
+    def __init__(self, diff: ModelDiff) -> None:
+        super().__init__()
+        self._diff = diff
+
+    def convert(self) -> DynamoDBUpdateExpressions:
+        """Convert the ModelDiff to DynamoDB update expressions."""
+        for change in self._diff.changes:
+            ddb_path = self._to_dynamodb_path(change.path)
+            if change.removed:
+                self._remove_clauses.append(ddb_path)
+            else:
+                self._add_set_clause_direct(ddb_path, dump_models(change.new_value))
+
+        return self._build_result()
+
+    def _to_dynamodb_path(self, path: ModelPath) -> str:
+        """
+        Convert a model path to a DynamoDB expression path.
+
+        Example: ("endpoints", 0, "status") -> #endpoints[0].#attr_status
+        """
+        ddb_parts: list[str] = []
+        for part in path:
+            if isinstance(part, int):
+                ddb_parts[-1] = f"{ddb_parts[-1]}[{part}]"
+            else:
+                ddb_parts.append(self._register_attribute_name(part))
+
+        return ".".join(ddb_parts)
+
+
+def model_diff_to_dynamodb_expressions(diff: ModelDiff) -> DynamoDBUpdateExpressions:
+    """Convert a ModelDiff to DynamoDB update expressions."""
+    return ModelDiffToDynamoDBConverter(diff).convert()
+
+
+def diff_organisation(previous: Organisation, current: Organisation) -> ModelDiff:
+    """Get differences between two Organisation records, excluding timestamps."""
+    return diff_models(previous, current)
+
+
+def diff_location(previous: Location, current: Location) -> ModelDiff:
+    """Get differences between two Location records, excluding timestamps."""
+    return diff_models(previous, current)
+
+
+def diff_healthcare_service(
+    previous: HealthcareService,
+    current: HealthcareService,
+) -> ModelDiff:
+    """Get differences between two HealthcareService records, excluding timestamps."""
+    return diff_models(previous, current)
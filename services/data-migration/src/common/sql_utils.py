@@ -1,7 +1,26 @@
+from ftrs_data_layer.domain import legacy
 from sqlalchemy import Engine, create_engine
+from sqlalchemy.orm import selectinload
 
 from common.config import DatabaseConfig
 
+# Eager loaders for every legacy Service relationship used by the transformers.
+# selectinload issues one IN query per relationship for a whole result set, so
+# loading a batch of services costs a fixed number of queries rather than one
+# per service per relationship.
+SERVICE_RELATIONSHIP_LOADERS = (
+    selectinload(legacy.Service.endpoints),
+    selectinload(legacy.Service.scheduled_opening_times).selectinload(
+        legacy.ServiceDayOpening.times
+    ),
+    selectinload(legacy.Service.specified_opening_times).selectinload(
+        legacy.ServiceSpecifiedOpeningDate.times
+    ),
+    selectinload(legacy.Service.sgsds),
+    selectinload(legacy.Service.dispositions),
+    selectinload(legacy.Service.age_range),
+)
+
 
 def get_sqlalchemy_engine_from_config(db_config: DatabaseConfig) -> Engine:
     """Create and configure an SQLAlchemy engine from DatabaseConfig with optimized settings."""
@@ -13,15 +13,21 @@ from ftrs_data_layer.logbase import DataMigrationLogBase
 
 from common.events import DMSEvent
 from service_migration.config import DataMigrationConfig
+from service_migration.models import FullSyncShard
 from service_migration.processor import DataMigrationProcessor
 
 
 class DataMigrationApplication:
+    PROCESSOR_CLS: type[DataMigrationProcessor] = DataMigrationProcessor
+
     def __init__(self, config: DataMigrationConfig | None = None) -> None:
         self.config = config or DataMigrationConfig()
         self.logger = self.create_logger()
         self.processor = self.create_processor()
         self.batch_processor = BatchProcessor(event_type=EventType.SQS)
+        # Outcome of each service synced ahead of the records in an SQS batch,
+        # None for success. Only set while a coalesced batch is handled.
+        self.batch_results: dict[int, Exception | None] | None = None
 
     def handle_sqs_event(
         self,
@@ -34,16 +40,30 @@ class DataMigrationApplication:
         self.processor.metrics.reset()
         self.logger.log(DataMigrationLogBase.DM_ETL_000, event=event)
 
-        result = process_partial_response(
-            event=event,
-            context=context,
-            record_handler=self.handle_sqs_record,
-            processor=self.batch_processor,
-        )
+        service_ids = self.get_batch_service_ids(event)
+        try:
+            self.processor.prefetch_state_records(service_ids)
+        except Exception as e:
+            self.logger.log(DataMigrationLogBase.DM_ETL_043, error=str(e))
+
+        try:
+            if self.config.coalesce_sqs_batches:
+                self.sync_batch_services(service_ids)
+
+            result = process_partial_response(
+                event=event,
+                context=context,
+                record_handler=self.handle_sqs_record,
+                processor=self.batch_processor,
+            )
+        finally:
+            self.batch_results = None
+            self.processor.state_cache.clear()
 
         self.logger.log(
             DataMigrationLogBase.DM_ETL_999,
             metrics=self.processor.metrics.model_dump(),
+            metadata_cache=self.processor.metadata_cache_stats(),
             failures=result["batchItemFailures"],
         )
 
@@ -69,12 +89,55 @@ class DataMigrationApplication:
             event=event.model_dump(),
         )
 
-    def handle_full_sync_event(self) -> None:
+    def get_batch_service_ids(self, event: dict) -> list[int]:
+        """
+        Return the IDs of the services the records in an SQS batch will sync.
+        Records that cannot be parsed or will not sync a service are skipped here;
+        handle_sqs_record reports them.
+        """
+        service_ids = []
+        for raw_record in event.get("Records", []):
+            try:
+                dms_event = self._parse_dms_event(SQSRecord(raw_record).json_body)
+            except Exception:
+                continue
+
+            match dms_event.table_name:
+                case "services" if dms_event.method.lower() in ["insert", "update"]:
+                    service_ids.append(dms_event.record_id)
+                case "serviceendpoints":
+                    service_ids.append(dms_event.service_id)
+
+        return service_ids
+
+    def sync_batch_services(self, service_ids: list[int]) -> None:
+        """
+        Sync each distinct service in an SQS batch once, writing the results of
+        independent services together in as few transactions as possible.
+        The outcome is kept for handle_sqs_record, so every record that triggered
+        a failed sync is still reported as a batch item failure.
+        """
+        self.batch_results = {}
+        with self.processor.coalesced_writes():
+            for service_id in dict.fromkeys(service_ids):
+                try:
+                    self.processor.sync_service(service_id, "update")
+                    self.batch_results[service_id] = None
+                except Exception as e:
+                    self.batch_results[service_id] = e
+
+        self.logger.log(
+            DataMigrationLogBase.DM_ETL_048,
+            record_count=len(service_ids),
+            service_count=len(self.batch_results),
+        )
+
+    def handle_full_sync_event(self, shard: FullSyncShard | None = None) -> None:
         """
         Handle a full sync event.
-        This should trigger the full sync process.
+        This should trigger the full sync process, for one shard if given.
         """
-        self.processor.sync_all_services()
+        self.processor.sync_all_services(shard=shard)
 
     def parse_event(self, event: dict) -> DMSEvent:
         """
@@ -82,16 +145,7 @@ class DataMigrationApplication:
         Handles both direct events and nested Aurora trigger events.
         """
         try:
-            # Unwrap nested Aurora trigger events from migration_copy_db_trigger_lambda_handler
-            # TODO: FTRS-1666 - Remove this once updated record change trigger is deployed to dev
-            if (
-                "source" in event
-                and event.get("source") == "aurora_trigger"
-                and "event" in event
-            ):
-                event = event["event"]
-
-            return DMSEvent(**event)
+            return self._parse_dms_event(event)
         except Exception as e:
             self.logger.log(
                 DataMigrationLogBase.DM_ETL_009,
@@ -100,6 +154,18 @@ class DataMigrationApplication:
             )
             raise ValueError("Invalid event format") from e
 
+    def _parse_dms_event(self, event: dict) -> DMSEvent:
+        # Unwrap nested Aurora trigger events from migration_copy_db_trigger_lambda_handler
+        # TODO: FTRS-1666 - Remove this once updated record change trigger is deployed to dev
+        if (
+            "source" in event
+            and event.get("source") == "aurora_trigger"
+            and "event" in event
+        ):
+            event = event["event"]
+
+        return DMSEvent(**event)
+
     def create_logger(self) -> Logger:
         """
         Set up the logger for the data migration application.
@@ -116,7 +182,7 @@ class DataMigrationApplication:
         """
         Create a DataMigrationProcessor instance with the configured database URI.
         """
-        return DataMigrationProcessor(
+        return self.PROCESSOR_CLS(
             logger=self.logger,
             config=self.config,
         )
@@ -126,7 +192,7 @@ class DataMigrationApplication:
         Handle database change events for the serviceendpoints table.
         All endpoint events (insert/update/delete) trigger a service update to sync endpoint changes.
         """
-        return self.processor.sync_service(event.service_id, "update")
+        return self.sync_service(event.service_id, "update")
 
     def handle_service_event(self, event: DMSEvent) -> None:
         """
@@ -141,4 +207,16 @@ class DataMigrationApplication:
             )
             return
 
-        return self.processor.sync_service(event.record_id, event.method)
+        return self.sync_service(event.record_id, event.method)
+
+    def sync_service(self, service_id: int, method: str) -> None:
+        """
+        Sync a service, or report the outcome of its sync if it was already synced
+        ahead of the current SQS batch.
+        """
+        if self.batch_results is not None and service_id in self.batch_results:
+            if (error := self.batch_results[service_id]) is not None:
+                raise error
+            return
+
+        self.processor.sync_service(service_id, method)
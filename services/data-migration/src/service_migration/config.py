@@ -17,3 +17,11 @@ class DataMigrationConfig(BaseSettings):
     env: Annotated[str, Field("local", alias="ENVIRONMENT")]
     workspace: Annotated[str | None, Field(None, alias="WORKSPACE")]
     dynamodb_endpoint: Annotated[str | None, Field(None, alias="ENDPOINT_URL")]
+    coalesce_sqs_batches: Annotated[bool, Field(True, alias="COALESCE_SQS_BATCHES")]
+    compress_state_snapshots: Annotated[
+        bool, Field(True, alias="COMPRESS_STATE_SNAPSHOTS")
+    ]
+    warm_metadata_cache: Annotated[bool, Field(True, alias="WARM_METADATA_CACHE")]
+    metadata_snapshot_path: Annotated[
+        str | None, Field(None, alias="METADATA_SNAPSHOT_PATH")
+    ]
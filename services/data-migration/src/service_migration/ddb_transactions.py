@@ -1,3 +1,4 @@
+import logging
 from datetime import datetime, timezone
 from typing import Self
 
@@ -11,13 +12,14 @@ from pydantic import BaseModel
 
 from common.diff_utils import (
     DynamoDBUpdateExpressions,
-    deepdiff_to_dynamodb_expressions,
-    get_healthcare_service_diff,
-    get_location_diff,
-    get_organisation_diff,
+    ModelDiff,
+    diff_healthcare_service,
+    diff_location,
+    diff_organisation,
+    model_diff_to_dynamodb_expressions,
 )
 from service_migration.exceptions import ServiceMigrationException
-from service_migration.models import ServiceMigrationState
+from service_migration.models import ServiceMigrationState, entity_hash
 
 
 class ServiceTransactionBuilder:
@@ -34,6 +36,7 @@ class ServiceTransactionBuilder:
         record_id: The source record identifier being migrated.
         serialiser: DynamoDB type serialiser for converting Python types.
         items: List of transaction items to be written.
+        compress_snapshots: Whether entity snapshots are compressed in the state record.
     """
 
     def __init__(
@@ -42,6 +45,7 @@ class ServiceTransactionBuilder:
         logger: Logger,
         migration_state: ServiceMigrationState | None = None,
         validation_issues: list = [],
+        compress_snapshots: bool = True,
     ) -> None:
         """
         Initialise the TransactionBuilder.
@@ -51,6 +55,7 @@ class ServiceTransactionBuilder:
             record_id: The source record identifier being migrated.
             migration_state: Optional existing migration state. If None, a new state
                 is created for the given record_id.
+            compress_snapshots: Whether to store entity snapshots as compressed JSON.
         """
         self.migration_state = (
             migration_state.model_copy()
@@ -63,6 +68,7 @@ class ServiceTransactionBuilder:
         self.logger = logger
         self.service_id = service_id
         self.serialiser = TypeSerializer()
+        self.compress_snapshots = compress_snapshots
         self.items = []
         self.current_time = datetime.now(timezone.utc)
 
@@ -131,6 +137,7 @@ class ServiceTransactionBuilder:
         )
         self.migration_state.organisation_id = organisation.id
         self.migration_state.organisation = organisation
+        self.migration_state.organisation_hash = entity_hash(organisation)
 
         self.logger.log(
             DataMigrationLogBase.DM_ETL_024,
@@ -141,8 +148,9 @@ class ServiceTransactionBuilder:
     def _update_organisation(self, organisation: Organisation | None) -> Self:
         """Update an existing organisation in DynamoDB.
 
-        Compares the current organisation with the previous state and applies
-        only the changed fields.
+        Skips the organisation when its content hash matches the previous state,
+        otherwise compares it with the previous state and applies only the
+        changed fields.
 
         Args:
             organisation: The updated organisation entity.
@@ -156,7 +164,12 @@ class ServiceTransactionBuilder:
                 requeue=False,
             )
 
-        diff = get_organisation_diff(
+        current_hash = entity_hash(organisation)
+        if current_hash == self.migration_state.organisation_hash:
+            self.logger.log(DataMigrationLogBase.DM_ETL_029)
+            return self
+
+        diff = diff_organisation(
             previous=self.migration_state.organisation,
             current=organisation,
         )
@@ -164,13 +177,10 @@ class ServiceTransactionBuilder:
             self.logger.log(DataMigrationLogBase.DM_ETL_029)
             return self
 
-        self.logger.log(
-            DataMigrationLogBase.DM_ETL_030,
-            changes=diff.pretty().splitlines(),
-            diff=diff.to_dict(view_override="text"),
-        )
+        self.logger.log(DataMigrationLogBase.DM_ETL_030, changed_fields=diff.paths())
+        self._log_diff_detail("organisation", diff)
 
-        expressions = deepdiff_to_dynamodb_expressions(diff)
+        expressions = model_diff_to_dynamodb_expressions(diff)
         if expressions.is_empty():
             return self
 
@@ -182,6 +192,7 @@ class ServiceTransactionBuilder:
 
         self.items.append({"Update": update_item})
         self.migration_state.organisation = organisation
+        self.migration_state.organisation_hash = current_hash
 
         return self
 
@@ -211,6 +222,7 @@ class ServiceTransactionBuilder:
         )
         self.migration_state.location_id = location.id
         self.migration_state.location = location
+        self.migration_state.location_hash = entity_hash(location)
 
         self.logger.log(
             DataMigrationLogBase.DM_ETL_026,
@@ -221,8 +233,9 @@ class ServiceTransactionBuilder:
     def _update_location(self, location: Location | None) -> Self:
         """Update an existing location in DynamoDB.
 
-        Compares the current location with the previous state and applies
-        only the changed fields.
+        Skips the location when its content hash matches the previous state,
+        otherwise compares it with the previous state and applies only the
+        changed fields.
 
         Args:
             location: The updated location entity.
@@ -236,7 +249,12 @@ class ServiceTransactionBuilder:
                 requeue=False,
             )
 
-        diff = get_location_diff(
+        current_hash = entity_hash(location)
+        if current_hash == self.migration_state.location_hash:
+            self.logger.log(DataMigrationLogBase.DM_ETL_031)
+            return self
+
+        diff = diff_location(
             previous=self.migration_state.location,
             current=location,
         )
@@ -244,13 +262,10 @@ class ServiceTransactionBuilder:
             self.logger.log(DataMigrationLogBase.DM_ETL_031)
             return self
 
-        self.logger.log(
-            DataMigrationLogBase.DM_ETL_032,
-            changes=diff.pretty().splitlines(),
-            diff=diff.to_dict(view_override="text"),
-        )
+        self.logger.log(DataMigrationLogBase.DM_ETL_032, changed_fields=diff.paths())
+        self._log_diff_detail("location", diff)
 
-        expressions = deepdiff_to_dynamodb_expressions(diff)
+        expressions = model_diff_to_dynamodb_expressions(diff)
         if expressions.is_empty():
             return self
 
@@ -261,6 +276,7 @@ class ServiceTransactionBuilder:
         )
         self.items.append({"Update": update_item})
         self.migration_state.location = location
+        self.migration_state.location_hash = current_hash
 
         return self
 
@@ -292,6 +308,7 @@ class ServiceTransactionBuilder:
         )
         self.migration_state.healthcare_service_id = healthcare_service.id
         self.migration_state.healthcare_service = healthcare_service
+        self.migration_state.healthcare_service_hash = entity_hash(healthcare_service)
 
         self.logger.log(
             DataMigrationLogBase.DM_ETL_028,
@@ -304,8 +321,9 @@ class ServiceTransactionBuilder:
     ) -> Self:
         """Update an existing healthcare service in DynamoDB.
 
-        Compares the current healthcare service with the previous state and applies
-        only the changed fields.
+        Skips the healthcare service when its content hash matches the previous
+        state, otherwise compares it with the previous state and applies only the
+        changed fields.
 
         Args:
             healthcare_service: The updated healthcare service entity.
@@ -319,7 +337,12 @@ class ServiceTransactionBuilder:
                 requeue=False,
             )
 
-        diff = get_healthcare_service_diff(
+        current_hash = entity_hash(healthcare_service)
+        if current_hash == self.migration_state.healthcare_service_hash:
+            self.logger.log(DataMigrationLogBase.DM_ETL_033)
+            return self
+
+        diff = diff_healthcare_service(
             previous=self.migration_state.healthcare_service,
             current=healthcare_service,
         )
@@ -327,13 +350,10 @@ class ServiceTransactionBuilder:
             self.logger.log(DataMigrationLogBase.DM_ETL_033)
             return self
 
-        self.logger.log(
-            DataMigrationLogBase.DM_ETL_034,
-            changes=diff.pretty().splitlines(),
-            diff=diff.to_dict(view_override="text"),
-        )
+        self.logger.log(DataMigrationLogBase.DM_ETL_034, changed_fields=diff.paths())
+        self._log_diff_detail("healthcare_service", diff)
 
-        expressions = deepdiff_to_dynamodb_expressions(diff)
+        expressions = model_diff_to_dynamodb_expressions(diff)
         if expressions.is_empty():
             return self
 
@@ -344,9 +364,22 @@ class ServiceTransactionBuilder:
         )
         self.items.append({"Update": update_item})
         self.migration_state.healthcare_service = healthcare_service
+        self.migration_state.healthcare_service_hash = current_hash
 
         return self
 
+    def _log_diff_detail(self, entity: str, diff: ModelDiff) -> None:
+        """Log the old and new values of each change, only when debug logging is on."""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+
+        self.logger.log(
+            DataMigrationLogBase.DM_ETL_049,
+            entity=entity,
+            changes=diff.pretty().splitlines(),
+            diff=diff.to_dict(),
+        )
+
     def _serialise_item(self, item: BaseModel, **additional_fields: dict) -> dict:
         """Serialise a Pydantic model to DynamoDB format.
 
@@ -361,6 +394,13 @@ class ServiceTransactionBuilder:
         item_dict.update(additional_fields)
         return self.serialiser.serialize(item_dict)["M"]
 
+    def _serialise_state_record(self) -> dict:
+        """Serialise the migration state record to DynamoDB format."""
+        item_dict = self.migration_state.dump_item(
+            compress_snapshots=self.compress_snapshots
+        )
+        return self.serialiser.serialize(item_dict)["M"]
+
     def build(self) -> list[dict]:
         """Build and return the complete list of transaction items.
 
@@ -396,7 +436,7 @@ class ServiceTransactionBuilder:
             {
                 "Put": {
                     "TableName": get_table_name("data-migration-state"),
-                    "Item": self._serialise_item(self.migration_state),
+                    "Item": self._serialise_state_record(),
                     "ConditionExpression": "attribute_not_exists(source_record_id)",
                     "ReturnValuesOnConditionCheckFailure": "ALL_OLD",
                 }
@@ -424,7 +464,7 @@ class ServiceTransactionBuilder:
             {
                 "Put": {
                     "TableName": get_table_name("data-migration-state"),
-                    "Item": self._serialise_item(self.migration_state),
+                    "Item": self._serialise_state_record(),
                     "ConditionExpression": "attribute_exists(source_record_id) AND version = :current_version",
                     "ExpressionAttributeValues": {
                         ":current_version": {"N": str(self.migration_state.version - 1)}
@@ -0,0 +1,176 @@
+import csv
+from collections import Counter
+from pathlib import Path
+from typing import Any, Iterable
+
+from ftrs_common.logger import Logger
+from ftrs_common.utils.db_service import get_table_name
+from ftrs_data_layer.domain import legacy
+
+from service_migration.application import DataMigrationApplication
+from service_migration.config import DataMigrationConfig
+from service_migration.models import (
+    DryRunRow,
+    FullSyncShard,
+    ServiceMigrationMetrics,
+    ServiceMigrationState,
+)
+from service_migration.processor import DataMigrationProcessor
+from service_migration.transformer import ServiceTransformer
+from service_migration.validation.types import ValidationResult
+
+# Entity columns of the report, by the table their items are written to
+ENTITY_TABLES = {
+    "organisations": "organisation",
+    "locations": "location",
+    "healthcare_services": "healthcare-service",
+}
+
+
+class DryRunProcessor(DataMigrationProcessor):
+    """
+    Runs services through transformer selection, validation and transformation
+    without reading or writing DynamoDB, and records a report row per service.
+
+    No state records are read, so every service is treated as new and its items
+    counted as inserts. State records the migration would write are kept in
+    memory, so a parent pharmacy is only counted once however many linked
+    pharmacies are processed after it.
+    """
+
+    def __init__(self, config: DataMigrationConfig, logger: Logger) -> None:
+        super().__init__(config=config, logger=logger)
+        self.rows: list[DryRunRow] = []
+        self.dry_run_state: dict[str, ServiceMigrationState] = {}
+        self.inserts: dict[str, Counter[str]] = {}
+        self._row: DryRunRow | None = None
+
+    def report_rows(self) -> list[DryRunRow]:
+        """
+        Return the report rows with the counts of items each service would insert.
+        """
+        for row in self.rows:
+            counts = self.inserts.get(
+                ServiceMigrationState.format_source_record_id(row.service_id),
+                Counter(),
+            )
+            for column in ENTITY_TABLES:
+                setattr(row, column, counts[column])
+        return self.rows
+
+    def prefetch_state_records(self, service_ids: Iterable[int]) -> None:
+        """
+        Dry runs do not read state records.
+        """
+
+    def get_state_record(self, service_id: int) -> ServiceMigrationState | None:
+        return self.dry_run_state.get(
+            ServiceMigrationState.format_source_record_id(service_id)
+        )
+
+    def get_transformer(self, service: legacy.Service) -> ServiceTransformer | None:
+        transformer = super().get_transformer(service)
+        if transformer is not None and self._row is not None:
+            self._row.transformer = type(transformer).__name__
+        return transformer
+
+    def _process_service(self, service: legacy.Service) -> None:
+        before = self.metrics.model_copy()
+        self._row = DryRunRow(service_id=service.id, service_type_id=service.typeid)
+        try:
+            super()._process_service(service)
+        finally:
+            self._row.outcome = _outcome(before, self.metrics)
+            self.rows.append(self._row)
+            self._row = None
+
+    def _check_validation_result(
+        self,
+        service: legacy.Service,
+        validation_result: ValidationResult[legacy.Service],
+    ) -> ValidationResult[legacy.Service] | None:
+        if self._row is not None:
+            self._row.issue_count = len(validation_result.issues)
+            self._row.issue_codes = [issue.code for issue in validation_result.issues]
+        return super()._check_validation_result(service, validation_result)
+
+    def _execute_transaction(self, transact_items: list[dict[str, Any]]) -> None:
+        """
+        Record the items a transaction would put instead of writing them.
+        """
+        table_columns = {
+            get_table_name(table): column for column, table in ENTITY_TABLES.items()
+        }
+        counts = Counter(
+            table_columns[put["TableName"]]
+            for transact_item in transact_items
+            if (put := transact_item.get("Put")) and put["TableName"] in table_columns
+        )
+        for source_record_id, item in self._written_state_records(
+            transact_items
+        ).items():
+            self.dry_run_state[source_record_id] = self._deserialise_state_record(item)
+            self.inserts.setdefault(source_record_id, Counter()).update(counts)
+
+
+class DryRunApplication(DataMigrationApplication):
+    PROCESSOR_CLS = DryRunProcessor
+
+
+def _outcome(before: ServiceMigrationMetrics, after: ServiceMigrationMetrics) -> str:
+    for outcome, metric in (
+        ("error", "errors"),
+        ("unsupported", "unsupported"),
+        ("skipped", "skipped"),
+        ("invalid", "invalid"),
+        ("transformed", "transformed"),
+    ):
+        if getattr(after, metric) > getattr(before, metric):
+            return outcome
+    return "error"
+
+
+def dry_run_shard(
+    config: DataMigrationConfig, shard: FullSyncShard
+) -> tuple[list[DryRunRow], ServiceMigrationMetrics]:
+    """
+    Dry run one shard of the full sync, returning its report rows and metrics.
+    """
+    app = DryRunApplication(config=config)
+    app.handle_full_sync_event(shard=shard)
+    return app.processor.report_rows(), app.processor.metrics
+
+
+class DryRunReport:
+    """
+    CSV report of a dry run, written as shards complete.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._file = self.path.open("w", newline="")
+        self._writer = csv.DictWriter(
+            self._file, fieldnames=list(DryRunRow.model_fields)
+        )
+        self._writer.writeheader()
+        self.outcomes: Counter[str] = Counter()
+        self.inserts: Counter[str] = Counter()
+
+    def write(self, rows: Iterable[DryRunRow]) -> None:
+        for row in rows:
+            self.outcomes[row.outcome] += 1
+            for column in ENTITY_TABLES:
+                self.inserts[column] += getattr(row, column)
+
+            line = row.model_dump()
+            line["issue_codes"] = ";".join(row.issue_codes)
+            self._writer.writerow(line)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "DryRunReport":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
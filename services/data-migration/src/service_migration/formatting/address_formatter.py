@@ -1,9 +1,12 @@
-from typing import Optional
+from collections import Counter, defaultdict
+from functools import cache, lru_cache
+from typing import Any, Iterable, Optional
 
 import pycountry
 from ftrs_common.logger import Logger
 from ftrs_data_layer.domain import Address
 from ftrs_data_layer.logbase import UtilsLogBase
+from pycountry import remove_accents
 
 from service_migration.constants import UK_COUNTIES
 
@@ -39,46 +42,109 @@ def _is_invalid_address(address: str) -> bool:
     return False
 
 
-def _pycountry_county_name_gb(segment: str) -> str | None:
+class CountyIndex:
     """
-    Use pycountry to recognize GB county-like subdivisions from a free-text segment.
-    Returns the canonical subdivision name if recognized, else None.
+    Precomputed, normalised index of the GB subdivisions and UK_COUNTIES.
+
+    Gives the same answers as the previous per-segment
+    pycountry.subdivisions.search_fuzzy search: the best scoring GB subdivision
+    wins, and UK_COUNTIES is only consulted when no subdivision of any country
+    matches the segment.
     """
-    if not pycountry:
-        return None
 
+    def __init__(self, subdivisions: Iterable[Any], uk_counties: Iterable[str]) -> None:
+        self._exact_values: set[str] = set()
+        self._gb_exact: dict[str, Counter[str]] = defaultdict(Counter)
+        self._gb_names: dict[str, str] = {}
+        self._gb_search_names: list[tuple[str, str]] = []
+        names: list[str] = []
+
+        for subdivision in subdivisions:
+            name = remove_accents(subdivision.name.lower())
+            names.append(name)
+            is_gb = subdivision.country_code == "GB"
+            if is_gb:
+                self._gb_names[subdivision.code] = subdivision.name
+                self._gb_search_names.append((subdivision.code, name))
+
+            for value in subdivision._fields.values():
+                if value is None:
+                    continue
+                # Alternative names are separated by semicolons, and each field
+                # scores at most once, as in search_fuzzy.
+                for word in set(remove_accents(value.lower()).split(";")):
+                    self._exact_values.add(word)
+                    if is_gb:
+                        self._gb_exact[word][subdivision.code] += 1
+
+        # Names never contain newlines, so a substring test on the joined names
+        # tells whether any subdivision name contains a query without one.
+        self._all_names = "\n".join(names)
+        self._uk_counties: dict[str, str] = {}
+        for county in uk_counties:
+            self._uk_counties.setdefault(_norm(county), county)
+
+    def lookup(self, segment: str) -> str | None:
+        """
+        Return the county name recognised in a free-text segment, if any.
+        """
+        query = remove_accents(segment.strip().lower())
+        if not query:
+            return None
+
+        points: Counter[str] = Counter()
+        for code, count in self._gb_exact.get(query, {}).items():
+            points[code] += 50 * count
+
+        for code, name in self._gb_search_names:
+            position = name.find(query)
+            if position != -1:
+                points[code] += max(1, 5 - position)
+
+        if points:
+            code = min(points, key=lambda code: (-points[code], code))
+            return self._gb_names[code]
+
+        if query in self._exact_values or (
+            "\n" not in query and query in self._all_names
+        ):
+            # Only subdivisions of other countries matched
+            return None
+
+        return self._uk_counties.get(_norm(segment))
+
+
+@cache
+def _county_index() -> CountyIndex:
+    return CountyIndex(pycountry.subdivisions, UK_COUNTIES)
+
+
+@lru_cache(maxsize=4096)
+def _lookup_county(segment: str) -> str | None:
+    return _county_index().lookup(segment)
+
+
+def _pycountry_county_name_gb(segment: str) -> str | None:
+    """
+    Recognize GB county-like subdivisions from a free-text segment.
+    Returns the canonical subdivision or county name if recognized, else None.
+    """
     q = (segment or "").strip()
     if not q:
         return None
 
-    # First, check our custom mapping
-    try:
-        address_formatter_logger.log(
-            UtilsLogBase.UTILS_ADDRESS_FORMATTER_001, county_name=q
-        )
-        matches = pycountry.subdivisions.search_fuzzy(q)
-    except Exception as e:
-        address_formatter_logger.log(
-            UtilsLogBase.UTILS_ADDRESS_FORMATTER_002, error=str(e), county_name=q
-        )
-        matches = []
-    for sub in matches:
-        # Only consider Great Britain (United Kingdom) subdivisions
-        if getattr(sub, "country_code", None) != "GB":
-            continue
-        address_formatter_logger.log(
-            UtilsLogBase.UTILS_ADDRESS_FORMATTER_003, county_name=sub.name
-        )
-        return sub.name
-    if matches is None or len(matches) == 0:
+    address_formatter_logger.log(
+        UtilsLogBase.UTILS_ADDRESS_FORMATTER_001, county_name=q
+    )
+    # Segments repeat across many services, so lookups are cached by their
+    # lowercased form, which is all the index looks at.
+    county_name = _lookup_county(q.lower())
+    if county_name:
         address_formatter_logger.log(
-            UtilsLogBase.UTILS_ADDRESS_FORMATTER_004, county_name=q
+            UtilsLogBase.UTILS_ADDRESS_FORMATTER_003, county_name=county_name
         )
-        # Fallback: check against our predefined list of UK counties
-        q_norm = _norm(q)
-        for county in UK_COUNTIES:
-            if _norm(county) == q_norm:
-                return county
+        return county_name
+
     address_formatter_logger.log(
         UtilsLogBase.UTILS_ADDRESS_FORMATTER_005, county_name=q
     )
@@ -0,0 +1,42 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+from typing import Callable, Iterator, TypeVar
+
+from service_migration.application import DataMigrationApplication
+from service_migration.config import DataMigrationConfig
+from service_migration.models import FullSyncShard, ServiceMigrationMetrics
+
+ShardResult = TypeVar("ShardResult")
+
+
+def sync_shard(
+    config: DataMigrationConfig, shard: FullSyncShard
+) -> ServiceMigrationMetrics:
+    """
+    Run one shard of the full sync.
+    Each worker process builds its own application, database engine and clients.
+    """
+    app = DataMigrationApplication(config=config)
+    app.handle_full_sync_event(shard=shard)
+    return app.processor.metrics
+
+
+def iter_parallel_full_sync(
+    config: DataMigrationConfig,
+    shards: list[FullSyncShard],
+    worker: Callable[[DataMigrationConfig, FullSyncShard], ShardResult] | None = None,
+) -> Iterator[tuple[FullSyncShard, ShardResult]]:
+    """
+    Run each shard of the full sync in its own worker process.
+    Yields the result of worker, by default sync_shard's metrics, for each shard
+    as it completes. worker must be a module-level function so it can be pickled.
+    """
+    worker = worker or sync_shard
+    # Spawn rather than fork so workers do not inherit open connections or
+    # the parent's boto3 clients.
+    with ProcessPoolExecutor(
+        max_workers=len(shards), mp_context=get_context("spawn")
+    ) as executor:
+        futures = {executor.submit(worker, config, shard): shard for shard in shards}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
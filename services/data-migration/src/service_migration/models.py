@@ -1,22 +1,103 @@
+import json
+import zlib
+from hashlib import sha256
+from typing import Annotated, Any, Literal, Self
 from uuid import UUID
 
+from boto3.dynamodb.types import Binary
 from ftrs_data_layer.domain import HealthcareService, Location, Organisation
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from common.diff_utils import EXCLUDE_FIELDS
 from service_migration.validation.types import ValidationIssue
 
+SNAPSHOT_FIELDS = ("organisation", "location", "healthcare_service")
+
+
+def entity_hash(entity: BaseModel) -> str:
+    """
+    Stable content hash of an entity, ignoring the fields the differ ignores,
+    so an entity hashes the same whenever it would produce an empty diff.
+    """
+    document = entity.model_dump(mode="json", exclude=set(EXCLUDE_FIELDS))
+    encoded = json.dumps(document, sort_keys=True, separators=(",", ":"))
+    return sha256(encoded.encode()).hexdigest()
+
+
+def compress_snapshot(entity: BaseModel) -> bytes:
+    """
+    Encode an entity snapshot as zlib-compressed JSON.
+    """
+    encoded = json.dumps(entity.model_dump(mode="json"), separators=(",", ":"))
+    return zlib.compress(encoded.encode())
+
+
+def decompress_snapshot(value: bytes) -> dict[str, Any]:
+    return json.loads(zlib.decompress(value))
+
 
 class ServiceMigrationState(BaseModel):
+    """
+    The migration state record of a service.
+
+    Each entity snapshot is stored alongside a hash of its content, so an
+    unchanged entity can be recognised without diffing it. Snapshots are either
+    maps or zlib-compressed JSON binaries; records written before hashes were
+    stored have their hashes derived from their snapshots when read.
+    """
+
     source_record_id: str
     version: int
     organisation_id: UUID | None
     organisation: Organisation | None
+    organisation_hash: str | None = None
     location_id: UUID | None
     location: Location | None
+    location_hash: str | None = None
     healthcare_service_id: UUID | None
     healthcare_service: HealthcareService | None
+    healthcare_service_hash: str | None = None
     validation_issues: list[ValidationIssue]
 
+    @model_validator(mode="before")
+    @classmethod
+    def decompress_snapshots(cls, data: Any) -> Any:  # noqa: ANN401
+        if not isinstance(data, dict):
+            return data
+
+        data = dict(data)
+        for name in SNAPSHOT_FIELDS:
+            value = data.get(name)
+            if isinstance(value, Binary):
+                value = value.value
+            if isinstance(value, (bytes, bytearray)):
+                data[name] = decompress_snapshot(value)
+        return data
+
+    @model_validator(mode="after")
+    def fill_missing_hashes(self) -> Self:
+        for name in SNAPSHOT_FIELDS:
+            entity = getattr(self, name)
+            if entity is not None and getattr(self, f"{name}_hash") is None:
+                setattr(self, f"{name}_hash", entity_hash(entity))
+        return self
+
+    def dump_item(self, compress_snapshots: bool = True) -> dict[str, Any]:
+        """
+        Dump the state record for writing to DynamoDB, with the entity
+        snapshots compressed unless compress_snapshots is False.
+        """
+        item = self.model_dump(mode="json", exclude=set(SNAPSHOT_FIELDS))
+        for name in SNAPSHOT_FIELDS:
+            entity = getattr(self, name)
+            if entity is None:
+                item[name] = None
+            elif compress_snapshots:
+                item[name] = compress_snapshot(entity)
+            else:
+                item[name] = entity.model_dump(mode="json")
+        return item
+
     @classmethod
     def format_source_record_id(cls, service_id: int) -> str:
         return f"services#{service_id}"
@@ -51,6 +132,13 @@ class ServiceMigrationMetrics(BaseModel):
     invalid: int = 0
     errors: int = 0
 
+    def add(self, other: "ServiceMigrationMetrics") -> None:
+        """
+        Add the counts from another run, such as a full sync shard, to these metrics.
+        """
+        for name in type(self).model_fields:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
     def reset(self) -> None:
         """
         Reset all metrics to zero.
@@ -64,3 +152,65 @@ class ServiceMigrationMetrics(BaseModel):
         self.skipped = 0
         self.invalid = 0
         self.errors = 0
+
+
+class FullSyncShard(BaseModel):
+    """
+    One of count partitions of the legacy services for a full sync, numbered from 0.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    index: Annotated[int, Field(ge=0)]
+    count: Annotated[int, Field(ge=1)]
+
+    @model_validator(mode="after")
+    def check_index(self) -> Self:
+        if self.index >= self.count:
+            raise ValueError(f"Shard index must be less than {self.count}")
+        return self
+
+    @classmethod
+    def parse(cls, value: str) -> "FullSyncShard":
+        """
+        Parse a shard given as index/count, for example 0/4.
+        """
+        index, separator, count = value.partition("/")
+        if not separator:
+            raise ValueError(f"Shard must be given as index/count, got {value!r}")
+
+        return cls(index=int(index), count=int(count))
+
+    def split(self, parts: int) -> list["FullSyncShard"]:
+        """
+        Split this shard into parts smaller shards that together cover the same
+        services, as shard keys congruent to index modulo count.
+        """
+        return [
+            FullSyncShard(
+                index=self.index + part * self.count, count=self.count * parts
+            )
+            for part in range(parts)
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+
+class DryRunRow(BaseModel):
+    """
+    One service in a dry-run report: the transformer chosen, the outcome, the
+    validation issues raised and the items that would be inserted.
+    """
+
+    service_id: int
+    service_type_id: int | None = None
+    transformer: str | None = None
+    outcome: Literal["unsupported", "skipped", "invalid", "transformed", "error"] = (
+        "error"
+    )
+    issue_count: int = 0
+    issue_codes: list[str] = []
+    organisations: int = 0
+    locations: int = 0
+    healthcare_services: int = 0
@@ -1,5 +1,9 @@
-from time import perf_counter
-from typing import Any, Iterable
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from itertools import chain
+from pathlib import Path
+from time import perf_counter, sleep
+from typing import Any, Iterable, Iterator
 from uuid import UUID
 
 from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
@@ -7,15 +11,26 @@ from ftrs_common.logger import Logger
 from ftrs_common.utils.db_service import get_table_name
 from ftrs_data_layer.client import get_dynamodb_client
 from ftrs_data_layer.domain import legacy
+from ftrs_data_layer.domain.base import TRUSTED_READ_CONTEXT
 from ftrs_data_layer.logbase import DataMigrationLogBase
-from sqlalchemy import Engine
+from ftrs_data_layer.repository.dynamodb.repository import (
+    BATCH_GET_MAX_KEYS,
+    MAX_UNPROCESSED_RETRIES,
+    backoff_delay,
+)
+from sqlalchemy import ColumnElement, Engine, Integer, String, cast, func
 from sqlmodel import Session, create_engine, select
 
 from common.cache import DoSMetadataCache
+from common.sql_utils import SERVICE_RELATIONSHIP_LOADERS
 from service_migration.config import DataMigrationConfig
 from service_migration.ddb_transactions import ServiceTransactionBuilder
 from service_migration.exceptions import ParentPharmacyNotFoundError
-from service_migration.models import ServiceMigrationMetrics, ServiceMigrationState
+from service_migration.models import (
+    FullSyncShard,
+    ServiceMigrationMetrics,
+    ServiceMigrationState,
+)
 from service_migration.transformer import (
     SUPPORTED_TRANSFORMERS,
     ServiceTransformer,
@@ -27,6 +42,60 @@ from service_migration.transformer.base_pharmacy import (
 )
 from service_migration.validation.types import ValidationResult
 
+FULL_SYNC_CHUNK_SIZE = 1000
+PHARMACY_ODS_CODE_LENGTH = 5
+TRANSACT_WRITE_MAX_ITEMS = 100
+
+
+@dataclass
+class PendingServiceWrite:
+    """
+    The transaction items for one service, held back to be written with others.
+    """
+
+    service_id: int
+    state_record: ServiceMigrationState | None
+    transaction_items: list[dict[str, Any]]
+
+
+def pack_pending_writes(
+    pending_writes: list[PendingServiceWrite],
+    max_items: int = TRANSACT_WRITE_MAX_ITEMS,
+) -> list[list[PendingServiceWrite]]:
+    """
+    Group pending writes, in order, into as few transactions of at most max_items
+    items as possible. A service's items are never split across transactions.
+    """
+    groups: list[list[PendingServiceWrite]] = []
+    group_size = 0
+    for pending_write in pending_writes:
+        item_count = len(pending_write.transaction_items)
+        if not groups or group_size + item_count > max_items:
+            groups.append([])
+            group_size = 0
+
+        groups[-1].append(pending_write)
+        group_size += item_count
+
+    return groups
+
+
+def shard_key() -> ColumnElement[int]:
+    """
+    Hash used to partition services between full sync shards.
+
+    Services are hashed on the first five characters of their ODS code, the length
+    of a pharmacy ODS code, so linked pharmacy services always share a shard with
+    their parent pharmacy. Services without an ODS code are hashed on their id.
+    """
+    return func.hashtext(
+        func.coalesce(
+            func.left(legacy.Service.odscode, PHARMACY_ODS_CODE_LENGTH),
+            cast(legacy.Service.id, String),
+        ),
+        type_=Integer,
+    )
+
 
 class DataMigrationProcessor:
     """
@@ -47,13 +116,79 @@ class DataMigrationProcessor:
         self.engine = self._create_db_engine()
         self.metrics = ServiceMigrationMetrics()
         self.metadata = DoSMetadataCache(self.engine)
+        # State records by source_record_id; None marks a service known to have
+        # no state record yet. Cleared after each full-sync chunk or SQS batch.
+        self.state_cache: dict[str, ServiceMigrationState | None] = {}
+        # Writes held back while inside coalesced_writes, otherwise None.
+        self.pending_writes: list[PendingServiceWrite] | None = None
+        if self.config.warm_metadata_cache:
+            self.warm_metadata()
+
+    def warm_metadata(self) -> None:
+        """
+        Preload the DoS metadata cache so transforms never query reference tables.
+        The snapshot file, when configured, is read instead of the database if it
+        exists and written after warming from the database if it does not.
+        """
+        snapshot_path = self.config.metadata_snapshot_path
+        if snapshot_path and Path(snapshot_path).exists():
+            try:
+                self.metadata.load_snapshot(snapshot_path)
+                self._log_metadata_warmed(source=snapshot_path)
+                return
+            except (OSError, ValueError, KeyError) as e:
+                self.logger.log(
+                    DataMigrationLogBase.DM_ETL_046,
+                    action="read",
+                    path=snapshot_path,
+                    error=str(e),
+                )
+
+        self.metadata.warm()
+        self._log_metadata_warmed(source="database")
+
+        if snapshot_path:
+            try:
+                self.metadata.save_snapshot(snapshot_path)
+            except OSError as e:
+                self.logger.log(
+                    DataMigrationLogBase.DM_ETL_046,
+                    action="write",
+                    path=snapshot_path,
+                    error=str(e),
+                )
 
-    def sync_all_services(self) -> None:
+    def _log_metadata_warmed(self, source: str) -> None:
+        self.logger.log(
+            DataMigrationLogBase.DM_ETL_045,
+            source=source,
+            sizes={name: stats.size for name, stats in self.metadata.stats().items()},
+        )
+
+    def metadata_cache_stats(self) -> dict[str, dict[str, int]]:
+        return {name: asdict(stats) for name, stats in self.metadata.stats().items()}
+
+    def sync_all_services(self, shard: FullSyncShard | None = None) -> None:
         """
-        Run the full sync process.
+        Run the full sync process, or only the services in the given shard.
         """
-        for record in self._iter_records():
-            self._process_service(record)
+        start_time = perf_counter()
+        processed_count = 0
+
+        for chunk in self._iter_record_chunks(shard=shard):
+            self.prefetch_state_records(service.id for service in chunk)
+            for record in chunk:
+                self._process_service(record)
+            self.state_cache.clear()
+
+            processed_count += len(chunk)
+            elapsed_time = perf_counter() - start_time
+            self.logger.log(
+                DataMigrationLogBase.DM_ETL_044,
+                shard=str(shard) if shard else None,
+                processed_count=processed_count,
+                services_per_second=round(processed_count / elapsed_time, 1),
+            )
 
     def sync_service(self, record_id: int, method: str) -> None:
         """
@@ -103,37 +238,105 @@ class DataMigrationProcessor:
         """
         Check if a data migration state record exists for the given service ID.
         Returns the state record if it exists, None otherwise.
-        Uses get_item with the source_record_id as the key.
+        Records in the state cache are returned without a read; anything else is
+        read with get_item using the source_record_id as the key, then cached.
         """
-        dynamodb_client = get_dynamodb_client(self.config.dynamodb_endpoint)
-        state_table = get_table_name("data-migration-state")
-
         source_record_id = ServiceMigrationState.format_source_record_id(service_id)
 
-        response = dynamodb_client.get_item(
-            TableName=state_table,
-            Key={"source_record_id": {"S": source_record_id}},
-            ConsistentRead=True,
-        )
+        if source_record_id in self.state_cache:
+            state_record = self.state_cache[source_record_id]
+        else:
+            dynamodb_client = get_dynamodb_client(self.config.dynamodb_endpoint)
+            response = dynamodb_client.get_item(
+                TableName=get_table_name("data-migration-state"),
+                Key={"source_record_id": {"S": source_record_id}},
+                ConsistentRead=True,
+            )
+
+            item = response.get("Item")
+            state_record = self._deserialise_state_record(item) if item else None
+            self.state_cache[source_record_id] = state_record
 
-        item = response.get("Item")
-        if not item:
+        if state_record is None:
             self.logger.log(
                 DataMigrationLogBase.DM_ETL_020,
                 record_id=service_id,
             )
             return None
 
-        # Deserialize the item back into a ServiceMigrationState
-        deserialized_data = {
-            k: self.deserializer.deserialize(v) for k, v in item.items()
-        }
-
         self.logger.log(
             DataMigrationLogBase.DM_ETL_019,
             record_id=service_id,
         )
-        return ServiceMigrationState.model_validate(deserialized_data)
+        return state_record
+
+    def prefetch_state_records(self, service_ids: Iterable[int]) -> None:
+        """
+        Load the state records for the given service IDs into the state cache using
+        strongly consistent BatchGetItem requests of up to 100 keys.
+        Services without a state record are cached as None, and services already in
+        the cache are not read again.
+        """
+        source_record_ids = [
+            source_record_id
+            for source_record_id in dict.fromkeys(
+                ServiceMigrationState.format_source_record_id(service_id)
+                for service_id in service_ids
+            )
+            if source_record_id not in self.state_cache
+        ]
+        if not source_record_ids:
+            return
+
+        dynamodb_client = get_dynamodb_client(self.config.dynamodb_endpoint)
+        state_table = get_table_name("data-migration-state")
+        request_count = 0
+        found_count = 0
+
+        for start in range(0, len(source_record_ids), BATCH_GET_MAX_KEYS):
+            chunk = source_record_ids[start : start + BATCH_GET_MAX_KEYS]
+            request_items = {
+                state_table: {
+                    "Keys": [
+                        {"source_record_id": {"S": source_record_id}}
+                        for source_record_id in chunk
+                    ],
+                    "ConsistentRead": True,
+                }
+            }
+            attempt = 0
+            while request_items:
+                response = dynamodb_client.batch_get_item(RequestItems=request_items)
+                request_count += 1
+
+                for item in response.get("Responses", {}).get(state_table, []):
+                    state_record = self._deserialise_state_record(item)
+                    self.state_cache[state_record.source_record_id] = state_record
+                    found_count += 1
+
+                request_items = response.get("UnprocessedKeys") or {}
+                if not request_items:
+                    break
+
+                if attempt >= MAX_UNPROCESSED_RETRIES:
+                    error_msg = (
+                        f"Unprocessed state record keys after {attempt} retries: "
+                        f"{request_items}"
+                    )
+                    raise RuntimeError(error_msg)
+
+                sleep(backoff_delay(attempt))
+                attempt += 1
+
+            for source_record_id in chunk:
+                self.state_cache.setdefault(source_record_id, None)
+
+        self.logger.log(
+            DataMigrationLogBase.DM_ETL_042,
+            record_count=len(source_record_ids),
+            found_count=found_count,
+            request_count=request_count,
+        )
 
     def _process_service(self, service: legacy.Service) -> None:
         """
@@ -221,7 +424,16 @@ class DataMigrationProcessor:
         validation_result = transformer.validator.validate(
             service
         )  # note: some pre-transformation logic here
+        return self._check_validation_result(service, validation_result)
 
+    def _check_validation_result(
+        self,
+        service: legacy.Service,
+        validation_result: ValidationResult[legacy.Service],
+    ) -> ValidationResult[legacy.Service] | None:
+        """
+        Log the validation issues, returning None if the service cannot continue.
+        """
         if not validation_result.is_valid:
             issues = [
                 issue.model_dump(mode="json") for issue in validation_result.issues
@@ -270,7 +482,7 @@ class DataMigrationProcessor:
         transaction_items = self._build_transaction_items(
             service.id, state_record, validation_result.issues, result
         )
-        self._execute_transaction_and_track(state_record, transaction_items)
+        self._execute_transaction_and_track(service.id, state_record, transaction_items)
 
         return result
 
@@ -289,6 +501,7 @@ class DataMigrationProcessor:
                 logger=self.logger,
                 migration_state=state_record,
                 validation_issues=validation_issues,
+                compress_snapshots=self.config.compress_state_snapshots,
             )
             .add_organisation(result.organisation[0] if result.organisation else None)
             .add_location(result.location[0] if result.location else None)
@@ -300,19 +513,92 @@ class DataMigrationProcessor:
 
     def _execute_transaction_and_track(
         self,
+        service_id: int,
         state_record: ServiceMigrationState | None,
         transaction_items: list[dict[str, Any]],
     ) -> None:
         if not transaction_items:
             return
 
+        if self.pending_writes is not None:
+            self.pending_writes.append(
+                PendingServiceWrite(service_id, state_record, transaction_items)
+            )
+            return
+
         self._execute_transaction(transaction_items)
+        self._track_write(state_record)
+
+    def _track_write(self, state_record: ServiceMigrationState | None) -> None:
         if state_record is None:
             self.metrics.inserted += 1
             return
 
         self.metrics.updated += 1
 
+    @contextmanager
+    def coalesced_writes(self) -> Iterator[None]:
+        """
+        Hold back the DynamoDB writes of services processed inside the block, then
+        write them packed into as few TransactWriteItems calls as possible.
+        """
+        self.pending_writes = []
+        try:
+            yield
+        finally:
+            self.flush_pending_writes()
+            self.pending_writes = None
+
+    def flush_pending_writes(self) -> None:
+        """
+        Write the services held back by coalesced_writes.
+        Each packed transaction is atomic, so when one fails nothing in it was
+        written and its services are retried one transaction each, leaving only the
+        failing services counted as errors.
+        """
+        if not self.pending_writes:
+            return
+
+        pending_writes, self.pending_writes = self.pending_writes, []
+        for group in pack_pending_writes(pending_writes):
+            if len(group) == 1:
+                self._write_pending_service(group[0])
+                continue
+
+            try:
+                self._execute_transaction(
+                    [item for write in group for item in write.transaction_items]
+                )
+            except Exception as e:
+                self.logger.log(
+                    DataMigrationLogBase.DM_ETL_047,
+                    service_count=len(group),
+                    error=str(e),
+                )
+                for pending_write in group:
+                    self._write_pending_service(pending_write)
+                continue
+
+            for pending_write in group:
+                self._track_write(pending_write.state_record)
+
+    def _write_pending_service(self, pending_write: PendingServiceWrite) -> None:
+        # Flushes can happen while another record is being processed, so the
+        # record_id logger key is left alone and passed with the log instead.
+        try:
+            self._execute_transaction(pending_write.transaction_items)
+            self._track_write(pending_write.state_record)
+        except Exception as e:
+            self.metrics.errors += 1
+            self.logger.exception(
+                "Unexpected error encountered whilst writing service record"
+            )
+            self.logger.log(
+                DataMigrationLogBase.DM_ETL_008,
+                error=str(e),
+                record_id=pending_write.service_id,
+            )
+
     def _log_migration_completion(
         self,
         transformer: ServiceTransformer,
@@ -333,13 +619,50 @@ class DataMigrationProcessor:
 
     # State & database helpers
 
-    def _iter_records(self, batch_size: int = 1000) -> Iterable[legacy.Service]:
+    def _iter_records(
+        self, batch_size: int = FULL_SYNC_CHUNK_SIZE
+    ) -> Iterable[legacy.Service]:
         """
-        Iterate over records in the database.
+        Iterate over records in the database, ordered by id.
         """
-        stmt = select(legacy.Service).execution_options(yield_per=batch_size)
-        with Session(self.engine) as session:
-            yield from session.scalars(stmt)
+        return chain.from_iterable(self._iter_record_chunks(batch_size))
+
+    def _iter_record_chunks(
+        self,
+        batch_size: int = FULL_SYNC_CHUNK_SIZE,
+        shard: FullSyncShard | None = None,
+    ) -> Iterable[list[legacy.Service]]:
+        """
+        Iterate over records in the database in chunks of batch_size, ordered by id.
+        When a shard is given, only services whose shard key falls in it are read.
+
+        Each chunk is read in its own short session with all relationships eagerly
+        loaded, so a chunk costs a fixed number of queries however many services it
+        holds, and the session does not grow over the full run.
+        """
+        last_id = None
+        while True:
+            stmt = (
+                select(legacy.Service)
+                .options(*SERVICE_RELATIONSHIP_LOADERS)
+                .order_by(legacy.Service.id)
+                .limit(batch_size)
+            )
+            if shard is not None:
+                stmt = stmt.where(func.abs(shard_key() % shard.count) == shard.index)
+            if last_id is not None:
+                stmt = stmt.where(legacy.Service.id > last_id)
+
+            with Session(self.engine) as session:
+                chunk = list(session.scalars(stmt))
+
+            if chunk:
+                yield chunk
+
+            if len(chunk) < batch_size:
+                return
+
+            last_id = chunk[-1].id
 
     def _execute_transaction(self, transact_items: list[dict[str, Any]]) -> None:
         """
@@ -355,6 +678,11 @@ class DataMigrationProcessor:
                 item_count=len(transact_items),
             )
         except Exception as e:
+            # The stored state is unknown after a failed write, so read it again
+            # next time rather than trusting the cache.
+            for source_record_id in self._written_state_records(transact_items):
+                self.state_cache.pop(source_record_id, None)
+
             # Check if it's a TransactionCanceledException with ConditionalCheckFailed
             error_code = None
             if hasattr(e, "response"):
@@ -389,6 +717,34 @@ class DataMigrationProcessor:
 
             raise  # Reraise other exceptions
 
+        for source_record_id, item in self._written_state_records(
+            transact_items
+        ).items():
+            self.state_cache[source_record_id] = self._deserialise_state_record(item)
+
+    def _written_state_records(
+        self, transact_items: list[dict[str, Any]]
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Return the state record items put by a transaction, by source_record_id.
+        """
+        state_table = get_table_name("data-migration-state")
+        return {
+            put["Item"]["source_record_id"]["S"]: put["Item"]
+            for transact_item in transact_items
+            if (put := transact_item.get("Put")) and put["TableName"] == state_table
+        }
+
+    def _deserialise_state_record(self, item: dict[str, Any]) -> ServiceMigrationState:
+        deserialized_data = {
+            k: self.deserializer.deserialize(v) for k, v in item.items()
+        }
+        # State records are only written by this service, so the snapshots have
+        # already passed the expensive domain validation.
+        return ServiceMigrationState.model_validate(
+            deserialized_data, context=TRUSTED_READ_CONTEXT
+        )
+
     def _create_db_engine(self) -> Engine:
         # Validate the presence of a real connection string to avoid confusing errors when given mocks
         connection_string = getattr(
@@ -413,6 +769,10 @@ class DataMigrationProcessor:
         and set the org/location IDs on the transformer.
         Returns False if processing should stop (parent not found or parent migration failed).
         """
+        # The parent may be among the held back writes; it must be stored before
+        # its state record is read.
+        self.flush_pending_writes()
+
         try:
             parent_service, org_id, loc_id = transformer.resolve_parent(
                 service, self.engine, self.get_state_record
@@ -477,6 +837,7 @@ class DataMigrationProcessor:
                 logger=self.logger,
                 migration_state=parent_state,
                 validation_issues=validation_result.issues,
+                compress_snapshots=self.config.compress_state_snapshots,
             )
             .add_organisation(
                 parent_result.organisation[0] if parent_result.organisation else None
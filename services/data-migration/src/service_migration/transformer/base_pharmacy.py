@@ -13,10 +13,10 @@ from ftrs_data_layer.domain import (
 from ftrs_data_layer.domain import legacy as legacy_model
 from ftrs_data_layer.logbase import DataMigrationLogBase
 from sqlalchemy import Engine
-from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select
 
 from common.cache import DoSMetadataCache
+from common.sql_utils import SERVICE_RELATIONSHIP_LOADERS
 from service_migration.exceptions import ParentPharmacyNotFoundError
 from service_migration.transformer.base import (
     ServiceTransformer,
@@ -220,18 +220,7 @@ class LinkedPharmacyTransformer(ServiceTransformer):
             .where(legacy_model.Service.odscode == base_ods_code)
             .where(legacy_model.Service.typeid.in_(self.PARENT_PHARMACY_TYPE_IDS))
             .where(legacy_model.Service.statusid == self.STATUS_ACTIVE)
-            .options(
-                selectinload(legacy_model.Service.endpoints),
-                selectinload(legacy_model.Service.scheduled_opening_times).selectinload(
-                    legacy_model.ServiceDayOpening.times
-                ),
-                selectinload(legacy_model.Service.specified_opening_times).selectinload(
-                    legacy_model.ServiceSpecifiedOpeningDate.times
-                ),
-                selectinload(legacy_model.Service.sgsds),
-                selectinload(legacy_model.Service.dispositions),
-                selectinload(legacy_model.Service.age_range),
-            )
+            .options(*SERVICE_RELATIONSHIP_LOADERS)
             .limit(1)
         )
         with Session(engine) as session:
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Generic
+from typing import Generic, Sequence
 
 from ftrs_common.logger import Logger
 
@@ -19,6 +19,14 @@ class Validator(ABC, Generic[TypeToValidate]):
     def validate(self, data: TypeToValidate) -> ValidationResult:
         raise NotImplementedError("Subclasses must implement this method")
 
+    def validate_many(
+        self, data: Sequence[TypeToValidate]
+    ) -> list[ValidationResult[TypeToValidate]]:
+        """
+        Validate a batch of records, returning a result per record in order
+        """
+        return [self.validate(record) for record in data]
+
     @classmethod
     def validate_email(
         cls,
@@ -18,6 +18,8 @@ class FieldValidationResult(BaseModel, Generic[FieldType]):
 
 
 class FieldValidator(ABC, Generic[FieldType]):
+    ERROR_MESSAGES: dict[str, str] = {}
+
     issues: list[ValidationIssue]
 
     def __init__(self, expression: str | None = None) -> None:
@@ -54,6 +56,24 @@ class FieldValidator(ABC, Generic[FieldType]):
             )
         )
 
+    @classmethod
+    def build_issue(
+        cls,
+        code: str,
+        value: FieldType | None,
+        expression: str | None,
+    ) -> ValidationIssue:
+        """
+        Build the error issue add_issue would record for a failed check
+        """
+        return ValidationIssue(
+            value=value,
+            severity="error",
+            code=code,
+            diagnostics=cls.ERROR_MESSAGES[code],
+            expression=[expression] if expression else None,
+        )
+
     @property
     def is_valid(self) -> bool:
         return not any(issue.severity in ["error", "fatal"] for issue in self.issues)
@@ -30,17 +30,13 @@ class EmailValidator(FieldValidator[str]):
         """
         Run validation over a specific email field
         """
-        validation_functions = [
-            self.is_valid_type,
-            self.is_valid_length,
-            self.is_valid_format,
-            self.is_nhs_email,
-        ]
-
-        for func in validation_functions:
-            is_valid = func(data)
-            if not is_valid:
-                break
+        if code := self.check(data):
+            self.add_issue(
+                severity="error",
+                code=code,
+                diagnostics=self.ERROR_MESSAGES[code],
+                value=data,
+            )
 
         return FieldValidationResult(
             original=data,
@@ -48,102 +44,28 @@ class EmailValidator(FieldValidator[str]):
             issues=self.issues,
         )
 
-    def is_valid_type(self, email: str) -> bool:
+    @classmethod
+    def check(cls, email: str) -> str | None:
         """
-        Validates if the provided email is a string.
-
-        Args:
-            email (str): The email address to validate.
-
-        Returns:
-            bool: True if the email is a string, False otherwise.
+        Return the code of the first check the email fails, or None if valid.
+        Used directly when validating many emails at once, without building
+        issue or result objects.
         """
         if not email or not isinstance(email, str):
-            self.add_issue(
-                severity="error",
-                code="email_not_string",
-                diagnostics=self.ERROR_MESSAGES["email_not_string"],
-                value=email,
-            )
-            return False
-
-        return True
-
-    def is_valid_length(self, email: str) -> bool:
-        """
-        Validates if the provided email is within the valid length.
-
-        Args:
-            email (str): The email address to validate.
-
-        Returns:
-            bool: True if the email length is valid, False otherwise.
-        """
-        if len(email) > self.VALID_EMAIL_ADDRESS_LENGTH:
-            self.add_issue(
-                severity="error",
-                code="invalid_length",
-                diagnostics=self.ERROR_MESSAGES["invalid_length"],
-                value=email,
-            )
-            return False
-
-        return True
+            return "email_not_string"
 
-    def is_valid_format(self, email: str) -> bool:
-        """
-        Validates if the provided email is in a legitimate format.
-
-        Args:
-            email (str): The email address to validate.
+        if len(email) > cls.VALID_EMAIL_ADDRESS_LENGTH:
+            return "invalid_length"
 
-        Returns:
-            bool: True if the email is valid, False otherwise.
-        """
         email_parts = email.split("@")
-        if len(email_parts) != self.VALID_EMAIL_PARTS_COUNT:
-            self.add_issue(
-                severity="error",
-                code="invalid_format",
-                diagnostics=self.ERROR_MESSAGES["invalid_format"],
-                value=email,
-            )
-            return False
-
-        match_local = self.VALID_EMAIL_LOCAL_REGEX.fullmatch(email_parts[0])
-        match_domain = self.VALID_EMAIL_DOMAIN_REGEX.fullmatch(email_parts[-1])
-
-        if match_local is not None and match_domain is not None:
-            return True
-
-        self.add_issue(
-            severity="error",
-            code="invalid_format",
-            diagnostics=self.ERROR_MESSAGES["invalid_format"],
-            value=email,
-        )
-        return False
+        if (
+            len(email_parts) != cls.VALID_EMAIL_PARTS_COUNT
+            or cls.VALID_EMAIL_LOCAL_REGEX.fullmatch(email_parts[0]) is None
+            or cls.VALID_EMAIL_DOMAIN_REGEX.fullmatch(email_parts[-1]) is None
+        ):
+            return "invalid_format"
 
-    def is_nhs_email(self, email: str) -> bool:
-        """
-        Validates if the provided email is a valid NHS email.
-
-        Args:
-            email (str): The email address to validate.
-
-        Returns:
-            bool: True if the email is a valid NHS email, False otherwise.
-        """
-        email_parts = email.split("@")
-
-        match = self.NHS_EMAIL_REGEX.fullmatch(email_parts[-1])
-        if match is None:
-            self.add_issue(
-                severity="error",
-                code="not_nhs_email",
-                diagnostics=self.ERROR_MESSAGES["not_nhs_email"],
-                value=email,
-            )
-            return False
+        if cls.NHS_EMAIL_REGEX.fullmatch(email_parts[-1]) is None:
+            return "not_nhs_email"
 
-        return True
+        return None
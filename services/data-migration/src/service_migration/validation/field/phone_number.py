@@ -21,63 +21,43 @@ class PhoneNumberValidator(FieldValidator[str]):
         "empty": "Phone number cannot be empty",
     }
 
-    def validate(self, data: str) -> FieldValidationResult[str]:
+    @classmethod
+    def check(cls, data: str) -> tuple[str, str | None]:
+        """
+        Return the normalised phone number and the code of the check it fails,
+        or None if valid. Empty and non-string values are returned unchanged.
+        Used directly when validating many phone numbers at once, without
+        building issue or result objects.
+        """
         if not data:
-            self.add_issue(
-                severity="error",
-                code="empty",
-                diagnostics=self.ERROR_MESSAGES["empty"],
-                value=data,
-            )
-            return FieldValidationResult(
-                original=data,
-                sanitised=None,
-                issues=self.issues,
-            )
+            return data, "empty"
 
         if not isinstance(data, str):
-            self.add_issue(
-                severity="error",
-                code="not_string",
-                diagnostics=self.ERROR_MESSAGES["not_string"],
-                value=data,
-            )
-            return FieldValidationResult(
-                original=data,
-                sanitised=None,
-                issues=self.issues,
-            )
+            return data, "not_string"
 
         # Normalise input: strip spaces and convert +44 prefix to 0
         data = data.strip().replace(" ", "").replace("+44", "0")
 
-        # 1) Length validation first. If length is invalid, report only that.
-        length_invalid = any(
-            [
-                len(data) > PhoneNumberValidator.PHONE_NUMBER_VALID_UPPER_LENGTH,
-                len(data) < PhoneNumberValidator.PHONE_NUMBER_VALID_LOWER_LENGTH,
-                len(data) == PhoneNumberValidator.INVALID_PHONE_NUMBER_LENGTH,
-            ]
-        )
-        if length_invalid:
-            self.add_issue(
-                severity="error",
-                code="invalid_length",
-                diagnostics=self.ERROR_MESSAGES["invalid_length"],
-                value=data,
-            )
-            return FieldValidationResult(
-                original=data,
-                sanitised=None,
-                issues=self.issues,
-            )
+        # Length is checked first, so an invalid length is the only issue reported
+        if (
+            len(data) > cls.PHONE_NUMBER_VALID_UPPER_LENGTH
+            or len(data) < cls.PHONE_NUMBER_VALID_LOWER_LENGTH
+            or len(data) == cls.INVALID_PHONE_NUMBER_LENGTH
+        ):
+            return data, "invalid_length"
+
+        if not cls.PHONE_NUMBER_REGEX.fullmatch(data):
+            return data, "invalid_format"
 
-        # 2) Format validation only when length is acceptable
-        if not self.PHONE_NUMBER_REGEX.fullmatch(data):
+        return data, None
+
+    def validate(self, data: str) -> FieldValidationResult[str]:
+        data, code = self.check(data)
+        if code:
             self.add_issue(
                 severity="error",
-                code="invalid_format",
-                diagnostics=self.ERROR_MESSAGES["invalid_format"],
+                code=code,
+                diagnostics=self.ERROR_MESSAGES[code],
                 value=data,
             )
 
@@ -1,6 +1,8 @@
 import html
 import re
+from typing import Callable, Sequence, TypeVar
 
+from ftrs_data_layer.domain import Address
 from ftrs_data_layer.domain.legacy.service import Service
 from ftrs_data_layer.logbase import UtilsLogBase
 
@@ -10,8 +12,30 @@ from service_migration.validation.base import (
     ValidationResult,
     Validator,
 )
+from service_migration.validation.field import EmailValidator, PhoneNumberValidator
 from service_migration.validation.types import ValidationIssue
 
+CheckResult = TypeVar("CheckResult")
+
+
+def _check_column(
+    check: Callable[[str | None], CheckResult], values: list[str | None]
+) -> list[CheckResult]:
+    """
+    Run a field check over a column of values, once per distinct value
+    """
+    outcomes = {value: check(value) for value in dict.fromkeys(values)}
+    return [outcomes[value] for value in values]
+
+
+def _set_if_changed(service: Service, field: str, value: str | None) -> None:
+    """
+    Assign a sanitised value, skipping the instrumented attribute set when the
+    value is unchanged, as it is for most valid fields
+    """
+    if getattr(service, field) != value:
+        setattr(service, field, value)
+
 
 class ServiceValidator(Validator[Service]):
     """
@@ -50,6 +74,70 @@ class ServiceValidator(Validator[Service]):
 
         return validation_result
 
+    def validate_many(self, data: Sequence[Service]) -> list[ValidationResult[Service]]:
+        """
+        Validate a batch of services column by column.
+
+        Each distinct email and phone number is checked once, and issues are
+        only created for failures. Gives the same results as validate.
+        """
+        email_codes = _check_column(EmailValidator.check, [s.email for s in data])
+        publicphones = _check_column(
+            PhoneNumberValidator.check, [s.publicphone for s in data]
+        )
+        nonpublicphones = _check_column(
+            PhoneNumberValidator.check, [s.nonpublicphone for s in data]
+        )
+
+        result_cls = ValidationResult[Service]
+        results = []
+        for service, email_code, publicphone, nonpublicphone in zip(
+            data, email_codes, publicphones, nonpublicphones, strict=True
+        ):
+            issues = []
+            if email_code is not None:
+                issues.append(
+                    EmailValidator.build_issue(email_code, service.email, "email")
+                )
+                _set_if_changed(service, "email", None)
+
+            _set_if_changed(
+                service,
+                "publicphone",
+                self._apply_phone_check(publicphone, "publicphone", issues),
+            )
+            _set_if_changed(
+                service,
+                "nonpublicphone",
+                self._apply_phone_check(nonpublicphone, "nonpublicphone", issues),
+            )
+
+            results.append(
+                result_cls(
+                    origin_record_id=service.id,
+                    issues=issues,
+                    sanitised=service,
+                )
+            )
+
+        return results
+
+    def _apply_phone_check(
+        self,
+        check: tuple[str, str | None],
+        expression: str,
+        issues: list[ValidationIssue],
+    ) -> str | None:
+        """
+        Record the issue from a phone number check, returning the sanitised value
+        """
+        phone_number, code = check
+        if code is None:
+            return phone_number
+
+        issues.append(PhoneNumberValidator.build_issue(code, phone_number, expression))
+        return None
+
 
 class GPPracticeValidator(ServiceValidator):
     # Maximum allowed length for practice names
@@ -80,6 +168,28 @@ class GPPracticeValidator(ServiceValidator):
 
         return result
 
+    def validate_many(self, data: Sequence[Service]) -> list[ValidationResult[Service]]:
+        """
+        Validate a batch of GP practices, with the name and location checks
+        only creating issues for failures. Gives the same results as validate.
+        """
+        results = super().validate_many(data)
+
+        for result in results:
+            service = result.sanitised
+            publicname, name_error = self._clean_name(service.publicname)
+            _set_if_changed(service, "publicname", publicname)
+            if name_error:
+                result.issues.append(self._name_issue(*name_error))
+
+            _, location_issue = self._format_location(
+                service.address, service.town, service.postcode
+            )
+            if location_issue:
+                result.issues.append(location_issue)
+
+        return results
+
     def validate_name(self, name: str | None) -> FieldValidationResult[str]:
         """
         Validate and sanitize GP practice name.
@@ -98,12 +208,31 @@ class GPPracticeValidator(ServiceValidator):
         Returns:
             FieldValidationResult containing sanitised name and any validation issues
         """
+        cleaned_name, error = self._clean_name(name)
+        if error:
+            return self._error(*error)
+
+        return FieldValidationResult(
+            original=name,
+            sanitised=cleaned_name,
+            issues=[],
+        )
+
+    def _clean_name(
+        self, name: str | None
+    ) -> tuple[str | None, tuple[str, str] | None]:
+        """
+        Apply the name checks and sanitisation steps of validate_name.
+
+        Returns:
+            The cleaned name, or None and the code and diagnostics of the failed check
+        """
         # Store full original for audit trail
         full_original = name
 
         # Early validation checks
         if error := self._validate_basic_checks(name):
-            return error
+            return None, error
 
         # Remove GP prefix variations
         name = self._remove_gp_prefix(name)
@@ -111,7 +240,7 @@ class GPPracticeValidator(ServiceValidator):
         # Apply hyphen-splitting business rule with logging
         name = self._apply_hyphen_splitting(name, full_original)
         if not name:
-            return self._error(
+            return None, (
                 "publicname_empty_after_sanitization",
                 "Name is empty after removing suffix",
             )
@@ -121,7 +250,7 @@ class GPPracticeValidator(ServiceValidator):
             decoded_name = self._decode_html_entities(name)
         except ValueError:
             self.logger.log(UtilsLogBase.UTILS_GP_PRACTICE_VALIDATOR_002)
-            return self._error(
+            return None, (
                 "publicname_suspicious_encoding",
                 "Name contains disallowed HTML entities",
             )
@@ -129,16 +258,12 @@ class GPPracticeValidator(ServiceValidator):
         # Sanitize whitespace only (hyphen-splitting already done)
         cleaned_name = self._sanitize(decoded_name)
         if not cleaned_name:
-            return self._error(
+            return None, (
                 "publicname_empty_after_sanitization",
                 "Name is empty after sanitization",
             )
 
-        return FieldValidationResult(
-            original=full_original,
-            sanitised=cleaned_name,
-            issues=[],
-        )
+        return cleaned_name, None
 
     def _remove_gp_prefix(self, name: str) -> str:
         """
@@ -182,19 +307,15 @@ class GPPracticeValidator(ServiceValidator):
 
         return split_name
 
-    def _validate_basic_checks(
-        self, name: str | None
-    ) -> FieldValidationResult[str] | None:
+    def _validate_basic_checks(self, name: str | None) -> tuple[str, str] | None:
         """
         Perform basic validation checks on the name.
 
         Returns:
-            Error result if validation fails, None if all checks pass
+            Code and diagnostics if validation fails, None if all checks pass
         """
         if not name:
-            return self._error(
-                "publicname_required", "Public name is required for GP practices"
-            )
+            return ("publicname_required", "Public name is required for GP practices")
 
         # Length validation (before any processing)
         if len(name) > self.MAX_NAME_LENGTH:
@@ -202,7 +323,7 @@ class GPPracticeValidator(ServiceValidator):
                 UtilsLogBase.UTILS_GP_PRACTICE_VALIDATOR_004,
                 max_chars=self.MAX_NAME_LENGTH,
             )
-            return self._error(
+            return (
                 "publicname_too_long",
                 f"Name exceeds maximum length of {self.MAX_NAME_LENGTH} characters",
             )
@@ -210,7 +331,7 @@ class GPPracticeValidator(ServiceValidator):
         # Check for dangerous patterns BEFORE decoding (catch injection attacks)
         if self.DANGEROUS_PATTERNS.search(name):
             self.logger.log(UtilsLogBase.UTILS_GP_PRACTICE_VALIDATOR_005)
-            return self._error(
+            return (
                 "publicname_dangerous_pattern",
                 "Name contains dangerous patterns that could lead to injection attacks",
             )
@@ -222,14 +343,15 @@ class GPPracticeValidator(ServiceValidator):
         return FieldValidationResult(
             original=None,
             sanitised=None,
-            issues=[
-                ValidationIssue(
-                    severity="error",
-                    code=code,
-                    diagnostics=message,
-                    expression=["publicname"],
-                )
-            ],
+            issues=[self._name_issue(code, message)],
+        )
+
+    def _name_issue(self, code: str, message: str) -> ValidationIssue:
+        return ValidationIssue(
+            severity="error",
+            code=code,
+            diagnostics=message,
+            expression=["publicname"],
         )
 
     def validate_location(
@@ -241,41 +363,41 @@ class GPPracticeValidator(ServiceValidator):
         Returns formatted address if at least town or postcode is available,
         even if address field is missing or invalid.
         """
-        result = FieldValidationResult(
+        formatted_address, issue = self._format_location(address, town, postcode)
+        return FieldValidationResult(
             original=address,
-            sanitised=None,
-            issues=[],
+            sanitised=formatted_address,
+            issues=[issue] if issue else [],
         )
 
+    def _format_location(
+        self, address: str, town: str, postcode: str
+    ) -> tuple[Address | None, ValidationIssue | None]:
+        """
+        Format the location, returning the address or the fatal issue preventing it.
+        """
         # Check 1: Early validation - all fields empty
         if not address and not town and not postcode:
-            result.issues.append(
-                ValidationIssue(
-                    severity="fatal",
-                    code="address_required",
-                    diagnostics="Address is required for GP practices to create a location",
-                    expression=["address"],
-                )
+            return None, ValidationIssue(
+                severity="fatal",
+                code="address_required",
+                diagnostics="Address is required for GP practices to create a location",
+                expression=["address"],
             )
-            return result
 
         # Check 2: Attempt to format address
         formatted_address = format_address(address, town, postcode)
 
         # Check 3: Format result validation Address invalid or incomplete
         if not formatted_address:
-            result.issues.append(
-                ValidationIssue(
-                    severity="fatal",
-                    code="invalid_address",
-                    diagnostics="Address was invalid or incomplete, could not be formatted for GP practices to create a location",
-                    expression=["address"],
-                )
+            return None, ValidationIssue(
+                severity="fatal",
+                code="invalid_address",
+                diagnostics="Address was invalid or incomplete, could not be formatted for GP practices to create a location",
+                expression=["address"],
             )
-            return result
 
-        result.sanitised = formatted_address
-        return result
+        return formatted_address, None
 
     def _decode_html_entities(self, name: str) -> str:
         """
@@ -0,0 +1,122 @@
+"""
+Benchmark for address formatting in the service transformers.
+
+Compares the previous county recognition, which ran
+pycountry.subdivisions.search_fuzzy on every address segment, against the
+precomputed CountyIndex with its LRU cache of segment lookups. The corpus is
+a synthetic set of legacy addresses in which street lines are mostly unique
+while towns and counties repeat, as they do across DoS services.
+
+Run from services/data-migration:
+
+    PYTHONPATH=src python -m tests.benchmarks.bench_address_formatting [address_count]
+"""
+
+import random
+import sys
+from time import perf_counter
+from unittest.mock import patch
+
+import pycountry
+
+from service_migration.constants import UK_COUNTIES
+from service_migration.formatting import address_formatter
+from service_migration.formatting.address_formatter import (
+    _county_index,
+    _lookup_county,
+    _norm,
+    format_address,
+)
+
+DEFAULT_ADDRESS_COUNT = 5000
+
+BUILDINGS = [
+    "Health Centre",
+    "Medical Centre",
+    "Surgery",
+    "Pharmacy",
+    "Community Hospital",
+    "Clinic",
+    "House",
+    "Unit 4",
+]
+STREETS = ["High Street", "Station Road", "Church Lane", "Park Avenue", "Mill Way"]
+
+
+def _search_fuzzy_county(segment: str) -> str | None:
+    try:
+        matches = pycountry.subdivisions.search_fuzzy(segment.strip())
+    except LookupError:
+        matches = []
+    for sub in matches:
+        if sub.country_code == "GB":
+            return sub.name
+    if not matches:
+        for county in UK_COUNTIES:
+            if _norm(county) == _norm(segment):
+                return county
+    return None
+
+
+def _corpus(address_count: int) -> list[tuple[str, str, str]]:
+    rng = random.Random(0)
+    gb_names = [sub.name for sub in pycountry.subdivisions if sub.country_code == "GB"]
+    counties = list(UK_COUNTIES.values())
+    towns = [
+        f"{rng.choice(['North', 'South', 'Old', 'Great'])} {name}" for name in gb_names
+    ]
+
+    addresses = []
+    for i in range(address_count):
+        town = rng.choice(towns)
+        segments = [
+            f"{rng.choice(['The', 'Riverside', 'Oak Tree', 'Market'])} {rng.choice(BUILDINGS)}",
+            f"{i % 300 + 1} {rng.choice(STREETS)}",
+        ]
+        if rng.random() < 0.5:  # noqa: PLR2004
+            segments.append(town)
+        if rng.random() < 0.7:  # noqa: PLR2004
+            segments.append(rng.choice(counties))
+        addresses.append(("$".join(segments), town, f"AB{i % 99} 1CD"))
+    return addresses
+
+
+def _format_all(addresses: list[tuple[str, str, str]]) -> list:
+    return [format_address(*address) for address in addresses]
+
+
+def main() -> None:
+    address_count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ADDRESS_COUNT
+    address_formatter.address_formatter_logger.setLevel("WARNING")
+    addresses = _corpus(address_count)
+
+    start = perf_counter()
+    _county_index()
+    print(f"index built in {perf_counter() - start:.3f}s")
+
+    print(f"{'lookup':<12} {'addresses':>10} {'seconds':>10} {'per address':>14}")
+
+    def _run(name: str) -> list:
+        start = perf_counter()
+        results = _format_all(addresses)
+        elapsed = perf_counter() - start
+        per_address = elapsed / len(addresses) * 1_000_000
+        print(
+            f"{name:<12} {len(addresses):>10} {elapsed:>10.3f} {per_address:>11.1f} us"
+        )
+        return results
+
+    with patch.object(address_formatter, "_lookup_county", _search_fuzzy_county):
+        fuzzy = _run("fuzzy")
+
+    _lookup_county.cache_clear()
+    indexed = _run("index cold")
+    _run("index warm")
+
+    info = _lookup_county.cache_info()
+    print(f"cache hits={info.hits} misses={info.misses} size={info.currsize}")
+    assert indexed == fuzzy, "index results differ from the fuzzy search"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark for validating legacy services.
+
+Compares the per-record path, validate, against the batch path,
+validate_many, for ServiceValidator and GPPracticeValidator. The corpus is a
+synthetic set of services in which most fields are valid and emails and
+phone numbers repeat, as they do across DoS services.
+
+Run from services/data-migration:
+
+    PYTHONPATH=src python -m tests.benchmarks.bench_validation [service_count]
+"""
+
+import random
+import sys
+from time import perf_counter
+
+from ftrs_common.logger import Logger
+from ftrs_data_layer.domain.legacy import Service
+
+from service_migration.formatting.address_formatter import address_formatter_logger
+from service_migration.validation.service import GPPracticeValidator, ServiceValidator
+
+DEFAULT_SERVICE_COUNT = 20000
+
+# Mostly valid values, with a long tail of the failures seen in DoS data
+EMAILS = ["surgery@nhs.net", "reception@nhs.net", "practice@gmail.com", None]
+EMAIL_WEIGHTS = [60, 30, 5, 5]
+PHONES = ["01234567890", "02079460000", "0123 456 7890", "012345", None]
+PHONE_WEIGHTS = [50, 35, 5, 5, 5]
+NAMES = ["Riverside Surgery", "GP - Oak Tree Practice", "Market Health Centre"]
+
+
+def _services(service_count: int) -> list[Service]:
+    rng = random.Random(0)
+    return [
+        Service(
+            id=i,
+            uid=str(i),
+            name=f"Service {i}",
+            publicname=f"{rng.choice(NAMES)} {i % 500}",
+            address=f"{i % 300 + 1} High Street$Hampshire",
+            town="Southampton",
+            postcode="SO1 1AA",
+            email=rng.choices(EMAILS, EMAIL_WEIGHTS)[0],
+            publicphone=rng.choices(PHONES, PHONE_WEIGHTS)[0],
+            nonpublicphone=rng.choices(PHONES, PHONE_WEIGHTS)[0],
+            typeid=100,
+            statusid=1,
+        )
+        for i in range(service_count)
+    ]
+
+
+def main() -> None:
+    service_count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SERVICE_COUNT
+    logger = Logger.get(service="data-migration-benchmark")
+    logger.setLevel("WARNING")
+    address_formatter_logger.setLevel("WARNING")
+    services = _services(service_count)
+
+    print(f"{'validator':<22} {'path':<10} {'services':>10} {'seconds':>10}")
+    for validator in (ServiceValidator(logger), GPPracticeValidator(logger)):
+        name = type(validator).__name__
+        runs = {}
+        for path, validate in (
+            ("validate", lambda batch: [validator.validate(s) for s in batch]),
+            ("batch", validator.validate_many),
+        ):
+            batch = [service.model_copy() for service in services]
+            start = perf_counter()
+            runs[path] = validate(batch)
+            elapsed = perf_counter() - start
+            print(f"{name:<22} {path:<10} {len(batch):>10} {elapsed:>10.3f}")
+
+        assert [result.model_dump() for result in runs["batch"]] == [
+            result.model_dump() for result in runs["validate"]
+        ], f"{name} batch results differ from validate"
+
+
+if __name__ == "__main__":
+    main()
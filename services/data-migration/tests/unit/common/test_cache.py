@@ -1,9 +1,12 @@
+from pathlib import Path
+
 import pytest
 from ftrs_data_layer.domain.legacy import (
     Disposition,
     OpeningTimeDay,
     ServiceType,
     SymptomDiscriminator,
+    SymptomDiscriminatorSynonym,
     SymptomGroup,
 )
 from ftrs_data_layer.domain.legacy.base import LegacyDoSModel
@@ -12,7 +15,7 @@ from sqlalchemy import Engine
 from sqlalchemy.engine.mock import create_mock_engine
 from sqlmodel import Field
 
-from common.cache import DoSMetadataCache, SQLModelKVCache
+from common.cache import CacheStats, DoSMetadataCache, SQLModelKVCache
 
 
 class MockModel(LegacyDoSModel, table=True):
@@ -159,3 +162,99 @@ def test_dos_metadata_cache_init(mocker: MockerFixture) -> None:
     assert cache.dispositions.prejoin is False
     assert cache.opening_time_days.prejoin is False
     assert cache.service_types.prejoin is False
+
+
+def test_sqlmodel_cache_get_counts_hits_and_misses(mocker: MockerFixture) -> None:
+    """
+    Test that SQLModelKVCache.get counts cache hits and misses.
+    """
+    engine = mocker.MagicMock(spec=Engine)
+    cache = SQLModelKVCache(engine, MockModel)
+    cache._retrieve_item = mocker.MagicMock(return_value=MockModel(id=1, name="A"))
+
+    cache.get(1)
+    cache.get(1)
+    cache.get(1)
+
+    assert cache.stats() == CacheStats(hits=2, misses=1, size=1)
+
+
+def test_sqlmodel_cache_warm(mocker: MockerFixture) -> None:
+    """
+    Test that SQLModelKVCache.warm loads the whole table in a single query.
+    """
+    executor = mocker.MagicMock()
+    engine = create_mock_engine(
+        url="postgresql:///postgres:postgres@localhost:5432/postgres",
+        executor=executor,
+    )
+    engine.begin = mocker.MagicMock()
+    engine.close = mocker.MagicMock()
+    engine.in_transaction = mocker.MagicMock(return_value=False)
+
+    cache = SQLModelKVCache(engine, SymptomDiscriminator, prejoin=True)
+    cache.warm()
+
+    executor.assert_called_once()
+    statement = executor.mock_calls[0][1][0]
+
+    compiled_statement = statement.compile(compile_kwargs={"literal_binds": True})
+    assert str(compiled_statement) == (
+        "SELECT pathwaysdos.symptomdiscriminators.id, pathwaysdos.symptomdiscriminators.description, symptomdiscriminatorsynonyms_1.id AS id_1, symptomdiscriminatorsynonyms_1.name, symptomdiscriminatorsynonyms_1.symptomdiscriminatorid \n"
+        "FROM pathwaysdos.symptomdiscriminators "
+        "LEFT OUTER JOIN pathwaysdos.symptomdiscriminatorsynonyms AS symptomdiscriminatorsynonyms_1 ON pathwaysdos.symptomdiscriminators.id = symptomdiscriminatorsynonyms_1.symptomdiscriminatorid"
+    )
+
+
+def test_sqlmodel_cache_warm_populates_cache(mocker: MockerFixture) -> None:
+    """
+    Test that SQLModelKVCache.warm caches every row so lookups skip the database.
+    """
+    items = [MockModel(id=1, name="A"), MockModel(id=2, name="B")]
+    session = mocker.MagicMock()
+    session.__enter__.return_value = session
+    session.exec.return_value.unique.return_value = items
+    mocker.patch("common.cache.Session", return_value=session)
+
+    cache = SQLModelKVCache(mocker.MagicMock(spec=Engine), MockModel)
+    cache._retrieve_item = mocker.MagicMock()
+    cache.warm()
+
+    assert cache.get(2) == items[1]
+    cache._retrieve_item.assert_not_called()
+    assert cache.stats() == CacheStats(hits=1, misses=0, size=2)
+
+
+def test_dos_metadata_cache_warm(mocker: MockerFixture) -> None:
+    """
+    Test that DoSMetadataCache.warm warms every metadata table.
+    """
+    mock_warm = mocker.patch.object(SQLModelKVCache, "warm")
+
+    DoSMetadataCache(mocker.MagicMock(spec=Engine)).warm()
+
+    assert mock_warm.call_count == 5  # noqa: PLR2004
+
+
+def test_dos_metadata_cache_snapshot_round_trip(
+    mock_metadata_cache: DoSMetadataCache, tmp_path: Path
+) -> None:
+    """
+    Test that a saved snapshot restores every cache, including prejoined synonyms.
+    """
+    snapshot_path = tmp_path / "metadata.json"
+    mock_metadata_cache.save_snapshot(snapshot_path)
+
+    cache = DoSMetadataCache(None)
+    cache.load_snapshot(snapshot_path)
+
+    for name, restored in cache.caches.items():
+        assert restored.cache == mock_metadata_cache.caches[name].cache
+
+    synonyms = cache.symptom_discriminators.get(14023).synonyms
+    assert synonyms == [
+        SymptomDiscriminatorSynonym(
+            id=2341, symptomdiscriminatorid=14023, name="General Practice"
+        )
+    ]
+    assert list(tmp_path.iterdir()) == [snapshot_path]
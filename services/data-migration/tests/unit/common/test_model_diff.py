@@ -0,0 +1,498 @@
+"""
+Tests for the schema-aware model differ in common.diff_utils.
+
+The equivalence tests apply the update expressions from both the model differ
+and the original DeepDiff implementation to the stored form of the previous
+record, and check they produce the same item.
+"""
+
+import re
+from datetime import time
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any, Callable
+from uuid import UUID
+
+import pytest
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from ftrs_data_layer.domain import (
+    HealthcareService,
+    Location,
+    Organisation,
+    SymptomGroupSymptomDiscriminatorPair,
+)
+from ftrs_data_layer.domain.auditevent import AuditEvent, AuditEventType
+from ftrs_data_layer.domain.availability import AvailableTime, NotAvailable
+from ftrs_data_layer.domain.endpoint import Endpoint
+from ftrs_data_layer.domain.enums import (
+    DayOfWeek,
+    EndpointStatus,
+    HealthcareServiceStatus,
+    TelecomType,
+    TimeUnit,
+)
+from ftrs_data_layer.domain.healthcare_service import (
+    AgeRangeType,
+    HealthcareServiceTelecom,
+)
+from ftrs_data_layer.domain.location import Address, PositionGCS
+from ftrs_data_layer.domain.telecom import Telecom
+from pydantic import BaseModel
+
+from common.diff_utils import (
+    DynamoDBUpdateExpressions,
+    ModelChange,
+    UpdateExpressionWriter,
+    deepdiff_to_dynamodb_expressions,
+    diff_healthcare_service,
+    diff_location,
+    diff_models,
+    diff_organisation,
+    get_healthcare_service_diff,
+    get_location_diff,
+    get_organisation_diff,
+    model_diff_to_dynamodb_expressions,
+)
+
+SECOND_ENDPOINT_ID = UUID("55555555-5555-5555-5555-555555555555")
+
+
+@pytest.fixture
+def models(
+    base_organisation: Organisation,
+    base_location: Location,
+    base_healthcare_service: HealthcareService,
+    base_endpoint: Endpoint,
+) -> SimpleNamespace:
+    return SimpleNamespace(
+        organisation=base_organisation,
+        location=base_location,
+        healthcare_service=base_healthcare_service,
+        endpoint=base_endpoint,
+    )
+
+
+def _update(model: BaseModel, **changes: Any) -> BaseModel:  # noqa: ANN401
+    return model.model_copy(update=changes)
+
+
+def _second_endpoint(endpoint: Endpoint) -> Endpoint:
+    return _update(endpoint, id=SECOND_ENDPOINT_ID, order=2)
+
+
+def _with_endpoints(models: SimpleNamespace, *endpoints: Endpoint) -> Organisation:
+    return _update(models.organisation, endpoints=list(endpoints))
+
+
+def _opening_time(day: DayOfWeek, start: int = 9) -> AvailableTime:
+    return AvailableTime(dayOfWeek=day, startTime=time(start, 0), endTime=time(17, 0))
+
+
+def _with_hs(models: SimpleNamespace, **changes: Any) -> HealthcareService:  # noqa: ANN401
+    return _update(models.healthcare_service, **changes)
+
+
+Scenario = Callable[[SimpleNamespace], tuple[BaseModel, BaseModel]]
+
+SCENARIOS: dict[str, Scenario] = {
+    "organisation_unchanged": lambda m: (m.organisation, m.organisation),
+    "organisation_timestamps_only": lambda m: (
+        m.organisation,
+        _update(m.organisation, lastUpdated=m.organisation.created),
+    ),
+    "organisation_name": lambda m: (
+        m.organisation,
+        _update(m.organisation, name="Renamed Organisation"),
+    ),
+    "organisation_active_and_ods_code": lambda m: (
+        m.organisation,
+        _update(m.organisation, active=False, identifier_ODS_ODSCode="ODS999"),
+    ),
+    "organisation_created_by": lambda m: (
+        m.organisation,
+        _update(
+            m.organisation,
+            createdBy=AuditEvent(
+                type=AuditEventType.app, value="OTHER", display="Other"
+            ),
+        ),
+    ),
+    "organisation_telecom_value": lambda m: (
+        m.organisation,
+        _update(
+            m.organisation,
+            telecom=[
+                Telecom(type=TelecomType.PHONE, value="0300 000 0000", isPublic=True)
+            ],
+        ),
+    ),
+    "organisation_telecom_added": lambda m: (
+        m.organisation,
+        _update(
+            m.organisation,
+            telecom=[
+                *m.organisation.telecom,
+                Telecom(type=TelecomType.PHONE, value="0300 000 0000", isPublic=False),
+            ],
+        ),
+    ),
+    "organisation_telecom_removed": lambda m: (
+        m.organisation,
+        _update(m.organisation, telecom=None),
+    ),
+    "endpoint_added": lambda m: (
+        m.organisation,
+        _with_endpoints(m, m.endpoint),
+    ),
+    "endpoint_address": lambda m: (
+        _with_endpoints(m, m.endpoint),
+        _with_endpoints(m, _update(m.endpoint, address="https://new.endpoint.com")),
+    ),
+    "endpoint_status_and_order": lambda m: (
+        _with_endpoints(m, m.endpoint, _second_endpoint(m.endpoint)),
+        _with_endpoints(
+            m,
+            m.endpoint,
+            _update(_second_endpoint(m.endpoint), status=EndpointStatus.OFF, order=3),
+        ),
+    ),
+    "endpoint_added_while_modified": lambda m: (
+        _with_endpoints(m, m.endpoint),
+        _with_endpoints(
+            m,
+            _update(m.endpoint, address="https://new.endpoint.com"),
+            _second_endpoint(m.endpoint),
+        ),
+    ),
+    "endpoint_removed": lambda m: (
+        _with_endpoints(m, m.endpoint, _second_endpoint(m.endpoint)),
+        _with_endpoints(m, m.endpoint),
+    ),
+    "endpoints_reordered": lambda m: (
+        _with_endpoints(m, m.endpoint, _second_endpoint(m.endpoint)),
+        _with_endpoints(m, _second_endpoint(m.endpoint), m.endpoint),
+    ),
+    "location_postcode": lambda m: (
+        m.location,
+        _update(
+            m.location,
+            address=_update(m.location.address, postcode="NE1 1AA"),
+        ),
+    ),
+    "location_address_replaced": lambda m: (
+        m.location,
+        _update(
+            m.location,
+            address=Address(
+                line1="1 New Road",
+                line2=None,
+                county=None,
+                town="Newtown",
+                postcode="NE1 1AA",
+            ),
+        ),
+    ),
+    "location_position_added": lambda m: (
+        _update(m.location, positionGCS=None),
+        m.location,
+    ),
+    "location_position_removed": lambda m: (
+        m.location,
+        _update(m.location, positionGCS=None),
+    ),
+    "location_latitude": lambda m: (
+        m.location,
+        _update(
+            m.location,
+            positionGCS=PositionGCS(
+                latitude=Decimal("52.0000"), longitude=Decimal("-0.1278")
+            ),
+        ),
+    ),
+    "location_managing_organisation_and_primary": lambda m: (
+        m.location,
+        _update(
+            m.location,
+            managingOrganisation=UUID("99999999-9999-9999-9999-999999999999"),
+            primaryAddress=False,
+        ),
+    ),
+    "healthcare_service_status": lambda m: (
+        m.healthcare_service,
+        _with_hs(m, status=HealthcareServiceStatus.INACTIVE),
+    ),
+    "healthcare_service_provided_by_removed": lambda m: (
+        m.healthcare_service,
+        _with_hs(m, providedBy=None),
+    ),
+    "healthcare_service_phone": lambda m: (
+        m.healthcare_service,
+        _with_hs(
+            m,
+            telecom=_update(m.healthcare_service.telecom, phone_public="0300 1"),
+        ),
+    ),
+    "healthcare_service_telecom_added": lambda m: (
+        _with_hs(m, telecom=None),
+        m.healthcare_service,
+    ),
+    "healthcare_service_telecom_removed": lambda m: (
+        m.healthcare_service,
+        _with_hs(m, telecom=None),
+    ),
+    "healthcare_service_telecom_replaced": lambda m: (
+        m.healthcare_service,
+        _with_hs(
+            m,
+            telecom=HealthcareServiceTelecom(
+                phone_public=None, phone_private="1", email=None, web=None
+            ),
+        ),
+    ),
+    "dispositions_added": lambda m: (
+        m.healthcare_service,
+        _with_hs(m, dispositions=["DX1", "DX2"]),
+    ),
+    "dispositions_modified": lambda m: (
+        _with_hs(m, dispositions=["DX1", "DX2"]),
+        _with_hs(m, dispositions=["DX1", "DX999"]),
+    ),
+    "dispositions_removed": lambda m: (
+        _with_hs(m, dispositions=["DX1", "DX2", "DX3"]),
+        _with_hs(m, dispositions=["DX1"]),
+    ),
+    "dispositions_reordered": lambda m: (
+        _with_hs(m, dispositions=["DX1", "DX2"]),
+        _with_hs(m, dispositions=["DX2", "DX1"]),
+    ),
+    "sgsds_added": lambda m: (
+        m.healthcare_service,
+        _with_hs(
+            m,
+            symptomGroupSymptomDiscriminators=[
+                SymptomGroupSymptomDiscriminatorPair(sg=1000, sd=2000),
+                SymptomGroupSymptomDiscriminatorPair(sg=1001, sd=2001),
+            ],
+        ),
+    ),
+    "sgsd_modified": lambda m: (
+        _with_hs(
+            m,
+            symptomGroupSymptomDiscriminators=[
+                SymptomGroupSymptomDiscriminatorPair(sg=1000, sd=2000)
+            ],
+        ),
+        _with_hs(
+            m,
+            symptomGroupSymptomDiscriminators=[
+                SymptomGroupSymptomDiscriminatorPair(sg=1000, sd=5003)
+            ],
+        ),
+    ),
+    "opening_times_added": lambda m: (
+        m.healthcare_service,
+        _with_hs(m, openingTime=[_opening_time(DayOfWeek.MONDAY)]),
+    ),
+    "opening_time_start_changed": lambda m: (
+        _with_hs(m, openingTime=[_opening_time(DayOfWeek.MONDAY)]),
+        _with_hs(m, openingTime=[_opening_time(DayOfWeek.MONDAY, start=8)]),
+    ),
+    "opening_time_category_changed": lambda m: (
+        _with_hs(m, openingTime=[_opening_time(DayOfWeek.MONDAY)]),
+        _with_hs(
+            m,
+            openingTime=[
+                NotAvailable(
+                    startTime="2025-12-25T00:00:00", endTime="2025-12-26T00:00:00"
+                )
+            ],
+        ),
+    ),
+    "opening_times_removed": lambda m: (
+        _with_hs(
+            m,
+            openingTime=[
+                _opening_time(DayOfWeek.MONDAY),
+                _opening_time(DayOfWeek.TUESDAY),
+            ],
+        ),
+        _with_hs(m, openingTime=None),
+    ),
+    "age_eligibility_added": lambda m: (
+        m.healthcare_service,
+        _with_hs(
+            m,
+            ageEligibilityCriteria=[
+                AgeRangeType(
+                    rangeFrom=Decimal(0),
+                    rangeTo=Decimal(365),
+                    type=TimeUnit.DAYS,
+                )
+            ],
+        ),
+    ),
+}
+
+DIFFERS = {
+    Organisation: (get_organisation_diff, diff_organisation),
+    Location: (get_location_diff, diff_location),
+    HealthcareService: (get_healthcare_service_diff, diff_healthcare_service),
+}
+
+
+def _stored(model: BaseModel) -> dict[str, Any]:
+    """
+    Return a model as it would be read back from DynamoDB.
+    """
+    prepared = UpdateExpressionWriter()._prepare_for_dynamodb(model.model_dump())
+    return TypeDeserializer().deserialize(TypeSerializer().serialize(prepared))
+
+
+def _resolve(path: str, names: dict[str, str]) -> list[str | int]:
+    parts: list[str | int] = []
+    for token in path.split("."):
+        name, *indexes = re.split(r"\[|\]\[|\]$", token.rstrip("]") + "]")
+        parts.append(names[name])
+        parts.extend(int(index) for index in indexes if index)
+    return parts
+
+
+def _apply(
+    item: dict[str, Any], expressions: DynamoDBUpdateExpressions
+) -> dict[str, Any]:
+    """
+    Apply SET and REMOVE update expressions to a deserialised DynamoDB item.
+    """
+    names = expressions.expression_attribute_names
+    values = {
+        placeholder: TypeDeserializer().deserialize(value)
+        for placeholder, value in expressions.expression_attribute_values.items()
+    }
+
+    for action, clauses in re.findall(
+        r"(SET|REMOVE) (.*?)(?= SET | REMOVE |$)", expressions.update_expression
+    ):
+        for clause in clauses.split(", "):
+            if action == "SET":
+                path, placeholder = clause.split(" = ")
+                *parents, leaf = _resolve(path, names)
+            else:
+                *parents, leaf = _resolve(clause, names)
+
+            target = item
+            for part in parents:
+                target = target[part]
+
+            if action == "SET":
+                target[leaf] = values[placeholder]
+            else:
+                del target[leaf]
+
+    return item
+
+
+@pytest.mark.parametrize("scenario", SCENARIOS.values(), ids=SCENARIOS.keys())
+def test_model_diff_matches_deepdiff(
+    models: SimpleNamespace, scenario: Scenario
+) -> None:
+    previous, current = scenario(models)
+    get_deepdiff, get_model_diff = DIFFERS[type(previous)]
+
+    deepdiff = get_deepdiff(previous, current)
+    model_diff = get_model_diff(previous, current)
+
+    assert bool(model_diff) == bool(deepdiff)
+
+    expected = _apply(_stored(previous), deepdiff_to_dynamodb_expressions(deepdiff))
+    actual = _apply(_stored(previous), model_diff_to_dynamodb_expressions(model_diff))
+    assert actual == expected
+
+
+@pytest.mark.parametrize("name", SCENARIOS.keys())
+def test_model_diff_updates_item_to_current(models: SimpleNamespace, name: str) -> None:
+    previous, current = SCENARIOS[name](models)
+    _, get_model_diff = DIFFERS[type(previous)]
+
+    expressions = model_diff_to_dynamodb_expressions(get_model_diff(previous, current))
+    updated = _apply(_stored(previous), expressions)
+
+    if name.endswith("_reordered"):
+        # Order-only list changes are ignored, as DeepDiff's ignore_order does
+        assert expressions.is_empty()
+        return
+
+    expected = _stored(current)
+    expected.update(created=updated["created"], lastUpdated=updated["lastUpdated"])
+    assert updated == expected
+
+
+@pytest.mark.parametrize(
+    ("scenario", "expected_expression"),
+    [
+        ("organisation_name", "SET #attr_name = :val_0"),
+        ("endpoint_address", "SET #endpoints[0].#attr_address = :val_0"),
+        ("endpoint_added_while_modified", "SET #endpoints = :val_0"),
+        ("location_postcode", "SET #attr_address.#postcode = :val_0"),
+        ("healthcare_service_phone", "SET #telecom.#phone_public = :val_0"),
+        ("dispositions_modified", "SET #dispositions[1] = :val_0"),
+        ("dispositions_added", "SET #dispositions = :val_0"),
+    ],
+)
+def test_model_diff_expressions_match_deepdiff_for_single_changes(
+    models: SimpleNamespace, scenario: str, expected_expression: str
+) -> None:
+    previous, current = SCENARIOS[scenario](models)
+    get_deepdiff, get_model_diff = DIFFERS[type(previous)]
+
+    expected = deepdiff_to_dynamodb_expressions(get_deepdiff(previous, current))
+    actual = model_diff_to_dynamodb_expressions(get_model_diff(previous, current))
+
+    assert actual.update_expression == expected_expression
+    assert actual == expected
+
+
+def test_diff_models_reports_changes(models: SimpleNamespace) -> None:
+    previous = models.location
+    current = _update(
+        previous,
+        name="New Name",
+        address=_update(previous.address, postcode="NE1 1AA"),
+    )
+
+    diff = diff_models(previous, current)
+
+    assert diff.changes == [
+        ModelChange(("address", "postcode"), "TE1 1ST", "NE1 1AA"),
+        ModelChange(("name",), "Test Location", "New Name"),
+    ]
+    assert diff.paths() == ["address.postcode", "name"]
+    assert diff.pretty().splitlines() == [
+        "Value of address.postcode changed from 'TE1 1ST' to 'NE1 1AA'.",
+        "Value of name changed from 'Test Location' to 'New Name'.",
+    ]
+    assert diff.to_dict() == {
+        "address.postcode": {"old_value": "TE1 1ST", "new_value": "NE1 1AA"},
+        "name": {"old_value": "Test Location", "new_value": "New Name"},
+    }
+
+
+class TaggedModel(BaseModel):
+    tags: dict[str, str]
+
+
+def test_diff_models_adds_and_removes_dict_keys() -> None:
+    previous = TaggedModel(tags={"colour": "red", "size": "large"})
+    current = TaggedModel(tags={"colour": "blue", "shape": "round"})
+
+    diff = diff_models(previous, current)
+
+    assert diff.changes == [
+        ModelChange(("tags", "colour"), "red", "blue"),
+        ModelChange(("tags", "shape"), None, "round"),
+        ModelChange(("tags", "size"), "large", None, removed=True),
+    ]
+    expressions = model_diff_to_dynamodb_expressions(diff)
+    assert expressions.update_expression == (
+        "SET #tags.#colour = :val_0, #tags.#shape = :val_1 REMOVE #tags.#attr_size"
+    )
+    assert _apply(previous.model_dump(), expressions) == current.model_dump()
@@ -1,13 +1,49 @@
 import unittest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import pycountry
+
+from service_migration.constants import UK_COUNTIES
 from service_migration.formatting.address_formatter import (
+    CountyIndex,
+    _county_index,
+    _lookup_county,
     _norm,
     format_address,
 )
 
 
+def _subdivision(code: str, name: str, country_code: str) -> SimpleNamespace:
+    fields = {
+        "code": code,
+        "name": name,
+        "type": "County",
+        "country_code": country_code,
+    }
+    return SimpleNamespace(**fields, _fields=fields)
+
+
+def _search_fuzzy_county(segment: str) -> str | None:
+    """The county search the index replaces, one fuzzy search per segment."""
+    try:
+        matches = pycountry.subdivisions.search_fuzzy(segment.strip())
+    except LookupError:
+        matches = []
+    for sub in matches:
+        if sub.country_code == "GB":
+            return sub.name
+    if not matches:
+        for county in UK_COUNTIES:
+            if _norm(county) == _norm(segment):
+                return county
+    return None
+
+
 class TestAddressFormatter(unittest.TestCase):
+    def setUp(self) -> None:
+        _lookup_county.cache_clear()
+
     def test_verify_address_formatting_with_multiple_segments(self) -> None:
         """Test address with standard 3-segment format."""
         result = format_address(
@@ -66,50 +102,88 @@ class TestAddressFormatter(unittest.TestCase):
         self.assertEqual(result.line2, "Apt 4B")
         self.assertEqual(result.county, "Hampshire")
 
-    @patch("service_migration.formatting.address_formatter.pycountry")
-    def test_verify_county_detection_with_pycountry(
-        self, mock_pycountry: MagicMock
+    @patch("service_migration.formatting.address_formatter._county_index")
+    def test_verify_county_detection_with_subdivision_index(
+        self, mock_county_index: MagicMock
     ) -> None:
-        """Test county detection using pycountry subdivisions."""
-        mock_subdivision = MagicMock()
-        mock_subdivision.country_code = "GB"
-        mock_subdivision.name = "West Yorkshire"
-        mock_pycountry.subdivisions.search_fuzzy.return_value = [mock_subdivision]
+        """Test county detection using the GB subdivision index."""
+        mock_county_index.return_value = CountyIndex(
+            [_subdivision("GB-WYK", "West Yorkshire", "GB")], []
+        )
 
         result = format_address("123 Main St$Leeds$West Yorkshire", "Leeds", "LS1 1AB")
 
         self.assertEqual(result.county, "West Yorkshire")
-        mock_pycountry.subdivisions.search_fuzzy.assert_called_once()
 
-    @patch("service_migration.formatting.address_formatter.pycountry")
+    @patch("service_migration.formatting.address_formatter._county_index")
     def test_verify_county_detection_fallback_to_uk_counties(
-        self, mock_pycountry: MagicMock
+        self, mock_county_index: MagicMock
     ) -> None:
-        """Test fallback to UK_COUNTIES list when pycountry returns empty."""
-        mock_pycountry.subdivisions.search_fuzzy.return_value = []
+        """Test fallback to UK_COUNTIES list when no subdivision matches."""
+        mock_county_index.return_value = CountyIndex([], ["Hampshire"])
 
-        with patch(
-            "service_migration.formatting.address_formatter.UK_COUNTIES", ["Hampshire"]
-        ):
-            result = format_address("123 Main St$Hampshire", "Springfield", "SP1 2AB")
+        result = format_address("123 Main St$Hampshire", "Springfield", "SP1 2AB")
 
-            self.assertEqual(result.county, "Hampshire")
+        self.assertEqual(result.county, "Hampshire")
 
-    @patch("service_migration.formatting.address_formatter.pycountry")
-    def test_verify_county_detection_with_exception(
-        self, mock_pycountry: MagicMock
+    @patch("service_migration.formatting.address_formatter._county_index")
+    def test_verify_county_detection_ignores_other_countries(
+        self, mock_county_index: MagicMock
     ) -> None:
-        """Test graceful handling when pycountry raises exception."""
-        mock_pycountry.subdivisions.search_fuzzy.side_effect = Exception(
-            "Search failed"
+        """Test UK_COUNTIES is not consulted when only other countries match."""
+        mock_county_index.return_value = CountyIndex(
+            [_subdivision("US-NH", "New Hampshire", "US")], ["Hampshire"]
         )
 
-        with patch(
-            "service_migration.formatting.address_formatter.UK_COUNTIES", ["Hampshire"]
-        ):
-            result = format_address("123 Main St$Hampshire", "Springfield", "SP1 2AB")
+        result = format_address("123 Main St$Hampshire", "Springfield", "SP1 2AB")
+
+        self.assertIsNone(result.county)
+
+    def test_verify_county_index_matches_fuzzy_search(self) -> None:
+        """Test the county index agrees with pycountry's fuzzy search."""
+        gb_names = [
+            sub.name for sub in pycountry.subdivisions if sub.country_code == "GB"
+        ]
+        corpus = [
+            *gb_names[::10],
+            *UK_COUNTIES.values(),
+            "Hampshire",
+            "hampshire  ",
+            "West Yorkshire",
+            "Greater London",
+            "Leeds",
+            "GB",
+            "gb-eng",
+            "County",
+            "Unitary authority",
+            "shire",
+            "New York",
+            "Bayern",
+            "Zürich",
+            "123 Main St",
+            "Building A",
+            "Burnt Oak Broadway",
+            "St. Mary's",
+            "Apt #5B",
+        ]
+
+        for segment in corpus:
+            with self.subTest(segment=segment):
+                self.assertEqual(
+                    _county_index().lookup(segment), _search_fuzzy_county(segment)
+                )
+
+    def test_verify_county_lookups_are_cached(self) -> None:
+        """Test repeated segments are looked up once."""
+        _lookup_county.cache_clear()
+
+        format_address("1 High St$Hampshire", "Springfield", "SP1 2AB")
+        format_address("2 High St$HAMPSHIRE", "Springfield", "SP1 2AC")
 
-            self.assertEqual(result.county, "Hampshire")
+        # The last segment is checked first and is a county both times.
+        info = _lookup_county.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
 
     def test_verify_text_normalization(self) -> None:
         """Test text normalization function."""
@@ -1,5 +1,6 @@
 import pytest
 from aws_lambda_powertools.utilities.data_classes.sqs_event import SQSRecord
+from aws_lambda_powertools.utilities.typing import LambdaContext
 from ftrs_common.mocks.mock_logger import MockLogger
 from pytest_mock import MockerFixture
 
@@ -194,3 +195,177 @@ def test_create_logger(
         env="test",
         workspace="test_workspace",
     )
+
+
+def _sqs_record(body: str, message_id: str = "1") -> dict:
+    return {"messageId": message_id, "body": body}
+
+
+def test_get_batch_service_ids(mock_config: DataMigrationConfig) -> None:
+    app = DataMigrationApplication(config=mock_config)
+
+    event = {
+        "Records": [
+            _sqs_record(
+                DMSEvent(
+                    record_id=1, service_id=1, table_name="services", method="insert"
+                ).model_dump_json()
+            ),
+            _sqs_record(
+                DMSEvent(
+                    record_id=2, service_id=2, table_name="services", method="delete"
+                ).model_dump_json()
+            ),
+            _sqs_record(
+                DMSEvent(
+                    record_id=30,
+                    service_id=3,
+                    table_name="serviceendpoints",
+                    method="update",
+                ).model_dump_json()
+            ),
+            _sqs_record(
+                DMSEvent(
+                    record_id=4, service_id=4, table_name="other", method="update"
+                ).model_dump_json()
+            ),
+            _sqs_record('{"invalid": "event"}'),
+        ]
+    }
+
+    assert app.get_batch_service_ids(event) == [1, 3]
+
+
+def test_handle_sqs_event_prefetches_state_records(
+    mocker: MockerFixture,
+    mock_config: DataMigrationConfig,
+    mock_lambda_context: LambdaContext,
+) -> None:
+    app = DataMigrationApplication(config=mock_config)
+    app.processor.prefetch_state_records = mocker.MagicMock()
+    app.processor.sync_service = mocker.MagicMock()
+    app.handle_sqs_record = mocker.MagicMock()
+
+    def handle_record(record: SQSRecord) -> None:
+        app.processor.state_cache["services#1"] = None
+
+    app.handle_sqs_record.side_effect = handle_record
+
+    event = {
+        "Records": [
+            _sqs_record(
+                DMSEvent(
+                    record_id=1, service_id=1, table_name="services", method="update"
+                ).model_dump_json()
+            )
+        ]
+    }
+
+    result = app.handle_sqs_event(event, mock_lambda_context)
+
+    assert result == {"batchItemFailures": []}
+    app.processor.prefetch_state_records.assert_called_once_with([1])
+    assert app.processor.state_cache == {}
+
+
+def test_handle_sqs_event_continues_when_prefetch_fails(
+    mocker: MockerFixture,
+    mock_logger: MockLogger,
+    mock_config: DataMigrationConfig,
+    mock_lambda_context: LambdaContext,
+) -> None:
+    app = DataMigrationApplication(config=mock_config)
+    app.processor.prefetch_state_records = mocker.MagicMock(
+        side_effect=Exception("throttled")
+    )
+    app.processor.sync_service = mocker.MagicMock()
+    app.handle_sqs_record = mocker.MagicMock()
+
+    event = {
+        "Records": [
+            _sqs_record(
+                DMSEvent(
+                    record_id=1, service_id=1, table_name="services", method="update"
+                ).model_dump_json()
+            )
+        ]
+    }
+
+    result = app.handle_sqs_event(event, mock_lambda_context)
+
+    assert result == {"batchItemFailures": []}
+    app.handle_sqs_record.assert_called_once()
+    assert mock_logger.get_log("DM_ETL_043")[0]["detail"] == {"error": "throttled"}
+
+
+def _coalescing_event() -> dict:
+    events = [
+        DMSEvent(record_id=1, service_id=1, table_name="services", method="update"),
+        DMSEvent(
+            record_id=10, service_id=1, table_name="serviceendpoints", method="insert"
+        ),
+        DMSEvent(
+            record_id=20, service_id=2, table_name="serviceendpoints", method="update"
+        ),
+        DMSEvent(record_id=3, service_id=3, table_name="services", method="update"),
+        DMSEvent(
+            record_id=30, service_id=3, table_name="serviceendpoints", method="delete"
+        ),
+        DMSEvent(record_id=4, service_id=4, table_name="services", method="delete"),
+    ]
+    return {
+        "Records": [
+            _sqs_record(dms_event.model_dump_json(), message_id=str(index))
+            for index, dms_event in enumerate(events)
+        ]
+    }
+
+
+def test_handle_sqs_event_coalesces_services(
+    mocker: MockerFixture,
+    mock_logger: MockLogger,
+    mock_config: DataMigrationConfig,
+    mock_lambda_context: LambdaContext,
+) -> None:
+    app = DataMigrationApplication(config=mock_config)
+    app.processor.prefetch_state_records = mocker.MagicMock()
+    mock_coalesced_writes = mocker.patch.object(app.processor, "coalesced_writes")
+
+    def sync_service(service_id: int, method: str) -> None:
+        if service_id == 3:  # noqa: PLR2004
+            raise ValueError("Service with ID 3 not found")
+
+    app.processor.sync_service = mocker.MagicMock(side_effect=sync_service)
+
+    result = app.handle_sqs_event(_coalescing_event(), mock_lambda_context)
+
+    assert [call.args[0] for call in app.processor.sync_service.call_args_list] == [
+        1,
+        2,
+        3,
+    ]
+    mock_coalesced_writes.assert_called_once_with()
+    assert result == {
+        "batchItemFailures": [{"itemIdentifier": "3"}, {"itemIdentifier": "4"}]
+    }
+    assert mock_logger.get_log("DM_ETL_048")[0]["detail"] == {
+        "record_count": 5,
+        "service_count": 3,
+    }
+    assert app.batch_results is None
+
+
+def test_handle_sqs_event_without_coalescing(
+    mocker: MockerFixture,
+    mock_config: DataMigrationConfig,
+    mock_lambda_context: LambdaContext,
+) -> None:
+    mock_config.coalesce_sqs_batches = False
+    app = DataMigrationApplication(config=mock_config)
+    app.processor.prefetch_state_records = mocker.MagicMock()
+    app.processor.sync_service = mocker.MagicMock()
+
+    result = app.handle_sqs_event(_coalescing_event(), mock_lambda_context)
+
+    assert result == {"batchItemFailures": []}
+    assert app.processor.sync_service.call_count == 5  # noqa: PLR2004
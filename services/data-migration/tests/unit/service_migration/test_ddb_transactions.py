@@ -1,7 +1,9 @@
 from datetime import datetime
+from unittest.mock import patch
 from uuid import UUID
 
 import pytest
+from boto3.dynamodb.types import TypeDeserializer
 from ftrs_common.mocks.mock_logger import MockLogger
 from ftrs_data_layer.domain import (
     Address,
@@ -18,7 +20,7 @@ from ftrs_data_layer.domain.enums import (
 
 from service_migration.ddb_transactions import ServiceTransactionBuilder
 from service_migration.exceptions import ServiceMigrationException
-from service_migration.models import ServiceMigrationState
+from service_migration.models import ServiceMigrationState, entity_hash
 
 
 @pytest.fixture
@@ -247,6 +249,42 @@ def test_update_organisation_with_changes(
     assert mock_logger.was_logged("DM_ETL_030")
 
 
+@pytest.mark.parametrize("debug", [False, True])
+def test_update_organisation_logs_diff_detail_only_when_debugging(
+    mock_logger: MockLogger,
+    mock_organisation: Organisation,
+    debug: bool,
+) -> None:
+    existing_state = ServiceMigrationState(
+        source_record_id="services#123",
+        version=1,
+        organisation_id=mock_organisation.id,
+        organisation=mock_organisation,
+        location_id=None,
+        location=None,
+        healthcare_service_id=None,
+        healthcare_service=None,
+        validation_issues=[],
+    )
+    builder = ServiceTransactionBuilder(
+        service_id=123, logger=mock_logger, migration_state=existing_state
+    )
+    mock_logger.setLevel("DEBUG" if debug else "INFO")
+
+    builder.add_organisation(
+        mock_organisation.model_copy(update={"name": "Updated Name"})
+    )
+
+    assert mock_logger.get_log("DM_ETL_030")[0]["detail"] == {
+        "changed_fields": ["name"]
+    }
+    assert mock_logger.was_logged("DM_ETL_049") is debug
+    if debug:
+        assert mock_logger.get_log("DM_ETL_049")[0]["detail"]["diff"] == {
+            "name": {"old_value": mock_organisation.name, "new_value": "Updated Name"}
+        }
+
+
 def test_update_organisation_none_raises(
     mock_logger: MockLogger,
     mock_organisation: Organisation,
@@ -780,3 +818,123 @@ def test_audit_updater_metadata_is_correct(
     assert updated_by["type"]["S"] == "app"
     assert updated_by["value"]["S"] == "INTERNAL001"
     assert updated_by["display"]["S"] == "Data Migration"
+
+
+def test_update_organisation_skips_diff_when_hash_matches(
+    mock_logger: MockLogger,
+    mock_organisation: Organisation,
+) -> None:
+    existing_state = ServiceMigrationState(
+        source_record_id="services#123",
+        version=1,
+        organisation_id=mock_organisation.id,
+        organisation=mock_organisation,
+        location_id=None,
+        location=None,
+        healthcare_service_id=None,
+        healthcare_service=None,
+        validation_issues=[],
+    )
+    builder = ServiceTransactionBuilder(
+        service_id=123, logger=mock_logger, migration_state=existing_state
+    )
+
+    # Audit timestamps are refreshed on every transform but are not hashed.
+    transformed = mock_organisation.model_copy(
+        update={"lastUpdated": datetime.fromisoformat("2026-01-01T00:00:00Z")}
+    )
+    with patch("service_migration.ddb_transactions.diff_organisation") as mock_diff:
+        builder.add_organisation(transformed)
+
+    mock_diff.assert_not_called()
+    assert builder.items == []
+    assert mock_logger.was_logged("DM_ETL_029")
+
+
+def test_update_organisation_diffs_when_stored_hash_differs(
+    mock_logger: MockLogger,
+    mock_organisation: Organisation,
+) -> None:
+    existing_state = ServiceMigrationState(
+        source_record_id="services#123",
+        version=1,
+        organisation_id=mock_organisation.id,
+        organisation=mock_organisation,
+        organisation_hash="stale",
+        location_id=None,
+        location=None,
+        healthcare_service_id=None,
+        healthcare_service=None,
+        validation_issues=[],
+    )
+    builder = ServiceTransactionBuilder(
+        service_id=123, logger=mock_logger, migration_state=existing_state
+    )
+
+    builder.add_organisation(mock_organisation)
+
+    assert builder.items == []
+    assert mock_logger.was_logged("DM_ETL_029")
+    # The hash always describes the stored snapshot, which was not rewritten.
+    assert builder.migration_state.organisation_hash == "stale"
+
+
+def test_update_location_records_new_hash(
+    mock_logger: MockLogger,
+    mock_location: Location,
+) -> None:
+    existing_state = ServiceMigrationState(
+        source_record_id="services#123",
+        version=1,
+        organisation_id=None,
+        organisation=None,
+        location_id=mock_location.id,
+        location=mock_location,
+        healthcare_service_id=None,
+        healthcare_service=None,
+        validation_issues=[],
+    )
+    builder = ServiceTransactionBuilder(
+        service_id=123, logger=mock_logger, migration_state=existing_state
+    )
+
+    updated_location = mock_location.model_copy(update={"primaryAddress": False})
+    builder.add_location(updated_location)
+
+    assert len(builder.items) == 1
+    assert builder.migration_state.location_hash == entity_hash(updated_location)
+    assert existing_state.location_hash == entity_hash(mock_location)
+
+
+@pytest.mark.parametrize("compress_snapshots", [True, False])
+def test_state_record_round_trips(
+    mock_logger: MockLogger,
+    mock_organisation: Organisation,
+    mock_location: Location,
+    mock_healthcare_service: HealthcareService,
+    compress_snapshots: bool,
+) -> None:
+    builder = ServiceTransactionBuilder(
+        service_id=123, logger=mock_logger, compress_snapshots=compress_snapshots
+    )
+    items = (
+        builder.add_organisation(mock_organisation)
+        .add_location(mock_location)
+        .add_healthcare_service(mock_healthcare_service)
+        .build()
+    )
+
+    state_item = items[-1]["Put"]["Item"]
+    snapshot_type = "B" if compress_snapshots else "M"
+    for name in ["organisation", "location", "healthcare_service"]:
+        assert snapshot_type in state_item[name]
+        assert "S" in state_item[f"{name}_hash"]
+
+    deserialiser = TypeDeserializer()
+    state = ServiceMigrationState.model_validate(
+        {key: deserialiser.deserialize(value) for key, value in state_item.items()}
+    )
+    assert state == builder.migration_state
+    assert state.organisation_hash == entity_hash(mock_organisation)
+    assert state.location_hash == entity_hash(mock_location)
+    assert state.healthcare_service_hash == entity_hash(mock_healthcare_service)
@@ -0,0 +1,190 @@
+import csv
+from pathlib import Path
+
+import pytest
+from ftrs_common.mocks.mock_logger import MockLogger
+from ftrs_data_layer.domain.legacy import Service
+from pytest_mock import MockerFixture
+
+from common.cache import DoSMetadataCache
+from service_migration.config import DataMigrationConfig
+from service_migration.dry_run import (
+    DryRunApplication,
+    DryRunProcessor,
+    DryRunReport,
+    dry_run_shard,
+)
+from service_migration.models import (
+    DryRunRow,
+    FullSyncShard,
+    ServiceMigrationMetrics,
+    ServiceMigrationState,
+)
+
+
+@pytest.fixture
+def dry_run_processor(
+    mocker: MockerFixture,
+    mock_config: DataMigrationConfig,
+    mock_logger: MockLogger,
+    mock_metadata_cache: DoSMetadataCache,
+) -> DryRunProcessor:
+    mocker.patch(
+        "service_migration.transformer.gp_practice.is_enabled", return_value=True
+    )
+    processor = DryRunProcessor(config=mock_config, logger=mock_logger)
+    processor.metadata = mock_metadata_cache
+    return processor
+
+
+def test_dry_run_processor_records_transformed_service(
+    mocker: MockerFixture,
+    dry_run_processor: DryRunProcessor,
+    mock_legacy_service: Service,
+) -> None:
+    mock_get_client = mocker.patch("service_migration.processor.get_dynamodb_client")
+
+    dry_run_processor._process_service(mock_legacy_service)
+
+    mock_get_client.assert_not_called()
+    assert dry_run_processor.report_rows() == [
+        DryRunRow(
+            service_id=mock_legacy_service.id,
+            service_type_id=mock_legacy_service.typeid,
+            transformer="GPPracticeTransformer",
+            outcome="transformed",
+            organisations=1,
+            locations=1,
+            healthcare_services=1,
+        )
+    ]
+    assert dry_run_processor.metrics.inserted == 1
+
+    state = dry_run_processor.get_state_record(mock_legacy_service.id)
+    assert state is not None
+    assert state.source_record_id == ServiceMigrationState.format_source_record_id(
+        mock_legacy_service.id
+    )
+
+
+def test_dry_run_processor_records_invalid_service(
+    dry_run_processor: DryRunProcessor,
+    mock_legacy_service: Service,
+) -> None:
+    mock_legacy_service.address = ""
+    mock_legacy_service.town = ""
+    mock_legacy_service.postcode = ""
+
+    dry_run_processor._process_service(mock_legacy_service)
+
+    [row] = dry_run_processor.report_rows()
+    assert row.outcome == "invalid"
+    assert row.transformer == "GPPracticeTransformer"
+    assert row.issue_count == len(row.issue_codes)
+    assert "address_required" in row.issue_codes
+    assert row.organisations == row.locations == row.healthcare_services == 0
+
+
+def test_dry_run_processor_records_unsupported_service(
+    mocker: MockerFixture,
+    dry_run_processor: DryRunProcessor,
+    mock_legacy_service: Service,
+) -> None:
+    mocker.patch("service_migration.processor.SUPPORTED_TRANSFORMERS", [])
+
+    dry_run_processor._process_service(mock_legacy_service)
+
+    assert dry_run_processor.report_rows() == [
+        DryRunRow(
+            service_id=mock_legacy_service.id,
+            service_type_id=mock_legacy_service.typeid,
+            outcome="unsupported",
+        )
+    ]
+
+
+def test_dry_run_processor_records_error(
+    mocker: MockerFixture,
+    dry_run_processor: DryRunProcessor,
+    mock_legacy_service: Service,
+) -> None:
+    mocker.patch.object(
+        dry_run_processor, "_transform_and_persist", side_effect=ValueError("boom")
+    )
+
+    dry_run_processor._process_service(mock_legacy_service)
+
+    [row] = dry_run_processor.report_rows()
+    assert row.outcome == "error"
+    assert row.transformer == "GPPracticeTransformer"
+
+
+def test_dry_run_processor_does_not_read_state(
+    mocker: MockerFixture,
+    dry_run_processor: DryRunProcessor,
+) -> None:
+    mock_get_client = mocker.patch("service_migration.processor.get_dynamodb_client")
+
+    dry_run_processor.prefetch_state_records([1, 2, 3])
+
+    assert dry_run_processor.get_state_record(1) is None
+    mock_get_client.assert_not_called()
+
+
+def test_dry_run_shard(mocker: MockerFixture, mock_config: DataMigrationConfig) -> None:
+    mock_app = mocker.patch("service_migration.dry_run.DryRunApplication")
+    rows = [DryRunRow(service_id=1, outcome="transformed")]
+    mock_app.return_value.processor.report_rows.return_value = rows
+    mock_app.return_value.processor.metrics = ServiceMigrationMetrics(total=1)
+    shard = FullSyncShard(index=0, count=2)
+
+    assert dry_run_shard(mock_config, shard) == (
+        rows,
+        ServiceMigrationMetrics(total=1),
+    )
+    mock_app.assert_called_once_with(config=mock_config)
+    mock_app.return_value.handle_full_sync_event.assert_called_once_with(shard=shard)
+
+
+def test_dry_run_application_creates_dry_run_processor(
+    mock_config: DataMigrationConfig,
+) -> None:
+    app = DryRunApplication(config=mock_config)
+
+    assert isinstance(app.processor, DryRunProcessor)
+
+
+def test_dry_run_report(tmp_path: Path) -> None:
+    path = tmp_path / "report.csv"
+
+    with DryRunReport(path) as report:
+        report.write(
+            [
+                DryRunRow(
+                    service_id=1,
+                    service_type_id=100,
+                    transformer="GPPracticeTransformer",
+                    outcome="transformed",
+                    issue_count=2,
+                    issue_codes=["email_invalid", "phone_invalid"],
+                    organisations=1,
+                    locations=1,
+                    healthcare_services=1,
+                ),
+                DryRunRow(service_id=2, outcome="unsupported"),
+            ]
+        )
+
+    assert report.outcomes == {"transformed": 1, "unsupported": 1}
+    assert report.inserts == {
+        "organisations": 1,
+        "locations": 1,
+        "healthcare_services": 1,
+    }
+    with path.open(newline="") as f:
+        lines = list(csv.DictReader(f))
+    assert [line["service_id"] for line in lines] == ["1", "2"]
+    assert lines[0]["transformer"] == "GPPracticeTransformer"
+    assert lines[0]["issue_codes"] == "email_invalid;phone_invalid"
+    assert lines[1]["outcome"] == "unsupported"
+    assert lines[1]["issue_codes"] == ""
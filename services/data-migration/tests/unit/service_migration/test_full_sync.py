@@ -0,0 +1,66 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from pytest_mock import MockerFixture
+
+from service_migration.config import DataMigrationConfig
+from service_migration.full_sync import iter_parallel_full_sync, sync_shard
+from service_migration.models import FullSyncShard, ServiceMigrationMetrics
+
+
+def test_sync_shard(mocker: MockerFixture, mock_config: DataMigrationConfig) -> None:
+    mock_app = mocker.patch("service_migration.full_sync.DataMigrationApplication")
+    mock_app.return_value.processor.metrics = ServiceMigrationMetrics(total=3)
+    shard = FullSyncShard(index=1, count=4)
+
+    metrics = sync_shard(mock_config, shard)
+
+    mock_app.assert_called_once_with(config=mock_config)
+    mock_app.return_value.handle_full_sync_event.assert_called_once_with(shard=shard)
+    assert metrics == ServiceMigrationMetrics(total=3)
+
+
+def test_iter_parallel_full_sync(
+    mocker: MockerFixture, mock_config: DataMigrationConfig
+) -> None:
+    mock_executor = mocker.patch(
+        "service_migration.full_sync.ProcessPoolExecutor",
+        side_effect=lambda max_workers, mp_context: ThreadPoolExecutor(max_workers),
+    )
+    mocker.patch(
+        "service_migration.full_sync.sync_shard",
+        side_effect=lambda config, shard: ServiceMigrationMetrics(total=shard.index),
+    )
+    shards = FullSyncShard(index=0, count=1).split(3)
+
+    results = dict(iter_parallel_full_sync(mock_config, shards))
+
+    assert mock_executor.call_args.kwargs["max_workers"] == 3  # noqa: PLR2004
+    assert mock_executor.call_args.kwargs["mp_context"].get_start_method() == "spawn"
+    assert {str(shard): metrics.total for shard, metrics in results.items()} == {
+        "0/3": 0,
+        "1/3": 1,
+        "2/3": 2,
+    }
+
+
+def test_iter_parallel_full_sync_with_worker(
+    mocker: MockerFixture, mock_config: DataMigrationConfig
+) -> None:
+    mocker.patch(
+        "service_migration.full_sync.ProcessPoolExecutor",
+        side_effect=lambda max_workers, mp_context: ThreadPoolExecutor(max_workers),
+    )
+    mock_sync_shard = mocker.patch("service_migration.full_sync.sync_shard")
+    shards = FullSyncShard(index=0, count=1).split(2)
+
+    results = dict(
+        iter_parallel_full_sync(
+            mock_config, shards, worker=lambda config, shard: str(shard)
+        )
+    )
+
+    mock_sync_shard.assert_not_called()
+    assert {str(shard): result for shard, result in results.items()} == {
+        "0/2": "0/2",
+        "1/2": "1/2",
+    }
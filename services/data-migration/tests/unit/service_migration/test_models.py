@@ -0,0 +1,149 @@
+from datetime import datetime
+from uuid import UUID
+
+import pytest
+from boto3.dynamodb.types import Binary
+from ftrs_data_layer.domain import Organisation
+
+from service_migration.models import (
+    FullSyncShard,
+    ServiceMigrationMetrics,
+    ServiceMigrationState,
+    compress_snapshot,
+    entity_hash,
+)
+
+
+@pytest.fixture
+def organisation() -> Organisation:
+    return Organisation(
+        id=UUID("11111111-1111-1111-1111-111111111111"),
+        type="GP Practice",
+        active=True,
+        name="Test Organisation",
+        created=datetime.fromisoformat("2025-01-01T00:00:00Z"),
+        lastUpdated=datetime.fromisoformat("2025-01-01T00:00:00Z"),
+        identifier_ODS_ODSCode="ABC123",
+        endpoints=[],
+        telecom=[],
+    )
+
+
+def _state_item(**fields: object) -> dict:
+    return {
+        "source_record_id": "services#123",
+        "version": 1,
+        "organisation_id": "11111111-1111-1111-1111-111111111111",
+        "location_id": None,
+        "location": None,
+        "healthcare_service_id": None,
+        "healthcare_service": None,
+        "validation_issues": [],
+        **fields,
+    }
+
+
+def test_metrics_add() -> None:
+    metrics = ServiceMigrationMetrics(total=3, inserted=1, errors=1)
+
+    metrics.add(ServiceMigrationMetrics(total=2, inserted=1, skipped=1))
+
+    assert metrics.model_dump() == {
+        "total": 5,
+        "supported": 0,
+        "unsupported": 0,
+        "transformed": 0,
+        "inserted": 2,
+        "updated": 0,
+        "skipped": 1,
+        "invalid": 0,
+        "errors": 1,
+    }
+
+
+def test_full_sync_shard_parse() -> None:
+    shard = FullSyncShard.parse("2/4")
+
+    assert shard == FullSyncShard(index=2, count=4)
+    assert str(shard) == "2/4"
+
+
+@pytest.mark.parametrize("value", ["2", "a/4", "4/4", "-1/4", "0/0"])
+def test_full_sync_shard_parse_invalid(value: str) -> None:
+    with pytest.raises(ValueError):
+        FullSyncShard.parse(value)
+
+
+def test_full_sync_shard_split() -> None:
+    shards = FullSyncShard(index=1, count=2).split(3)
+
+    assert [str(shard) for shard in shards] == ["1/6", "3/6", "5/6"]
+    # Every shard key in shard 1/2 is in exactly one of the smaller shards.
+    for key in range(-50, 50):
+        owners = [shard for shard in shards if abs(key % 6) == shard.index]
+        assert len(owners) == (1 if abs(key % 2) == 1 else 0)
+
+
+def test_entity_hash_ignores_audit_timestamps(organisation: Organisation) -> None:
+    refreshed = organisation.model_copy(
+        update={
+            "created": datetime.fromisoformat("2026-01-01T00:00:00Z"),
+            "lastUpdated": datetime.fromisoformat("2026-01-01T00:00:00Z"),
+        }
+    )
+    renamed = organisation.model_copy(update={"name": "Renamed Organisation"})
+
+    assert entity_hash(refreshed) == entity_hash(organisation)
+    assert entity_hash(renamed) != entity_hash(organisation)
+
+
+def test_state_derives_missing_hashes_from_legacy_snapshots(
+    organisation: Organisation,
+) -> None:
+    state = ServiceMigrationState.model_validate(
+        _state_item(organisation=organisation.model_dump(mode="json"))
+    )
+
+    assert state.organisation == organisation
+    assert state.organisation_hash == entity_hash(organisation)
+    assert state.location_hash is None
+    assert state.healthcare_service_hash is None
+
+
+def test_state_keeps_stored_hashes(organisation: Organisation) -> None:
+    state = ServiceMigrationState.model_validate(
+        _state_item(
+            organisation=organisation.model_dump(mode="json"),
+            organisation_hash="stored",
+        )
+    )
+
+    assert state.organisation_hash == "stored"
+
+
+def test_state_decompresses_snapshots(organisation: Organisation) -> None:
+    state = ServiceMigrationState.model_validate(
+        _state_item(
+            organisation=Binary(compress_snapshot(organisation)),
+            organisation_hash=entity_hash(organisation),
+        )
+    )
+
+    assert state.organisation == organisation
+
+
+@pytest.mark.parametrize("compress_snapshots", [True, False])
+def test_state_dump_item(organisation: Organisation, compress_snapshots: bool) -> None:
+    state = ServiceMigrationState.model_validate(
+        _state_item(organisation=organisation.model_dump(mode="json"))
+    )
+
+    item = state.dump_item(compress_snapshots=compress_snapshots)
+
+    if compress_snapshots:
+        assert isinstance(item["organisation"], bytes)
+    else:
+        assert item["organisation"] == organisation.model_dump(mode="json")
+    assert item["location"] is None
+    assert item["organisation_hash"] == entity_hash(organisation)
+    assert ServiceMigrationState.model_validate(item) == state
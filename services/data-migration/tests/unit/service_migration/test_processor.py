@@ -1,17 +1,27 @@
+from pathlib import Path
+
 import pytest
+from boto3.dynamodb.types import TypeSerializer
 from freezegun import freeze_time
 from ftrs_common.mocks.mock_logger import MockLogger
+from ftrs_common.utils.db_service import get_table_name
 from ftrs_data_layer.domain import Organisation
 from ftrs_data_layer.domain.legacy.service import (
     Service,
 )
 from pytest_mock import MockerFixture
 from sqlalchemy import Engine
+from sqlalchemy.dialects import postgresql
 
 from common.cache import DoSMetadataCache
 from service_migration.config import DataMigrationConfig
-from service_migration.models import ServiceMigrationState
-from service_migration.processor import DataMigrationProcessor, ServiceMigrationMetrics
+from service_migration.models import FullSyncShard, ServiceMigrationState
+from service_migration.processor import (
+    DataMigrationProcessor,
+    PendingServiceWrite,
+    ServiceMigrationMetrics,
+    pack_pending_writes,
+)
 from service_migration.transformer.base import ServiceTransformOutput
 from service_migration.validation.types import ValidationIssue, ValidationResult
 
@@ -41,6 +51,83 @@ def test_processor_init(
     }
 
 
+def test_processor_init_warms_metadata(
+    mocker: MockerFixture,
+    mock_config: DataMigrationConfig,
+    mock_logger: MockLogger,
+) -> None:
+    mock_warm = mocker.patch.object(DoSMetadataCache, "warm")
+    mock_config.warm_metadata_cache = True
+
+    DataMigrationProcessor(config=mock_config, logger=mock_logger)
+
+    mock_warm.assert_called_once_with()
+    assert mock_logger.get_log("DM_ETL_045")[0]["detail"]["source"] == "database"
+
+
+def test_warm_metadata_writes_snapshot(
+    mocker: MockerFixture,
+    mock_config: DataMigrationConfig,
+    mock_logger: MockLogger,
+    mock_metadata_cache: DoSMetadataCache,
+    tmp_path: Path,
+) -> None:
+    snapshot_path = tmp_path / "metadata.json"
+    mock_config.metadata_snapshot_path = str(snapshot_path)
+    processor = DataMigrationProcessor(config=mock_config, logger=mock_logger)
+    processor.metadata = mock_metadata_cache
+    mocker.patch.object(mock_metadata_cache, "warm")
+
+    processor.warm_metadata()
+
+    mock_metadata_cache.warm.assert_called_once_with()
+    assert snapshot_path.exists()
+
+
+def test_warm_metadata_reads_snapshot(
+    mocker: MockerFixture,
+    mock_config: DataMigrationConfig,
+    mock_logger: MockLogger,
+    mock_metadata_cache: DoSMetadataCache,
+    tmp_path: Path,
+) -> None:
+    snapshot_path = tmp_path / "metadata.json"
+    mock_metadata_cache.save_snapshot(snapshot_path)
+    mock_config.metadata_snapshot_path = str(snapshot_path)
+    processor = DataMigrationProcessor(config=mock_config, logger=mock_logger)
+    mock_warm = mocker.patch.object(processor.metadata, "warm")
+
+    processor.warm_metadata()
+
+    mock_warm.assert_not_called()
+    assert processor.metadata.dispositions.cache == (
+        mock_metadata_cache.dispositions.cache
+    )
+    log = mock_logger.get_log("DM_ETL_045")[0]["detail"]
+    assert log["source"] == str(snapshot_path)
+    assert log["sizes"]["symptom_discriminators"] == 2  # noqa: PLR2004
+
+
+def test_warm_metadata_falls_back_to_database_on_invalid_snapshot(
+    mocker: MockerFixture,
+    mock_config: DataMigrationConfig,
+    mock_logger: MockLogger,
+    tmp_path: Path,
+) -> None:
+    snapshot_path = tmp_path / "metadata.json"
+    snapshot_path.write_text("{")
+    mock_config.metadata_snapshot_path = str(snapshot_path)
+    processor = DataMigrationProcessor(config=mock_config, logger=mock_logger)
+    mock_warm = mocker.patch.object(processor.metadata, "warm")
+    mocker.patch.object(processor.metadata, "save_snapshot")
+
+    processor.warm_metadata()
+
+    mock_warm.assert_called_once_with()
+    assert mock_logger.get_log("DM_ETL_046")[0]["detail"]["action"] == "read"
+    assert mock_logger.get_log("DM_ETL_045")[0]["detail"]["source"] == "database"
+
+
 def test_sync_all_services(
     mocker: MockerFixture,
     mock_config: DataMigrationConfig,
@@ -53,6 +140,7 @@ def test_sync_all_services(
     )
 
     processor._process_service = mocker.MagicMock()
+    processor.prefetch_state_records = mocker.MagicMock()
 
     mock_session = mocker.MagicMock()
     mock_session.__enter__.return_value = mock_session
@@ -64,6 +152,117 @@ def test_sync_all_services(
 
     assert processor._process_service.call_count == 1
     processor._process_service.assert_called_once_with(mock_legacy_service)
+    processor.prefetch_state_records.assert_called_once()
+    assert list(processor.prefetch_state_records.call_args.args[0]) == [
+        mock_legacy_service.id
+    ]
+    assert processor.state_cache == {}
+
+
+def test_iter_records_reads_in_eager_loaded_chunks(
+    mocker: MockerFixture,
+    mock_config: DataMigrationConfig,
+    mock_logger: MockLogger,
+) -> None:
+    processor = DataMigrationProcessor(
+        config=mock_config,
+        logger=mock_logger,
+    )
+
+    services = [mocker.MagicMock(id=service_id) for service_id in (1, 2, 3, 4, 5)]
+    mock_session = mocker.MagicMock()
+    mock_session.__enter__.return_value = mock_session
+    mock_session.scalars.side_effect = [services[0:2], services[2:4], services[4:]]
+
+    mocker.patch("service_migration.processor.Session", return_value=mock_session)
+
+    assert list(processor._iter_records(batch_size=2)) == services
+
+    statements = [call.args[0] for call in mock_session.scalars.call_args_list]
+    assert len(statements) == 3  # noqa: PLR2004
+    assert statements[0].whereclause is None
+    assert statements[1].whereclause.right.value == 2  # noqa: PLR2004
+    assert statements[2].whereclause.right.value == 4  # noqa: PLR2004
+    assert all(
+        len(statement._with_options) == 6  # noqa: PLR2004
+        for statement in statements
+    )
+
+
+def test_iter_record_chunks_filters_by_shard(
+    mocker: MockerFixture,
+    mock_config: DataMigrationConfig,
+    mock_logger: MockLogger,
+) -> None:
+    processor = DataMigrationProcessor(
+        config=mock_config,
+        logger=mock_logger,
+    )
+
+    mock_session = mocker.MagicMock()
+    mock_session.__enter__.return_value = mock_session
+    mock_session.scalars.return_value = []
+
+    mocker.patch("service_migration.processor.Session", return_value=mock_session)
+
+    chunks = list(processor._iter_record_chunks(shard=FullSyncShard(index=1, count=4)))
+
+    assert chunks == []
+    statement = mock_session.scalars.call_args.args[0]
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert (
+        "abs(hashtext(coalesce(left(pathwaysdos.services.odscode, %(left_1)s), "
+        "CAST(pathwaysdos.services.id AS VARCHAR))) %% %(hashtext_1)s) = %(abs_1)s"
+    ) in sql
+    assert statement.compile().params["hashtext_1"] == 4  # noqa: PLR2004
+    assert statement.compile().params["abs_1"] == 1
+
+
+def test_sync_all_services_for_shard_logs_progress(
+    mocker: MockerFixture,
+    mock_config: DataMigrationConfig,
+    mock_logger: MockLogger,
+) -> None:
+    processor = DataMigrationProcessor(
+        config=mock_config,
+        logger=mock_logger,
+    )
+    processor._process_service = mocker.MagicMock()
+    processor.prefetch_state_records = mocker.MagicMock()
+    services = [mocker.MagicMock(id=service_id) for service_id in (1, 2, 3)]
+    processor._iter_record_chunks = mocker.MagicMock(
+        return_value=[services[:2], services[2:]]
+    )
+    shard = FullSyncShard(index=0, count=2)
+
+    processor.sync_all_services(shard=shard)
+
+    processor._iter_record_chunks.assert_called_once_with(shard=shard)
+    assert processor._process_service.call_count == 3  # noqa: PLR2004
+    progress = mock_logger.get_log("DM_ETL_044")
+    assert [log["detail"]["processed_count"] for log in progress] == [2, 3]
+    assert all(log["detail"]["shard"] == "0/2" for log in progress)
+
+
+def test_iter_records_stops_after_full_final_chunk(
+    mocker: MockerFixture,
+    mock_config: DataMigrationConfig,
+    mock_logger: MockLogger,
+) -> None:
+    processor = DataMigrationProcessor(
+        config=mock_config,
+        logger=mock_logger,
+    )
+
+    services = [mocker.MagicMock(id=service_id) for service_id in (1, 2)]
+    mock_session = mocker.MagicMock()
+    mock_session.__enter__.return_value = mock_session
+    mock_session.scalars.side_effect = [services, []]
+
+    mocker.patch("service_migration.processor.Session", return_value=mock_session)
+
+    assert list(processor._iter_records(batch_size=2)) == services
+    assert mock_session.scalars.call_count == 2  # noqa: PLR2004
 
 
 def test_sync_service(
@@ -1196,7 +1395,7 @@ def test_execute_transaction_logs_success_on_successful_write(
     # Mock get_state_record to return None
     processor.get_state_record = mocker.MagicMock(return_value=None)
 
-    mock_items = ["item1", "item2", "item3", "item4"]
+    mock_items = [{"Update": {"TableName": f"table-{i}"}} for i in range(4)]
     item_count = len(mock_items)
 
     processor._execute_transaction(mock_items)
@@ -1208,3 +1407,320 @@ def test_execute_transaction_logs_success_on_successful_write(
     assert (
         log_entry["detail"]["item_count"] == item_count
     )  # org, location, service, state
+
+
+def _state_record_item(service_id: int, version: int = 1) -> dict:
+    state = ServiceMigrationState.init(service_id)
+    state.version = version
+    return TypeSerializer().serialize(state.model_dump(mode="json"))["M"]
+
+
+def test_get_state_record_reads_and_caches_state(
+    mocker: MockerFixture,
+    mock_config: DataMigrationConfig,
+    mock_logger: MockLogger,
+) -> None:
+    processor = DataMigrationProcessor(config=mock_config, logger=mock_logger)
+
+    mock_dynamodb_client = mocker.MagicMock()
+    mock_dynamodb_client.get_item.return_value = {"Item": _state_record_item(1)}
+    mocker.patch(
+        "service_migration.processor.get_dynamodb_client",
+        return_value=mock_dynamodb_client,
+    )
+
+    first = processor.get_state_record(1)
+    second = processor.get_state_record(1)
+
+    assert first.source_record_id == "services#1"
+    assert second == first
+    mock_dynamodb_client.get_item.assert_called_once_with(
+        TableName=get_table_name("data-migration-state"),
+        Key={"source_record_id": {"S": "services#1"}},
+        ConsistentRead=True,
+    )
+    assert len(mock_logger.get_log("DM_ETL_019")) == 2  # noqa: PLR2004
+
+
+def test_get_state_record_serves_cached_missing_state(
+    mocker: MockerFixture,
+    mock_config: DataMigrationConfig,
+    mock_logger: MockLogger,
+) -> None:
+    processor = DataMigrationProcessor(config=mock_config, logger=mock_logger)
+    processor.state_cache["services#1"] = None
+    mock_get_client = mocker.patch("service_migration.processor.get_dynamodb_client")
+
+    assert processor.get_state_record(1) is None
+
+    mock_get_client.assert_not_called()
+    assert mock_logger.was_logged("DM_ETL_020") is True
+
+
+def test_prefetch_state_records_batches_keys_and_caches_results(
+    mocker: MockerFixture,
+    mock_config: DataMigrationConfig,
+    mock_logger: MockLogger,
+) -> None:
+    processor = DataMigrationProcessor(config=mock_config, logger=mock_logger)
+    processor.state_cache["services#0"] = None
+    state_table = get_table_name("data-migration-state")
+
+    def batch_get_item(RequestItems: dict) -> dict:
+        keys = RequestItems[state_table]["Keys"]
+        found = [
+            key["source_record_id"]["S"]
+            for key in keys
+            if int(key["source_record_id"]["S"].split("#")[1]) % 2 == 0
+        ]
+        return {
+            "Responses": {
+                state_table: [
+                    _state_record_item(int(record_id.split("#")[1]))
+                    for record_id in found
+                ]
+            }
+        }
+
+    mock_dynamodb_client = mocker.MagicMock()
+    mock_dynamodb_client.batch_get_item.side_effect = batch_get_item
+    mocker.patch(
+        "service_migration.processor.get_dynamodb_client",
+        return_value=mock_dynamodb_client,
+    )
+
+    processor.prefetch_state_records([0, *range(1, 151), 1])
+
+    requests = [
+        call.kwargs["RequestItems"][state_table]
+        for call in mock_dynamodb_client.batch_get_item.call_args_list
+    ]
+    assert [len(request["Keys"]) for request in requests] == [100, 50]
+    assert all(request["ConsistentRead"] is True for request in requests)
+    assert len(processor.state_cache) == 151  # noqa: PLR2004
+    assert processor.state_cache["services#1"] is None
+    assert processor.state_cache["services#2"].source_record_id == "services#2"
+
+    log = mock_logger.get_log("DM_ETL_042")[0]
+    assert log["detail"] == {
+        "record_count": 150,
+        "found_count": 75,
+        "request_count": 2,
+    }
+
+
+def test_prefetch_state_records_retries_unprocessed_keys(
+    mocker: MockerFixture,
+    mock_config: DataMigrationConfig,
+    mock_logger: MockLogger,
+) -> None:
+    processor = DataMigrationProcessor(config=mock_config, logger=mock_logger)
+    state_table = get_table_name("data-migration-state")
+    unprocessed = {
+        state_table: {
+            "Keys": [{"source_record_id": {"S": "services#2"}}],
+            "ConsistentRead": True,
+        }
+    }
+
+    mock_dynamodb_client = mocker.MagicMock()
+    mock_dynamodb_client.batch_get_item.side_effect = [
+        {
+            "Responses": {state_table: [_state_record_item(1)]},
+            "UnprocessedKeys": unprocessed,
+        },
+        {"Responses": {state_table: [_state_record_item(2)]}},
+    ]
+    mocker.patch(
+        "service_migration.processor.get_dynamodb_client",
+        return_value=mock_dynamodb_client,
+    )
+    mock_sleep = mocker.patch("service_migration.processor.sleep")
+
+    processor.prefetch_state_records([1, 2])
+
+    assert mock_dynamodb_client.batch_get_item.call_count == 2  # noqa: PLR2004
+    mock_dynamodb_client.batch_get_item.assert_called_with(RequestItems=unprocessed)
+    mock_sleep.assert_called_once()
+    assert processor.state_cache["services#1"].source_record_id == "services#1"
+    assert processor.state_cache["services#2"].source_record_id == "services#2"
+
+
+def test_prefetch_state_records_skips_cached_services(
+    mocker: MockerFixture,
+    mock_config: DataMigrationConfig,
+    mock_logger: MockLogger,
+) -> None:
+    processor = DataMigrationProcessor(config=mock_config, logger=mock_logger)
+    processor.state_cache["services#1"] = None
+    mock_get_client = mocker.patch("service_migration.processor.get_dynamodb_client")
+
+    processor.prefetch_state_records([1, 1])
+
+    mock_get_client.assert_not_called()
+
+
+def test_execute_transaction_caches_written_state_record(
+    mocker: MockerFixture,
+    mock_config: DataMigrationConfig,
+    mock_logger: MockLogger,
+) -> None:
+    processor = DataMigrationProcessor(config=mock_config, logger=mock_logger)
+    processor.state_cache["services#1"] = None
+    mocker.patch("service_migration.processor.get_dynamodb_client")
+
+    processor._execute_transaction(
+        [
+            {"Put": {"TableName": get_table_name("organisation"), "Item": {}}},
+            {
+                "Put": {
+                    "TableName": get_table_name("data-migration-state"),
+                    "Item": _state_record_item(1, version=3),
+                }
+            },
+        ]
+    )
+
+    assert processor.state_cache["services#1"].version == 3  # noqa: PLR2004
+
+
+def test_execute_transaction_evicts_state_record_on_failure(
+    mocker: MockerFixture,
+    mock_config: DataMigrationConfig,
+    mock_logger: MockLogger,
+) -> None:
+    processor = DataMigrationProcessor(config=mock_config, logger=mock_logger)
+    processor.state_cache["services#1"] = ServiceMigrationState.init(1)
+    processor.state_cache["services#2"] = None
+
+    mock_dynamodb_client = mocker.MagicMock()
+    mock_dynamodb_client.transact_write_items.side_effect = Exception("boom")
+    mocker.patch(
+        "service_migration.processor.get_dynamodb_client",
+        return_value=mock_dynamodb_client,
+    )
+
+    with pytest.raises(Exception, match="boom"):
+        processor._execute_transaction(
+            [
+                {
+                    "Put": {
+                        "TableName": get_table_name("data-migration-state"),
+                        "Item": _state_record_item(1, version=2),
+                    }
+                },
+            ]
+        )
+
+    assert "services#1" not in processor.state_cache
+    assert processor.state_cache["services#2"] is None
+
+
+def _pending_write(
+    service_id: int,
+    item_count: int,
+    state_record: ServiceMigrationState | None = None,
+) -> PendingServiceWrite:
+    return PendingServiceWrite(
+        service_id=service_id,
+        state_record=state_record,
+        transaction_items=[
+            {"Update": {"TableName": f"table-{service_id}-{i}"}}
+            for i in range(item_count)
+        ],
+    )
+
+
+def test_pack_pending_writes() -> None:
+    pending_writes = [
+        _pending_write(1, 40),
+        _pending_write(2, 40),
+        _pending_write(3, 30),
+        _pending_write(4, 70),
+        _pending_write(5, 100),
+    ]
+
+    groups = pack_pending_writes(pending_writes)
+
+    assert [[write.service_id for write in group] for group in groups] == [
+        [1, 2],
+        [3, 4],
+        [5],
+    ]
+
+
+def test_coalesced_writes_packs_services_into_one_transaction(
+    mocker: MockerFixture,
+    mock_config: DataMigrationConfig,
+    mock_logger: MockLogger,
+) -> None:
+    processor = DataMigrationProcessor(config=mock_config, logger=mock_logger)
+    processor._execute_transaction = mocker.MagicMock()
+    state_record = ServiceMigrationState.init(service_id=2)
+    pending_writes = [
+        _pending_write(1, 4),
+        _pending_write(2, 2, state_record),
+        _pending_write(3, 3),
+    ]
+
+    with processor.coalesced_writes():
+        for write in pending_writes:
+            processor._execute_transaction_and_track(
+                write.service_id, write.state_record, write.transaction_items
+            )
+        processor._execute_transaction.assert_not_called()
+
+    processor._execute_transaction.assert_called_once_with(
+        [item for write in pending_writes for item in write.transaction_items]
+    )
+    assert processor.metrics.inserted == 2  # noqa: PLR2004
+    assert processor.metrics.updated == 1
+    assert processor.pending_writes is None
+
+
+def test_coalesced_writes_retries_services_separately_on_failure(
+    mocker: MockerFixture,
+    mock_config: DataMigrationConfig,
+    mock_logger: MockLogger,
+) -> None:
+    processor = DataMigrationProcessor(config=mock_config, logger=mock_logger)
+    processor._execute_transaction = mocker.MagicMock(
+        side_effect=[Exception("cancelled"), None, Exception("cancelled")]
+    )
+
+    with processor.coalesced_writes():
+        processor._execute_transaction_and_track(
+            1, None, _pending_write(1, 2).transaction_items
+        )
+        processor._execute_transaction_and_track(
+            2, None, _pending_write(2, 2).transaction_items
+        )
+
+    assert processor._execute_transaction.call_count == 3  # noqa: PLR2004
+    assert processor.metrics.inserted == 1
+    assert processor.metrics.errors == 1
+    assert mock_logger.get_log("DM_ETL_047")[0]["detail"] == {
+        "service_count": 2,
+        "error": "cancelled",
+    }
+    assert mock_logger.get_log("DM_ETL_008")[0]["detail"] == {
+        "error": "cancelled",
+        "record_id": 2,
+    }
+
+
+def test_setup_linked_transformer_flushes_pending_writes(
+    mocker: MockerFixture,
+    mock_config: DataMigrationConfig,
+    mock_logger: MockLogger,
+) -> None:
+    processor = DataMigrationProcessor(config=mock_config, logger=mock_logger)
+    processor._execute_transaction = mocker.MagicMock()
+    processor.pending_writes = [_pending_write(1, 2)]
+    transformer = mocker.MagicMock()
+    transformer.resolve_parent.return_value = (None, None, None)
+
+    processor._setup_linked_transformer(transformer, mocker.MagicMock(id=2))
+
+    processor._execute_transaction.assert_called_once()
+    assert processor.pending_writes == []
@@ -58,3 +58,29 @@ def test_valid_nhs_email_with_subdomain(email_validator: EmailValidator) -> None
     assert result is not None
     assert result.sanitised == email
     assert len(result.issues) == 0
+
+
+@pytest.mark.parametrize(
+    "email",
+    [
+        "test.user@nhs.net",
+        "test@england.nhs.uk",
+        "",
+        None,
+        12345,
+        "a" * 255 + "@nhs.net",
+        "no-at-sign.nhs.net",
+        "two@at@nhs.net",
+        ".leading@nhs.net",
+        "test@-domain.nhs.net",
+        "test@gmail.com",
+    ],
+)
+def test_check_matches_validate(email: str) -> None:
+    result = EmailValidator().validate(email)
+
+    code = EmailValidator.check(email)
+
+    assert [issue.code for issue in result.issues] == ([code] if code else [])
+    if code:
+        assert EmailValidator.build_issue(code, email, None) == result.issues[0]
@@ -62,3 +62,31 @@ def test_phone_number_validator_trims_and_converts_correct_number(
     result = validator.validate(" +44 7123 456 789 ")
     assert result.sanitised == "07123456789"
     assert len(result.issues) == 0
+
+
+@pytest.mark.parametrize(
+    "phone_number",
+    [
+        "01234567890",
+        "0123 456 7890",
+        "+441234567890",
+        "08001234567",
+        "",
+        None,
+        1234567890,
+        "012345",
+        "012345678",
+        "012345678901",
+        "06123456789",
+    ],
+)
+def test_check_matches_validate(phone_number: str) -> None:
+    result = PhoneNumberValidator("publicphone").validate(phone_number)
+
+    normalised, code = PhoneNumberValidator.check(phone_number)
+
+    assert normalised == result.original
+    assert [issue.code for issue in result.issues] == ([code] if code else [])
+    if code:
+        issue = PhoneNumberValidator.build_issue(code, normalised, "publicphone")
+        assert issue == result.issues[0]
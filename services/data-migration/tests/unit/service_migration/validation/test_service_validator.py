@@ -0,0 +1,82 @@
+from unittest.mock import patch
+
+import pytest
+from ftrs_common.mocks.mock_logger import MockLogger
+from ftrs_data_layer.domain.legacy import Service
+
+from service_migration.validation.field import EmailValidator
+from service_migration.validation.service import GPPracticeValidator, ServiceValidator
+
+
+def _services() -> list[Service]:
+    values = [
+        ("test@nhs.net", "01234567890", "0123 456 7891", "Test GP Practice"),
+        ("test@nhs.net", "+441234567890", None, "GP - Practice - Branch"),
+        ("test@gmail.com", "012345", "01234567890", "Practice &amp; Partners"),
+        (None, "06123456789", "", "<script>alert(1)</script>"),
+        ("bad.email", "01234567890", "012345678", "Practice &amp;#39;"),
+        ("test@nhs.net", "", "08001234567", None),
+    ]
+    addresses = [
+        ("123 Main Street$Building A$Hampshire", "Southampton", "SO1 1AA"),
+        ("Not Available", None, None),
+        (None, None, None),
+        ("1 High Street", "Leeds", "LS1 1AA"),
+    ]
+    return [
+        Service(
+            id=i,
+            uid=f"uid-{i}",
+            name=f"Service {i}",
+            publicname=publicname,
+            address=address,
+            town=town,
+            postcode=postcode,
+            email=email,
+            publicphone=publicphone,
+            nonpublicphone=nonpublicphone,
+            typeid=100,
+            statusid=1,
+        )
+        for i, (
+            (email, publicphone, nonpublicphone, publicname),
+            (address, town, postcode),
+        ) in enumerate(
+            (values[i % len(values)], addresses[i % len(addresses)]) for i in range(24)
+        )
+    ]
+
+
+@pytest.mark.parametrize("validator_cls", [ServiceValidator, GPPracticeValidator])
+def test_validate_many_matches_validate(
+    mock_logger: MockLogger, validator_cls: type[ServiceValidator]
+) -> None:
+    validator = validator_cls(logger=mock_logger)
+
+    expected = [validator.validate(service) for service in _services()]
+    results = validator.validate_many(_services())
+
+    assert [result.model_dump() for result in results] == [
+        result.model_dump() for result in expected
+    ]
+    assert [result.is_valid for result in results] == [
+        result.is_valid for result in expected
+    ]
+
+
+def test_validate_many_checks_each_distinct_value_once(
+    mock_logger: MockLogger,
+) -> None:
+    services = _services()
+
+    with patch.object(
+        EmailValidator, "check", side_effect=EmailValidator.check
+    ) as mock_check:
+        ServiceValidator(logger=mock_logger).validate_many(services)
+
+    distinct_emails = {service.email for service in _services()}
+    assert mock_check.call_count == len(distinct_emails)
+
+
+def test_validate_many_empty(mock_logger: MockLogger) -> None:
+    assert ServiceValidator(logger=mock_logger).validate_many([]) == []
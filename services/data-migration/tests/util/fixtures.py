@@ -60,6 +60,7 @@ def mock_config() -> DataMigrationConfig:
         ENVIRONMENT="test",
         WORKSPACE="test_workspace",
         ENDPOINT_URL="http://localhost:8000",
+        WARM_METADATA_CACHE=False,
     )
 
 
@@ -3,16 +3,20 @@ import time
 from aws_lambda_powertools import Tracer
 from aws_lambda_powertools.event_handler import APIGatewayRestResolver, Response
 from aws_lambda_powertools.utilities.typing import LambdaContext
-from fhir.resources.R4B.fhirresourcemodel import FHIRResourceModel
 from ftrs_common.feature_flags import FeatureFlag, FeatureFlagsClient
 from ftrs_common.logger import Logger
 from pydantic import ValidationError
 
 from functions import error_util
-from functions.event_context import DosSearchLogBase, get_response_size_and_duration
+from functions.event_context import (
+    DosSearchLogBase,
+    get_response_size_and_duration,
+    serialise_fhir_resource,
+)
 from functions.ftrs_service.healthcare_services_by_ods import (
     HealthcareServicesByOdsService,
 )
+from functions.ftrs_service.service_registry import service_registry
 from functions.healthcare_service_query_params import HealthcareServiceQueryParams
 from functions.request_context_middleware import request_context_middleware
 
@@ -49,9 +53,8 @@ def get_healthcare_service() -> Response:
         return _handle_healthcare_service_request(start)
 
     fhir_resource = error_util.create_resource_service_unavailable_error()
-    response_size, duration_ms = get_response_size_and_duration(
-        fhir_resource, start, logger
-    )
+    body = serialise_fhir_resource(fhir_resource)
+    response_size, duration_ms = get_response_size_and_duration(body, start, logger)
     logger.log(
         DosSearchLogBase.DOS_SEARCH_013,
         feature_flag="DOS_SEARCH_HEALTHCARE_SERVICE_ENABLED",
@@ -60,7 +63,7 @@ def get_healthcare_service() -> Response:
         dos_response_time=f"{duration_ms}ms",
         dos_response_size=response_size,
     )
-    return create_response(503, fhir_resource)
+    return create_response(503, body)
 
 
 def _handle_healthcare_service_request(start: float) -> Response:
@@ -75,49 +78,47 @@ def _handle_healthcare_service_request(start: float) -> Response:
             dos_message_category="REQUEST",
         )
 
-        ftrs_service = HealthcareServicesByOdsService()
-        fhir_resource = ftrs_service.healthcare_services_by_ods(ods_code)
+        lookup = service_registry.get(HealthcareServicesByOdsService)
+        fhir_resource = lookup.service.healthcare_services_by_ods(ods_code)
+        body = serialise_fhir_resource(fhir_resource)
 
     except ValidationError as exception:
         fhir_resource = error_util.create_validation_error_operation_outcome(exception)
-        response_size, duration_ms = get_response_size_and_duration(
-            fhir_resource, start, logger
-        )
+        body = serialise_fhir_resource(fhir_resource)
+        response_size, duration_ms = get_response_size_and_duration(body, start, logger)
         logger.log(
             DosSearchLogBase.DOS_SEARCH_005,
             validation_errors=exception.errors(),
             dos_response_time=f"{duration_ms}ms",
             dos_response_size=response_size,
         )
-        return create_response(400, fhir_resource)
+        return create_response(400, body)
 
     except Exception:
         fhir_resource = error_util.create_resource_internal_server_error()
-        response_size, duration_ms = get_response_size_and_duration(
-            fhir_resource, start, logger
-        )
+        body = serialise_fhir_resource(fhir_resource)
+        response_size, duration_ms = get_response_size_and_duration(body, start, logger)
         logger.log(
             DosSearchLogBase.DOS_SEARCH_006,
             dos_response_time=f"{duration_ms}ms",
             dos_response_size=response_size,
         )
-        return create_response(500, fhir_resource)
+        return create_response(500, body)
 
     else:
-        response_size, duration_ms = get_response_size_and_duration(
-            fhir_resource, start, logger
-        )
+        response_size, duration_ms = get_response_size_and_duration(body, start, logger)
         logger.log(
             DosSearchLogBase.DOS_SEARCH_003,
             dos_response_time=f"{duration_ms}ms",
             dos_response_size=response_size,
+            dos_cold_start=lookup.cold_start,
+            dos_service_init_time=f"{lookup.init_time_ms}ms",
             dos_message_category="METRICS",
         )
-        return create_response(200, fhir_resource)
+        return create_response(200, body)
 
 
-def create_response(status_code: int, fhir_resource: FHIRResourceModel) -> Response:
-    body = fhir_resource.model_dump_json()
+def create_response(status_code: int, body: str) -> Response:
     logger.log(
         DosSearchLogBase.DOS_SEARCH_004,
         status_code=status_code,
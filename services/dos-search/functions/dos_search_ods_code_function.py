@@ -3,13 +3,16 @@ import time
 from aws_lambda_powertools import Tracer
 from aws_lambda_powertools.event_handler import APIGatewayRestResolver, Response
 from aws_lambda_powertools.utilities.typing import LambdaContext
-from fhir.resources.R4B.fhirresourcemodel import FHIRResourceModel
 from ftrs_common.logger import Logger
 from pydantic import ValidationError
 
 from functions import error_util
-from functions.event_context import get_response_size_and_duration
+from functions.event_context import (
+    get_response_size_and_duration,
+    serialise_fhir_resource,
+)
 from functions.ftrs_service.ftrs_service import FtrsService
+from functions.ftrs_service.service_registry import service_registry
 from functions.logbase import DosSearchLogBase
 from functions.organization_headers import OrganizationHeaders
 from functions.organization_query_params import OrganizationQueryParams
@@ -61,60 +64,61 @@ def get_organization() -> Response:
             dos_message_category="REQUEST",
         )
 
-        ftrs_service = FtrsService()
-        fhir_resource = ftrs_service.endpoints_by_ods(ods_code)
+        lookup = service_registry.get(FtrsService)
+        fhir_resource = lookup.service.endpoints_by_ods(ods_code)
+        body = serialise_fhir_resource(fhir_resource)
 
     except Exception:
         return handle_general_exception(start)
     else:
         # success path: measure and log response metrics
-        response_size, duration_ms = get_response_size_and_duration(
-            fhir_resource, start, logger
-        )
+        response_size, duration_ms = get_response_size_and_duration(body, start, logger)
+        cache_stats = lookup.service.ods_cache.stats()
 
         logger.log(
             DosSearchLogBase.DOS_SEARCH_003,
             dos_response_time=f"{duration_ms}ms",
             dos_response_size=response_size,
+            dos_cold_start=lookup.cold_start,
+            dos_service_init_time=f"{lookup.init_time_ms}ms",
+            dos_ods_cache_hits=cache_stats.hits,
+            dos_ods_cache_misses=cache_stats.misses,
             dos_message_category="METRICS",
         )
-        return create_response(200, fhir_resource)
+        return create_response(200, body)
 
 
 def handle_event_validation_error(exception: ValidationError, start: float) -> Response:
     fhir_resource = error_util.create_validation_error_operation_outcome(exception)
+    body = serialise_fhir_resource(fhir_resource)
 
-    response_size, duration_ms = get_response_size_and_duration(
-        fhir_resource, start, logger
-    )
+    response_size, duration_ms = get_response_size_and_duration(body, start, logger)
     logger.log(
         DosSearchLogBase.DOS_SEARCH_005,
         validation_errors=exception.errors(),
         dos_response_time=f"{duration_ms}ms",
         dos_response_size=response_size,
     )
-    return create_response(400, fhir_resource)
+    return create_response(400, body)
 
 
 def handle_general_exception(start: float) -> Response:
     fhir_resource = error_util.create_resource_internal_server_error()
+    body = serialise_fhir_resource(fhir_resource)
 
-    response_size, duration_ms = get_response_size_and_duration(
-        fhir_resource, start, logger
-    )
+    response_size, duration_ms = get_response_size_and_duration(body, start, logger)
     logger.log(
         DosSearchLogBase.DOS_SEARCH_006,
         dos_response_time=f"{duration_ms}ms",
         dos_response_size=response_size,
     )
 
-    return create_response(500, fhir_resource)
+    return create_response(500, body)
 
 
-def create_response(status_code: int, fhir_resource: FHIRResourceModel) -> Response:
+def create_response(status_code: int, body: str) -> Response:
     # Log response creation with structured fields (we don't have event in this scope)
     # response details have been logged in the handler; this is an additional log point
-    body = fhir_resource.model_dump_json()
     logger.log(
         DosSearchLogBase.DOS_SEARCH_004,
         status_code=status_code,
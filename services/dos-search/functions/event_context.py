@@ -1,3 +1,4 @@
+import json
 import os
 import time
 from typing import Any, Optional
@@ -29,12 +30,24 @@ def setup_request(event: dict[str, Any], logger: Logger) -> None:
     )
 
 
+def serialise_fhir_resource(fhir_resource: FHIRResourceModel | dict) -> str:
+    """
+    Serialise a FHIR resource into the JSON response body.
+    The result is reused for the size metric, the HTTP body and any logging,
+    so each response is serialised exactly once.
+    Unvalidated bundles from the mappers are plain dicts already in FHIR
+    element order and are dumped in the same compact form as the models.
+    """
+    if isinstance(fhir_resource, dict):
+        return json.dumps(fhir_resource, separators=(",", ":"), ensure_ascii=False)
+    return fhir_resource.model_dump_json()
+
+
 def get_response_size_and_duration(
-    fhir_resource: Optional[FHIRResourceModel], start: float, logger: Logger
+    body: Optional[str], start: float, logger: Logger
 ) -> tuple[int, int]:
     duration_ms = int((time.time() - start) * 1000)
     try:
-        body = fhir_resource.model_dump_json()
         response_size = len(body.encode("utf-8"))
     except Exception:
         response_size = 0
@@ -2,7 +2,6 @@ from uuid import uuid4
 
 from aws_lambda_powertools import Tracer
 from fhir.resources.R4B.bundle import Bundle
-from fhir.resources.R4B.fhirresourcemodel import FHIRResourceModel
 from ftrs_common.utils.api_url_util import get_fhir_url
 from ftrs_data_layer.domain import Organisation
 
@@ -19,19 +18,30 @@ tracer = Tracer()
 
 
 class BundleMapper:
-    def __init__(self) -> None:
+    """
+    Maps an Organisation and its Endpoints to a FHIR searchset Bundle.
+
+    Resources are built as plain dicts and only the final Bundle is validated.
+    With validate=False the Bundle dict is returned as is, ready to be
+    serialised without building the FHIR models at all.
+    """
+
+    def __init__(self, validate: bool = True) -> None:
+        self.validate = validate
         self.organization_mapper = OrganizationMapper()
         self.endpoint_mapper = EndpointMapper()
 
     @tracer.capture_method
-    def map_to_fhir(self, organisation: Organisation, ods_code: str) -> Bundle:
+    def map_to_fhir(self, organisation: Organisation, ods_code: str) -> Bundle | dict:
         resources = self._create_resources(organisation) if organisation else []
 
         return self._create_bundle(resources, ods_code)
 
-    def _create_resources(self, organisation: Organisation) -> list[FHIRResourceModel]:
-        endpoint_resources = self.endpoint_mapper.map_to_fhir_endpoints(organisation)
-        organization_resource = self.organization_mapper.map_to_fhir_organization(
+    def _create_resources(self, organisation: Organisation) -> list[dict]:
+        endpoint_resources = self.endpoint_mapper.create_endpoint_resources(
+            organisation
+        )
+        organization_resource = self.organization_mapper.create_organization_resource(
             organisation
         )
 
@@ -39,9 +49,9 @@ class BundleMapper:
 
     def _create_bundle(
         self,
-        resources: list[FHIRResourceModel],
+        resources: list[dict],
         ods_code: str,
-    ) -> Bundle:
+    ) -> Bundle | dict:
         bundle_type = "searchset"
         bundle_id = str(uuid4())
         url = (
@@ -58,19 +68,18 @@ class BundleMapper:
 
         entries = [self._create_entry(resource) for resource in resources]
 
-        bundle = Bundle.model_validate(
-            {
-                "type": bundle_type,
-                "id": bundle_id,
-                "link": bundle_link,
-                "entry": entries,
-            }
-        )
+        bundle = {
+            "resourceType": "Bundle",
+            "id": bundle_id,
+            "type": bundle_type,
+            "link": bundle_link,
+            "entry": entries,
+        }
 
-        return bundle
+        return Bundle.model_validate(bundle) if self.validate else bundle
 
-    def _create_entry(self, resource: FHIRResourceModel) -> dict[str, object]:
-        url = get_fhir_url("dos-search", resource.get_resource_type(), resource.id)
+    def _create_entry(self, resource: dict) -> dict[str, object]:
+        url = get_fhir_url("dos-search", resource["resourceType"], resource["id"])
         search_mode = self._get_search_mode(resource)
 
         return {
@@ -79,8 +88,8 @@ class BundleMapper:
             "search": {"mode": search_mode},
         }
 
-    def _get_search_mode(self, resource: FHIRResourceModel) -> str:
-        if resource.get_resource_type() == "Organization":
+    def _get_search_mode(self, resource: dict) -> str:
+        if resource["resourceType"] == "Organization":
             return "match"
         else:
             return "include"
@@ -1,5 +1,3 @@
-from fhir.resources.R4B.codeableconcept import CodeableConcept
-from fhir.resources.R4B.coding import Coding
 from fhir.resources.R4B.endpoint import Endpoint as FhirEndpoint
 from ftrs_common.logger import Logger
 from ftrs_data_layer.domain import Endpoint, Organisation
@@ -16,39 +14,36 @@ class EndpointMapper:
     }
 
     def map_to_fhir_endpoints(self, organisation: Organisation) -> list[FhirEndpoint]:
-        fhir_endpoints = []
-
-        for endpoint in organisation.endpoints:
-            fhir_endpoint = self._create_fhir_endpoint(endpoint)
-            if fhir_endpoint:
-                fhir_endpoints.append(fhir_endpoint)
-
-        return fhir_endpoints
-
-    def _create_fhir_endpoint(self, endpoint: Endpoint) -> FhirEndpoint | None:
-        endpoint_id = str(endpoint.id)
-        status = endpoint.status.value
-        connection_type = self._create_connection_type(endpoint)
-        managing_organization = self._create_managing_organization(endpoint)
-        payload_type = self._create_payload_type(endpoint)
-        payload_mime_type = self._create_payload_mime_type(endpoint)
-        address = self._create_address(endpoint)
-        extension = self._create_extensions(endpoint)
-
-        endpoint = FhirEndpoint.model_validate(
-            {
-                "id": endpoint_id,
-                "status": status,
-                "connectionType": connection_type,
-                "managingOrganization": managing_organization,
-                "payloadType": payload_type,
-                "payloadMimeType": payload_mime_type,
-                "address": address,
-                "extension": extension,
-            }
-        )
-
-        return endpoint
+        return [
+            FhirEndpoint.model_validate(resource)
+            for resource in self.create_endpoint_resources(organisation)
+        ]
+
+    def create_endpoint_resources(self, organisation: Organisation) -> list[dict]:
+        """
+        Build the FHIR Endpoint resources as plain dicts in FHIR element order,
+        ready to be validated as part of a Bundle or serialised directly.
+        """
+        return [
+            self._create_endpoint_resource(endpoint)
+            for endpoint in organisation.endpoints
+        ]
+
+    def _create_fhir_endpoint(self, endpoint: Endpoint) -> FhirEndpoint:
+        return FhirEndpoint.model_validate(self._create_endpoint_resource(endpoint))
+
+    def _create_endpoint_resource(self, endpoint: Endpoint) -> dict:
+        return {
+            "resourceType": "Endpoint",
+            "id": str(endpoint.id),
+            "extension": self._create_extensions(endpoint),
+            "status": endpoint.status.value,
+            "connectionType": self._create_connection_type(endpoint),
+            "managingOrganization": self._create_managing_organization(endpoint),
+            "payloadType": self._create_payload_type(endpoint),
+            "payloadMimeType": self._create_payload_mime_type(endpoint),
+            "address": self._create_address(endpoint),
+        }
 
     def _create_address(self, endpoint: Endpoint) -> str:
         return endpoint.address
@@ -58,23 +53,21 @@ class EndpointMapper:
         managing_organization = {"reference": f"Organization/{org_id}"}
         return managing_organization
 
-    def _create_payload_type(self, endpoint: Endpoint) -> list[CodeableConcept]:
+    def _create_payload_type(self, endpoint: Endpoint) -> list[dict]:
         system = "http://hl7.org/fhir/ValueSet/endpoint-payload-type"
         code = endpoint.payloadType
 
         if not code:
             return []
 
-        codeable_concept = CodeableConcept.model_validate(
-            {
-                "coding": [
-                    {
-                        "system": system,
-                        "code": code,
-                    },
-                ],
-            }
-        )
+        codeable_concept = {
+            "coding": [
+                {
+                    "system": system,
+                    "code": code,
+                },
+            ],
+        }
 
         return [codeable_concept]
 
@@ -131,12 +124,10 @@ class EndpointMapper:
             "valueCode": business_scenario_code,
         }
 
-    def _create_connection_type(self, endpoint: Endpoint) -> Coding | None:
+    def _create_connection_type(self, endpoint: Endpoint) -> dict:
         db_conn_type = endpoint.connectionType.lower()
 
-        return Coding.model_validate(
-            {
-                "system": "https://fhir.nhs.uk/England/CodeSystem/England-EndpointConnection",
-                "code": db_conn_type,
-            }
-        )
+        return {
+            "system": "https://fhir.nhs.uk/England/CodeSystem/England-EndpointConnection",
+            "code": db_conn_type,
+        }
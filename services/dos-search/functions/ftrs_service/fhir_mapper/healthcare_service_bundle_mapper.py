@@ -2,7 +2,6 @@ from uuid import uuid4
 
 from aws_lambda_powertools import Tracer
 from fhir.resources.R4B.bundle import Bundle
-from fhir.resources.R4B.fhirresourcemodel import FHIRResourceModel
 from ftrs_common.utils.api_url_util import get_fhir_url
 from ftrs_data_layer.domain import HealthcareService
 
@@ -17,15 +16,20 @@ tracer = Tracer()
 
 
 class HealthcareServiceBundleMapper:
-    """Maps a list of HealthcareService domain objects to a FHIR Bundle."""
+    """Maps a list of HealthcareService domain objects to a FHIR Bundle.
 
-    def __init__(self) -> None:
+    Resources are built as plain dicts and only the final Bundle is validated.
+    With validate=False the Bundle dict is returned as is.
+    """
+
+    def __init__(self, validate: bool = True) -> None:
+        self.validate = validate
         self.healthcare_service_mapper = HealthcareServiceMapper()
 
     @tracer.capture_method
     def map_to_fhir(
         self, healthcare_services: list[HealthcareService], ods_code: str
-    ) -> Bundle:
+    ) -> Bundle | dict:
         """Map a list of HealthcareService objects to a FHIR Bundle.
 
         Args:
@@ -33,40 +37,41 @@ class HealthcareServiceBundleMapper:
             ods_code: The ODS code used for the search.
 
         Returns:
-            A FHIR Bundle containing HealthcareService resources.
+            A FHIR Bundle containing HealthcareService resources, or its dict
+            form when validation is disabled.
         """
         resources = self._create_resources(healthcare_services)
         return self._create_bundle(resources, ods_code)
 
     def _create_resources(
         self, healthcare_services: list[HealthcareService]
-    ) -> list[FHIRResourceModel]:
-        """Convert domain HealthcareService objects to FHIR resources.
+    ) -> list[dict]:
+        """Convert domain HealthcareService objects to FHIR resource dicts.
 
         Args:
             healthcare_services: List of domain HealthcareService objects.
 
         Returns:
-            List of FHIR HealthcareService resources.
+            List of FHIR HealthcareService resource dicts.
         """
         return [
-            self.healthcare_service_mapper.map_to_fhir_healthcare_service(hs)
+            self.healthcare_service_mapper.create_healthcare_service_resource(hs)
             for hs in healthcare_services
         ]
 
     def _create_bundle(
         self,
-        resources: list[FHIRResourceModel],
+        resources: list[dict],
         ods_code: str,
-    ) -> Bundle:
+    ) -> Bundle | dict:
         """Create a FHIR Bundle from resources.
 
         Args:
-            resources: List of FHIR resources to include.
+            resources: List of FHIR resource dicts to include.
             ods_code: The ODS code used for the search.
 
         Returns:
-            A FHIR Bundle.
+            A FHIR Bundle, or its dict form when validation is disabled.
         """
         bundle_type = "searchset"
         bundle_id = str(uuid4())
@@ -83,28 +88,27 @@ class HealthcareServiceBundleMapper:
 
         entries = [self._create_entry(resource) for resource in resources]
 
-        bundle = Bundle.model_validate(
-            {
-                "type": bundle_type,
-                "id": bundle_id,
-                "total": len(resources),
-                "link": bundle_link,
-                "entry": entries,
-            }
-        )
+        bundle = {
+            "resourceType": "Bundle",
+            "id": bundle_id,
+            "type": bundle_type,
+            "total": len(resources),
+            "link": bundle_link,
+            "entry": entries,
+        }
 
-        return bundle
+        return Bundle.model_validate(bundle) if self.validate else bundle
 
-    def _create_entry(self, resource: FHIRResourceModel) -> dict[str, object]:
+    def _create_entry(self, resource: dict) -> dict[str, object]:
         """Create a Bundle entry for a resource.
 
         Args:
-            resource: The FHIR resource to wrap.
+            resource: The FHIR resource dict to wrap.
 
         Returns:
             A Bundle entry dict.
         """
-        url = get_fhir_url("dos-search", "HealthcareService", resource.id)
+        url = get_fhir_url("dos-search", "HealthcareService", resource["id"])
 
         return {
             "fullUrl": url,
@@ -1,8 +1,6 @@
-from fhir.resources.R4B.codeableconcept import CodeableConcept
 from fhir.resources.R4B.healthcareservice import (
     HealthcareService as FhirHealthcareService,
 )
-from fhir.resources.R4B.identifier import Identifier
 from ftrs_data_layer.domain import HealthcareService
 
 
@@ -11,34 +9,44 @@ class HealthcareServiceMapper:
         self, healthcare_service: HealthcareService
     ) -> FhirHealthcareService:
         """Map a domain HealthcareService to a FHIR HealthcareService resource."""
-        service_id = str(healthcare_service.id)
-
-        fhir_healthcare_service = FhirHealthcareService.model_validate(
-            {
-                "id": service_id,
-                "identifier": self._create_identifiers(healthcare_service),
-                "providedBy": self._create_provided_by_reference(healthcare_service),
-                "location": self._create_location_references(healthcare_service),
-                "type": self._create_type(healthcare_service),
-                "telecom": self._create_telecom(healthcare_service),
-            }
+        return FhirHealthcareService.model_validate(
+            self.create_healthcare_service_resource(healthcare_service)
         )
-        return fhir_healthcare_service
 
-    def _create_identifiers(
+    def create_healthcare_service_resource(
         self, healthcare_service: HealthcareService
-    ) -> list[Identifier]:
+    ) -> dict:
+        """Build the FHIR HealthcareService resource as a plain dict.
+
+        Keys follow the FHIR element order and empty elements are left out,
+        so the dict serialises to the same JSON as the validated model.
+        """
+        resource = {
+            "resourceType": "HealthcareService",
+            "id": str(healthcare_service.id),
+            "identifier": self._create_identifiers(healthcare_service),
+        }
+
+        provided_by = self._create_provided_by_reference(healthcare_service)
+        if provided_by is not None:
+            resource["providedBy"] = provided_by
+
+        resource["type"] = self._create_type(healthcare_service)
+        resource["location"] = self._create_location_references(healthcare_service)
+        resource["telecom"] = self._create_telecom(healthcare_service)
+
+        return resource
+
+    def _create_identifiers(self, healthcare_service: HealthcareService) -> list[dict]:
         identifiers = []
 
         if healthcare_service.identifier_oldDoS_uid:
             identifiers.append(
-                Identifier.model_validate(
-                    {
-                        "use": "official",
-                        "system": "https://fhir.nhs.uk/Id/dos-service-id",
-                        "value": healthcare_service.identifier_oldDoS_uid,
-                    }
-                )
+                {
+                    "use": "official",
+                    "system": "https://fhir.nhs.uk/Id/dos-service-id",
+                    "value": healthcare_service.identifier_oldDoS_uid,
+                }
             )
 
         return identifiers
@@ -57,9 +65,7 @@ class HealthcareServiceMapper:
             return [{"reference": f"Location/{healthcare_service.location}"}]
         return []
 
-    def _create_type(
-        self, healthcare_service: HealthcareService
-    ) -> list[CodeableConcept]:
+    def _create_type(self, healthcare_service: HealthcareService) -> list[dict]:
         if not healthcare_service.type:
             return []
 
@@ -70,30 +76,28 @@ class HealthcareServiceMapper:
         )
 
         return [
-            CodeableConcept.model_validate(
-                {
-                    "coding": [
-                        {
-                            "system": "http://hl7.org/fhir/ValueSet/service-type",
-                            "code": type_value,
-                            "display": type_value,
-                        }
-                    ],
-                }
-            )
+            {
+                "coding": [
+                    {
+                        "system": "http://hl7.org/fhir/ValueSet/service-type",
+                        "code": type_value,
+                        "display": type_value,
+                    }
+                ],
+            }
         ]
 
     def _create_phone_telecom(self, phone_number: str, comment: str) -> dict:
         return {
-            "system": "phone",
-            "value": phone_number,
-            "use": "work",
             "extension": [
                 {
                     "url": "http://hl7.org/fhir/StructureDefinition/contactpoint-comment",
                     "valueString": comment,
                 }
             ],
+            "system": "phone",
+            "value": phone_number,
+            "use": "work",
         }
 
     def _create_telecom(self, healthcare_service: HealthcareService) -> list[dict]:
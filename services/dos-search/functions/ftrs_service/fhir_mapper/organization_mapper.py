@@ -1,4 +1,3 @@
-from fhir.resources.R4B.identifier import Identifier
 from fhir.resources.R4B.organization import Organization as FhirOrganization
 from ftrs_data_layer.domain import Organisation
 
@@ -7,28 +6,27 @@ from functions.constants import ODS_ORG_CODE_IDENTIFIER_SYSTEM
 
 class OrganizationMapper:
     def map_to_fhir_organization(self, organisation: Organisation) -> FhirOrganization:
-        organization_id = str(organisation.id)
-        name = organisation.name
-        active = organisation.active
-        identifier = self._create_identifier(organisation)
-
-        fhir_organization = FhirOrganization.model_validate(
-            {
-                "id": organization_id,
-                "identifier": identifier,
-                "active": active,
-                "name": name,
-            }
+        return FhirOrganization.model_validate(
+            self.create_organization_resource(organisation)
         )
-        return fhir_organization
 
-    def _create_identifier(self, organisation: Organisation) -> list[Identifier]:
-        identifier = Identifier.model_validate(
-            {
-                "use": "official",
-                "system": ODS_ORG_CODE_IDENTIFIER_SYSTEM,
-                "value": organisation.identifier_ODS_ODSCode,
-            }
-        )
+    def create_organization_resource(self, organisation: Organisation) -> dict:
+        """
+        Build the FHIR Organization resource as a plain dict in FHIR element order.
+        """
+        return {
+            "resourceType": "Organization",
+            "id": str(organisation.id),
+            "identifier": self._create_identifier(organisation),
+            "active": organisation.active,
+            "name": organisation.name,
+        }
+
+    def _create_identifier(self, organisation: Organisation) -> list[dict]:
+        identifier = {
+            "use": "official",
+            "system": ODS_ORG_CODE_IDENTIFIER_SYSTEM,
+            "value": organisation.identifier_ODS_ODSCode,
+        }
 
         return [identifier]
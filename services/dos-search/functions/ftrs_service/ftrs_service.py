@@ -1,24 +1,53 @@
+import os
+
 from fhir.resources.R4B.bundle import Bundle
 from ftrs_common.logger import Logger
 from ftrs_common.utils.db_service import get_service_repository
 from ftrs_data_layer.domain import Organisation
 
 from functions.ftrs_service.fhir_mapper.bundle_mapper import BundleMapper
+from functions.ftrs_service.lookup_cache import LookupCache
 from functions.logbase import DosSearchLogBase
 
 logger = Logger.get(service="dos-search")
 
+# Organisation data only changes through the daily ETL ODS run, so lookups can
+# be served from the warm container for a few minutes.
+DEFAULT_ODS_CACHE_MAX_SIZE = 1000
+DEFAULT_ODS_CACHE_TTL_SECONDS = 300
+DEFAULT_ODS_CACHE_NEGATIVE_TTL_SECONDS = 60
+
 
 class FtrsService:
     def __init__(self) -> None:
-        self.repository = get_service_repository(Organisation, "organisation")
-        self.mapper = BundleMapper()
-
-    def endpoints_by_ods(self, ods_code: str) -> Bundle:
+        self.repository = get_service_repository(
+            Organisation, "organisation", trusted_reads=True
+        )
+        self.mapper = BundleMapper(
+            validate=os.environ.get("VALIDATE_FHIR_RESPONSES", "true").lower() == "true"
+        )
+        self.ods_cache = LookupCache[str, Organisation](
+            max_size=int(
+                os.environ.get("ODS_CACHE_MAX_SIZE", DEFAULT_ODS_CACHE_MAX_SIZE)
+            ),
+            ttl_seconds=float(
+                os.environ.get("ODS_CACHE_TTL_SECONDS", DEFAULT_ODS_CACHE_TTL_SECONDS)
+            ),
+            negative_ttl_seconds=float(
+                os.environ.get(
+                    "ODS_CACHE_NEGATIVE_TTL_SECONDS",
+                    DEFAULT_ODS_CACHE_NEGATIVE_TTL_SECONDS,
+                )
+            ),
+        )
+
+    def endpoints_by_ods(self, ods_code: str) -> Bundle | dict:
         try:
             logger.log(DosSearchLogBase.DOS_SEARCH_007)
 
-            organisation = self.repository.get_first_record_by_ods_code(ods_code)
+            organisation = self.ods_cache.get_or_load(
+                ods_code, self.repository.get_first_record_by_ods_code
+            )
 
             logger.log(
                 DosSearchLogBase.DOS_SEARCH_008,
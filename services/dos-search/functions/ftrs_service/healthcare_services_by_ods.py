@@ -1,3 +1,7 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+
 from fhir.resources.R4B.bundle import Bundle
 from ftrs_common.logger import Logger
 from ftrs_common.utils.db_service import get_service_repository
@@ -10,16 +14,24 @@ from functions.ftrs_service.fhir_mapper.healthcare_service_bundle_mapper import
 
 logger = Logger.get(service="dos-search")
 
+DEFAULT_MAX_LOOKUP_WORKERS = 8
+
 
 class HealthcareServicesByOdsService:
-    def __init__(self) -> None:
-        self.repository = get_service_repository(Organisation, "organisation")
+    def __init__(self, max_lookup_workers: int = DEFAULT_MAX_LOOKUP_WORKERS) -> None:
+        self.max_lookup_workers = max_lookup_workers
+        self._lookup_executor: ThreadPoolExecutor | None = None
+        self.repository = get_service_repository(
+            Organisation, "organisation", trusted_reads=True
+        )
         self.healthcare_service_repository = get_service_repository(
-            HealthcareService, "healthcare-service"
+            HealthcareService, "healthcare-service", trusted_reads=True
+        )
+        self.healthcare_service_mapper = HealthcareServiceBundleMapper(
+            validate=os.environ.get("VALIDATE_FHIR_RESPONSES", "true").lower() == "true"
         )
-        self.healthcare_service_mapper = HealthcareServiceBundleMapper()
 
-    def healthcare_services_by_ods(self, ods_code: str) -> Bundle:
+    def healthcare_services_by_ods(self, ods_code: str) -> Bundle | dict:
         try:
             logger.info(
                 "Retrieving organisations by ods_code for healthcare services lookup",
@@ -41,17 +53,7 @@ class HealthcareServicesByOdsService:
                 organization_ids=organization_ids,
                 ods_code=ods_code,
             )
-            healthcare_services = []
-            for organization_id in organization_ids:
-                logger.info(
-                    "Retrieving healthcare services for organisation",
-                    organization_id=organization_id,
-                )
-                healthcare_services.extend(
-                    self.healthcare_service_repository.get_records_by_provided_by(
-                        str(organization_id)
-                    )
-                )
+            healthcare_services = self._get_healthcare_services(organization_ids)
 
             logger.info(
                 "Mapping healthcare services to fhir_bundle",
@@ -70,3 +72,49 @@ class HealthcareServicesByOdsService:
 
         else:
             return fhir_bundle
+
+    def _get_healthcare_services(
+        self, organization_ids: list[str]
+    ) -> list[HealthcareService]:
+        """
+        Query the ProvidedByIndex for each organisation.
+        Lookups for more than one organisation run concurrently on a bounded
+        thread pool; results keep the order of organization_ids.
+        """
+        max_workers = min(self.max_lookup_workers, len(organization_ids))
+        if max_workers <= 1:
+            results = map(self._get_by_provided_by, organization_ids)
+        else:
+            executor = self._get_lookup_executor()
+            # Each task runs in a copy of the request context so the
+            # correlation keys appended to the logger are kept.
+            futures = [
+                executor.submit(
+                    copy_context().run, self._get_by_provided_by, organization_id
+                )
+                for organization_id in organization_ids
+            ]
+            results = [future.result() for future in futures]
+
+        return [service for services in results for service in services]
+
+    def _get_lookup_executor(self) -> ThreadPoolExecutor:
+        """
+        Return the thread pool for lookups, kept for the life of the container.
+        Each worker thread builds its own DynamoDB resource on first use, so
+        reusing the threads avoids paying for that on every request.
+        """
+        if self._lookup_executor is None:
+            self._lookup_executor = ThreadPoolExecutor(
+                max_workers=self.max_lookup_workers
+            )
+        return self._lookup_executor
+
+    def _get_by_provided_by(self, organization_id: str) -> list[HealthcareService]:
+        logger.info(
+            "Retrieving healthcare services for organisation",
+            organization_id=organization_id,
+        )
+        return self.healthcare_service_repository.get_records_by_provided_by(
+            organization_id
+        )
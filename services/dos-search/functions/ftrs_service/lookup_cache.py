@@ -0,0 +1,91 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Generic, Hashable, TypeVar
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Hit and miss counts since the cache was created or last cleared.
+    """
+
+    hits: int
+    misses: int
+    size: int
+
+
+class LookupCache(Generic[KeyT, ValueT]):
+    """
+    Container-scoped LRU read-through cache with a time-to-live.
+
+    Lookups that find nothing (None) are cached too, for negative_ttl_seconds,
+    so repeated requests for unknown keys do not reach the database either.
+    A max_size or ttl_seconds of 0 disables caching, negative results included.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        negative_ttl_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = (
+            ttl_seconds if negative_ttl_seconds is None else negative_ttl_seconds
+        )
+        self._clock = clock
+        self._entries: OrderedDict[KeyT, tuple[float, ValueT | None]] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_load(
+        self, key: KeyT, loader: Callable[[KeyT], ValueT | None]
+    ) -> ValueT | None:
+        """
+        Return the cached value for key, calling loader on a miss or expiry.
+        Exceptions from loader are not cached.
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+
+            self._misses += 1
+
+        value = loader(key)
+
+        ttl = self.ttl_seconds if value is not None else self.negative_ttl_seconds
+        if self.max_size > 0 and self.ttl_seconds > 0 and ttl > 0:
+            with self._lock:
+                self._entries[key] = (self._clock() + ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+
+        return value
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits, misses=self._misses, size=len(self._entries)
+            )
+
+    def clear(self) -> None:
+        """
+        Drop all entries and reset the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
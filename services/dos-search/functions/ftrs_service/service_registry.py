@@ -0,0 +1,63 @@
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Generic, TypeVar
+
+ServiceT = TypeVar("ServiceT")
+
+
+@dataclass(frozen=True)
+class ServiceLookup(Generic[ServiceT]):
+    """
+    Result of resolving a service from the registry.
+
+    cold_start is True when the service had to be built for this invocation,
+    and init_time_ms is the time spent building it (0 on a warm start).
+    """
+
+    service: ServiceT
+    cold_start: bool
+    init_time_ms: int
+
+
+class ServiceRegistry:
+    """
+    Container-scoped registry of dos-search services.
+
+    Services, and so their repositories and FHIR mappers, are built on first use
+    and reused across warm Lambda invocations.
+    """
+
+    def __init__(self) -> None:
+        self._services: dict[type, Any] = {}
+        self._lock = Lock()
+
+    def get(self, service_cls: type[ServiceT]) -> ServiceLookup[ServiceT]:
+        """
+        Return the shared instance of service_cls, building it if required.
+        """
+        if (service := self._services.get(service_cls)) is not None:
+            return ServiceLookup(service=service, cold_start=False, init_time_ms=0)
+
+        with self._lock:
+            if (service := self._services.get(service_cls)) is not None:
+                return ServiceLookup(service=service, cold_start=False, init_time_ms=0)
+
+            start = time.perf_counter()
+            service = service_cls()
+            init_time_ms = int((time.perf_counter() - start) * 1000)
+            self._services[service_cls] = service
+
+        return ServiceLookup(
+            service=service, cold_start=True, init_time_ms=init_time_ms
+        )
+
+    def clear(self) -> None:
+        """
+        Drop all cached services so the next lookup rebuilds them.
+        """
+        with self._lock:
+            self._services.clear()
+
+
+service_registry = ServiceRegistry()
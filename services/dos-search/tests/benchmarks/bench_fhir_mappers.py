@@ -0,0 +1,73 @@
+"""
+Microbenchmarks for building dos-search FHIR Bundles with BundleMapper and
+HealthcareServiceBundleMapper for 1, 10 and 100 resources.
+
+Each mapper is timed with the final Bundle validated (the default) and with
+validation disabled, both for mapping alone and for mapping plus serialising
+the response body.
+
+Run from services/dos-search:
+
+    python -m tests.benchmarks.bench_fhir_mappers
+"""
+
+import timeit
+
+from functions.event_context import serialise_fhir_resource
+from functions.ftrs_service.fhir_mapper import (
+    BundleMapper,
+    HealthcareServiceBundleMapper,
+)
+from tests.benchmarks.data import build_healthcare_service, build_organisation
+
+RESOURCE_COUNTS = (1, 10, 100)
+REPEAT = 5
+NUMBER = 20
+
+
+def _best_ms(func: object) -> float:
+    timings = timeit.repeat(func, repeat=REPEAT, number=NUMBER)
+    return min(timings) / NUMBER * 1000
+
+
+def _print_row(label: str, resource_count: int, map_ms: float, body_ms: float) -> None:
+    print(f"{label:<45} {resource_count:>10} {map_ms:>10.3f} {body_ms:>12.3f}")
+
+
+def main() -> None:
+    print(f"{'mapper':<45} {'resources':>10} {'map ms':>10} {'map+body ms':>12}")
+    for validate in (True, False):
+        bundle_mapper = BundleMapper(validate=validate)
+        healthcare_service_mapper = HealthcareServiceBundleMapper(validate=validate)
+        suffix = "" if validate else " (no validation)"
+
+        for resource_count in RESOURCE_COUNTS:
+            organisation = build_organisation(resource_count)
+            healthcare_services = [
+                build_healthcare_service(1) for _ in range(resource_count)
+            ]
+
+            def map_organisation() -> object:
+                return bundle_mapper.map_to_fhir(organisation, "ABC123")
+
+            def map_healthcare_services() -> object:
+                return healthcare_service_mapper.map_to_fhir(
+                    healthcare_services, "ABC123"
+                )
+
+            _print_row(
+                f"BundleMapper{suffix}",
+                resource_count,
+                _best_ms(map_organisation),
+                _best_ms(lambda: serialise_fhir_resource(map_organisation())),
+            )
+            _print_row(
+                f"HealthcareServiceBundleMapper{suffix}",
+                resource_count,
+                _best_ms(map_healthcare_services),
+                _best_ms(lambda: serialise_fhir_resource(map_healthcare_services())),
+            )
+
+
+if __name__ == "__main__":
+    main()
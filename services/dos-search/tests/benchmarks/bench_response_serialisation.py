@@ -0,0 +1,50 @@
+"""
+Compare the CPU cost of serialising a dos-search Bundle once per response
+against the previous behaviour of serialising it for the size metric, the
+HTTP body and the DOS_SEARCH_004 log separately.
+
+Run from services/dos-search:
+
+    python -m tests.benchmarks.bench_response_serialisation
+"""
+
+import timeit
+
+from functions.event_context import serialise_fhir_resource
+from functions.ftrs_service.fhir_mapper.bundle_mapper import BundleMapper
+from tests.benchmarks.data import build_organisation
+
+ENDPOINT_COUNTS = (1, 10, 50, 100)
+PREVIOUS_SERIALISATIONS_PER_RESPONSE = 2
+REPEAT = 5
+NUMBER = 20
+
+
+def _serialise_previous(bundle: object) -> None:
+    for _ in range(PREVIOUS_SERIALISATIONS_PER_RESPONSE):
+        bundle.model_dump_json()
+
+
+def _serialise_once(bundle: object) -> None:
+    body = serialise_fhir_resource(bundle)
+    len(body.encode("utf-8"))
+
+
+def _best_ms(func: object, bundle: object) -> float:
+    timings = timeit.repeat(lambda: func(bundle), repeat=REPEAT, number=NUMBER)
+    return min(timings) / NUMBER * 1000
+
+
+def main() -> None:
+    mapper = BundleMapper()
+    print(f"{'endpoints':>10} {'bytes':>10} {'before ms':>10} {'after ms':>10}")
+    for endpoint_count in ENDPOINT_COUNTS:
+        bundle = mapper.map_to_fhir(build_organisation(endpoint_count), "ABC123")
+        size = len(serialise_fhir_resource(bundle).encode("utf-8"))
+        before = _best_ms(_serialise_previous, bundle)
+        after = _best_ms(_serialise_once, bundle)
+        print(f"{endpoint_count:>10} {size:>10} {before:>10.3f} {after:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Compare the cost of building domain models from stored DynamoDB items with
+full validation, with trusted-read validation as used by dos-search, and with
+pydantic's model_construct.
+
+model_construct is shown for reference only. It leaves nested models, UUIDs,
+datetimes and enums as raw stored values, so its result cannot be used by the
+FHIR mappers, and rebuilding those in Python was slower than pydantic-core's
+compiled validators. Trusted reads keep the compiled validation and skip only
+the Python-level Telecom checks. Email telecoms are left out because their
+deliverability check needs DNS, which makes the real saving larger.
+
+Run from services/dos-search:
+
+    python -m tests.benchmarks.bench_trusted_reads
+"""
+
+import json
+import timeit
+from decimal import Decimal
+
+from ftrs_data_layer.domain import HealthcareService, Organisation
+from ftrs_data_layer.domain.base import TRUSTED_READ_CONTEXT
+from pydantic import BaseModel
+
+from tests.benchmarks.data import build_healthcare_service, build_organisation
+
+SIZES = (1, 10, 50, 100)
+REPEAT = 5
+NUMBER = 200
+
+
+def _as_stored(model: BaseModel) -> dict:
+    # DynamoDB returns every number as a Decimal.
+    return json.loads(model.model_dump_json(), parse_float=Decimal, parse_int=Decimal)
+
+
+def _best_us(func: object) -> float:
+    timings = timeit.repeat(func, repeat=REPEAT, number=NUMBER)
+    return min(timings) / NUMBER * 1_000_000
+
+
+def _compare(model_cls: type[BaseModel], item: dict) -> tuple[float, float, float]:
+    validate = _best_us(lambda: model_cls.model_validate(item))
+    trusted = _best_us(
+        lambda: model_cls.model_validate(item, context=TRUSTED_READ_CONTEXT)
+    )
+    construct = _best_us(lambda: model_cls.model_construct(**item))
+    return validate, trusted, construct
+
+
+def main() -> None:
+    builders = (
+        ("Organisation", "endpoints", Organisation, build_organisation),
+        (
+            "HealthcareService",
+            "opening times",
+            HealthcareService,
+            build_healthcare_service,
+        ),
+    )
+    for name, size_label, model_cls, build in builders:
+        print(name)
+        print(
+            f"{size_label:>14} {'validate us':>12} {'trusted us':>11} "
+            f"{'construct us':>13}"
+        )
+        for size in SIZES:
+            validate, trusted, construct = _compare(model_cls, _as_stored(build(size)))
+            print(f"{size:>14} {validate:>12.1f} {trusted:>11.1f} {construct:>13.1f}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Synthetic dos-search data for the benchmark scripts in this package.
+"""
+
+from datetime import time
+from uuid import uuid4
+
+from ftrs_data_layer.domain import (
+    AvailableTime,
+    DayOfWeek,
+    Endpoint,
+    HealthcareService,
+    HealthcareServiceTelecom,
+    Organisation,
+    SymptomGroupSymptomDiscriminatorPair,
+    Telecom,
+)
+from ftrs_data_layer.domain.enums import (
+    EndpointBusinessScenario,
+    EndpointConnectionType,
+    EndpointPayloadMimeType,
+    EndpointStatus,
+    TelecomType,
+)
+
+
+def build_organisation(endpoint_count: int) -> Organisation:
+    organisation_id = uuid4()
+    endpoints = [
+        Endpoint(
+            id=uuid4(),
+            identifier_oldDoS_id=100000 + order,
+            status=EndpointStatus.ACTIVE,
+            connectionType=EndpointConnectionType.ITK,
+            businessScenario=EndpointBusinessScenario.PRIMARY,
+            payloadMimeType=EndpointPayloadMimeType.CDA,
+            isCompressionEnabled=True,
+            managedByOrganisation=organisation_id,
+            name=f"Benchmark Endpoint {order}",
+            payloadType=(
+                "urn:nhs-itk:interaction:"
+                "primaryEmergencyDepartmentRecipientNHS111CDADocument-v2-0"
+            ),
+            service=None,
+            address=f"https://example.com/endpoint/{order}",
+            order=order,
+        )
+        for order in range(1, endpoint_count + 1)
+    ]
+    return Organisation(
+        id=organisation_id,
+        identifier_ODS_ODSCode="ABC123",
+        active=True,
+        name="Benchmark Organisation",
+        telecom=[
+            Telecom(type=TelecomType.PHONE, value="0300 311 22 33", isPublic=True),
+            Telecom(type=TelecomType.WEB, value="https://example.com", isPublic=True),
+        ],
+        type="GP Practice",
+        endpoints=endpoints,
+    )
+
+
+def build_healthcare_service(opening_time_count: int) -> HealthcareService:
+    days = list(DayOfWeek)
+    return HealthcareService(
+        status="active",
+        category="GP Services",
+        type="GP Consultation Service",
+        providedBy=uuid4(),
+        location=uuid4(),
+        name="Benchmark Healthcare Service",
+        telecom=HealthcareServiceTelecom(
+            phone_public="0300 311 22 33",
+            phone_private=None,
+            email="service@example.com",
+            web="https://example.com",
+        ),
+        openingTime=[
+            AvailableTime(
+                dayOfWeek=days[index % len(days)],
+                startTime=time(8),
+                endTime=time(18),
+            )
+            for index in range(opening_time_count)
+        ],
+        symptomGroupSymptomDiscriminators=[
+            SymptomGroupSymptomDiscriminatorPair(sg=1000 + index, sd=4000 + index)
+            for index in range(opening_time_count)
+        ],
+        dispositions=["DX1", "DX114"],
+    )
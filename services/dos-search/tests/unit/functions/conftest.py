@@ -7,6 +7,7 @@ from functions.constants import (
     ODS_ORG_CODE_IDENTIFIER_SYSTEM,
     REVINCLUDE_VALUE_ENDPOINT_ORGANIZATION,
 )
+from functions.ftrs_service.service_registry import service_registry
 
 
 @pytest.fixture
@@ -105,3 +106,11 @@ def details(event):
             "request_context": event.get("requestContext") or {},
         },
     }
+
+
+@pytest.fixture(autouse=True)
+def reset_service_registry():
+    """Start every test from a cold container."""
+    service_registry.clear()
+    yield
+    service_registry.clear()
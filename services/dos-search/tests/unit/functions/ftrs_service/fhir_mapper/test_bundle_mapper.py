@@ -44,11 +44,13 @@ class TestBundleMapper:
         # Mock the mapper methods
         with patch.object(
             bundle_mapper.organization_mapper,
-            "map_to_fhir_organization",
-            return_value=org_resource,
+            "create_organization_resource",
+            return_value=org_resource.model_dump(),
         ) as mock_org_mapper:
             with patch.object(
-                bundle_mapper.endpoint_mapper, "map_to_fhir_endpoints", return_value=[]
+                bundle_mapper.endpoint_mapper,
+                "create_endpoint_resources",
+                return_value=[],
             ) as mock_endpoint_mapper:
                 # Act
                 bundle = bundle_mapper.map_to_fhir(org_value, ods_code)
@@ -90,13 +92,13 @@ class TestBundleMapper:
         # Mock the mapper methods
         with patch.object(
             bundle_mapper.organization_mapper,
-            "map_to_fhir_organization",
-            return_value=org_resource,
+            "create_organization_resource",
+            return_value=org_resource.model_dump(),
         ) as mock_org_mapper:
             with patch.object(
                 bundle_mapper.endpoint_mapper,
-                "map_to_fhir_endpoints",
-                return_value=[endpoint1, endpoint2],
+                "create_endpoint_resources",
+                return_value=[endpoint1.model_dump(), endpoint2.model_dump()],
             ) as mock_endpoint_mapper:
                 # Act
                 bundle = bundle_mapper.map_to_fhir(organisation, ods_code)
@@ -115,7 +117,7 @@ class TestBundleMapper:
         self, bundle_mapper, create_fhir_endpoint, mock_get_fhir_url
     ):
         # Arrange
-        endpoint_resource = create_fhir_endpoint()
+        endpoint_resource = create_fhir_endpoint().model_dump()
         mock_get_fhir_url.return_value = (
             "https://example.org/FHIR/R4/Endpoint/endpoint-123"
         )
@@ -132,7 +134,7 @@ class TestBundleMapper:
         self, bundle_mapper, create_fhir_organization, mock_get_fhir_url
     ):
         # Arrange
-        organization_resource = create_fhir_organization()
+        organization_resource = create_fhir_organization().model_dump()
         mock_get_fhir_url.return_value = "https://dos-search.dev.ftrs.cloud.nhs.uk/FHIR/R4/Organization/00000000-0000-0000-0000-000000000000"  # gitleaks:allow
 
         # Act
@@ -150,8 +152,8 @@ class TestBundleMapper:
         self, bundle_mapper, create_fhir_endpoint, create_fhir_organization
     ):
         # Arrange
-        endpoint_resource = create_fhir_endpoint()
-        org_resource = create_fhir_organization()
+        endpoint_resource = create_fhir_endpoint().model_dump()
+        org_resource = create_fhir_organization().model_dump()
 
         # Act & Assert
         # Check that Organizations get 'match' mode
@@ -185,18 +187,18 @@ class TestBundleMapper:
         create_fhir_organization,
     ):
         # Arrange
-        endpoint = create_fhir_endpoint()
-        org = create_fhir_organization()
+        endpoint = create_fhir_endpoint().model_dump()
+        org = create_fhir_organization().model_dump()
 
         # Mock the mapper methods
         with patch.object(
             bundle_mapper.organization_mapper,
-            "map_to_fhir_organization",
+            "create_organization_resource",
             return_value=org,
         ) as mock_org_mapper:
             with patch.object(
                 bundle_mapper.endpoint_mapper,
-                "map_to_fhir_endpoints",
+                "create_endpoint_resources",
                 return_value=[endpoint],
             ) as mock_endpoint_mapper:
                 # Act
@@ -208,3 +210,21 @@ class TestBundleMapper:
                 assert len(resources) == 2
                 assert resources[0] == org
                 assert resources[1] == endpoint
+
+    def test_map_to_fhir_without_validation_returns_dict(self, organisation):
+        # Arrange
+        bundle_mapper = BundleMapper(validate=False)
+
+        # Act
+        bundle = bundle_mapper.map_to_fhir(organisation, "O123")
+
+        # Assert
+        assert isinstance(bundle, dict)
+        assert bundle["resourceType"] == "Bundle"
+        assert bundle["type"] == "searchset"
+        assert len(bundle["entry"]) == 1 + len(organisation.endpoints)
+        assert bundle["entry"][0]["resource"]["resourceType"] == "Organization"
+        assert bundle["entry"][0]["search"] == {"mode": "match"}
+        assert Bundle.model_validate(bundle).entry[0].resource.id == str(
+            organisation.id
+        )
@@ -1,7 +1,6 @@
 from uuid import UUID
 
 import pytest
-from fhir.resources.R4B.codeableconcept import CodeableConcept
 from fhir.resources.R4B.endpoint import Endpoint as FhirEndpoint
 from ftrs_data_layer.domain.enums import (
     EndpointBusinessScenario,
@@ -24,14 +23,13 @@ class TestEndpointMapper:
 
         # Assert
         assert len(result) == 1
-        assert isinstance(result[0], CodeableConcept)
-        assert len(result[0].coding) == 1
+        assert len(result[0]["coding"]) == 1
         assert (
-            result[0].coding[0].system
+            result[0]["coding"][0]["system"]
             == "http://hl7.org/fhir/ValueSet/endpoint-payload-type"
         )
         assert (
-            result[0].coding[0].code
+            result[0]["coding"][0]["code"]
             == "urn:nhs-itk:interaction:primaryEmergencyDepartmentRecipientNHS111CDADocument-v2-0"
         )
 
@@ -261,7 +259,7 @@ class TestEndpointMapper:
         result = endpoint_mapper._create_connection_type(endpoint)
 
         # Assert
-        assert result.code == "itk"
+        assert result["code"] == "itk"
 
     def test_create_connection_type_http(self, endpoint_mapper, create_endpoint):
         # Arrange
@@ -271,9 +269,9 @@ class TestEndpointMapper:
         result = endpoint_mapper._create_connection_type(endpoint)
 
         # Assert
-        assert result.code == "http"
+        assert result["code"] == "http"
         assert (
-            result.system
+            result["system"]
             == "https://fhir.nhs.uk/England/CodeSystem/England-EndpointConnection"
         )
 
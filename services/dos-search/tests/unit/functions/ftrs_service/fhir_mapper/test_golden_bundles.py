@@ -0,0 +1,190 @@
+"""
+Golden-file tests for the complete FHIR Bundles returned by dos-search.
+
+The expected JSON in golden/ was captured from the original per-resource
+model_validate mappers and pins the response bodies byte for byte, both for
+validated Bundles and for the unvalidated dicts served with
+VALIDATE_FHIR_RESPONSES=false.
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+from uuid import UUID
+
+import pytest
+from ftrs_common.utils import api_url_util
+from ftrs_data_layer.domain import (
+    Endpoint,
+    HealthcareService,
+    HealthcareServiceTelecom,
+    Organisation,
+)
+from ftrs_data_layer.domain.enums import (
+    EndpointBusinessScenario,
+    EndpointConnectionType,
+    EndpointPayloadMimeType,
+    EndpointStatus,
+)
+
+from functions.event_context import serialise_fhir_resource
+from functions.ftrs_service.fhir_mapper import (
+    BundleMapper,
+    HealthcareServiceBundleMapper,
+)
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+BUNDLE_ID = UUID("00000000-0000-4000-8000-000000000000")
+ORGANISATION_ID = UUID("11111111-1111-4111-8111-111111111111")
+ODS_CODE = "ABC123"
+
+
+@pytest.fixture(autouse=True)
+def fixed_urls_and_ids(monkeypatch):
+    monkeypatch.setattr(api_url_util._settings, "env", "dev")
+    monkeypatch.setattr(api_url_util._settings, "workspace", None)
+    with (
+        patch(
+            "functions.ftrs_service.fhir_mapper.bundle_mapper.uuid4",
+            return_value=BUNDLE_ID,
+        ),
+        patch(
+            "functions.ftrs_service.fhir_mapper.healthcare_service_bundle_mapper.uuid4",
+            return_value=BUNDLE_ID,
+        ),
+    ):
+        yield
+
+
+def _golden(name: str) -> str:
+    """
+    Return the golden Bundle in the compact form written to response bodies.
+    """
+    golden = json.loads((GOLDEN_DIR / name).read_text())
+    return json.dumps(golden, separators=(",", ":"), ensure_ascii=False)
+
+
+def _endpoint(
+    index: int,
+    connection_type: EndpointConnectionType,
+    business_scenario: EndpointBusinessScenario,
+    payload_mime_type: EndpointPayloadMimeType,
+    payload_type: str | None,
+    order: int,
+    is_compression_enabled: bool,
+) -> Endpoint:
+    return Endpoint(
+        id=UUID(f"22222222-2222-4222-8222-{index:012d}"),
+        identifier_oldDoS_id=100000 + index,
+        status=EndpointStatus.ACTIVE,
+        connectionType=connection_type,
+        name=f"Endpoint {index}",
+        payloadMimeType=payload_mime_type,
+        businessScenario=business_scenario,
+        payloadType=payload_type,
+        address=f"https://example.com/endpoint/{index}",
+        managedByOrganisation=ORGANISATION_ID,
+        service=None,
+        order=order,
+        isCompressionEnabled=is_compression_enabled,
+    )
+
+
+def _organisation() -> Organisation:
+    return Organisation(
+        id=ORGANISATION_ID,
+        identifier_ODS_ODSCode=ODS_CODE,
+        active=True,
+        name="Golden Organisation",
+        telecom=[],
+        type="GP Practice",
+        endpoints=[
+            _endpoint(
+                1,
+                EndpointConnectionType.ITK,
+                EndpointBusinessScenario.PRIMARY,
+                EndpointPayloadMimeType.CDA,
+                "urn:nhs-itk:interaction:primaryGeneralPractitionerAdmitted",
+                1,
+                True,
+            ),
+            _endpoint(
+                2,
+                EndpointConnectionType.EMAIL,
+                EndpointBusinessScenario.COPY,
+                EndpointPayloadMimeType.PDF,
+                None,
+                2,
+                False,
+            ),
+            _endpoint(
+                3,
+                EndpointConnectionType.HTTP,
+                EndpointBusinessScenario.COPY,
+                EndpointPayloadMimeType.FHIR,
+                "urn:nhs-itk:interaction:copyRecipient",
+                0,
+                True,
+            ),
+        ],
+    )
+
+
+def _healthcare_services() -> list[HealthcareService]:
+    return [
+        HealthcareService(
+            id=UUID("33333333-3333-4333-8333-000000000001"),
+            identifier_oldDoS_uid="1001",
+            status="active",
+            category="GP Services",
+            type="GP Consultation Service",
+            providedBy=ORGANISATION_ID,
+            location=UUID("44444444-4444-4444-8444-444444444444"),
+            name="Golden Healthcare Service",
+            telecom=HealthcareServiceTelecom(
+                phone_public="0300 311 22 33",
+                phone_private="0300 311 22 44",
+                email="service@example.com",
+                web="https://example.com",
+            ),
+            openingTime=None,
+            symptomGroupSymptomDiscriminators=[],
+            dispositions=[],
+        ),
+        HealthcareService(
+            id=UUID("33333333-3333-4333-8333-000000000002"),
+            status="active",
+            category="GP Services",
+            type="GP Consultation Service",
+            providedBy=None,
+            location=None,
+            name="Minimal Healthcare Service",
+            telecom=None,
+            openingTime=None,
+            symptomGroupSymptomDiscriminators=[],
+            dispositions=[],
+        ),
+    ]
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_organization_bundle_matches_golden_file(validate):
+    bundle = BundleMapper(validate=validate).map_to_fhir(_organisation(), ODS_CODE)
+
+    assert serialise_fhir_resource(bundle) == _golden("organization_bundle.json")
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_empty_organization_bundle_matches_golden_file(validate):
+    bundle = BundleMapper(validate=validate).map_to_fhir(None, ODS_CODE)
+
+    assert serialise_fhir_resource(bundle) == _golden("organization_bundle_empty.json")
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_healthcare_service_bundle_matches_golden_file(validate):
+    bundle = HealthcareServiceBundleMapper(validate=validate).map_to_fhir(
+        _healthcare_services(), ODS_CODE
+    )
+
+    assert serialise_fhir_resource(bundle) == _golden("healthcare_service_bundle.json")
@@ -1,5 +1,4 @@
 import pytest
-from fhir.resources.R4B.identifier import Identifier
 from fhir.resources.R4B.organization import Organization as FhirOrganization
 
 from functions.constants import ODS_ORG_CODE_IDENTIFIER_SYSTEM
@@ -29,10 +28,11 @@ class TestOrganizationMapper:
 
         # Assert
         assert len(identifiers) == 1
-        assert isinstance(identifiers[0], Identifier)
-        assert identifiers[0].use == "official"
-        assert identifiers[0].system == ODS_ORG_CODE_IDENTIFIER_SYSTEM
-        assert identifiers[0].value == "123456"
+        assert identifiers[0] == {
+            "use": "official",
+            "system": ODS_ORG_CODE_IDENTIFIER_SYSTEM,
+            "value": "123456",
+        }
 
     @pytest.mark.parametrize(
         ("org_name", "active"),
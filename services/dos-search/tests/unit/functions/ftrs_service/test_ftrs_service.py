@@ -3,7 +3,11 @@ from unittest.mock import patch
 import pytest
 from fhir.resources.R4B.bundle import Bundle
 
-from functions.ftrs_service.ftrs_service import FtrsService
+from functions.ftrs_service.ftrs_service import (
+    DEFAULT_ODS_CACHE_MAX_SIZE,
+    DEFAULT_ODS_CACHE_TTL_SECONDS,
+    FtrsService,
+)
 
 
 @pytest.fixture
@@ -38,6 +42,37 @@ class TestFtrsService:
         # Assert
         assert service.repository == mock_repository
         assert service.mapper == mock_bundle_mapper
+        assert service.ods_cache.max_size == DEFAULT_ODS_CACHE_MAX_SIZE
+        assert service.ods_cache.ttl_seconds == DEFAULT_ODS_CACHE_TTL_SECONDS
+
+    def test_init_reads_cache_settings_from_environment(
+        self, mock_repository, mock_bundle_mapper, monkeypatch
+    ):
+        monkeypatch.setenv("ODS_CACHE_MAX_SIZE", "10")
+        monkeypatch.setenv("ODS_CACHE_TTL_SECONDS", "30")
+        monkeypatch.setenv("ODS_CACHE_NEGATIVE_TTL_SECONDS", "5")
+
+        service = FtrsService()
+
+        assert service.ods_cache.max_size == 10
+        assert service.ods_cache.ttl_seconds == 30
+        assert service.ods_cache.negative_ttl_seconds == 5
+
+    @pytest.mark.parametrize(
+        ("env_value", "expected"),
+        [(None, True), ("true", True), ("false", False), ("FALSE", False)],
+    )
+    def test_init_reads_response_validation_from_environment(
+        self, mock_repository, monkeypatch, env_value, expected
+    ):
+        if env_value is None:
+            monkeypatch.delenv("VALIDATE_FHIR_RESPONSES", raising=False)
+        else:
+            monkeypatch.setenv("VALIDATE_FHIR_RESPONSES", env_value)
+
+        service = FtrsService()
+
+        assert service.mapper.validate is expected
 
     def test_endpoints_by_ods_success(
         self, ftrs_service, mock_repository, mock_bundle_mapper, organisation
@@ -104,3 +139,30 @@ class TestFtrsService:
         mock_repository.get_first_record_by_ods_code.assert_called_once_with(ods_code)
         mock_bundle_mapper.map_to_fhir.assert_called_once_with(organisation, ods_code)
         assert exc_info.value == expected_exc
+
+    def test_endpoints_by_ods_reuses_cached_organisation(
+        self, ftrs_service, mock_repository, mock_bundle_mapper, organisation
+    ):
+        # Act
+        ftrs_service.endpoints_by_ods("O123")
+        ftrs_service.endpoints_by_ods("O123")
+
+        # Assert
+        mock_repository.get_first_record_by_ods_code.assert_called_once_with("O123")
+        assert mock_bundle_mapper.map_to_fhir.call_count == 2
+        mock_bundle_mapper.map_to_fhir.assert_called_with(organisation, "O123")
+        assert ftrs_service.ods_cache.stats().hits == 1
+
+    def test_endpoints_by_ods_caches_unknown_ods_code(
+        self, ftrs_service, mock_repository, mock_bundle_mapper
+    ):
+        # Arrange
+        mock_repository.get_first_record_by_ods_code.return_value = None
+
+        # Act
+        ftrs_service.endpoints_by_ods("UNKNOWN")
+        ftrs_service.endpoints_by_ods("UNKNOWN")
+
+        # Assert
+        mock_repository.get_first_record_by_ods_code.assert_called_once_with("UNKNOWN")
+        mock_bundle_mapper.map_to_fhir.assert_called_with(None, "UNKNOWN")
@@ -1,3 +1,4 @@
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -140,10 +141,13 @@ class TestFtrsServiceHealthcareServices:
             mock_organisation,
             mock_org_2,
         ]
-        mock_healthcare_service_repository.get_records_by_provided_by.side_effect = [
-            [mock_healthcare_service_1],
-            [mock_healthcare_service_2],
-        ]
+        services_by_org = {
+            str(mock_organisation.id): [mock_healthcare_service_1],
+            str(mock_org_2.id): [mock_healthcare_service_2],
+        }
+        mock_healthcare_service_repository.get_records_by_provided_by.side_effect = (
+            services_by_org.get
+        )
 
         # Act
         result = ftrs_service.healthcare_services_by_ods(ods_code)
@@ -158,6 +162,95 @@ class TestFtrsServiceHealthcareServices:
         )
         assert isinstance(result, Bundle)
 
+    def test_healthcare_services_by_ods_concurrent_lookups_keep_order(
+        self,
+        ftrs_service: HealthcareServicesByOdsService,
+        mock_healthcare_service_repository: MagicMock,
+        mock_healthcare_service_bundle_mapper: MagicMock,
+    ) -> None:
+        # Arrange
+        ods_code = "ABC123"
+        organisations = [MagicMock(id=f"org-{index}") for index in range(5)]
+        ftrs_service.repository.get_by_ods_code.return_value = organisations
+        release = threading.Barrier(2, timeout=5)
+
+        def get_records_by_provided_by(organisation_id: str) -> list[str]:
+            # The first two lookups must be in flight together
+            if organisation_id in ("org-0", "org-1"):
+                release.wait()
+            return [f"{organisation_id}-service"]
+
+        mock_healthcare_service_repository.get_records_by_provided_by.side_effect = (
+            get_records_by_provided_by
+        )
+
+        # Act
+        ftrs_service.healthcare_services_by_ods(ods_code)
+
+        # Assert
+        mock_healthcare_service_bundle_mapper.map_to_fhir.assert_called_once_with(
+            [f"org-{index}-service" for index in range(5)], ods_code
+        )
+
+    def test_healthcare_services_by_ods_reuses_lookup_threads(
+        self,
+        ftrs_service: HealthcareServicesByOdsService,
+        mock_healthcare_service_repository: MagicMock,
+    ) -> None:
+        # Arrange
+        ftrs_service.max_lookup_workers = 2
+        ftrs_service.repository.get_by_ods_code.return_value = [
+            MagicMock(id=f"org-{index}") for index in range(4)
+        ]
+        thread_ids = []
+
+        def get_records_by_provided_by(organisation_id: str) -> list[str]:
+            thread_ids.append(threading.get_ident())
+            return []
+
+        mock_healthcare_service_repository.get_records_by_provided_by.side_effect = (
+            get_records_by_provided_by
+        )
+
+        # Act
+        for _ in range(3):
+            ftrs_service.healthcare_services_by_ods("ABC123")
+
+        # Assert
+        assert len(thread_ids) == 12  # noqa: PLR2004
+        assert len(set(thread_ids)) <= 2  # noqa: PLR2004
+        assert threading.get_ident() not in thread_ids
+
+    def test_healthcare_services_by_ods_sequential_when_single_worker(
+        self,
+        ftrs_service: HealthcareServicesByOdsService,
+        mock_healthcare_service_repository: MagicMock,
+        mock_healthcare_service_bundle_mapper: MagicMock,
+    ) -> None:
+        # Arrange
+        ods_code = "ABC123"
+        ftrs_service.max_lookup_workers = 1
+        ftrs_service.repository.get_by_ods_code.return_value = [
+            MagicMock(id="org-1"),
+            MagicMock(id="org-2"),
+        ]
+        mock_healthcare_service_repository.get_records_by_provided_by.side_effect = [
+            ["service-1"],
+            ["service-2"],
+        ]
+
+        # Act
+        with patch(
+            "functions.ftrs_service.healthcare_services_by_ods.ThreadPoolExecutor"
+        ) as mock_executor:
+            ftrs_service.healthcare_services_by_ods(ods_code)
+
+        # Assert
+        mock_executor.assert_not_called()
+        mock_healthcare_service_bundle_mapper.map_to_fhir.assert_called_once_with(
+            ["service-1", "service-2"], ods_code
+        )
+
     def test_healthcare_services_by_ods_repository_exception(
         self,
         ftrs_service: HealthcareServicesByOdsService,
@@ -0,0 +1,121 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from functions.ftrs_service.lookup_cache import CacheStats, LookupCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestLookupCache:
+    def test_get_or_load_loads_on_miss_and_reuses_on_hit(self, clock):
+        cache = LookupCache(max_size=10, ttl_seconds=60, clock=clock)
+        loader = MagicMock(return_value="organisation")
+
+        first = cache.get_or_load("ABC123", loader)
+        second = cache.get_or_load("ABC123", loader)
+
+        loader.assert_called_once_with("ABC123")
+        assert first == second == "organisation"
+        assert cache.stats() == CacheStats(hits=1, misses=1, size=1)
+
+    def test_entries_expire_after_ttl(self, clock):
+        cache = LookupCache(max_size=10, ttl_seconds=60, clock=clock)
+        loader = MagicMock(side_effect=["old", "new"])
+
+        cache.get_or_load("ABC123", loader)
+        clock.now = 60
+        result = cache.get_or_load("ABC123", loader)
+
+        assert result == "new"
+        assert loader.call_count == 2
+        assert cache.stats().misses == 2
+
+    def test_unknown_keys_use_negative_ttl(self, clock):
+        cache = LookupCache(
+            max_size=10, ttl_seconds=60, negative_ttl_seconds=5, clock=clock
+        )
+        loader = MagicMock(return_value=None)
+
+        cache.get_or_load("UNKNOWN", loader)
+        clock.now = 4
+        cache.get_or_load("UNKNOWN", loader)
+        assert loader.call_count == 1
+
+        clock.now = 5
+        cache.get_or_load("UNKNOWN", loader)
+        assert loader.call_count == 2
+
+    def test_least_recently_used_entry_is_evicted(self, clock):
+        cache = LookupCache(max_size=2, ttl_seconds=60, clock=clock)
+        loader = MagicMock(side_effect=lambda key: key.lower())
+
+        cache.get_or_load("AAAAA", loader)
+        cache.get_or_load("BBBBB", loader)
+        cache.get_or_load("AAAAA", loader)
+        cache.get_or_load("CCCCC", loader)
+        cache.get_or_load("AAAAA", loader)
+        cache.get_or_load("BBBBB", loader)
+
+        assert [call.args[0] for call in loader.call_args_list] == [
+            "AAAAA",
+            "BBBBB",
+            "CCCCC",
+            "BBBBB",
+        ]
+        assert cache.stats().size == 2
+
+    def test_loader_errors_are_not_cached(self, clock):
+        cache = LookupCache(max_size=10, ttl_seconds=60, clock=clock)
+        loader = MagicMock(side_effect=[Exception("DynamoDB error"), "organisation"])
+
+        with pytest.raises(Exception, match="DynamoDB error"):
+            cache.get_or_load("ABC123", loader)
+
+        assert cache.get_or_load("ABC123", loader) == "organisation"
+        assert cache.stats() == CacheStats(hits=0, misses=2, size=1)
+
+    @pytest.mark.parametrize(("max_size", "ttl_seconds"), [(0, 60), (10, 0)])
+    def test_zero_size_or_ttl_disables_caching(self, clock, max_size, ttl_seconds):
+        cache = LookupCache(max_size=max_size, ttl_seconds=ttl_seconds, clock=clock)
+        loader = MagicMock(return_value="organisation")
+
+        cache.get_or_load("ABC123", loader)
+        cache.get_or_load("ABC123", loader)
+
+        assert loader.call_count == 2
+        assert cache.stats().size == 0
+
+    def test_zero_ttl_disables_negative_caching(self, clock):
+        cache = LookupCache(
+            max_size=10, ttl_seconds=0, negative_ttl_seconds=60, clock=clock
+        )
+        loader = MagicMock(return_value=None)
+
+        cache.get_or_load("UNKNOWN", loader)
+        cache.get_or_load("UNKNOWN", loader)
+
+        assert loader.call_count == 2
+        assert cache.stats().size == 0
+
+    def test_clear_drops_entries_and_counters(self, clock):
+        cache = LookupCache(max_size=10, ttl_seconds=60, clock=clock)
+        loader = MagicMock(return_value="organisation")
+        cache.get_or_load("ABC123", loader)
+
+        cache.clear()
+
+        assert cache.stats() == CacheStats(hits=0, misses=0, size=0)
+        cache.get_or_load("ABC123", loader)
+        assert loader.call_count == 2
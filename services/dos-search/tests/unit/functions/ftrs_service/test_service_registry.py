@@ -0,0 +1,51 @@
+from unittest.mock import MagicMock
+
+from functions.ftrs_service.service_registry import ServiceRegistry
+
+
+class TestServiceRegistry:
+    def test_get_builds_service_on_first_lookup(self):
+        registry = ServiceRegistry()
+        service_cls = MagicMock()
+
+        lookup = registry.get(service_cls)
+
+        service_cls.assert_called_once_with()
+        assert lookup.service is service_cls.return_value
+        assert lookup.cold_start is True
+        assert lookup.init_time_ms >= 0
+
+    def test_get_reuses_service_on_warm_lookup(self):
+        registry = ServiceRegistry()
+        service_cls = MagicMock()
+
+        first = registry.get(service_cls)
+        second = registry.get(service_cls)
+
+        service_cls.assert_called_once_with()
+        assert second.service is first.service
+        assert second.cold_start is False
+        assert second.init_time_ms == 0
+
+    def test_get_keeps_services_separate_per_class(self):
+        registry = ServiceRegistry()
+        service_cls_a = MagicMock()
+        service_cls_b = MagicMock()
+
+        lookup_a = registry.get(service_cls_a)
+        lookup_b = registry.get(service_cls_b)
+
+        assert lookup_a.service is service_cls_a.return_value
+        assert lookup_b.service is service_cls_b.return_value
+        assert lookup_b.cold_start is True
+
+    def test_clear_forces_rebuild(self):
+        registry = ServiceRegistry()
+        service_cls = MagicMock()
+        registry.get(service_cls)
+
+        registry.clear()
+        lookup = registry.get(service_cls)
+
+        assert service_cls.call_count == 2
+        assert lookup.cold_start is True
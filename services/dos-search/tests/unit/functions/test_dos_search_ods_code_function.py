@@ -12,6 +12,7 @@ from functions.dos_search_ods_code_function import (
     DEFAULT_RESPONSE_HEADERS,
     lambda_handler,
 )
+from functions.event_context import serialise_fhir_resource
 from functions.logbase import DosSearchLogBase
 
 
@@ -122,7 +123,9 @@ class TestLambdaHandler:
         mock_ftrs_service.endpoints_by_ods.assert_called_once_with(ods_code)
 
         mock_setup_request.assert_called_once_with(ANY, ANY)
-        mock_get_response_size_and_duration.assert_called_once_with(bundle, ANY, ANY)
+        mock_get_response_size_and_duration.assert_called_once_with(
+            bundle.model_dump_json(), ANY, ANY
+        )
 
         mock_logger.assert_has_calls(
             [
@@ -135,6 +138,10 @@ class TestLambdaHandler:
                     DosSearchLogBase.DOS_SEARCH_003,
                     dos_response_time=ANY,
                     dos_response_size=len(bundle.model_dump_json().encode("utf-8")),
+                    dos_cold_start=True,
+                    dos_service_init_time=ANY,
+                    dos_ods_cache_hits=ANY,
+                    dos_ods_cache_misses=ANY,
                     dos_message_category="METRICS",
                 ),
                 call.log(
@@ -150,6 +157,58 @@ class TestLambdaHandler:
             response, expected_status_code=200, expected_body=bundle.model_dump_json()
         )
 
+    def test_lambda_handler_reuses_service_on_warm_start(
+        self,
+        lambda_context,
+        mock_setup_request,
+        mock_get_response_size_and_duration,
+        mock_logger,
+        event,
+        bundle,
+    ):
+        # Arrange
+        with patch(
+            "functions.dos_search_ods_code_function.FtrsService"
+        ) as mock_service_class:
+            mock_service_class.return_value.endpoints_by_ods.return_value = bundle
+
+            # Act
+            lambda_handler(event, lambda_context)
+            lambda_handler(event, lambda_context)
+
+        # Assert
+        mock_service_class.assert_called_once_with()
+        metrics_calls = [
+            c
+            for c in mock_logger.log.call_args_list
+            if c.args[0] == DosSearchLogBase.DOS_SEARCH_003
+        ]
+        assert [c.kwargs["dos_cold_start"] for c in metrics_calls] == [True, False]
+        assert metrics_calls[1].kwargs["dos_service_init_time"] == "0ms"
+
+    def test_lambda_handler_serialises_bundle_once(
+        self,
+        lambda_context,
+        mock_ftrs_service,
+        mock_setup_request,
+        mock_logger,
+        event,
+        bundle,
+    ):
+        # Arrange
+        mock_ftrs_service.endpoints_by_ods.return_value = bundle
+
+        # Act
+        with patch(
+            "functions.dos_search_ods_code_function.serialise_fhir_resource",
+            wraps=serialise_fhir_resource,
+        ) as mock_serialise:
+            response = lambda_handler(event, lambda_context)
+
+        # Assert
+        mock_serialise.assert_called_once_with(bundle)
+        assert response["body"] == bundle.model_dump_json()
+
     @pytest.mark.parametrize(
         "model_to_throw_validation_error",
         [
@@ -190,7 +249,7 @@ class TestLambdaHandler:
 
         mock_setup_request.assert_called_once_with(ANY, ANY)
         mock_get_response_size_and_duration.assert_called_once_with(
-            mock_error_util.create_validation_error_operation_outcome.return_value,
+            mock_error_util.create_validation_error_operation_outcome.return_value.model_dump_json(),
             ANY,
             ANY,
         )
@@ -251,7 +310,7 @@ class TestLambdaHandler:
 
         mock_setup_request.assert_called_once_with(ANY, ANY)
         mock_get_response_size_and_duration.assert_called_once_with(
-            mock_error_util.create_resource_internal_server_error.return_value,
+            mock_error_util.create_resource_internal_server_error.return_value.model_dump_json(),
             ANY,
             ANY,
         )
@@ -8,6 +8,7 @@ import pytest
 from functions.event_context import (
     PLACEHOLDER,
     get_response_size_and_duration,
+    serialise_fhir_resource,
     setup_request,
 )
 from functions.logbase import DosSearchLogBase
@@ -105,13 +106,26 @@ class TestGetResponseSizeAndDuration:
         start_time = time.time()
         mock_logger = MagicMock()
 
+        body = serialise_fhir_resource(bundle)
+
         response_size, duration_ms = get_response_size_and_duration(
-            bundle, start_time, mock_logger
+            body, start_time, mock_logger
         )
 
         assert response_size == len(bundle.model_dump_json().encode("utf-8"))
         assert duration_ms >= 0
 
+    def test_counts_multibyte_characters_as_bytes(self):
+        start_time = time.time()
+        mock_logger = MagicMock()
+
+        response_size, _ = get_response_size_and_duration(
+            '{"name":"Caf\u00e9"}', start_time, mock_logger
+        )
+
+        assert response_size == len('{"name":"Caf\u00e9"}'.encode("utf-8"))
+        mock_logger.log.assert_not_called()
+
     def test_with_exception_returns_zero_and_logs(self):
         start_time = time.time()
         mock_logger = MagicMock()
@@ -127,3 +141,8 @@ class TestGetResponseSizeAndDuration:
             dos_response_time=ANY,
             dos_response_size=0,
         )
+
+
+class TestSerialiseFhirResource:
+    def test_returns_json_body(self, bundle):
+        assert serialise_fhir_resource(bundle) == bundle.model_dump_json()
@@ -11,6 +11,9 @@ from common.exceptions import (
     RetryableProcessingError,
 )
 
+PERMANENT_STATUS_CODES = frozenset({400, 401, 403, 404, 405, 406, 422})
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 410, 412, 429, 500, 502, 503, 504})
+
 
 def extract_operation_outcome(response: requests.Response) -> Dict[str, Any]:
     """Extract FHIR OperationOutcome information from HTTP response.
@@ -224,14 +227,11 @@ def handle_http_error(
     operation_outcome = extract_operation_outcome(http_error.response)
     outcome_summary = _get_operation_outcome_summary(operation_outcome)
 
-    permanent_status_codes = {400, 401, 403, 404, 405, 406, 422}
-    retryable_status_codes = {408, 409, 410, 412, 429, 500, 502, 503, 504}
-
-    if status_code in permanent_status_codes:
+    if status_code in PERMANENT_STATUS_CODES:
         _raise_permanent_http_error(
             message_id, status_code, error_context, outcome_summary
         )
-    elif status_code in retryable_status_codes:
+    elif status_code in RETRYABLE_STATUS_CODES:
         _raise_retryable_http_error(
             message_id, status_code, error_context, outcome_summary
         )
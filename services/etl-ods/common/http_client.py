@@ -10,13 +10,104 @@ from ftrs_common.utils.correlation_id import (
 )
 from ftrs_common.utils.request_id import REQUEST_ID_HEADER
 from ftrs_data_layer.logbase import OdsETLPipelineLogBase
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from common.error_handling import RETRYABLE_STATUS_CODES
 
 TIMEOUT_SECONDS = 20
 FHIR_JSON_CONTENT_TYPE = "application/fhir+json"
 RESOURCE_TYPE_OPERATION_OUTCOME = "OperationOutcome"
 
+# Connection pooling for the shared session. Each host (ODS Terminology API,
+# APIM, token endpoint) gets its own pool of up to POOL_MAXSIZE connections.
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 10
+# Transport level retries for idempotent requests. Kept short, as longer waits
+# are left to SQS redelivery.
+MAX_RETRIES = 2
+RETRY_BACKOFF_FACTOR = 0.5
+
 http_client_logger = Logger.get(service="ods_http_client")
 
+_session: requests.Session | None = None
+
+
+def get_session() -> requests.Session:
+    """
+    Return the session shared by every request made by this container.
+    Connections are kept alive between requests and across warm invocations.
+    """
+    global _session  # noqa: PLW0603
+    if _session is None:
+        _session = _create_session()
+    return _session
+
+
+def reset_session() -> None:
+    """Close the shared session, so the next request opens new connections."""
+    global _session  # noqa: PLW0603
+    if _session is not None:
+        _session.close()
+        _session = None
+
+
+def _create_session() -> requests.Session:
+    retry = Retry(
+        total=MAX_RETRIES,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRYABLE_STATUS_CODES,
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        # Return the final response so raise_for_status reports its status code
+        raise_on_status=False,
+        respect_retry_after_header=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Accept-Encoding"] = "gzip, deflate"
+    return session
+
+
+def connection_pool_stats() -> dict[str, dict[str, int]]:
+    """
+    Return the requests made and connections opened by each pool of the shared session,
+    keyed by scheme, host and port.
+    Counts are cumulative for the life of the container, not per invocation, and cover only
+    the pools the session still holds. Requests include urllib3 retries.
+    """
+    if _session is None:
+        return {}
+
+    stats = {}
+    for adapter in set(_session.adapters.values()):
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools[key]
+            stats[f"{pool.scheme}://{pool.host}:{pool.port}"] = {
+                "requests": pool.num_requests,
+                "connections": pool.num_connections,
+            }
+    return stats
+
+
+def _append_response_ids(response: requests.Response | None) -> None:
+    """
+    Add the ids returned with a response to the logs of the current context.
+    Thread-safe keys are used as requests for several records can run at once,
+    each in its own context.
+    """
+    response_headers = response.headers if response is not None else {}
+    http_client_logger.thread_safe_append_keys(
+        response_correlation_id=response_headers.get(CORRELATION_ID_HEADER),
+        response_request_id=response_headers.get(REQUEST_ID_HEADER),
+    )
+
 
 def handle_operation_outcomes(data: dict, method: str | None = None) -> dict:
     if data.get("resourceType") != RESOURCE_TYPE_OPERATION_OUTCOME:
@@ -70,8 +161,12 @@ def make_request(
         request_id=headers.get(REQUEST_ID_HEADER) if headers else None,
     )
 
+    # Clear the ids of the previous response, so a failed request is not
+    # logged with them
+    _append_response_ids(None)
+
     try:
-        response = requests.request(
+        response = get_session().request(
             url=url,
             method=method,
             params=params,
@@ -79,17 +174,9 @@ def make_request(
             timeout=TIMEOUT_SECONDS,
             **kwargs,
         )
+        _append_response_ids(response)
         response.raise_for_status()
 
-        response_correlation_id = response.headers.get(CORRELATION_ID_HEADER)
-        response_request_id = response.headers.get(REQUEST_ID_HEADER)
-        if response_correlation_id:
-            http_client_logger.append_keys(
-                response_correlation_id=response_correlation_id
-            )
-        if response_request_id:
-            http_client_logger.append_keys(response_request_id=response_request_id)
-
     except requests.exceptions.HTTPError as http_err:
         http_client_logger.log(
             OdsETLPipelineLogBase.ETL_COMMON_013,
@@ -1,5 +1,8 @@
+import asyncio
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from typing import Any, Callable, Dict, List, Union
 
 import requests
@@ -7,6 +10,8 @@ from ftrs_common.logger import Logger
 from ftrs_data_layer.logbase import OdsETLPipelineLogBase
 
 from common.error_handling import (
+    PERMANENT_STATUS_CODES,
+    RETRYABLE_STATUS_CODES,
     handle_general_error,
     handle_permanent_error,
     handle_retryable_error,
@@ -15,6 +20,7 @@ from common.exceptions import (
     PermanentProcessingError,
     RetryableProcessingError,
 )
+from common.http_client import connection_pool_stats
 from common.sqs_request_context import (
     extract_correlation_id_from_sqs_records,
     setup_request_context,
@@ -138,12 +144,12 @@ def _extract_status_code_safely(http_error: requests.exceptions.HTTPError) -> in
 
 def _is_permanent_status_code(status_code: int) -> bool:
     """Check if status code indicates a permanent error."""
-    return status_code in {400, 401, 403, 404, 405, 406, 422}
+    return status_code in PERMANENT_STATUS_CODES
 
 
 def _is_retryable_status_code(status_code: int) -> bool:
     """Check if status code indicates a retryable error."""
-    return status_code in {408, 409, 410, 412, 429, 500, 502, 503, 504}
+    return status_code in RETRYABLE_STATUS_CODES
 
 
 def process_sqs_records(
@@ -155,40 +161,90 @@ def process_sqs_records(
     batch_item_failures = []
 
     for record in records:
-        try:
-            metadata = extract_record_metadata(record)
-            message_id = metadata["message_id"]
+        _process_sqs_record(
+            record, process_function, logger, len(records), batch_item_failures
+        )
+
+    return batch_item_failures
 
-            _log_processing_start(logger, message_id, len(records))
-            process_function(record)
-            _log_processing_success(logger, message_id)
 
-        except requests.exceptions.HTTPError as http_error:
-            _handle_http_error_with_status_preservation(
-                http_error, record, logger, batch_item_failures
+async def process_sqs_records_concurrently(
+    records: List[Dict[str, Any]],
+    process_function: Callable[[Dict[str, Any]], Any],
+    logger: Logger,
+    max_concurrency: int,
+) -> List[Dict[str, str]]:
+    """Process a list of SQS records concurrently with common error handling.
+
+    Each record is processed on a worker thread, with at most max_concurrency
+    in flight. Errors are handled per record exactly as in process_sqs_records,
+    and failures are reported in record order.
+    """
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        record_failures = [[] for _ in records]
+        await asyncio.gather(
+            *(
+                # Each record runs in a copy of the current context so it keeps
+                # the correlation and request IDs of the invocation.
+                loop.run_in_executor(
+                    executor,
+                    copy_context().run,
+                    _process_sqs_record,
+                    record,
+                    process_function,
+                    logger,
+                    len(records),
+                    failures,
+                )
+                for record, failures in zip(records, record_failures)
             )
+        )
+
+    return [failure for failures in record_failures for failure in failures]
+
 
-        except PermanentProcessingError as permanent_error:
-            message_id = record.get("messageId", "unknown")
-            handle_permanent_error(message_id, permanent_error, logger)
+def _process_sqs_record(
+    record: Dict[str, Any],
+    process_function: Callable[[Dict[str, Any]], Any],
+    logger: Logger,
+    total_records: int,
+    batch_item_failures: List[Dict[str, str]],
+) -> None:
+    """Process a single SQS record, adding it to batch_item_failures if it should be retried."""
+    try:
+        metadata = extract_record_metadata(record)
+        message_id = metadata["message_id"]
 
-        except RetryableProcessingError as retryable_error:
-            message_id, receive_count = _extract_message_metadata_for_error(record)
-            handle_retryable_error(message_id, receive_count, retryable_error, logger)
-            _add_to_batch_failures(message_id, batch_item_failures)
+        _log_processing_start(logger, message_id, total_records)
+        process_function(record)
+        _log_processing_success(logger, message_id)
 
-        except Exception as error:
-            message_id, receive_count = _extract_message_metadata_for_error(record)
-            handle_general_error(message_id, receive_count, error, logger)
-            _add_to_batch_failures(message_id, batch_item_failures)
+    except requests.exceptions.HTTPError as http_error:
+        _handle_http_error_with_status_preservation(
+            http_error, record, logger, batch_item_failures
+        )
 
-    return batch_item_failures
+    except PermanentProcessingError as permanent_error:
+        message_id = record.get("messageId", "unknown")
+        handle_permanent_error(message_id, permanent_error, logger)
+
+    except RetryableProcessingError as retryable_error:
+        message_id, receive_count = _extract_message_metadata_for_error(record)
+        handle_retryable_error(message_id, receive_count, retryable_error, logger)
+        _add_to_batch_failures(message_id, batch_item_failures)
+
+    except Exception as error:
+        message_id, receive_count = _extract_message_metadata_for_error(record)
+        handle_general_error(message_id, receive_count, error, logger)
+        _add_to_batch_failures(message_id, batch_item_failures)
 
 
 def create_sqs_lambda_handler(
     process_function: Callable[[Dict[str, Any]], Any],
     logger: Logger,
     handler_name: str = "Handler",
+    get_max_concurrency: Callable[[], int] | None = None,
 ) -> Callable[[Dict[str, Any], Any], Dict[str, Any]]:
     """Create a standardized SQS lambda handler function.
 
@@ -196,6 +252,8 @@ def create_sqs_lambda_handler(
         process_function: Function to process each SQS record
         logger: Logger instance for the service
         handler_name: Name of the handler for logging (e.g., "Consumer", "Transformer")
+        get_max_concurrency: Returns how many records may be processed at once,
+            read on each invocation. Records are processed one at a time if not given.
 
     Returns:
         Lambda handler function that processes SQS events
@@ -223,7 +281,15 @@ def create_sqs_lambda_handler(
             total_records=len(records),
         )
 
-        batch_item_failures = process_sqs_records(records, process_function, logger)
+        max_concurrency = get_max_concurrency() if get_max_concurrency else 1
+        if max_concurrency > 1 and len(records) > 1:
+            batch_item_failures = asyncio.run(
+                process_sqs_records_concurrently(
+                    records, process_function, logger, max_concurrency
+                )
+            )
+        else:
+            batch_item_failures = process_sqs_records(records, process_function, logger)
 
         successful_count = len(records) - len(batch_item_failures)
         failed_count = len(batch_item_failures)
@@ -248,6 +314,7 @@ def create_sqs_lambda_handler(
             batch_status="completed"
             if failed_count == 0
             else "completed_with_failures",
+            connection_pools_cumulative=connection_pool_stats(),
         )
 
         return {"batchItemFailures": batch_item_failures}
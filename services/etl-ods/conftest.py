@@ -5,6 +5,8 @@ from unittest.mock import MagicMock, patch
 import pytest
 from pytest_mock import MockerFixture
 
+from transformer.uuid_fetcher import clear_uuid_cache
+
 
 @pytest.fixture(autouse=True)
 def set_environment_variables() -> Generator:
@@ -31,3 +33,11 @@ def mock_jwt_authenticator_global(mocker: MockerFixture) -> MagicMock:
     mocker.patch("common.auth.get_jwt_authenticator", return_value=mock_auth)
     mocker.patch("common.apim_client.get_jwt_authenticator", return_value=mock_auth)
     return mock_auth
+
+
+@pytest.fixture(autouse=True)
+def clear_organisation_uuid_cache() -> Generator:
+    """Start every test without cached organisation uuids."""
+    clear_uuid_cache()
+    yield
+    clear_uuid_cache()
@@ -1,3 +1,5 @@
+import os
+
 import requests
 from ftrs_common.logger import Logger
 from ftrs_data_layer.logbase import OdsETLPipelineLogBase
@@ -11,6 +13,8 @@ from common.sqs_processor import (
 )
 from common.url_config import get_base_apim_api_url
 
+DEFAULT_CONSUMER_MAX_CONCURRENCY = 1
+
 ods_consumer_logger = Logger.get(service="ods_consumer")
 
 
@@ -41,8 +45,31 @@ def process_message_and_send_request(record: dict) -> None:
         handle_http_error(http_error, message_id, "consumer_organization_put_request")
 
 
+def get_max_concurrency() -> int:
+    """Return how many PUT requests from a batch may be in flight at once."""
+    raw_value = os.environ.get("CONSUMER_MAX_CONCURRENCY")
+    if raw_value is None:
+        return DEFAULT_CONSUMER_MAX_CONCURRENCY
+
+    try:
+        max_concurrency = int(raw_value)
+        if max_concurrency > 0:
+            return max_concurrency
+    except ValueError:
+        pass
+
+    ods_consumer_logger.log(
+        OdsETLPipelineLogBase.ETL_CONSUMER_008,
+        invalid_value=raw_value,
+        env_var="CONSUMER_MAX_CONCURRENCY",
+        default_value=DEFAULT_CONSUMER_MAX_CONCURRENCY,
+    )
+    return DEFAULT_CONSUMER_MAX_CONCURRENCY
+
+
 consumer_lambda_handler = create_sqs_lambda_handler(
     process_function=process_message_and_send_request,
     logger=ods_consumer_logger,
     handler_name="Consumer",
+    get_max_concurrency=get_max_concurrency,
 )
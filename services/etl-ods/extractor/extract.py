@@ -1,4 +1,8 @@
 import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Iterator
 
 from ftrs_common.logger import Logger
 from ftrs_data_layer.domain.enums import OrganisationTypeCode
@@ -11,6 +15,7 @@ DEFAULT_ODS_API_PAGE_LIMIT = 1000
 RESOURCE_TYPE_BUNDLE = "Bundle"
 RESOURCE_TYPE_ORGANIZATION = "Organization"
 LINK_RELATION_NEXT = "next"
+MAX_PAGES = 100  # Safety limit to prevent infinite loops
 
 ods_extractor_logger = Logger.get(service="ods_extractor")
 ods_client = ODSClient()
@@ -21,53 +26,91 @@ def fetch_outdated_organisations(date: str) -> list[dict]:
     Returns a list of ods organisation FHIR resources that have been modified on a specified date.
     Uses the ODS Terminology API FHIR endpoint with pagination support.
     """
-    all_organisations = []
+    return [
+        organisation
+        for _, organisations in iter_outdated_organisation_pages(date)
+        for organisation in organisations
+    ]
+
+
+def iter_outdated_organisation_pages(date: str) -> Iterator[tuple[int, list[dict]]]:
+    """
+    Yields the ods organisation FHIR resources modified on a specified date, one page at a time,
+    with the number of the API page they came from. Pages without organisations are skipped.
+    The next page is fetched in the background while the caller handles the current one,
+    so at most two pages are held in memory.
+    """
     params = _build_ods_query_params(date)
     ods_url = get_base_ods_terminology_api_url()
     page_count = 0
-    max_pages = 100  # Safety limit to prevent infinite loops
+    organisation_count = 0
 
     ods_extractor_logger.log(
         OdsETLPipelineLogBase.ETL_EXTRACTOR_001,
         date=date,
     )
 
-    while ods_url and page_count < max_pages:
-        page_count += 1
-        ods_extractor_logger.log(
-            OdsETLPipelineLogBase.ETL_EXTRACTOR_034,
-            date=date,
-            page_num=page_count,
-        )
-
-        bundle = ods_client.make_request(ods_url, params=params)
-        organisations = _extract_organizations_from_bundle(bundle)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        next_page = _submit_page_request(executor, ods_url, params)
 
-        if organisations:
-            all_organisations.extend(organisations)
+        while next_page is not None:
+            page_count += 1
             ods_extractor_logger.log(
-                OdsETLPipelineLogBase.ETL_EXTRACTOR_035,
+                OdsETLPipelineLogBase.ETL_EXTRACTOR_034,
+                date=date,
                 page_num=page_count,
-                page_total=len(organisations),
-                cumulative_total=len(all_organisations),
             )
 
-        ods_url = _extract_next_page_url(bundle)
-        params = None  # Clear params for subsequent pages
+            bundle, fetch_duration_ms = next_page.result()
+            ods_url = _extract_next_page_url(bundle)
+            next_page = (
+                _submit_page_request(executor, ods_url)
+                if ods_url and page_count < MAX_PAGES
+                else None
+            )
 
-    if not all_organisations:
+            organisations = _extract_organizations_from_bundle(bundle)
+            if organisations:
+                organisation_count += len(organisations)
+                ods_extractor_logger.log(
+                    OdsETLPipelineLogBase.ETL_EXTRACTOR_035,
+                    page_num=page_count,
+                    page_total=len(organisations),
+                    cumulative_total=organisation_count,
+                    fetch_duration_ms=fetch_duration_ms,
+                )
+                yield page_count, organisations
+
+    if not organisation_count:
         ods_extractor_logger.log(
             OdsETLPipelineLogBase.ETL_EXTRACTOR_020,
             date=date,
         )
-        return []
+        return
 
     ods_extractor_logger.log(
         OdsETLPipelineLogBase.ETL_EXTRACTOR_002,
-        bundle_total=len(all_organisations),
+        bundle_total=organisation_count,
         total_pages=page_count,
     )
-    return all_organisations
+
+
+def _submit_page_request(
+    executor: ThreadPoolExecutor,
+    ods_url: str,
+    params: list[tuple[str, str]] | None = None,
+) -> Future[tuple[dict, float]]:
+    # Run in a copy of the current context so the page request keeps the
+    # correlation and request IDs of the invocation.
+    return executor.submit(copy_context().run, _request_page, ods_url, params)
+
+
+def _request_page(
+    ods_url: str, params: list[tuple[str, str]] | None
+) -> tuple[dict, float]:
+    start_time = time.time()
+    bundle = ods_client.make_request(ods_url, params=params)
+    return bundle, round((time.time() - start_time) * 1000, 2)
 
 
 def _build_ods_query_params(date: str) -> list[tuple[str, str]]:
@@ -12,9 +12,10 @@ from ftrs_common.utils.correlation_id import (
 from ftrs_common.utils.request_id import fetch_or_set_request_id, get_request_id
 from ftrs_data_layer.logbase import OdsETLPipelineLogBase
 
+from common.http_client import connection_pool_stats
 from common.sqs_sender import send_messages_to_queue
 from extractor.extract import (
-    fetch_outdated_organisations,
+    iter_outdated_organisation_pages,
 )
 
 MAX_DAYS_PAST = 185
@@ -24,12 +25,18 @@ ods_extractor_logger = Logger.get(service="ods_extractor")
 def processor(date: str) -> None:
     """
     Extract ODS data and send each organization to queue.
+    Each page of organisations is sent as soon as it arrives, while the next is fetched.
     """
     try:
-        organisations = fetch_outdated_organisations(date)
-        if not organisations:
-            return
-        _send_organisations_to_queue(organisations)
+        for page_num, organisations in iter_outdated_organisation_pages(date):
+            start_time = time.time()
+            _send_organisations_to_queue(organisations)
+            ods_extractor_logger.log(
+                OdsETLPipelineLogBase.ETL_EXTRACTOR_037,
+                page_num=page_num,
+                page_total=len(organisations),
+                duration_ms=round((time.time() - start_time) * 1000, 2),
+            )
 
     except requests.exceptions.RequestException as e:
         ods_extractor_logger.log(
@@ -110,6 +117,7 @@ def extractor_lambda_handler(event: dict, context: any) -> dict:
                 lambda_name="etl-ods-extractor",
                 duration_ms=duration_ms,
                 date_processed=date,
+                connection_pools_cumulative=connection_pool_stats(),
             )
 
             return {
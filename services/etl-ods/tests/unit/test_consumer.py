@@ -1,4 +1,5 @@
 import json
+import threading
 from typing import Any
 from unittest.mock import MagicMock
 
@@ -11,7 +12,9 @@ from common.exceptions import (
     RetryableProcessingError,
 )
 from consumer.consumer import (
+    DEFAULT_CONSUMER_MAX_CONCURRENCY,
     consumer_lambda_handler,
+    get_max_concurrency,
     process_message_and_send_request,
 )
 
@@ -479,3 +482,62 @@ class TestConsumerLambdaHandler:
         call_args = mocks["setup_context"].call_args[0]
         assert call_args[0] == "correlation-123"
         assert call_args[1] == context
+
+
+@pytest.mark.parametrize(
+    "env_value,expected,should_log",
+    [
+        (None, DEFAULT_CONSUMER_MAX_CONCURRENCY, False),
+        ("10", 10, False),
+        ("0", DEFAULT_CONSUMER_MAX_CONCURRENCY, True),
+        ("many", DEFAULT_CONSUMER_MAX_CONCURRENCY, True),
+    ],
+)
+def test_get_max_concurrency(
+    mocker: MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    env_value: str | None,
+    expected: int,
+    should_log: bool,
+) -> None:
+    mock_logger = mocker.patch("consumer.consumer.ods_consumer_logger")
+    if env_value is not None:
+        monkeypatch.setenv("CONSUMER_MAX_CONCURRENCY", env_value)
+
+    assert get_max_concurrency() == expected
+    assert mock_logger.log.called == should_log
+
+
+def test_consumer_sends_batch_concurrently(
+    mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the consumer sends the PUTs of a batch at once when configured."""
+    monkeypatch.setenv("CONSUMER_MAX_CONCURRENCY", "2")
+    monkeypatch.setenv("MAX_RECEIVE_COUNT", "3")
+    barrier = threading.Barrier(2, timeout=5)
+
+    def make_request(url: str, method: str, json: dict) -> dict:
+        barrier.wait()
+        if url.endswith("ORG002"):
+            raise create_http_error(503, "Service Unavailable")
+        return {"status_code": 200}
+
+    mocker.patch("consumer.consumer.get_base_apim_api_url", return_value="http://api")
+    mock_make_request = mocker.patch(
+        "consumer.consumer.make_apim_request", side_effect=make_request
+    )
+    event = {
+        "Records": [
+            {
+                "messageId": f"msg-{i}",
+                "attributes": {"ApproximateReceiveCount": "1"},
+                "body": json.dumps({"path": f"ORG00{i}", "body": {"name": "Org"}}),
+            }
+            for i in (1, 2)
+        ]
+    }
+
+    response = consumer_lambda_handler(event, {})
+
+    assert response["batchItemFailures"] == [{"itemIdentifier": "msg-2"}]
+    assert mock_make_request.call_count == 2  # noqa: PLR2004
@@ -1,5 +1,9 @@
+import threading
+
 import pytest
+from ftrs_common.utils.correlation_id import current_correlation_id, get_correlation_id
 from ftrs_data_layer.domain.enums import OrganisationTypeCode
+from ftrs_data_layer.logbase import OdsETLPipelineLogBase
 from pytest_mock import MockerFixture
 
 from extractor.extract import (
@@ -8,9 +12,25 @@ from extractor.extract import (
     _extract_organizations_from_bundle,
     _get_page_limit,
     fetch_outdated_organisations,
+    iter_outdated_organisation_pages,
 )
 
 
+def _page(*ids: str, next_url: str | None = None) -> dict:
+    page = {
+        "resourceType": "Bundle",
+        "type": "searchset",
+        "status_code": 200,
+        "entry": [
+            {"resource": {"resourceType": "Organization", "id": org_id}}
+            for org_id in ids
+        ],
+    }
+    if next_url:
+        page["link"] = [{"relation": "next", "url": next_url}]
+    return page
+
+
 def test_fetch_outdated_organisations_success(mocker: MockerFixture) -> None:
     """Test successful fetching of outdated organizations."""
     mock_bundle = {
@@ -145,6 +165,95 @@ def test_fetch_outdated_organisations_with_pagination(mocker: MockerFixture) ->
     assert make_request_mock.call_count == EXPECTED_CALL_COUNT
 
 
+def test_iter_outdated_organisation_pages_prefetches_next_page(
+    mocker: MockerFixture,
+) -> None:
+    """Test the next page is requested before the current page is handed over."""
+    second_page_requested = threading.Event()
+    pages = {
+        None: _page("ABC123", "DEF456", next_url="https://ods/page2"),
+        "https://ods/page2": _page("GHI789"),
+    }
+
+    def make_request(url: str, params: list | None = None) -> dict:
+        if params is None:
+            second_page_requested.set()
+            return pages[url]
+        return pages[None]
+
+    mocker.patch("extractor.extract.ods_client.make_request", side_effect=make_request)
+
+    page_iter = iter_outdated_organisation_pages("2025-10-15")
+    page_num, first_page = next(page_iter)
+
+    assert page_num == 1
+    assert [org["id"] for org in first_page] == ["ABC123", "DEF456"]
+    assert second_page_requested.wait(timeout=5)
+    assert [
+        (page_num, [org["id"] for org in page]) for page_num, page in page_iter
+    ] == [(2, ["GHI789"])]
+
+
+def test_iter_outdated_organisation_pages_keeps_correlation_id(
+    mocker: MockerFixture,
+) -> None:
+    """Test background page requests run with the caller's correlation ID."""
+    correlation_ids = []
+
+    def make_request(url: str, params: list | None = None) -> dict:
+        correlation_ids.append(get_correlation_id())
+        return _page("ABC123", next_url=None if params is None else "https://ods/2")
+
+    mocker.patch("extractor.extract.ods_client.make_request", side_effect=make_request)
+    token = current_correlation_id.set("corr-123")
+    try:
+        list(iter_outdated_organisation_pages("2025-10-15"))
+    finally:
+        current_correlation_id.reset(token)
+
+    assert correlation_ids == ["corr-123", "corr-123"]
+
+
+def test_iter_outdated_organisation_pages_stops_at_max_pages(
+    mocker: MockerFixture,
+) -> None:
+    """Test pagination stops at the page limit even if more pages are linked."""
+    mocker.patch("extractor.extract.MAX_PAGES", 3)
+    make_request_mock = mocker.patch(
+        "extractor.extract.ods_client.make_request",
+        return_value=_page("ABC123", next_url="https://ods/next"),
+    )
+
+    pages = list(iter_outdated_organisation_pages("2025-10-15"))
+
+    assert len(pages) == 3  # noqa: PLR2004
+    assert make_request_mock.call_count == 3  # noqa: PLR2004
+
+
+def test_iter_outdated_organisation_pages_skips_empty_pages(
+    mocker: MockerFixture,
+) -> None:
+    """Test pages without organisations are not yielded, nor renumbered."""
+    mocker.patch(
+        "extractor.extract.ods_client.make_request",
+        side_effect=[_page(next_url="https://ods/page2"), _page("ABC123")],
+    )
+    mock_log = mocker.patch("extractor.extract.ods_extractor_logger.log")
+
+    pages = list(iter_outdated_organisation_pages("2025-10-15"))
+
+    assert [(page_num, [org["id"] for org in page]) for page_num, page in pages] == [
+        (2, ["ABC123"])
+    ]
+    mock_log.assert_any_call(
+        OdsETLPipelineLogBase.ETL_EXTRACTOR_035,
+        page_num=2,
+        page_total=1,
+        cumulative_total=1,
+        fetch_duration_ms=mocker.ANY,
+    )
+
+
 def test_build_ods_query_params_includes_gp_practice_role_codes() -> None:
     """Test that role codes RO177 and RO76 are included for GP Practice filtering."""
     date = "2025-10-15"
@@ -1,8 +1,10 @@
 from datetime import datetime, timedelta
 from http import HTTPStatus
+from typing import Iterator
 from unittest.mock import MagicMock
 
 import pytest
+from ftrs_data_layer.logbase import OdsETLPipelineLogBase
 from pytest_mock import MockerFixture
 
 from extractor.extractor import (
@@ -37,8 +39,8 @@ def test_processor_success(mocker: MockerFixture) -> None:
     ]
 
     mock_fetch = mocker.patch(
-        "extractor.extractor.fetch_outdated_organisations",
-        return_value=mock_organisations,
+        "extractor.extractor.iter_outdated_organisation_pages",
+        return_value=iter([(1, mock_organisations)]),
     )
     mock_send = mocker.patch("extractor.extractor._send_organisations_to_queue")
 
@@ -49,10 +51,45 @@ def test_processor_success(mocker: MockerFixture) -> None:
     mock_send.assert_called_once_with(mock_organisations)
 
 
+def test_processor_sends_each_page_as_it_arrives(mocker: MockerFixture) -> None:
+    """Test each page of organisations is sent before the next page is fetched."""
+    events = []
+    first_page = [{"id": "org1"}, {"id": "org2"}]
+    second_page = [{"id": "org3"}]
+
+    def pages(date: str) -> Iterator[tuple[int, list[dict]]]:
+        # Page 2 of the API had no organisations, so was not yielded
+        for page_num, page in ((1, first_page), (3, second_page)):
+            events.append(("fetched", len(page)))
+            yield page_num, page
+
+    mocker.patch(
+        "extractor.extractor.iter_outdated_organisation_pages", side_effect=pages
+    )
+    mocker.patch(
+        "extractor.extractor._send_organisations_to_queue",
+        side_effect=lambda organisations: events.append(("sent", len(organisations))),
+    )
+    mock_log = mocker.patch("extractor.extractor.ods_extractor_logger.log")
+
+    processor("2025-01-15")
+
+    assert events == [("fetched", 2), ("sent", 2), ("fetched", 1), ("sent", 1)]
+    page_logs = [
+        call.kwargs
+        for call in mock_log.call_args_list
+        if call.args[0] == OdsETLPipelineLogBase.ETL_EXTRACTOR_037
+    ]
+    assert [(log["page_num"], log["page_total"]) for log in page_logs] == [
+        (1, 2),
+        (3, 1),
+    ]
+
+
 def test_processor_no_organisations(mocker: MockerFixture) -> None:
     """Test processor with no organizations returned."""
     mock_fetch = mocker.patch(
-        "extractor.extractor.fetch_outdated_organisations", return_value=[]
+        "extractor.extractor.iter_outdated_organisation_pages", return_value=iter([])
     )
     mock_send = mocker.patch("extractor.extractor._send_organisations_to_queue")
 
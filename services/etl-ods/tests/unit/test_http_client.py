@@ -1,5 +1,9 @@
 import json
+import threading
+from contextvars import copy_context
 from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Generator
 
 import pytest
 import requests
@@ -7,7 +11,57 @@ from ftrs_common.fhir.operation_outcome import OperationOutcomeException
 from pytest_mock import MockerFixture
 from requests_mock import Mocker as RequestsMock
 
-from common.http_client import build_headers, handle_operation_outcomes, make_request
+from common import http_client
+from common.http_client import (
+    build_headers,
+    connection_pool_stats,
+    get_session,
+    handle_operation_outcomes,
+    make_request,
+    reset_session,
+)
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Serves JSON over keep-alive connections, failing the first N requests."""
+
+    protocol_version = "HTTP/1.1"
+    failures_remaining = 0
+    request_count = 0
+
+    def do_GET(self) -> None:
+        handler = type(self)
+        handler.request_count += 1
+        if handler.failures_remaining > 0:
+            handler.failures_remaining -= 1
+            self._respond(HTTPStatus.SERVICE_UNAVAILABLE, {"error": "unavailable"})
+        else:
+            self._respond(HTTPStatus.OK, {"key": "value"})
+
+    def _respond(self, status: HTTPStatus, body: dict) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def stub_server() -> Generator[str, None, None]:
+    _StubHandler.failures_remaining = 0
+    _StubHandler.request_count = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    reset_session()
+    yield f"http://127.0.0.1:{server.server_port}"
+    reset_session()
+    server.shutdown()
+    server.server_close()
 
 
 def test_make_request_success(
@@ -187,8 +241,9 @@ def test_make_request_with_response_correlation_id(
     result = make_request("https://api.example.com/resource", headers=headers)
 
     assert result == {"key": "value", "status_code": HTTPStatus.OK}
-    mock_logger.append_keys.assert_any_call(
-        response_correlation_id="response-correlation-123"
+    mock_logger.thread_safe_append_keys.assert_called_with(
+        response_correlation_id="response-correlation-123",
+        response_request_id=None,
     )
 
 
@@ -293,7 +348,7 @@ def test_make_request_with_response_request_id_header(
     )
 
     mock_logger_append_keys = mocker.patch(
-        "common.http_client.http_client_logger.append_keys"
+        "common.http_client.http_client_logger.thread_safe_append_keys"
     )
 
     headers = build_headers()
@@ -301,4 +356,145 @@ def test_make_request_with_response_request_id_header(
 
     assert result == {"key": "value", "status_code": HTTPStatus.OK}
 
-    mock_logger_append_keys.assert_any_call(response_request_id="test-request-id-123")
+    mock_logger_append_keys.assert_called_with(
+        response_correlation_id=None, response_request_id="test-request-id-123"
+    )
+
+
+def test_get_session_is_shared() -> None:
+    reset_session()
+
+    session = get_session()
+
+    assert get_session() is session
+    assert session.headers["Accept-Encoding"] == "gzip, deflate"
+    adapter = session.get_adapter("https://api.example.com")
+    assert adapter.max_retries.total == http_client.MAX_RETRIES
+    assert set(adapter.max_retries.status_forcelist) == {
+        408,
+        409,
+        410,
+        412,
+        429,
+        500,
+        502,
+        503,
+        504,
+    }
+    assert "POST" not in adapter.max_retries.allowed_methods
+
+    reset_session()
+    assert get_session() is not session
+
+
+def test_make_request_reuses_connections(stub_server: str) -> None:
+    """Test requests to the same host share a kept-alive connection."""
+    for _ in range(3):
+        assert make_request(f"{stub_server}/resource") == {
+            "key": "value",
+            "status_code": HTTPStatus.OK,
+        }
+
+    assert connection_pool_stats() == {stub_server: {"requests": 3, "connections": 1}}
+
+
+def test_make_request_retries_retryable_status(
+    stub_server: str, mocker: MockerFixture
+) -> None:
+    """Test retryable status codes are retried before a response is returned."""
+    mocker.patch.object(http_client, "RETRY_BACKOFF_FACTOR", 0)
+    reset_session()
+    _StubHandler.failures_remaining = 1
+
+    result = make_request(f"{stub_server}/resource")
+
+    assert result == {"key": "value", "status_code": HTTPStatus.OK}
+    assert _StubHandler.request_count == 2  # noqa: PLR2004
+
+
+def test_make_request_raises_status_after_retries(
+    stub_server: str, mocker: MockerFixture
+) -> None:
+    """Test the final retryable response is raised as an HTTPError."""
+    mocker.patch.object(http_client, "RETRY_BACKOFF_FACTOR", 0)
+    reset_session()
+    _StubHandler.failures_remaining = http_client.MAX_RETRIES + 1
+
+    with pytest.raises(requests.exceptions.HTTPError) as exc_info:
+        make_request(f"{stub_server}/resource")
+
+    assert exc_info.value.response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    assert _StubHandler.request_count == http_client.MAX_RETRIES + 1
+
+
+def test_connection_pool_stats_keeps_pools_for_one_host_apart(
+    stub_server: str,
+) -> None:
+    """Test pools for the same host on different ports are reported separately."""
+    other_server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    thread = threading.Thread(target=other_server.serve_forever, daemon=True)
+    thread.start()
+    other_url = f"http://127.0.0.1:{other_server.server_port}"
+    try:
+        make_request(f"{stub_server}/resource")
+        make_request(f"{other_url}/resource")
+        make_request(f"{other_url}/resource")
+    finally:
+        other_server.shutdown()
+        other_server.server_close()
+
+    assert connection_pool_stats() == {
+        stub_server: {"requests": 1, "connections": 1},
+        other_url: {"requests": 2, "connections": 1},
+    }
+
+
+def test_connection_pool_stats_without_session() -> None:
+    reset_session()
+
+    assert connection_pool_stats() == {}
+
+
+def test_make_request_response_ids_are_scoped_to_each_context(
+    requests_mock: RequestsMock,
+) -> None:
+    """Test concurrent requests each log the ids of their own response."""
+    for name in ("first", "second"):
+        requests_mock.get(
+            f"https://api.example.com/{name}",
+            json={"key": "value"},
+            headers={"X-Request-ID": f"{name}-request-id"},
+        )
+    requests_mock.get(
+        "https://api.example.com/failing",
+        status_code=HTTPStatus.BAD_REQUEST,
+        json={"error": "bad"},
+        headers={"X-Request-ID": "failing-request-id"},
+    )
+    barrier = threading.Barrier(3, timeout=5)
+    response_request_ids = {}
+
+    def request(name: str) -> None:
+        barrier.wait()
+        try:
+            make_request(f"https://api.example.com/{name}")
+        except requests.exceptions.HTTPError:
+            pass
+        barrier.wait()
+        keys = http_client.http_client_logger.thread_safe_get_current_keys()
+        response_request_ids[name] = keys["response_request_id"]
+
+    threads = [
+        threading.Thread(target=copy_context().run, args=(request, name))
+        for name in ("first", "second", "failing")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert response_request_ids == {
+        "first": "first-request-id",
+        "second": "second-request-id",
+        "failing": "failing-request-id",
+    }
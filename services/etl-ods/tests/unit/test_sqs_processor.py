@@ -1,10 +1,13 @@
+import asyncio
 import json
 import os
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
 from ftrs_common.logger import Logger
+from ftrs_common.utils.correlation_id import current_correlation_id, get_correlation_id
 from ftrs_data_layer.logbase import OdsETLPipelineLogBase
 from pytest_mock import MockerFixture
 
@@ -19,6 +22,7 @@ from common.sqs_processor import (
     create_sqs_lambda_handler,
     extract_record_metadata,
     process_sqs_records,
+    process_sqs_records_concurrently,
     validate_required_fields,
 )
 
@@ -784,6 +788,110 @@ class TestProcessSqsRecords:
         assert len(failures) == 0
 
 
+def _records(*message_ids: str) -> list[dict]:
+    return [
+        {
+            "messageId": message_id,
+            "attributes": {"ApproximateReceiveCount": "1"},
+            "body": json.dumps({"path": message_id}),
+        }
+        for message_id in message_ids
+    ]
+
+
+def _http_error(status_code: int) -> requests.exceptions.HTTPError:
+    response = MagicMock()
+    response.status_code = status_code
+    return requests.exceptions.HTTPError(f"{status_code} Error", response=response)
+
+
+class TestProcessSqsRecordsConcurrently:
+    """Test process_sqs_records_concurrently function."""
+
+    def test_classifies_failures_per_message_in_record_order(
+        self, mock_logger: MagicMock
+    ) -> None:
+        """Test retryable failures are reported per message, in record order."""
+        errors = {
+            "retry-503": _http_error(503),
+            "permanent-404": _http_error(404),
+            "general": ValueError("boom"),
+            "retryable": RetryableProcessingError(
+                message_id="retryable", status_code=429, response_text="slow down"
+            ),
+            "permanent": PermanentProcessingError(
+                message_id="permanent", status_code=400, response_text="bad"
+            ),
+        }
+
+        def process(record: dict) -> None:
+            if error := errors.get(record["messageId"]):
+                raise error
+
+        records = _records(
+            "retry-503", "ok-1", "permanent-404", "general", "retryable", "permanent"
+        )
+
+        with patch.dict(os.environ, {"MAX_RECEIVE_COUNT": "3"}):
+            failures = asyncio.run(
+                process_sqs_records_concurrently(records, process, mock_logger, 3)
+            )
+
+        assert failures == [
+            {"itemIdentifier": "retry-503"},
+            {"itemIdentifier": "general"},
+            {"itemIdentifier": "retryable"},
+        ]
+        assert failures == process_sqs_records(records, process, mock_logger)
+
+    def test_limits_records_in_flight(self, mock_logger: MagicMock) -> None:
+        """Test records overlap, but never beyond max_concurrency."""
+        max_concurrency = 3
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+        barrier = threading.Barrier(max_concurrency, timeout=5)
+
+        def process(record: dict) -> None:
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            barrier.wait()
+            with lock:
+                in_flight -= 1
+
+        failures = asyncio.run(
+            process_sqs_records_concurrently(
+                _records(*(f"msg-{i}" for i in range(6))),
+                process,
+                mock_logger,
+                max_concurrency,
+            )
+        )
+
+        assert failures == []
+        assert peak == max_concurrency
+
+    def test_keeps_correlation_id(self, mock_logger: MagicMock) -> None:
+        """Test records are processed with the invocation's correlation ID."""
+        correlation_ids = []
+        token = current_correlation_id.set("corr-123")
+        try:
+            asyncio.run(
+                process_sqs_records_concurrently(
+                    _records("msg-1", "msg-2"),
+                    lambda record: correlation_ids.append(get_correlation_id()),
+                    mock_logger,
+                    2,
+                )
+            )
+        finally:
+            current_correlation_id.reset(token)
+
+        assert correlation_ids == ["corr-123", "corr-123"]
+
+
 class TestCreateSqsLambdaHandler:
     """Test create_sqs_lambda_handler function."""
 
@@ -1193,3 +1301,53 @@ class TestHandlerLogging:
         for call in mock_logger.log.call_args_list:
             if len(call[0]) > 0 and call[0][0].name == "ETL_HANDLER_START":
                 assert call[1].get("handler_name") == "Handler"
+
+
+class TestHandlerConcurrency:
+    """Test create_sqs_lambda_handler chooses how to process a batch."""
+
+    def test_processes_concurrently_when_configured(
+        self, mock_logger: MagicMock, mocker: MockerFixture
+    ) -> None:
+        mock_sequential = mocker.patch("common.sqs_processor.process_sqs_records")
+        mock_concurrent = mocker.patch(
+            "common.sqs_processor.process_sqs_records_concurrently",
+            new=mocker.AsyncMock(return_value=[{"itemIdentifier": "msg-2"}]),
+        )
+        process = MagicMock()
+        records = _records("msg-1", "msg-2")
+
+        handler = create_sqs_lambda_handler(
+            process, mock_logger, get_max_concurrency=lambda: 4
+        )
+        result = handler({"Records": records}, {})
+
+        assert result == {"batchItemFailures": [{"itemIdentifier": "msg-2"}]}
+        mock_concurrent.assert_awaited_once_with(records, process, mock_logger, 4)
+        mock_sequential.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "max_concurrency,records",
+        [(1, _records("msg-1", "msg-2")), (4, _records("msg-1"))],
+    )
+    def test_processes_sequentially(
+        self,
+        mock_logger: MagicMock,
+        mocker: MockerFixture,
+        max_concurrency: int,
+        records: list[dict],
+    ) -> None:
+        mock_sequential = mocker.patch(
+            "common.sqs_processor.process_sqs_records", return_value=[]
+        )
+        mock_concurrent = mocker.patch(
+            "common.sqs_processor.process_sqs_records_concurrently"
+        )
+
+        handler = create_sqs_lambda_handler(
+            MagicMock(), mock_logger, get_max_concurrency=lambda: max_concurrency
+        )
+        handler({"Records": records}, {})
+
+        mock_sequential.assert_called_once()
+        mock_concurrent.assert_not_called()
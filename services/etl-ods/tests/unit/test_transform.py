@@ -1,6 +1,7 @@
+import pytest
 from pytest_mock import MockFixture
 
-from transformer.transform import transform_to_payload
+from transformer.transform import extract_ods_code, transform_to_payload
 
 
 def test_transform_to_payload_returns_organization(
@@ -20,3 +21,26 @@ def test_transform_to_payload_returns_organization(
 
     mock_mapper.assert_called_once_with(ods_fhir)
     assert result == fake_organization
+
+
+def test_extract_ods_code_matches_payload_identifier() -> None:
+    ods_fhir = {
+        "resourceType": "Organization",
+        "id": "ODS123",
+        "name": "Test Org",
+        "active": True,
+        "identifier": [
+            {"system": "https://example.org/other", "value": "OTHER1"},
+            {"system": "https://fhir.nhs.uk/Id/ods-organization-code", "value": "A1"},
+            {"system": "https://fhir.nhs.uk/Id/ods-organization-code", "value": "B2"},
+        ],
+    }
+
+    assert extract_ods_code(ods_fhir) == "A1"
+    assert transform_to_payload(ods_fhir).identifier[0].value == "A1"
+
+
+@pytest.mark.parametrize("identifier", [None, {"value": "A1"}, []])
+def test_extract_ods_code_invalid_identifier(identifier: object) -> None:
+    with pytest.raises((TypeError, ValueError)):
+        extract_ods_code({"identifier": identifier})
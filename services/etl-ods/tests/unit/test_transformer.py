@@ -2,6 +2,7 @@ import json
 from unittest.mock import MagicMock
 
 import pytest
+from ftrs_data_layer.logbase import OdsETLPipelineLogBase
 from pytest_mock import MockerFixture
 
 from common.exceptions import (
@@ -9,6 +10,7 @@ from common.exceptions import (
     RetryableProcessingError,
 )
 from transformer.transformer import (
+    _collect_ods_codes,
     _process_record,
     _transform_organisation,
     transformer_lambda_handler,
@@ -859,3 +861,97 @@ class TestTransformerLogging:
                 assert kwargs["failed_count"] == 1
                 assert kwargs["successful_count"] == 0
                 assert kwargs["batch_status"] == "completed_with_failures"
+
+
+def test_collect_ods_codes() -> None:
+    """Test ODS codes are read from each record, skipping unreadable ones."""
+
+    def record(body: object) -> dict:
+        return {"messageId": "msg", "body": body}
+
+    def organisation(*identifiers: dict) -> str:
+        return json.dumps({"organisation": {"identifier": list(identifiers)}})
+
+    ods_identifier = {
+        "system": "https://fhir.nhs.uk/Id/ods-organization-code",
+        "value": "ABC123",
+    }
+    records = [
+        record(organisation({"system": "other", "value": "X"}, ods_identifier)),
+        record({"organisation": {"identifier": [{**ods_identifier, "value": "DEF"}]}}),
+        record("not json"),
+        record(json.dumps({"other": {}})),
+        record(organisation({"system": "other", "value": "X"})),
+        record(json.dumps({"organisation": {"identifier": None}})),
+        record(json.dumps({"organisation": {"identifier": {"value": "ABC123"}}})),
+        record(None),
+    ]
+
+    assert _collect_ods_codes(records) == ["ABC123", "DEF"]
+
+
+def test_handler_prefetches_batch_uuids(
+    mocker: MockerFixture, sample_organisation: dict
+) -> None:
+    """Test the handler resolves every ODS code in the batch before processing."""
+    calls = []
+    mocker.patch(
+        "transformer.transformer.prefetch_organisation_uuids",
+        side_effect=lambda ods_codes: calls.append(("prefetch", list(ods_codes))),
+    )
+    mocker.patch(
+        "transformer.transformer._process_record",
+        side_effect=lambda record: calls.append(("process", record["messageId"])),
+    )
+    mocker.patch("transformer.transformer.send_messages_to_queue")
+    event = {
+        "Records": [
+            {
+                "messageId": f"msg-{i}",
+                "attributes": {"ApproximateReceiveCount": "1"},
+                "body": json.dumps({"organisation": sample_organisation}),
+            }
+            for i in range(2)
+        ]
+    }
+
+    transformer_lambda_handler(event, {})
+
+    assert calls == [
+        ("prefetch", ["ABC123", "ABC123"]),
+        ("process", "msg-0"),
+        ("process", "msg-1"),
+    ]
+
+
+def test_handler_continues_when_prefetch_fails(
+    mocker: MockerFixture, sample_organisation: dict
+) -> None:
+    """Test a failed prefetch leaves each message to resolve its own uuid."""
+    mocker.patch(
+        "transformer.transformer.prefetch_organisation_uuids",
+        side_effect=RuntimeError("prefetch failed"),
+    )
+    mock_process = mocker.patch(
+        "transformer.transformer._process_record", return_value="payload"
+    )
+    mock_send = mocker.patch("transformer.transformer.send_messages_to_queue")
+    mock_log = mocker.patch("transformer.transformer.ods_transformer_logger.log")
+    event = {
+        "Records": [
+            {
+                "messageId": "msg-1",
+                "attributes": {"ApproximateReceiveCount": "1"},
+                "body": json.dumps({"organisation": sample_organisation}),
+            }
+        ]
+    }
+
+    result = transformer_lambda_handler(event, {})
+
+    assert result == {"batchItemFailures": []}
+    mock_process.assert_called_once()
+    mock_send.assert_called_once_with(["payload"], queue_suffix="load-queue")
+    mock_log.assert_any_call(
+        OdsETLPipelineLogBase.ETL_TRANSFORMER_036, error_message="prefetch failed"
+    )
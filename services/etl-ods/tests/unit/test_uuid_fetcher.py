@@ -1,16 +1,36 @@
 """Tests for transformer UUID fetcher module."""
 
+import threading
+
 import pytest
 from pytest_mock import MockerFixture
 from requests import HTTPError
 
-from common.exceptions import PermanentProcessingError
+from common.exceptions import PermanentProcessingError, RetryableProcessingError
+from transformer import uuid_fetcher
 from transformer.uuid_fetcher import (
     fetch_organisation_uuid,
+    prefetch_organisation_uuids,
     validate_ods_code,
 )
 
 
+def _bundle(*organisation_ids: str) -> dict:
+    return {
+        "resourceType": "Bundle",
+        "type": "searchset",
+        "status_code": 200,
+        "entry": [
+            {"resource": {"resourceType": "Organization", "id": organisation_id}}
+            for organisation_id in organisation_ids
+        ],
+    }
+
+
+def _ods_code_from_url(url: str) -> str:
+    return url.rsplit("|", 1)[1]
+
+
 def test_fetch_organisation_uuid(mocker: MockerFixture) -> None:
     """Test fetching organisation UUID from APIM."""
     mocker.patch(
@@ -189,3 +209,121 @@ def test_validate_ods_code(ods_code: str, should_pass: bool) -> None:
             validate_ods_code(ods_code, "test-msg-123")
         assert str(excinfo.value.status_code) == "400"
         assert "must match" in excinfo.value.response_text
+
+
+def test_fetch_organisation_uuid_uses_cache(mocker: MockerFixture) -> None:
+    """Test a resolved uuid is reused until it expires."""
+    make_request_mock = mocker.patch(
+        "transformer.uuid_fetcher.make_apim_request", return_value=_bundle("ORG-1")
+    )
+    mock_monotonic = mocker.patch(
+        "transformer.uuid_fetcher.time.monotonic", return_value=1000.0
+    )
+
+    assert fetch_organisation_uuid("ABC123", "msg-1") == "ORG-1"
+    assert fetch_organisation_uuid("ABC123", "msg-2") == "ORG-1"
+    assert make_request_mock.call_count == 1
+
+    mock_monotonic.return_value = 1000.0 + uuid_fetcher.UUID_CACHE_TTL_SECONDS
+    assert fetch_organisation_uuid("ABC123", "msg-3") == "ORG-1"
+    assert make_request_mock.call_count == 2  # noqa: PLR2004
+
+
+def test_fetch_organisation_uuid_does_not_cache_not_found(
+    mocker: MockerFixture,
+) -> None:
+    """Test an ODS code that was not found is requested again."""
+    make_request_mock = mocker.patch(
+        "transformer.uuid_fetcher.make_apim_request", return_value=_bundle()
+    )
+
+    for message_id in ("msg-1", "msg-2"):
+        with pytest.raises(PermanentProcessingError) as excinfo:
+            fetch_organisation_uuid("ABC123", message_id)
+        assert excinfo.value.message_id == message_id
+
+    assert make_request_mock.call_count == 2  # noqa: PLR2004
+
+
+def test_prefetch_organisation_uuids(mocker: MockerFixture) -> None:
+    """Test a batch of ODS codes is resolved once each, then served from the cache."""
+    make_request_mock = mocker.patch(
+        "transformer.uuid_fetcher.make_apim_request",
+        side_effect=lambda url, method: _bundle(f"uuid-{_ods_code_from_url(url)}"),
+    )
+    mock_log = mocker.patch("transformer.uuid_fetcher.transformer_uuid_logger.log")
+
+    prefetch_organisation_uuids(["ABC123", "DEF456", "ABC123", "not valid!"])
+
+    assert make_request_mock.call_count == 2  # noqa: PLR2004
+    assert fetch_organisation_uuid("ABC123", "msg-1") == "uuid-ABC123"
+    assert fetch_organisation_uuid("DEF456", "msg-2") == "uuid-DEF456"
+    assert make_request_mock.call_count == 2  # noqa: PLR2004
+    mock_log.assert_any_call(
+        uuid_fetcher.OdsETLPipelineLogBase.ETL_TRANSFORMER_035,
+        resolved_count=2,
+        ods_code_count=2,
+        duration_ms=mocker.ANY,
+    )
+
+
+def test_prefetch_organisation_uuids_runs_concurrently(mocker: MockerFixture) -> None:
+    """Test lookups overlap, up to the concurrency limit."""
+    barrier = threading.Barrier(uuid_fetcher.MAX_CONCURRENT_LOOKUPS, timeout=5)
+
+    def make_request(url: str, method: str) -> dict:
+        barrier.wait()
+        return _bundle(f"uuid-{_ods_code_from_url(url)}")
+
+    mocker.patch("transformer.uuid_fetcher.make_apim_request", side_effect=make_request)
+    ods_codes = [f"ODS{i}" for i in range(uuid_fetcher.MAX_CONCURRENT_LOOKUPS)]
+
+    prefetch_organisation_uuids(ods_codes)
+
+    assert not barrier.broken
+    assert fetch_organisation_uuid("ODS0", "msg-1") == "uuid-ODS0"
+
+
+def test_prefetch_organisation_uuids_leaves_failures_to_each_message(
+    mocker: MockerFixture,
+) -> None:
+    """Test failed lookups are classified against the message that needs them."""
+    mock_response = mocker.MagicMock()
+    mock_response.status_code = 503
+    mock_response.headers = {}
+    mocker.patch(
+        "transformer.uuid_fetcher.make_apim_request",
+        side_effect=HTTPError(response=mock_response),
+    )
+
+    prefetch_organisation_uuids(["ABC123"])
+
+    with pytest.raises(RetryableProcessingError) as excinfo:
+        fetch_organisation_uuid("ABC123", "msg-1")
+    assert excinfo.value.message_id == "msg-1"
+    assert excinfo.value.status_code == 503  # noqa: PLR2004
+
+
+def test_prefetch_organisation_uuids_skips_cached_codes(mocker: MockerFixture) -> None:
+    make_request_mock = mocker.patch(
+        "transformer.uuid_fetcher.make_apim_request", return_value=_bundle("ORG-1")
+    )
+    fetch_organisation_uuid("ABC123", "msg-1")
+
+    prefetch_organisation_uuids(["ABC123"])
+
+    make_request_mock.assert_called_once()
+
+
+def test_prefetch_organisation_uuids_at_cache_capacity(mocker: MockerFixture) -> None:
+    """Test concurrent lookups can evict from a full cache while others insert."""
+    mocker.patch.object(uuid_fetcher, "UUID_CACHE_MAX_SIZE", 3)
+    mocker.patch(
+        "transformer.uuid_fetcher.make_apim_request",
+        side_effect=lambda url, method: _bundle(f"uuid-{_ods_code_from_url(url)}"),
+    )
+
+    for batch in range(20):
+        prefetch_organisation_uuids([f"ODS{batch}X{i}" for i in range(10)])
+
+    assert len(uuid_fetcher._uuid_cache) <= 3  # noqa: PLR2004
@@ -11,3 +11,15 @@ def transform_to_payload(ods_fhir: dict) -> FhirOrganisation:
     """
     organisation = OrganizationMapper().from_ods_fhir_to_fhir(ods_fhir)
     return organisation
+
+
+def extract_ods_code(ods_fhir: dict) -> str:
+    """
+    Return the ODS code of an ODS FHIR resource, as used for the identifier
+    of the payload built by transform_to_payload.
+    """
+    identifiers = ods_fhir.get("identifier", [])
+    if not isinstance(identifiers, list):
+        err_msg = "Organisation identifier must be a list"
+        raise TypeError(err_msg)
+    return OrganizationMapper()._extract_ods_code_from_identifiers(identifiers)
@@ -1,3 +1,4 @@
+import json
 import time
 
 from aws_lambda_powertools.utilities.typing import LambdaContext
@@ -12,6 +13,7 @@ from common.error_handling import (
     handle_retryable_error,
 )
 from common.exceptions import PermanentProcessingError, RetryableProcessingError
+from common.http_client import connection_pool_stats
 from common.message_utils import create_message_payload
 from common.sqs_processor import (
     extract_record_metadata,
@@ -22,8 +24,11 @@ from common.sqs_request_context import (
     setup_request_context,
 )
 from common.sqs_sender import send_messages_to_queue
-from transformer.transform import transform_to_payload
-from transformer.uuid_fetcher import fetch_organisation_uuid
+from transformer.transform import extract_ods_code, transform_to_payload
+from transformer.uuid_fetcher import (
+    fetch_organisation_uuid,
+    prefetch_organisation_uuids,
+)
 
 BATCH_SIZE = 10
 ods_transformer_logger = Logger.get(service="ods_transformer")
@@ -83,6 +88,8 @@ def _transform_organisation(organisation: dict, message_id: str) -> str:
             response_text="No ODS code identifier found in organization",
         )
 
+    # transform_to_payload builds this identifier with the same mapper lookup as
+    # extract_ods_code, so it matches the ODS code the batch prefetch resolved
     ods_code = fhir_organisation.identifier[0].value
 
     # Fetch UUID for organisation (raises PermanentProcessingError for 404)
@@ -138,6 +145,22 @@ def _process_record(record: dict) -> str:
     return _transform_organisation(body["organisation"], message_id)
 
 
+def _collect_ods_codes(records: list[dict]) -> list[str]:
+    """
+    Return the ODS codes of the organisations in a batch of SQS records.
+    Records that cannot be read are skipped here and reported when they are processed.
+    """
+    ods_codes = []
+    for record in records:
+        try:
+            body = record.get("body")
+            body = json.loads(body) if isinstance(body, str) else body
+            ods_codes.append(extract_ods_code(body["organisation"]))
+        except (AttributeError, KeyError, TypeError, ValueError):
+            continue
+    return ods_codes
+
+
 def process_transformation_message_with_batching(
     event: dict, context: LambdaContext
 ) -> dict:
@@ -167,6 +190,16 @@ def process_transformation_message_with_batching(
     successful_count = 0
     failed_count = 0
 
+    # Resolve the uuids for the whole batch up front rather than one at a time.
+    # This is best effort, any uuid not prefetched is fetched with its message.
+    try:
+        prefetch_organisation_uuids(_collect_ods_codes(records))
+    except Exception as prefetch_error:
+        ods_transformer_logger.log(
+            OdsETLPipelineLogBase.ETL_TRANSFORMER_036,
+            error_message=str(prefetch_error),
+        )
+
     def send_batch_if_full() -> None:
         """Send batch when it reaches batch size."""
         if len(message_batch) >= BATCH_SIZE:
@@ -221,6 +254,7 @@ def process_transformation_message_with_batching(
         successful_count=successful_count,
         failed_count=failed_count,
         batch_status="completed" if failed_count == 0 else "completed_with_failures",
+        connection_pools_cumulative=connection_pool_stats(),
     )
 
     return {"batchItemFailures": batch_item_failures}
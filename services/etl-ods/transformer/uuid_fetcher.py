@@ -1,5 +1,10 @@
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from http import HTTPStatus
+from typing import Iterable
 
 from ftrs_common.logger import Logger
 from ftrs_data_layer.logbase import OdsETLPipelineLogBase
@@ -12,24 +17,31 @@ from common.url_config import get_base_apim_api_url
 
 ODS_CODE_PATTERN = r"^[A-Za-z0-9]{1,12}$"
 RESOURCE_TYPE_BUNDLE = "Bundle"
+# The Organization search takes a single identifier, so a batch of ODS codes is
+# resolved with concurrent requests instead.
+MAX_CONCURRENT_LOOKUPS = 5
+UUID_CACHE_TTL_SECONDS = 300
+UUID_CACHE_MAX_SIZE = 1000
 
 transformer_uuid_logger = Logger.get(service="ods_transformer")
 
+# Resolved organisation uuids by ODS code, with the time they expire
+_uuid_cache: dict[str, tuple[str, float]] = {}
+# Prefetch threads fill the cache concurrently
+_uuid_cache_lock = threading.Lock()
+
 
 def fetch_organisation_uuid(ods_code: str, message_id: str) -> str | None:
     validate_ods_code(ods_code, message_id)
-    base_url = get_base_apim_api_url()
-    identifier_param = f"https://fhir.nhs.uk/Id/ods-organization-code|{ods_code}"
-    organisation_get_uuid_uri = (
-        base_url + "/Organization?identifier=" + identifier_param
-    )
+    if cached_uuid := _get_cached_uuid(ods_code):
+        return cached_uuid
 
     try:
         transformer_uuid_logger.log(
             OdsETLPipelineLogBase.ETL_TRANSFORMER_031,
             ods_code=ods_code,
         )
-        response = make_apim_request(organisation_get_uuid_uri, method="GET")
+        response = _request_organisation(ods_code)
         if (
             isinstance(response, dict)
             and response.get("resourceType") == RESOURCE_TYPE_BUNDLE
@@ -37,6 +49,7 @@ def fetch_organisation_uuid(ods_code: str, message_id: str) -> str | None:
             organizations = _extract_organizations_from_bundle(response)
             if organizations:
                 uuid = organizations[0].get("id")
+                _cache_uuid(ods_code, uuid)
                 return uuid
 
             # No organisation found in bundle - this is a permanent error
@@ -82,6 +95,110 @@ def fetch_organisation_uuid(ods_code: str, message_id: str) -> str | None:
         handle_http_error(http_err, message_id, "transformer_organization_uuid_fetch")
 
 
+def prefetch_organisation_uuids(ods_codes: Iterable[str]) -> None:
+    """
+    Resolve the organisation uuids for a batch of ODS codes concurrently and cache them,
+    so fetch_organisation_uuid can return them without a request of its own.
+    Codes that cannot be resolved are left for fetch_organisation_uuid to request,
+    log and classify against their own message.
+    """
+    pending = {
+        ods_code
+        for ods_code in ods_codes
+        if isinstance(ods_code, str)
+        and re.match(ODS_CODE_PATTERN, ods_code)
+        and not _get_cached_uuid(ods_code)
+    }
+    if not pending:
+        return
+
+    start_time = time.time()
+    with ThreadPoolExecutor(
+        max_workers=min(MAX_CONCURRENT_LOOKUPS, len(pending))
+    ) as executor:
+        # Each lookup runs in a copy of the current context so it keeps the
+        # correlation and request IDs of the invocation.
+        futures = [
+            executor.submit(copy_context().run, _prefetch_uuid, ods_code)
+            for ods_code in pending
+        ]
+    resolved_count = sum(future.result() for future in futures)
+
+    transformer_uuid_logger.log(
+        OdsETLPipelineLogBase.ETL_TRANSFORMER_035,
+        resolved_count=resolved_count,
+        ods_code_count=len(pending),
+        duration_ms=round((time.time() - start_time) * 1000, 2),
+    )
+
+
+def clear_uuid_cache() -> None:
+    """Remove every cached organisation uuid."""
+    with _uuid_cache_lock:
+        _uuid_cache.clear()
+
+
+def _prefetch_uuid(ods_code: str) -> bool:
+    transformer_uuid_logger.log(
+        OdsETLPipelineLogBase.ETL_TRANSFORMER_031,
+        ods_code=ods_code,
+    )
+    try:
+        response = _request_organisation(ods_code)
+    except Exception:
+        return False
+
+    if not isinstance(response, dict):
+        return False
+    organizations = _extract_organizations_from_bundle(response)
+    if not organizations or not organizations[0].get("id"):
+        return False
+
+    _cache_uuid(ods_code, organizations[0]["id"])
+    return True
+
+
+def _request_organisation(ods_code: str) -> dict:
+    base_url = get_base_apim_api_url()
+    identifier_param = f"https://fhir.nhs.uk/Id/ods-organization-code|{ods_code}"
+    organisation_get_uuid_uri = (
+        base_url + "/Organization?identifier=" + identifier_param
+    )
+    return make_apim_request(organisation_get_uuid_uri, method="GET")
+
+
+def _get_cached_uuid(ods_code: str) -> str | None:
+    with _uuid_cache_lock:
+        cached = _uuid_cache.get(ods_code)
+        if cached is None:
+            return None
+
+        uuid, expires_at = cached
+        if expires_at <= time.monotonic():
+            del _uuid_cache[ods_code]
+            return None
+        return uuid
+
+
+def _cache_uuid(ods_code: str, uuid: str | None) -> None:
+    if not uuid:
+        return
+
+    with _uuid_cache_lock:
+        now = time.monotonic()
+        if len(_uuid_cache) >= UUID_CACHE_MAX_SIZE:
+            for expired_code in [
+                code
+                for code, (_, expires_at) in _uuid_cache.items()
+                if expires_at <= now
+            ]:
+                del _uuid_cache[expired_code]
+            if len(_uuid_cache) >= UUID_CACHE_MAX_SIZE:
+                _uuid_cache.clear()
+
+        _uuid_cache[ods_code] = (uuid, now + UUID_CACHE_TTL_SECONDS)
+
+
 def validate_ods_code(ods_code: str, message_id: str) -> None:
     """Validate ODS code format."""
     if not isinstance(ods_code, str) or not re.match(ODS_CODE_PATTERN, ods_code):